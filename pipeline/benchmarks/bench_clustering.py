@@ -0,0 +1,139 @@
+"""
+주제 클러스터링 백엔드 벤치마크.
+ArticleClusterer._cluster_articles를 기사 수별로 dense / sparse 백엔드에서 실행해
+소요 시간, 최대 메모리(tracemalloc), 정답 스토리 복원율(ARI)을 비교한다.
+
+백엔드:
+    dense   기존 방식 — TF-IDF 밀집 변환 + AgglomerativeClustering(cosine, average)
+    sparse  희소 kNN 유사도 그래프 + 평균 연결 병합 (sparse_linkage)
+
+코퍼스: 합성 한국어 기사. 스토리마다 고유 주제어를 섞은 기사 --story-size건을 만들고,
+목표 클러스터 수를 스토리 수로 두어 정답 스토리를 얼마나 복원하는지(ARI, 1.0이 완전 일치) 본다.
+
+dense는 기사 수 × max_features 밀집 행렬과 n(n-1)/2 거리 행렬이 필요하므로
+--dense-max 보다 큰 크기에서는 실행하지 않고 예상 메모리만 표시한다.
+
+실행:
+    python benchmarks/bench_clustering.py
+    python benchmarks/bench_clustering.py --sizes 200 2000 20000 --json result.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 직접 실행 시 패키지 경로 설정 (reconstruction 모듈은 평면 import)
+_pipeline_dir = Path(__file__).resolve().parent.parent
+for _path in (_pipeline_dir, _pipeline_dir / "reconstruction"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from sklearn.metrics import adjusted_rand_score
+
+from clusterer import ArticleClusterer
+
+DEFAULT_SIZES = (200, 2000, 20000)
+
+# 합성 기사용 음절 (가~힣에서 7개 간격)
+_SYLLABLES = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+
+
+def make_corpus(n_articles: int, story_size: int, seed: int = 0) -> tuple[list[dict], list[int]]:
+    """(합성 기사 리스트, 기사별 정답 스토리 번호)"""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+    common = [word() for _ in range(3000)]
+    articles, truth = [], []
+    for story in range(n_articles // story_size + 1):
+        topic = [word() for _ in range(8)]
+        for _ in range(story_size):
+            words = [rng.choice(topic) if rng.random() < 0.4 else rng.choice(common) for _ in range(90)]
+            text = " ".join(words)
+            articles.append({"title": text[:40], "content": text[40:400]})
+            truth.append(story)
+    return articles[:n_articles], truth[:n_articles]
+
+
+def dense_memory_mb(n_articles: int, max_features: int) -> float:
+    """dense 백엔드 예상 메모리 (밀집 TF-IDF + 압축 거리 행렬, float64)"""
+    return (n_articles * max_features + n_articles * (n_articles - 1) / 2) * 8 / 1e6
+
+
+def _measure(clusterer: ArticleClusterer, articles: list[dict], n_clusters: int) -> tuple[float, float, list[int]]:
+    """(소요 초, 최대 메모리 MB, 기사별 라벨) — tracemalloc이 병합 루프를 느리게 하므로 시간과 메모리는 따로 잰다"""
+    started = time.perf_counter()
+    clusters = clusterer._cluster_articles(articles, n_clusters)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    clusterer._cluster_articles(articles, n_clusters)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    label_of = {id(a): label for label, cluster in enumerate(clusters) for a in cluster}
+    return seconds, peak / 1e6, [label_of[id(a)] for a in articles]
+
+
+def run_benchmark(sizes: list[int], story_size: int, dense_max: int, knn_neighbors: int) -> list[dict]:
+    results = []
+    for n_articles in sizes:
+        articles, truth = make_corpus(n_articles, story_size)
+        n_clusters = len(set(truth))
+        for backend in ("dense", "sparse"):
+            clusterer = ArticleClusterer({"backend": backend, "knn_neighbors": knn_neighbors})
+            row = {"articles": n_articles, "clusters": n_clusters, "backend": backend}
+            if backend == "dense" and n_articles > dense_max:
+                row["skipped"] = True
+                row["estimated_mb"] = round(dense_memory_mb(n_articles, clusterer.max_features), 1)
+            else:
+                seconds, peak_mb, labels = _measure(clusterer, articles, n_clusters)
+                row.update(
+                    seconds=round(seconds, 3),
+                    peak_mb=round(peak_mb, 1),
+                    ari=round(adjusted_rand_score(truth, labels), 4),
+                )
+            results.append(row)
+            print(f"  · {n_articles}건 {backend} 완료", file=sys.stderr)
+    return results
+
+
+def print_table(results: list[dict]):
+    print(f"{'articles':>8} {'clusters':>8} {'backend':<7} {'seconds':>9} {'peak MB':>9} {'ARI':>7}")
+    print("-" * 54)
+    for row in results:
+        if row.get("skipped"):
+            note = f"건너뜀 (예상 {row['estimated_mb']:.0f} MB)"
+            print(f"{row['articles']:>8} {row['clusters']:>8} {row['backend']:<7} {note}")
+            continue
+        print(
+            f"{row['articles']:>8} {row['clusters']:>8} {row['backend']:<7} "
+            f"{row['seconds']:>9.3f} {row['peak_mb']:>9.1f} {row['ari']:>7.4f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주제 클러스터링 백엔드 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="기사 수 (기본: 200 2000 20000)")
+    parser.add_argument("--story-size", type=int, default=5, help="스토리당 기사 수 (기본: 5)")
+    parser.add_argument("--dense-max", type=int, default=2000, help="dense를 실행할 최대 기사 수 (기본: 2000)")
+    parser.add_argument("--knn-neighbors", type=int, default=15, help="sparse kNN 이웃 수 (기본: 15)")
+    parser.add_argument("--json", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.story_size, args.dense_max, args.knn_neighbors)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+날짜 파서 마이크로 벤치마크.
+크롤링 결과의 실제 published_time 문자열로 파싱 시간과 성공률을 측정한다.
+
+측정 항목:
+    cold   고유 문자열만, 매 반복마다 절대 날짜 LRU 캐시를 비우고 파싱 (모양 분기 + 정규식/strptime 비용)
+    warm   전체 코퍼스를 캐시를 채운 뒤 파싱 (목록 페이지/RSS에서 같은 날짜 문자열이 반복되는 경우)
+
+코퍼스 (앞에서부터 우선):
+    --corpus FILE   한 줄에 날짜 문자열 하나
+    크롤링 결과     crawling_naver_news/news_data, crawling_sites/sites_data (.jsonl.zst/.jsonl/.json)
+    내장 샘플       위 둘이 없을 때
+
+실행:
+    python benchmarks/bench_date_parser.py --repeat 20
+    python benchmarks/bench_date_parser.py --corpus dates.txt --json result.json
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# 직접 실행 시 패키지 경로 설정
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.utils import date_parser
+from crawling_sites.utils.jsonl_store import iter_items, resolve_path
+
+CRAWL_OUTPUTS = (
+    _pipeline_dir / "crawling_naver_news" / "news_data",
+    _pipeline_dir / "crawling_sites" / "sites_data",
+)
+
+SAMPLE_DATES = (
+    "2026.03.02. 오전 10:30", "2026.03.02. 오후 3:05", "2026.03.02.", "2026.03.02 10:30",
+    "2026-03-02T09:00:00Z", "2026-03-02T09:00:00+09:00", "2026-03-02", "2026-03-02 10:30",
+    "2026년 3월 2일", "2026/03/02", "20260302",
+    "Mon, 02 Mar 2026 09:00:00 +0000", "Mar 2, 2026", "March 2, 2026", "2 Mar 2026",
+    "5분 전", "3시간 전", "1일 전", "방금", "2 hours ago",
+)
+
+
+def load_corpus(corpus_path: str = None) -> tuple[list[str], str]:
+    """(날짜 문자열 리스트, 출처 설명)"""
+    if corpus_path:
+        lines = Path(corpus_path).read_text(encoding="utf-8").splitlines()
+        return [line for line in lines if line.strip()], corpus_path
+
+    dates, sources = [], []
+    for base in CRAWL_OUTPUTS:
+        path = resolve_path(base)
+        if path is None:
+            continue
+        found = [item.get("published_time", "") for _, item in iter_items(path)]
+        found = [d for d in found if d]
+        if found:
+            dates.extend(found)
+            sources.append(path.name)
+    if dates:
+        return dates, ", ".join(sources)
+    return list(SAMPLE_DATES) * 50, "내장 샘플"
+
+
+def _shape(text: str) -> str:
+    """문자열 모양 분류 (결과 표 출력용)"""
+    text = text.strip()
+    if not text:
+        return "empty"
+    if date_parser._parse_relative(text) is not None:
+        return "relative"
+    if text[0].isdigit():
+        return "iso" if date_parser._ISO_RE.match(text) else "numeric"
+    return "alpha" if text[0].isalpha() else "other"
+
+
+def _time_pass(dates: list[str], repeat: int, clear_cache: bool) -> float:
+    """문자열 하나당 중앙값 µs"""
+    timings = []
+    for _ in range(repeat):
+        if clear_cache:
+            date_parser._parse_absolute.cache_clear()
+        started = time.perf_counter()
+        for text in dates:
+            date_parser.parse_datetime(text)
+        timings.append((time.perf_counter() - started) / len(dates) * 1e6)
+    return statistics.median(timings)
+
+
+def run_benchmark(dates: list[str], repeat: int) -> dict:
+    date_parser.set_reference_now()
+
+    shapes = Counter(_shape(d) for d in dates)
+    failed = Counter(_shape(d) for d in dates if date_parser.parse_datetime(d) is None)
+
+    cold_us = _time_pass(list(dict.fromkeys(dates)), repeat, clear_cache=True)
+    date_parser._parse_absolute.cache_clear()
+    for text in dates:
+        date_parser.parse_datetime(text)
+    warm_us = _time_pass(dates, repeat, clear_cache=False)
+    info = date_parser._parse_absolute.cache_info()
+
+    return {
+        "strings": len(dates),
+        "unique": len(set(dates)),
+        "shapes": dict(shapes),
+        "failed": dict(failed),
+        "cold_us": round(cold_us, 2),
+        "warm_us": round(warm_us, 2),
+        "cache_size": info.currsize,
+        "cache_hit_rate": round(info.hits / max(1, info.hits + info.misses), 3),
+    }
+
+
+def print_report(result: dict, source: str):
+    print(f"코퍼스: {source} — {result['strings']}건 (고유 {result['unique']}건)")
+    print(f"{'shape':<10} {'count':>7} {'failed':>7}")
+    print("-" * 26)
+    for shape, count in sorted(result["shapes"].items(), key=lambda kv: -kv[1]):
+        print(f"{shape:<10} {count:>7} {result['failed'].get(shape, 0):>7}")
+    print("-" * 26)
+    print(f"cold (캐시 없음) {result['cold_us']:>8.2f} µs/건")
+    print(f"warm (캐시 적중) {result['warm_us']:>8.2f} µs/건")
+    print(f"캐시 항목 {result['cache_size']}개, 적중률 {result['cache_hit_rate']:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 파서 벤치마크")
+    parser.add_argument("--corpus", default=None, help="날짜 문자열 파일 (한 줄에 하나)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수 (기본: 20)")
+    parser.add_argument("--json", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    dates, source = load_corpus(args.corpus)
+    if not dates:
+        print("❌ 벤치마크할 날짜 문자열이 없습니다")
+        sys.exit(1)
+
+    result = run_benchmark(dates, args.repeat)
+    print_report(result, source)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"source": source, **result}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
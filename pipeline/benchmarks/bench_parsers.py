@@ -0,0 +1,187 @@
+"""
+HTML 파서 백엔드 마이크로 벤치마크.
+저장된 사이트 페이지로 목록/본문 추출에 걸리는 시간과 최대 메모리(tracemalloc)를 백엔드별로 비교한다.
+
+백엔드:
+    html.parser(full)  기존 방식 — BeautifulSoup 전체 트리 파싱
+    html.parser        SoupStrainer로 대상 하위 트리만 파싱 (단순 셀렉터일 때)
+    lxml               lxml + 사전 컴파일 CSS 셀렉터
+
+페이지 저장 (html 전략 사이트의 목록 페이지 + 첫 기사 상세 페이지):
+    python benchmarks/bench_parsers.py --fetch --pages benchmarks/pages
+
+벤치마크:
+    python benchmarks/bench_parsers.py --pages benchmarks/pages --repeat 20
+
+주의: tracemalloc은 Python 할당만 추적하므로 lxml(libxml2) 트리의 C 메모리는 최대 메모리에 포함되지 않는다.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 직접 실행 시 패키지 경로 설정
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.engine import create_crawler
+from crawling_sites.sites_crawler import load_config
+from crawling_sites.utils.html_parser import LXML_AVAILABLE, SiteParser
+
+DEFAULT_CONFIG = _pipeline_dir / "crawling_sites" / "config" / "sites.yaml"
+DEFAULT_PAGES_DIR = Path(__file__).resolve().parent / "pages"
+
+
+class _FullParser(SiteParser):
+    """부분 파싱 없이 항상 전체 트리를 만드는 기존 방식"""
+
+    def parse(self, html: str, target: str = None):
+        return super().parse(html)
+
+
+def _backends() -> dict:
+    backends = {
+        "html.parser(full)": lambda selectors: _FullParser(selectors, backend="html.parser"),
+        "html.parser": lambda selectors: SiteParser(selectors, backend="html.parser"),
+    }
+    if LXML_AVAILABLE:
+        backends["lxml"] = lambda selectors: SiteParser(selectors, backend="lxml")
+    return backends
+
+
+def fetch_pages(sites: dict, pages_dir: Path):
+    """html 전략 사이트의 현재 목록/상세 페이지를 저장한다."""
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    for key, site in sites.items():
+        if site.get("strategy", "html") != "html":
+            continue
+        crawler = create_crawler(site, rate_limiter=None)
+        try:
+            resp = crawler.session.get(crawler.url, timeout=crawler.timeout)
+            resp.raise_for_status()
+            if resp.encoding and resp.encoding.lower() == "iso-8859-1":
+                resp.encoding = resp.apparent_encoding
+            (pages_dir / f"{key}.html").write_text(resp.text, encoding="utf-8")
+
+            items = crawler._parse_article_list(resp.text, site.get("selectors", {}))
+            links = [item["link"] for item in items if item.get("link", "").startswith("http")]
+            if links:
+                detail = crawler.session.get(links[0], timeout=crawler.timeout)
+                detail.raise_for_status()
+                if detail.encoding and detail.encoding.lower() == "iso-8859-1":
+                    detail.encoding = detail.apparent_encoding
+                (pages_dir / f"{key}.detail.html").write_text(detail.text, encoding="utf-8")
+            print(f"💾 {key}: 목록{' + 상세' if links else ''}")
+        except Exception as e:
+            print(f"⚠️  {key}: 저장 실패 ({e})")
+        finally:
+            crawler.close()
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    """(중앙값 ms, tracemalloc 최대 KB)"""
+    fn()  # 워밍업 (셀렉터 컴파일 캐시 등)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def run_benchmark(sites: dict, pages_dir: Path, repeat: int) -> list[dict]:
+    results = []
+    for list_page in sorted(pages_dir.glob("*.html")):
+        if list_page.name.endswith(".detail.html"):
+            continue
+        key = list_page.stem
+        site = sites.get(key)
+        if not site:
+            continue
+        selectors = site.get("selectors", {})
+        list_html = list_page.read_text(encoding="utf-8")
+        detail_page = pages_dir / f"{key}.detail.html"
+        detail_html = detail_page.read_text(encoding="utf-8") if detail_page.exists() else None
+
+        crawler = create_crawler({**site, "strategy": "html"}, rate_limiter=None)
+        for backend, make_parser in _backends().items():
+            crawler.parser = make_parser(selectors)
+            label = backend if backend.startswith(crawler.parser.backend) else f"{backend}→{crawler.parser.backend}"
+            row = {"site": key, "backend": label}
+
+            list_ms, list_kb = _measure(lambda: crawler._parse_article_list(list_html, selectors), repeat)
+            row.update(list_ms=round(list_ms, 2), list_peak_kb=round(list_kb, 1),
+                       items=len(crawler._parse_article_list(list_html, selectors)))
+
+            if detail_html is not None:
+                detail_ms, detail_kb = _measure(lambda: crawler._extract_content(detail_html), repeat)
+                row.update(detail_ms=round(detail_ms, 2), detail_peak_kb=round(detail_kb, 1),
+                           content_chars=len(crawler._extract_content(detail_html) or ""))
+            results.append(row)
+    return results
+
+
+def print_table(results: list[dict]):
+    print(f"{'site':<24} {'backend':<18} {'list ms':>8} {'peak KB':>9} {'items':>5}"
+          f" {'detail ms':>9} {'peak KB':>9} {'chars':>6}")
+    print("-" * 95)
+    for r in results:
+        print(
+            f"{r['site']:<24} {r['backend']:<18} {r['list_ms']:>8.2f} {r['list_peak_kb']:>9.1f} {r['items']:>5}"
+            f" {r.get('detail_ms', float('nan')):>9.2f} {r.get('detail_peak_kb', float('nan')):>9.1f}"
+            f" {r.get('content_chars', 0):>6}"
+        )
+
+    # 백엔드별 합계
+    print("-" * 95)
+    totals = {}
+    for r in results:
+        t = totals.setdefault(r["backend"], [0.0, 0.0])
+        t[0] += r["list_ms"]
+        t[1] += r.get("detail_ms", 0.0)
+    for backend, (list_ms, detail_ms) in totals.items():
+        print(f"{'합계':<24} {backend:<18} {list_ms:>8.2f} {'':>9} {'':>5} {detail_ms:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG), help="sites.yaml 경로")
+    parser.add_argument("--pages", default=str(DEFAULT_PAGES_DIR), help="저장된 페이지 디렉토리")
+    parser.add_argument("--fetch", action="store_true", help="현재 페이지를 받아 --pages에 저장")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수 (기본: 20)")
+    parser.add_argument("--json", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    sites = load_config(args.config).get("sites", {})
+    pages_dir = Path(args.pages)
+
+    if args.fetch:
+        fetch_pages(sites, pages_dir)
+        return
+
+    if not pages_dir.exists():
+        print(f"❌ 페이지 디렉토리가 없습니다: {pages_dir} (--fetch로 먼저 저장)")
+        sys.exit(1)
+
+    results = run_benchmark(sites, pages_dir, args.repeat)
+    if not results:
+        print(f"❌ 벤치마크할 페이지가 없습니다 ({pages_dir}/<site_key>.html)")
+        sys.exit(1)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+브랜드명 정규화 마이크로 벤치마크.
+브랜드 사전 크기별로 기사 하나(제목 + 본문 앞 300자, 클러스터링 입력)를 정규화하는 시간을 비교한다.
+
+방식:
+    replace      기존 방식 — 사전 항목마다 str.replace (항목 수만큼 문자열을 새로 만듦)
+    alternation  긴 항목부터 나열한 정규식 alternation 하나 (위치마다 항목을 차례로 비교)
+    trie         BrandNormalizer — 트라이 형태 정규식 하나 (공통 접두사를 한 번만 비교)
+
+사전: 기본 BRAND_NORMALIZE에 합성 브랜드(영문 → 한글)를 더해 --sizes 크기로 맞춘다.
+기사: 합성 한국어 문장에 사전 브랜드명을 섞은 텍스트 (--mentions개).
+
+실행:
+    python benchmarks/bench_text_normalizer.py
+    python benchmarks/bench_text_normalizer.py --sizes 27 100 300 1000 --json result.json
+"""
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 직접 실행 시 패키지 경로 설정
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from reconstruction.text_normalizer import BRAND_NORMALIZE, BrandNormalizer
+
+DEFAULT_SIZES = (len(BRAND_NORMALIZE), 100, 300, 1000)
+
+# 합성 텍스트용 음절 (가~힣에서 7개 간격)
+_SYLLABLES = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+
+
+def make_dictionary(size: int, rng: random.Random) -> dict:
+    """
+    기본 사전 + 합성 브랜드 (영문 4~10자 → 한글 2~4음절)
+    다른 항목을 포함하거나 다른 항목에 포함되는 합성 브랜드는 버려 세 방식의 결과가 같게 한다.
+    """
+    mapping = dict(BRAND_NORMALIZE)
+    while len(mapping) < size:
+        brand = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+        if any(brand in key or key in brand for key in mapping):
+            continue
+        mapping[brand] = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return mapping
+
+
+def make_articles(mapping: dict, count: int, mentions: int, rng: random.Random) -> list[str]:
+    """브랜드명을 mentions개 섞은 제목 + 본문 앞 300자 (소문자, 클러스터링 입력과 같은 형태)"""
+    brands = list(mapping)
+    articles = []
+    for _ in range(count):
+        words = ["".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(110)]
+        for pos in rng.sample(range(len(words)), mentions):
+            words[pos] = rng.choice(brands)
+        articles.append(" ".join(words)[:340].lower())
+    return articles
+
+
+def _replace_loop(mapping: dict):
+    def normalize(text: str) -> str:
+        for en, ko in mapping.items():
+            text = text.replace(en, ko)
+        return text
+    return normalize
+
+
+def _alternation(mapping: dict):
+    pattern = re.compile("|".join(re.escape(k) for k in sorted(mapping, key=len, reverse=True)))
+    return lambda text: pattern.sub(lambda m: mapping[m.group(0)], text)
+
+
+def _measure(normalize, articles: list[str], repeat: int) -> float:
+    """기사 하나당 중앙값 µs"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in articles:
+            normalize(text)
+        timings.append((time.perf_counter() - started) / len(articles) * 1e6)
+    return statistics.median(timings)
+
+
+def run_benchmark(sizes: list[int], articles: int, mentions: int, repeat: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        rng = random.Random(size)
+        mapping = make_dictionary(size, rng)
+        texts = make_articles(mapping, articles, mentions, rng)
+
+        started = time.perf_counter()
+        normalizer = BrandNormalizer(mapping)
+        compile_ms = (time.perf_counter() - started) * 1e3
+
+        methods = {
+            "replace": _replace_loop(mapping),
+            "alternation": _alternation(mapping),
+            "trie": normalizer.normalize,
+        }
+        outputs = {name: [fn(t) for t in texts] for name, fn in methods.items()}
+        row = {
+            "entries": len(mapping),
+            "compile_ms": round(compile_ms, 2),
+            # 합성 항목끼리 겹치지 않으므로 세 방식의 결과가 같아야 한다
+            "same_output": outputs["replace"] == outputs["alternation"] == outputs["trie"],
+        }
+        for name, fn in methods.items():
+            row[f"{name}_us"] = round(_measure(fn, texts, repeat), 2)
+        results.append(row)
+    return results
+
+
+def print_table(results: list[dict]):
+    print(f"{'entries':>7} {'replace µs':>11} {'alternation µs':>15} {'trie µs':>9} {'compile ms':>11} {'same':>5}")
+    print("-" * 64)
+    for row in results:
+        print(
+            f"{row['entries']:>7} {row['replace_us']:>11.2f} {row['alternation_us']:>15.2f} "
+            f"{row['trie_us']:>9.2f} {row['compile_ms']:>11.2f} {'✓' if row['same_output'] else '✗':>5}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브랜드명 정규화 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help=f"사전 크기 (기본: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--articles", type=int, default=500, help="기사 수 (기본: 500)")
+    parser.add_argument("--mentions", type=int, default=4, help="기사당 브랜드명 수 (기본: 4)")
+    parser.add_argument("--repeat", type=int, default=10, help="측정 반복 횟수 (기본: 10)")
+    parser.add_argument("--json", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.articles, args.mentions, args.repeat)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+멀티사이트 크롤러 녹화/재생 벤치마크.
+라이브 사이트에 접속하지 않고 크롤러 처리량을 오프라인에서 재현 가능하게 측정한다.
+
+1. record — sites.yaml의 각 사이트를 실제 크롤러 흐름(목록/RSS → 상세)으로 한 번 크롤링하며
+   모든 HTTP 응답을 fixture 아카이브(zip)에 저장
+2. serve  — 아카이브를 로컬 HTTP 서버로 재생 (원본 호스트마다 포트 하나, 지연/지터/에러 주입)
+3. bench  — 재생 서버를 띄우고 crawl_all_sites를 끝까지 실행해 pages/s, 사이트별 소요 시간 p50/p95,
+   최대 RSS를 보고
+
+원본 호스트마다 별도 포트를 쓰므로 도메인별 레이트 리밋이 실제와 같이 동작하고,
+응답 본문과 sites.yaml의 URL은 재생 서버 주소로 바꿔 쓴다.
+Selenium 사이트는 렌더링 결과가 HTTP 응답과 달라 녹화/재생 대상에서 제외한다.
+
+사용 예:
+    python benchmarks/crawl_fixtures.py record --archive benchmarks/fixtures/sites.zip
+    python benchmarks/crawl_fixtures.py serve --archive benchmarks/fixtures/sites.zip --latency-ms 80
+    python benchmarks/crawl_fixtures.py bench --archive benchmarks/fixtures/sites.zip \\
+        --latency-ms 80 --jitter-ms 40 --error-rate 0.02 --rate-limit-scale 0
+"""
+import argparse
+import copy
+import hashlib
+import json
+import logging
+import math
+import random
+import resource
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+# 직접 실행 시 패키지 경로 설정
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.engine import DEFAULT_MAX_CONNECTIONS, create_crawler
+from crawling_sites.sites_crawler import crawl_all_sites, load_config
+from crawling_sites.utils import DomainRateLimiter
+
+logger = logging.getLogger("crawl_fixtures")
+
+DEFAULT_CONFIG = _pipeline_dir / "crawling_sites" / "config" / "sites.yaml"
+DEFAULT_ARCHIVE = Path(__file__).resolve().parent / "fixtures" / "sites_fixtures.zip"
+
+# 재생 시 저장하는 응답 헤더
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Location")
+# 본문 URL 치환 대상 (텍스트 응답만)
+_TEXT_TYPES = ("text/", "xml", "json", "javascript")
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class FixtureArchive:
+    """URL → 응답(상태, 헤더, 본문) 아카이브. 본문은 sha1로 중복 제거해 zip에 저장한다."""
+
+    def __init__(self):
+        self.entries = {}  # url → {"status", "headers", "body"}
+        self.bodies = {}   # sha1 → bytes
+        self._lock = threading.Lock()
+
+    def add(self, url: str, status: int, headers: dict, body: bytes):
+        digest = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            self.bodies[digest] = body
+            self.entries[url] = {
+                "status": status,
+                "headers": {k: headers[k] for k in _KEPT_HEADERS if headers.get(k)},
+                "body": digest,
+            }
+
+    def get(self, url: str):
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        return entry, self.bodies[entry["body"]]
+
+    def origins(self) -> list[str]:
+        return sorted({_origin(url) for url in self.entries})
+
+    def save(self, path: Path, meta: dict = None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("manifest.json", json.dumps(
+                {"meta": meta or {}, "entries": self.entries}, ensure_ascii=False, indent=1
+            ))
+            for digest, body in self.bodies.items():
+                zf.writestr(f"bodies/{digest}", body)
+
+    @classmethod
+    def load(cls, path: Path) -> "FixtureArchive":
+        archive = cls()
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+            archive.entries = manifest["entries"]
+            for entry in archive.entries.values():
+                if entry["body"] not in archive.bodies:
+                    archive.bodies[entry["body"]] = zf.read(f"bodies/{entry['body']}")
+        return archive
+
+
+class _RecordingAdapter(HTTPAdapter):
+    """크롤러 세션에 마운트해 리다이렉트를 포함한 모든 응답을 아카이브에 기록"""
+
+    def __init__(self, archive: FixtureArchive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        if request.method == "GET":
+            self.archive.add(request.url, resp.status_code, resp.headers, resp.content)
+        return resp
+
+
+def record(sites: dict, archive_path: Path, workers: int = 8):
+    """사이트별로 실제 크롤링 흐름을 실행하며 응답을 녹화한다 (HTTP 캐시/URL 인덱스 미사용)."""
+    archive = FixtureArchive()
+    targets = {k: cfg for k, cfg in sites.items() if cfg.get("strategy", "html") != "selenium"}
+    skipped = len(sites) - len(targets)
+
+    def record_site(key: str, cfg: dict):
+        rate_limiter = DomainRateLimiter(
+            default_delay=cfg.get("rate_limit_seconds", 2.0),
+            burst=cfg.get("rate_limit_burst", 1),
+        )
+        crawler = create_crawler(cfg, rate_limiter)
+        adapter = _RecordingAdapter(archive)
+        crawler.session.mount("https://", adapter)
+        crawler.session.mount("http://", adapter)
+        try:
+            articles = crawler.crawl()
+            print(f"💾 {key}: 기사 {len(articles)}건")
+        except Exception as e:
+            print(f"⚠️  {key}: 녹화 실패 ({e})")
+        finally:
+            crawler.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for key, cfg in targets.items():
+            executor.submit(record_site, key, cfg)
+
+    archive.save(archive_path, meta={
+        "recorded_at": datetime.now().isoformat(),
+        "sites": sorted(targets),
+    })
+    print(f"\n✅ {len(archive.entries)}개 응답 저장: {archive_path}"
+          f" (Selenium 사이트 {skipped}개 제외)")
+
+
+class ReplayServer:
+    """
+    아카이브 재생 서버. 원본 호스트(scheme://host)마다 127.0.0.1의 포트 하나를 연다.
+
+    Args:
+        latency_ms / jitter_ms: 응답 지연 (latency ± jitter 균등 분포)
+        error_rate: 이 확률로 error_status 응답을 주입
+    """
+
+    def __init__(self, archive: FixtureArchive, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = None):
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.origin_map = {}  # 원본 origin → 재생 origin
+        self._random = random.Random(seed)
+        self._servers = []
+        self._rewritten = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "served": 0, "not_modified": 0, "errors": 0, "misses": 0}
+
+    def start(self) -> "ReplayServer":
+        for origin in self.archive.origins():
+            httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_for(origin))
+            httpd.daemon_threads = True
+            self.origin_map[origin] = f"http://127.0.0.1:{httpd.server_address[1]}"
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            self._servers.append(httpd)
+        return self
+
+    def stop(self):
+        for httpd in self._servers:
+            httpd.shutdown()
+            httpd.server_close()
+        self._servers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def rewrite_url(self, url: str) -> str:
+        origin = _origin(url)
+        return self.origin_map[origin] + url[len(origin):] if origin in self.origin_map else url
+
+    def rewrite_sites(self, sites: dict) -> dict:
+        """sites.yaml 사이트 설정의 URL을 재생 서버 주소로 바꾼 사본"""
+        rewritten = copy.deepcopy(sites)
+        for cfg in rewritten.values():
+            for field in ("url", "rss_url", "link_pattern"):
+                if cfg.get(field):
+                    cfg[field] = self.rewrite_url(cfg[field])
+        return rewritten
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _body_for(self, entry: dict, body: bytes) -> bytes:
+        """텍스트 응답 본문의 원본 URL을 재생 서버 주소로 치환 (캐시)"""
+        content_type = entry["headers"].get("Content-Type", "")
+        if not any(t in content_type for t in _TEXT_TYPES):
+            return body
+        with self._lock:
+            cached = self._rewritten.get(entry["body"])
+        if cached is not None:
+            return cached
+        for origin, local in self.origin_map.items():
+            host = origin.split("://", 1)[1].encode()
+            for scheme in (b"https://", b"http://"):
+                body = body.replace(scheme + host, local.encode())
+        with self._lock:
+            self._rewritten[entry["body"]] = body
+        return body
+
+    def _handler_for(self, origin: str):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._count("requests")
+                delay = server.latency_ms + server._random.uniform(-server.jitter_ms, server.jitter_ms)
+                if delay > 0:
+                    time.sleep(delay / 1000)
+
+                if server.error_rate and server._random.random() < server.error_rate:
+                    server._count("errors")
+                    return self._send(server.error_status, {}, b"")
+
+                found = server.archive.get(origin + self.path)
+                if found is None:
+                    server._count("misses")
+                    return self._send(404, {}, b"")
+                entry, body = found
+                headers = dict(entry["headers"])
+                if "Location" in headers:
+                    headers["Location"] = server.rewrite_url(headers["Location"])
+
+                etag = headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    server._count("not_modified")
+                    return self._send(304, headers, b"")
+
+                server._count("served")
+                self._send(entry["status"], headers, server._body_for(entry, body))
+
+            def _send(self, status: int, headers: dict, body: bytes):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def bench(config: dict, archive: FixtureArchive, args) -> dict:
+    """재생 서버를 상대로 crawl_all_sites를 실행하고 처리량 지표를 반환한다."""
+    recorded = set(archive.origins())
+    sites = {
+        key: cfg for key, cfg in config.get("sites", {}).items()
+        if cfg.get("strategy", "html") != "selenium"
+        and _origin(cfg.get("rss_url") or cfg.get("url", "")) in recorded
+    }
+    if args.site:
+        sites = {k: v for k, v in sites.items() if k in args.site}
+    if not sites:
+        raise SystemExit("❌ 아카이브에 녹화된 사이트가 없습니다")
+
+    with ReplayServer(archive, args.latency_ms, args.jitter_ms, args.error_rate, seed=args.seed) as server:
+        bench_config = copy.deepcopy(config)
+        bench_config["sites"] = server.rewrite_sites(sites)
+        for cfg in [bench_config.get("defaults", {}), *bench_config["sites"].values()]:
+            if "rate_limit_seconds" in cfg:
+                cfg["rate_limit_seconds"] *= args.rate_limit_scale
+
+        started = time.time()
+        _, report = crawl_all_sites(
+            bench_config,
+            site_keys=list(sites),
+            max_connections=args.max_connections,
+            use_http_cache=False,
+            use_seen_index=False,
+            use_site_health=False,
+        )
+        wall = time.time() - started
+        stats = dict(server.stats)
+
+    elapsed = [info["elapsed_seconds"] for info in report["sites"].values()]
+    return {
+        "sites": len(sites),
+        "success": report["summary"]["success"],
+        "failed": report["summary"]["failed"],
+        "articles": report["summary"]["total_articles"],
+        "wall_seconds": round(wall, 2),
+        "requests": stats["requests"],
+        "pages_per_second": round(stats["requests"] / wall, 2) if wall else 0.0,
+        "site_p50_seconds": _percentile(elapsed, 50),
+        "site_p95_seconds": _percentile(elapsed, 95),
+        # Linux ru_maxrss 단위는 KB (재생 서버 스레드 포함)
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "server": stats,
+        "settings": {
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate,
+            "rate_limit_scale": args.rate_limit_scale, "max_connections": args.max_connections,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티사이트 크롤러 녹화/재생 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p):
+        p.add_argument("--config", default=str(DEFAULT_CONFIG), help="sites.yaml 경로")
+        p.add_argument("--archive", default=str(DEFAULT_ARCHIVE), help="fixture 아카이브(zip) 경로")
+        p.add_argument("--site", nargs="+", default=None, help="특정 사이트 키만")
+
+    def add_replay(p):
+        p.add_argument("--latency-ms", type=float, default=0, help="응답 지연 (ms)")
+        p.add_argument("--jitter-ms", type=float, default=0, help="지연 지터 (± ms)")
+        p.add_argument("--error-rate", type=float, default=0.0, help="에러 응답 주입 확률 (0~1)")
+        p.add_argument("--seed", type=int, default=42, help="지연/에러 주입 난수 시드")
+
+    p_record = sub.add_parser("record", help="라이브 사이트 응답을 아카이브에 녹화")
+    add_common(p_record)
+    p_record.add_argument("--workers", type=int, default=8, help="동시에 녹화할 사이트 수")
+
+    p_serve = sub.add_parser("serve", help="아카이브를 로컬 HTTP 서버로 재생")
+    add_common(p_serve)
+    add_replay(p_serve)
+
+    p_bench = sub.add_parser("bench", help="재생 서버를 상대로 crawl_all_sites 벤치마크")
+    add_common(p_bench)
+    add_replay(p_bench)
+    p_bench.add_argument("--rate-limit-scale", type=float, default=1.0,
+                         help="sites.yaml 레이트 리밋 배율 (0이면 레이트 리밋 없이 측정)")
+    p_bench.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS,
+                         help=f"전체 동시 요청 상한 (기본: {DEFAULT_MAX_CONNECTIONS})")
+    p_bench.add_argument("--json", default=None, help="결과를 JSON으로 저장할 경로")
+
+    args = parser.parse_args()
+    config = load_config(args.config)
+    archive_path = Path(args.archive)
+
+    if args.command == "record":
+        sites = config.get("sites", {})
+        if args.site:
+            sites = {k: v for k, v in sites.items() if k in args.site}
+        record(sites, archive_path, workers=args.workers)
+        return
+
+    if not archive_path.exists():
+        print(f"❌ 아카이브가 없습니다: {archive_path} (record로 먼저 녹화)")
+        sys.exit(1)
+    archive = FixtureArchive.load(archive_path)
+
+    if args.command == "serve":
+        with ReplayServer(archive, args.latency_ms, args.jitter_ms, args.error_rate, seed=args.seed) as server:
+            for origin, local in server.origin_map.items():
+                print(f"  {origin:<45} → {local}")
+            print(f"\n재생 중 ({len(archive.entries)}개 응답). Ctrl+C로 종료")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                print(f"\n{server.stats}")
+        return
+
+    result = bench(config, archive, args)
+    print("\n" + "=" * 60)
+    print(f"📈 재생 벤치마크: 사이트 {result['sites']}개 | 성공 {result['success']} | 실패 {result['failed']}")
+    print(f"   요청 {result['requests']}건 / {result['wall_seconds']}s = {result['pages_per_second']} pages/s")
+    print(f"   사이트별 소요 p50 {result['site_p50_seconds']}s | p95 {result['site_p95_seconds']}s")
+    print(f"   최대 RSS {result['peak_rss_mb']} MB | 서버 {result['server']}")
+    print("=" * 60)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
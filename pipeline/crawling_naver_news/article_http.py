@@ -0,0 +1,174 @@
+"""
+네이버 뉴스 기사 상세 HTTP 수집기
+- 브라우저 없이 requests + lxml로 기사 본문(#dic_area) 추출
+- 반응 수는 좋아요 API(news.like.naver.com), 댓글 수는 댓글 API(apis.naver.com/commentBox) JSON 응답에서 추출
+- 커넥션 풀을 공유하는 세션 + ThreadPoolExecutor로 동시 수집 (동시 요청 수 제한)
+- 본문이나 카운터를 얻지 못한 기사는 None을 반환 → 호출 측에서 Selenium으로 폴백
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# lxml 우선, 없으면 BeautifulSoup 내장 파서로 폴백
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup
+    LXML_AVAILABLE = False
+
+DEFAULT_WORKERS = 8
+REQUEST_TIMEOUT = 10
+
+# https://n.news.naver.com/mnews/article/{oid}/{aid} (또는 /article/{oid}/{aid})
+_ARTICLE_ID_RE = re.compile(r'/article/(?:comment/)?(\d+)/(\d+)')
+# JSONP 응답 본문: _callback({...});
+_JSONP_RE = re.compile(r'^[^(]*\((.*)\)\s*;?\s*$', re.DOTALL)
+
+LIKE_API_URL = 'https://news.like.naver.com/v1/search/contents'
+COMMENT_API_URL = 'https://apis.naver.com/commentBox/cbox/web_naver_list_jsonp.json'
+
+
+def create_session(user_agent: str, pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """동시 수집 워커 수만큼 커넥션을 유지하는 세션"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept-Language': 'ko-KR,ko;q=0.9',
+    })
+    return session
+
+
+def parse_article_ids(article_url: str) -> Optional[tuple[str, str]]:
+    """기사 URL에서 (언론사 ID, 기사 ID) 추출"""
+    match = _ARTICLE_ID_RE.search(article_url)
+    return match.groups() if match else None
+
+
+def extract_article_body(html: str) -> str:
+    """기사 HTML에서 #dic_area 본문 텍스트 추출 (줄바꿈 보존)"""
+    if LXML_AVAILABLE:
+        tree = lxml.html.fromstring(html)
+        nodes = tree.xpath('//*[@id="dic_area"]')
+        if not nodes:
+            return ""
+        body = nodes[0]
+        for bad in body.xpath('.//script | .//style'):
+            bad.drop_tree()
+        for br in body.xpath('.//br'):
+            br.tail = '\n' + (br.tail or '')
+        text = body.text_content()
+    else:
+        body = BeautifulSoup(html, 'html.parser').select_one('#dic_area')
+        if not body:
+            return ""
+        for bad in body.select('script, style'):
+            bad.decompose()
+        for br in body.find_all('br'):
+            br.replace_with('\n')
+        text = body.get_text()
+
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def _parse_jsonp(text: str) -> dict:
+    match = _JSONP_RE.match(text.strip())
+    return json.loads(match.group(1) if match else text)
+
+
+def fetch_reaction_count(session: requests.Session, oid: str, aid: str, referer: str) -> Optional[int]:
+    """좋아요 API에서 반응 수 합계 조회 (실패 시 None)"""
+    try:
+        resp = session.get(
+            LIKE_API_URL,
+            params={'q': f'NEWS[ne_{oid}_{aid}]'},
+            headers={'Referer': referer},
+            timeout=REQUEST_TIMEOUT
+        )
+        resp.raise_for_status()
+        contents = _parse_jsonp(resp.text).get('contents') or []
+        if not contents:
+            return None
+        return sum(int(r.get('count', 0)) for r in contents[0].get('reactions', []))
+    except (requests.RequestException, ValueError, AttributeError):
+        return None
+
+
+def fetch_comment_count(session: requests.Session, oid: str, aid: str, referer: str) -> Optional[int]:
+    """댓글 API에서 댓글 수 조회 (Referer 필수, 실패 시 None)"""
+    try:
+        resp = session.get(
+            COMMENT_API_URL,
+            params={
+                'ticket': 'news',
+                'templateId': 'default_society',
+                'pool': 'cbox5',
+                'lang': 'ko',
+                'country': 'KR',
+                'objectId': f'news{oid},{aid}',
+                'pageSize': 1,
+                'page': 1,
+            },
+            headers={'Referer': referer},
+            timeout=REQUEST_TIMEOUT
+        )
+        resp.raise_for_status()
+        data = _parse_jsonp(resp.text)
+        if not data.get('success'):
+            return None
+        return int(data['result']['count']['comment'])
+    except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def fetch_article_http(session: requests.Session, article_url: str) -> Optional[dict]:
+    """
+    기사 하나의 본문과 반응/댓글 수를 HTTP로 수집.
+    본문 또는 카운터를 하나라도 얻지 못하면 None (Selenium 폴백 대상).
+    """
+    ids = parse_article_ids(article_url)
+    if not ids:
+        return None
+
+    try:
+        resp = session.get(article_url, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        content = extract_article_body(resp.text)
+    except (requests.RequestException, ValueError):
+        return None
+    if not content:
+        return None
+
+    oid, aid = ids
+    reaction_count = fetch_reaction_count(session, oid, aid, article_url)
+    comment_count = fetch_comment_count(session, oid, aid, article_url)
+    if reaction_count is None or comment_count is None:
+        return None
+
+    return {
+        'content': content,
+        'comment_count': comment_count,
+        'reaction_count': reaction_count
+    }
+
+
+def fetch_articles_http(
+    session: requests.Session,
+    article_urls: list[str],
+    max_workers: int = DEFAULT_WORKERS
+) -> dict[str, Optional[dict]]:
+    """여러 기사를 동시에 수집. {URL: 결과 또는 None}"""
+    if not article_urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(article_urls))) as executor:
+        results = executor.map(lambda url: fetch_article_http(session, url), article_urls)
+        return dict(zip(article_urls, results))
@@ -2,23 +2,37 @@
 네이버 뉴스 크롤러
 - 크롤링.md 파일의 섹션 URL에서 기사 정보 수집
 - JSON 형태로 저장
+- 이전 실행에서 수집한 기사는 URL 인덱스(cache/seen_urls.sqlite)의 본문/반응 수 재사용
+- 기사 상세는 HTTP로 동시 수집하고(article_http.py), 실패한 기사만 Selenium으로 수집
 """
 
 import gc
-import json
+import queue
 import re
+import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import requests
+
+# 직접 실행 시 패키지 경로 설정 (crawling_sites.utils 공유)
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.utils.driver_pool import build_chrome_options, create_chrome_driver, get_shared_pool
+from crawling_sites.utils.jsonl_store import JsonlWriter, OrderedFlush
+from crawling_sites.utils.page_wait import WAIT_STATS, wait_for_page
+from crawling_sites.utils.seen_index import SeenIndex
+from crawling_naver_news.article_http import DEFAULT_WORKERS, create_session, fetch_articles_http
+
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
 
 def parse_crawling_md(file_path: str) -> list[dict]:
@@ -55,36 +69,17 @@ def parse_crawling_md(file_path: str) -> list[dict]:
     return sections
 
 
-def setup_driver() -> webdriver.Chrome:
-    """Selenium Chrome 드라이버 설정 (메모리 최적화)"""
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36')
+NAVER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
 
-    # 메모리 최적화 옵션 (안정적인 것만)
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-background-networking')
-    options.add_argument('--disable-default-apps')
-    options.add_argument('--disable-sync')
-    options.add_argument('--disable-translate')
-    options.add_argument('--no-first-run')
-    options.add_argument('--blink-settings=imagesEnabled=false')  # 이미지 로딩 비활성화
-    options.add_argument('--js-flags=--max-old-space-size=512')  # JS 힙 제한
 
-    # 시스템 chromedriver 우선 사용, 없으면 webdriver_manager 폴백
-    import shutil
-    chromedriver_path = shutil.which('chromedriver')
-    if chromedriver_path:
-        service = Service(chromedriver_path)
-    else:
-        service = Service(ChromeDriverManager().install())
+# 페이지 준비 대기 상한 (초)
+PAGE_WAIT_TIMEOUT = 10
+COUNT_WAIT_TIMEOUT = 2
 
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+
+def setup_driver() -> webdriver.Chrome:
+    """Selenium Chrome 드라이버 설정 (풀을 쓰지 않는 단독 실행용, 메모리 최적화)"""
+    return create_chrome_driver(build_chrome_options(user_agent=NAVER_USER_AGENT))
 
 
 def extract_articles_from_section(driver: webdriver.Chrome, section_url: str, max_articles: int = 10) -> list[dict]:
@@ -93,7 +88,9 @@ def extract_articles_from_section(driver: webdriver.Chrome, section_url: str, ma
     
     try:
         driver.get(section_url)
-        time.sleep(2)  # 페이지 로딩 대기
+        # 기사 목록이 렌더링될 때까지만 대기 (기존 고정 2초)
+        wait_for_page(driver, selector='.sa_text_title', timeout=PAGE_WAIT_TIMEOUT,
+                      stats_key='naver:section', baseline=2)
         
         # 기사 목록 추출 (sa_text_title 클래스를 가진 링크)
         article_elements = driver.find_elements(By.CSS_SELECTOR, '.sa_text_title')[:max_articles]
@@ -143,6 +140,15 @@ def extract_articles_from_section(driver: webdriver.Chrome, section_url: str, ma
     return articles
 
 
+# URL 인덱스 재사용 기준 (댓글/반응 수는 수집 시점 스냅샷이므로 하루 이내만 재사용)
+SEEN_MAX_AGE_HOURS = 24
+
+
+def _article_key(article_url: str) -> str:
+    """섹션마다 달라지는 쿼리(sid 등)를 제거한 기사 URL"""
+    return article_url.split('?')[0]
+
+
 def get_article_full_content(driver: webdriver.Chrome, article_url: str) -> dict:
     """개별 기사 페이지에서 본문과 댓글/반응 수 추출"""
     result = {
@@ -153,7 +159,11 @@ def get_article_full_content(driver: webdriver.Chrome, article_url: str) -> dict
     
     try:
         driver.get(article_url)
-        time.sleep(1)
+        # 본문 렌더링 후, 비동기로 채워지는 반응/댓글 수 영역까지 짧게 대기 (기존 고정 1초)
+        wait_for_page(driver, selector='#dic_area', timeout=PAGE_WAIT_TIMEOUT,
+                      stats_key='naver:article', baseline=1)
+        wait_for_page(driver, selector='.u_likeit_list_count', timeout=COUNT_WAIT_TIMEOUT,
+                      stats_key='naver:reactions')
         
         # 1. 본문 추출
         try:
@@ -188,13 +198,145 @@ def get_article_full_content(driver: webdriver.Chrome, article_url: str) -> dict
     return result
 
 
+def crawl_section(
+    driver: webdriver.Chrome,
+    section: dict,
+    articles_per_section: int = 10,
+    fetch_full_content: bool = True,
+    seen_index: Optional[SeenIndex] = None,
+    session: Optional[requests.Session] = None,
+    http_workers: int = DEFAULT_WORKERS
+) -> list[dict]:
+    """
+    섹션 하나의 기사 목록과 (선택) 본문/반응 수를 수집.
+    session이 있으면 상세 페이지를 HTTP로 먼저 동시 수집하고, 실패한 기사만 Selenium으로 연다.
+    """
+    # 섹션에서 기사 목록 추출 (요약본만 있음)
+    articles = extract_articles_from_section(
+        driver, 
+        section['section_url'],
+        max_articles=articles_per_section
+    )
+    
+    print(f"    → {len(articles)}개 기사 발견")
+    
+    # 개별 기사 상세 페이지 진입 (본문 + 반응)
+    if fetch_full_content and articles:
+        print(f"    → 본문 및 반응 수집 중...")
+        details_by_link = {}
+        for article in articles:
+            key = _article_key(article['link'])
+            cached = seen_index.get(key, max_age_seconds=SEEN_MAX_AGE_HOURS * 3600) if seen_index else None
+            if cached and cached['content']:
+                details_by_link[article['link']] = {'content': cached['content'], **cached['extra']}
+        
+        pending = [a['link'] for a in articles if a['link'] not in details_by_link]
+        fetched = fetch_articles_http(session, pending, http_workers) if session else {}
+        fallback = [link for link in pending if not fetched.get(link)]
+        if session and pending:
+            print(f"       HTTP {len(pending) - len(fallback)}/{len(pending)}건"
+                  f" | Selenium 폴백 {len(fallback)}건")
+        
+        for link in pending:
+            details = fetched.get(link) or get_article_full_content(driver, link)
+            details_by_link[link] = details
+            if seen_index and details['content']:
+                seen_index.put(_article_key(link), details['content'], extra={
+                    'comment_count': details['comment_count'],
+                    'reaction_count': details['reaction_count'],
+                })
+        
+        for article in articles:
+            details = details_by_link[article['link']]
+            
+            # 상세 내용 업데이트
+            if details['content']:
+                article['content'] = details['content'] # 본문 덮어쓰기
+            
+            article['comment_count'] = details['comment_count']
+            article['reaction_count'] = details['reaction_count']
+    
+    return articles
+
+
+def _section_worker(
+    pool,
+    tasks: queue.Queue,
+    results: dict,
+    total: int,
+    articles_per_section: int,
+    fetch_full_content: bool,
+    seen_index: Optional[SeenIndex],
+    use_http_fast_path: bool,
+    http_workers: int,
+    stop: threading.Event,
+    ordered: OrderedFlush
+):
+    """
+    큐에서 섹션을 꺼내 처리하는 워커.
+    워커마다 HTTP 세션을 따로 두고, 섹션마다 공용 WebDriver 풀에서 브라우저를 임대한다
+    (페이지 수가 쌓이면 풀이 재생성). 끝난 섹션은 ordered에 넘겨 섹션 순서대로 출력 파일에 기록하고
+    results에는 기사 수(실패 시 예외)만 남긴다.
+    """
+    session = create_session(NAVER_USER_AGENT, http_workers) if (use_http_fast_path and fetch_full_content) else None
+    try:
+        while not stop.is_set():
+            try:
+                i, section = tasks.get_nowait()
+            except queue.Empty:
+                return
+            
+            print(f"\n[{i + 1}/{total}] {section['main_category']} > {section['sub_category']}")
+            print(f"    URL: {section['section_url']}")
+            
+            try:
+                with pool.lease(user_agent=NAVER_USER_AGENT) as driver:
+                    articles = crawl_section(
+                        driver, section, articles_per_section, fetch_full_content,
+                        seen_index, session, http_workers
+                    )
+                    
+                    # 메모리 정리
+                    try:
+                        driver.execute_script("window.gc && window.gc();")
+                    except:
+                        pass
+            except BaseException as e:
+                results[i] = e
+                stop.set()
+                return
+            
+            results[i] = len(articles)
+            ordered.put(i, (section, articles))
+            
+            # 속도 제한
+            gc.collect()
+            time.sleep(0.5)
+    finally:
+        if session:
+            session.close()
+
+
 def crawl_news(
     crawling_md_path: str,
     output_path: str,
     articles_per_section: int = 10,
-    fetch_full_content: bool = True
+    fetch_full_content: bool = True,
+    use_seen_index: bool = True,
+    use_http_fast_path: bool = True,
+    http_workers: int = DEFAULT_WORKERS,
+    workers: int = 1
 ) -> dict:
-    """메인 크롤링 함수"""
+    """
+    메인 크롤링 함수
+
+    Args:
+        output_path: 결과 JSONL 경로 (.zst로 끝나면 zstd 압축). 섹션이 끝날 때마다 기록되므로
+                     중단되어도 그때까지 수집한 기사는 남는다. 기사는 이 파일에만 남고 반환값은 집계뿐이다.
+        use_http_fast_path: 기사 상세를 requests로 먼저 수집 (실패 시에만 Selenium)
+        http_workers: HTTP 상세 수집 동시 요청 수 (워커당)
+        workers: 동시에 처리할 섹션 수 (WebDriver 풀 크기를 넘으면 풀 크기로 제한)
+    """
     
     print("=" * 60)
     print("네이버 뉴스 크롤러 시작")
@@ -204,72 +346,75 @@ def crawl_news(
     sections = parse_crawling_md(crawling_md_path)
     print(f"\n총 {len(sections)}개 섹션 발견")
     
-    # 드라이버 설정
-    driver = setup_driver()
+    crawled_at = datetime.now().isoformat()
+    pool = get_shared_pool()
+    seen_index = SeenIndex() if (use_seen_index and fetch_full_content) else None
     
-    result = {
-        'crawled_at': datetime.now().isoformat(),
-        'total_sections': len(sections),
-        'total_articles': 0,
-        'categories': []
-    }
+    workers = max(1, min(workers, pool.size, len(sections) or 1))
+    if workers > 1:
+        print(f"섹션 병렬 수집: 워커 {workers}개 (WebDriver 풀 크기 {pool.size})")
+    
+    tasks = queue.Queue()
+    for task in enumerate(sections):
+        tasks.put(task)
+    results = {}
+    stop = threading.Event()
+    writer = JsonlWriter(output_path, meta={'crawled_at': crawled_at, 'total_sections': len(sections)})
+    
+    def write_section(done):
+        section, articles = done
+        category_id = writer.add_category({
+            'main_category': section['main_category'],
+            'sub_category': section['sub_category'],
+            'section_url': section['section_url'],
+            'article_count': len(articles),
+        })
+        for article in articles:
+            writer.add_item(category_id, article)
+    
+    # 병렬 워커가 끝낸 섹션도 크롤링.md 순서대로 기록
+    ordered = OrderedFlush(write_section)
+    worker_args = (
+        pool, tasks, results, len(sections), articles_per_section, fetch_full_content,
+        seen_index, use_http_fast_path, http_workers, stop, ordered
+    )
     
     try:
-        for i, section in enumerate(sections, 1):
-            print(f"\n[{i}/{len(sections)}] {section['main_category']} > {section['sub_category']}")
-            print(f"    URL: {section['section_url']}")
-            
-            # 섹션에서 기사 목록 추출 (요약본만 있음)
-            articles = extract_articles_from_section(
-                driver, 
-                section['section_url'],
-                max_articles=articles_per_section
-            )
-            
-            print(f"    → {len(articles)}개 기사 발견")
-            
-            # 개별 기사 상세 페이지 진입 (본문 + 반응)
-            if fetch_full_content and articles:
-                print(f"    → 본문 및 반응 수집 중...")
-                for j, article in enumerate(articles):
-                    details = get_article_full_content(driver, article['link'])
-                    
-                    # 상세 내용 업데이트
-                    if details['content']:
-                        article['content'] = details['content'] # 본문 덮어쓰기
-                    
-                    article['comment_count'] = details['comment_count']
-                    article['reaction_count'] = details['reaction_count']
-                    
-                    # 진행 상황 표시 (5개마다)
-                    if (j + 1) % 5 == 0:
-                        print(f"       {j + 1}/{len(articles)} 완료")
-            
-            # 결과에 추가
-            category_data = {
-                'main_category': section['main_category'],
-                'sub_category': section['sub_category'],
-                'section_url': section['section_url'],
-                'article_count': len(articles),
-                'articles': articles
-            }
-            result['categories'].append(category_data)
-            result['total_articles'] += len(articles)
-            
-            # 메모리 정리 + 속도 제한
-            try:
-                driver.execute_script("window.gc && window.gc();")
-            except:
-                pass
-            gc.collect()
-            time.sleep(0.5)
+        if workers == 1:
+            _section_worker(*worker_args)
+        else:
+            threads = [
+                threading.Thread(target=_section_worker, args=worker_args, name=f"naver-section-{n}")
+                for n in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        # 모든 섹션이 끝났으면 정상 종료 표시 (요약 레코드)
+        if not any(isinstance(r, BaseException) for r in results.values()):
+            writer.finish({'total_articles': writer.item_count})
     
     finally:
-        driver.quit()
+        ordered.drain()  # 실패한 섹션 뒤에 끝나 있던 섹션도 남긴다
+        writer.close()  # 실패/중단 시 end 레코드 없이 닫혀 부분 결과로 남음
+        print(f"\n{pool.summary()}")
+        print(WAIT_STATS.summary())
+        if seen_index:
+            print(f"{seen_index.summary()}")
+            seen_index.close()
     
-    # JSON 저장
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    # 실패한 섹션이 있으면 순차 실행과 동일하게 예외 전파 (출력 파일에는 끝난 섹션까지 남음)
+    for i in sorted(results):
+        if isinstance(results[i], BaseException):
+            raise results[i]
+    
+    result = {
+        'crawled_at': crawled_at,
+        'total_sections': len(sections),
+        'total_articles': sum(results.values()),
+    }
     
     print("\n" + "=" * 60)
     print(f"크롤링 완료!")
@@ -282,15 +427,26 @@ def crawl_news(
 
 
 if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="네이버 뉴스 크롤러")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="동시에 처리할 섹션 수 (기본: 2, WebDriver 풀 크기 CHROME_POOL_SIZE 이하)")
+    parser.add_argument("--articles-per-section", type=int, default=10, help="섹션당 기사 수 (기본: 10)")
+    parser.add_argument("--output", default="news_data.jsonl",
+                        help="출력 파일 이름 (기본: news_data.jsonl, .jsonl.zst면 zstd 압축)")
+    args = parser.parse_args()
+    
     # 경로 설정
     base_dir = Path(__file__).parent
     crawling_md_path = base_dir / '크롤링.md'
-    output_path = base_dir / 'news_data.json'
+    output_path = base_dir / args.output
     
     # 크롤링 실행
     crawl_news(
         crawling_md_path=str(crawling_md_path),
         output_path=str(output_path),
-        articles_per_section=10,  # 섹션당 기사 수
-        fetch_full_content=True   # 본문 및 반응 수집 여부
+        articles_per_section=args.articles_per_section,  # 섹션당 기사 수
+        fetch_full_content=True,   # 본문 및 반응 수집 여부
+        workers=args.workers
     )
@@ -0,0 +1,196 @@
+"""
+비동기 사이트 크롤링 엔진.
+
+sites.yaml의 모든 사이트를 asyncio 이벤트 루프에서 동시에 크롤링한다.
+전략 클래스(RSS/HTML/Selenium)는 requests·feedparser·selenium 기반의 블로킹 코드이므로
+각 네트워크 단계를 전용 스레드 풀에서 실행하고, 엔진은 동시성만 조율한다.
+
+동시성 제어:
+- 전체 연결 수: max_connections (asyncio.Semaphore) — 동시에 진행 중인 HTTP/브라우저 요청 상한
+- Selenium 사이트: selenium_workers — 동시에 띄우는 Chrome 인스턴스 상한
+- 사이트 내 상세 페이지: detail_concurrency (sites.yaml) — Selenium은 드라이버 공유로 항상 1
+- 도메인별 요청 간격: AsyncDomainRateLimiter (rate_limit_seconds/rate_limit_burst) — 연결 슬롯을 잡은 뒤 예약
+  (슬롯 대기열에서 보낸 시간이 요청 간격을 잡아먹지 않도록). 목록 페이지네이션은 crawler.list_pages()를
+  페이지마다 한 단계씩 스레드 풀에서 실행하고, 페이지 사이 대기는 이벤트 루프에서 하므로
+  기다리는 동안 연결 슬롯도 스레드도 잡지 않는다.
+
+사용 예:
+    engine = AsyncCrawlEngine(AsyncDomainRateLimiter(default_delay=2.0), max_connections=8)
+    results = engine.run(target_sites)  # {site_key: SiteResult} (입력 순서 유지)
+"""
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .strategies import RSSCrawler, HTMLCrawler, SeleniumCrawler
+
+logger = logging.getLogger("crawl_engine")
+
+# 전략별 크롤러 매핑
+STRATEGY_MAP = {
+    "rss": RSSCrawler,
+    "html": HTMLCrawler,
+    "selenium": SeleniumCrawler,
+}
+
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_SELENIUM_WORKERS = 2
+
+
+@dataclass
+class SiteResult:
+    """사이트 단위 크롤링 결과"""
+    key: str
+    status: str  # success | failed
+    articles: list = field(default_factory=list)
+    elapsed: float = 0.0
+    error: str = ""
+    latencies: list = field(default_factory=list)  # 성공한 HTTP 요청별 소요 시간 (초)
+
+
+def create_crawler(site_config: dict, rate_limiter, http_cache=None, seen_index=None):
+    """사이트 설정에 따라 적절한 크롤러 인스턴스를 생성한다."""
+    strategy = site_config.get("strategy", "html")
+    crawler_class = STRATEGY_MAP.get(strategy)
+    if not crawler_class:
+        raise ValueError(f"지원하지 않는 전략: {strategy}")
+    return crawler_class(site_config, rate_limiter, http_cache, seen_index)
+
+
+class AsyncCrawlEngine:
+    """사이트 간 병렬 크롤링 엔진 (asyncio + 블로킹 전략용 스레드 풀)"""
+
+    def __init__(
+        self,
+        rate_limiter,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        selenium_workers: int = DEFAULT_SELENIUM_WORKERS,
+        http_cache=None,
+        seen_index=None,
+    ):
+        """
+        Args:
+            rate_limiter: AsyncDomainRateLimiter 인스턴스 (도메인별 요청 간격, DomainRateLimiter도 허용)
+            max_connections: 전체 동시 요청 상한
+            selenium_workers: 동시에 실행할 Selenium 사이트 수 상한
+            http_cache: utils.http_cache.HTTPCache (조건부 요청 캐시, 선택)
+            seen_index: utils.seen_index.SeenIndex (수집 완료 URL 인덱스, 선택)
+        """
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.seen_index = seen_index
+        self.max_connections = max(1, max_connections)
+        self.selenium_workers = max(1, selenium_workers)
+
+    def run(self, sites: dict, on_result=None) -> dict:
+        """
+        동기 진입점. {site_key: site_config}를 크롤링해 {site_key: SiteResult}를 반환한다.
+        on_result(SiteResult)를 주면 사이트가 끝날 때마다 (완료 순서로) 호출한다.
+        """
+        return asyncio.run(self.crawl_sites(sites, on_result))
+
+    async def crawl_sites(self, sites: dict, on_result=None) -> dict:
+        """모든 사이트를 동시에 크롤링한다. 결과는 입력 순서를 유지한다."""
+        self._connections = asyncio.Semaphore(self.max_connections)
+        self._selenium_slots = asyncio.Semaphore(self.selenium_workers)
+        # 연결 슬롯 + 크롤러 정리(close) 호출용 여유분
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_connections + self.selenium_workers,
+            thread_name_prefix="crawl-io",
+        )
+
+        async def crawl_and_report(key, cfg):
+            result = await self.crawl_site(key, cfg)
+            if on_result:
+                on_result(result)
+            return result
+
+        try:
+            results = await asyncio.gather(
+                *(crawl_and_report(key, cfg) for key, cfg in sites.items())
+            )
+        finally:
+            self._executor.shutdown(wait=False)
+        return {result.key: result for result in results}
+
+    async def crawl_site(self, key: str, cfg: dict) -> SiteResult:
+        """단일 사이트 크롤링: 목록 → 상세 본문 → 정규화"""
+        if cfg.get("strategy", "html") == "selenium":
+            async with self._selenium_slots:
+                return await self._crawl_site(key, cfg)
+        return await self._crawl_site(key, cfg)
+
+    async def _crawl_site(self, key: str, cfg: dict) -> SiteResult:
+        start_time = time.time()
+        crawler = None
+        try:
+            crawler = create_crawler(cfg, self.rate_limiter, self.http_cache, self.seen_index)
+            domain = crawler._get_domain()
+
+            # 1단계: 기사 목록 (페이지마다 연결 슬롯을 잡고 요청 간격을 기다린 뒤 한 페이지씩)
+            pages = crawler.list_pages()
+            while True:
+                done, articles = await self._io(_next_page, pages, domain=domain)
+                if done:
+                    break
+
+            # 2단계: 상세 본문 (Selenium은 드라이버를 공유하므로 순차)
+            pending = crawler.articles_needing_content(articles)
+            if pending:
+                if cfg.get("strategy", "html") == "selenium":
+                    concurrency = 1
+                else:
+                    concurrency = max(1, cfg.get("detail_concurrency", 1))
+                site_slots = asyncio.Semaphore(concurrency)
+
+                async def fetch_detail(i, article):
+                    async with site_slots:
+                        await self._io(crawler.fill_article_content, article, i, len(pending), domain=domain)
+
+                await asyncio.gather(*(fetch_detail(i, a) for i, a in enumerate(pending)))
+
+            # 3단계: 정규화
+            results = crawler.finalize(articles)
+            return SiteResult(key, "success", results, time.time() - start_time, latencies=crawler.latencies)
+
+        except Exception as e:
+            logger.debug(f"[{key}] 크롤링 실패 상세:", exc_info=True)
+            return SiteResult(
+                key, "failed", elapsed=time.time() - start_time, error=str(e)[:100],
+                latencies=crawler.latencies if crawler is not None else [],
+            )
+        finally:
+            if crawler is not None:
+                await asyncio.get_running_loop().run_in_executor(self._executor, crawler.close)
+
+    async def _io(self, func, *args, domain: str = None):
+        """
+        블로킹 요청을 연결 슬롯 안에서 스레드 풀로 실행한다.
+        domain을 주면 슬롯을 잡은 뒤 도메인 요청 간격을 예약·대기하고 바로 요청한다.
+        """
+        async with self._connections:
+            if domain is not None:
+                await self._wait_rate_limit(domain)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def _wait_rate_limit(self, domain: str):
+        """도메인 요청 간격 대기"""
+        if self.rate_limiter is None:
+            return
+        if hasattr(self.rate_limiter, "wait_async"):
+            await self.rate_limiter.wait_async(domain)
+        else:
+            await asyncio.to_thread(self.rate_limiter.wait, domain)
+
+
+def _next_page(pages) -> tuple:
+    """목록 페이지 제너레이터를 다음 대기 지점까지 실행한다 → (끝났는지, 기사 목록)"""
+    try:
+        next(pages)
+    except StopIteration as stop:
+        return True, stop.value
+    return False, None
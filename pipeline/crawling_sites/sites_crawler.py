@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """
 멀티사이트 크롤러 오케스트레이터.
-33개 외부 IT 사이트에서 뉴스/보도자료를 수집하여 sites_data.json으로 출력한다.
+33개 외부 IT 사이트에서 뉴스/보도자료를 수집하여 sites_data.jsonl로 출력한다.
 
 사용법:
     python sites_crawler.py                          # 전체 실행
     python sites_crawler.py --category 빅테크_국내     # 카테고리 필터
     python sites_crawler.py --site samsung_newsroom   # 단일 사이트
     python sites_crawler.py --retry-failed            # 실패 사이트 재시도
+    python sites_crawler.py --max-connections 4       # 동시 요청 수 제한
+
+사이트들은 crawling_sites.engine.AsyncCrawlEngine으로 동시에 크롤링되며,
+반환값의 순서는 sites.yaml 순서(카테고리 → 사이트)를 그대로 유지하고,
+출력 파일(utils.jsonl_store)에는 사이트가 끝나는 대로 기사를 한 줄씩 기록한다.
+연속으로 실패하는 사이트는 sites_health.json(utils.site_health)의 서킷 브레이커로 일정 시간 건너뛴다.
 """
 import argparse
 import json
@@ -25,8 +31,15 @@ _current_dir = Path(__file__).resolve().parent
 if str(_current_dir.parent) not in sys.path:
     sys.path.insert(0, str(_current_dir.parent))
 
-from crawling_sites.strategies import RSSCrawler, HTMLCrawler, SeleniumCrawler
-from crawling_sites.utils import DomainRateLimiter, parse_date
+from crawling_sites.engine import (
+    AsyncCrawlEngine, DEFAULT_MAX_CONNECTIONS, DEFAULT_SELENIUM_WORKERS, STRATEGY_MAP,
+)
+from crawling_sites.utils import (
+    AsyncDomainRateLimiter, HTTPCache, SeenIndex, SiteHealth, WAIT_STATS, get_shared_pool, parse_date,
+)
+from crawling_sites.utils.date_parser import set_reference_now
+from crawling_sites.utils.jsonl_store import JsonlWriter, OrderedFlush
+from crawling_sites.utils.site_health import OPEN
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,13 +49,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sites_crawler")
 
-# 전략별 크롤러 매핑
-STRATEGY_MAP = {
-    "rss": RSSCrawler,
-    "html": HTMLCrawler,
-    "selenium": SeleniumCrawler,
-}
-
 
 def load_config(config_path: str) -> dict:
     """sites.yaml 설정 파일을 로드한다."""
@@ -76,15 +82,6 @@ def load_previous_report(report_path: str) -> dict:
         return {}
 
 
-def create_crawler(site_config: dict, rate_limiter: DomainRateLimiter):
-    """사이트 설정에 따라 적절한 크롤러 인스턴스를 생성한다."""
-    strategy = site_config.get("strategy", "html")
-    crawler_class = STRATEGY_MAP.get(strategy)
-    if not crawler_class:
-        raise ValueError(f"지원하지 않는 전략: {strategy}")
-    return crawler_class(site_config, rate_limiter)
-
-
 def filter_sites(
     sites: dict,
     category: str = None,
@@ -158,6 +155,7 @@ def print_summary(report: dict):
         f" | {summary.get('failed', 0)} 실패"
         f" | {summary.get('skipped', 0)} 건너뜀"
         f" | 총 {summary.get('total_articles', 0)}건"
+        f" | {summary.get('wall_seconds', 0)}s"
     )
 
     # 실패 사이트 목록
@@ -178,12 +176,26 @@ def crawl_all_sites(
     retry_failed: bool = False,
     previous_report: dict = None,
     max_articles_override: int = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    selenium_workers: int = DEFAULT_SELENIUM_WORKERS,
+    use_http_cache: bool = True,
+    use_seen_index: bool = True,
+    use_site_health: bool = True,
+    health_path: str = None,
+    writer: JsonlWriter = None,
 ) -> tuple[dict, dict]:
     """
-    모든 사이트를 크롤링하고 결과와 리포트를 반환한다.
+    모든 사이트를 동시에 크롤링하고 집계와 리포트를 반환한다.
+
+    기사는 메모리에 모으지 않는다. writer(JsonlWriter)를 주면 사이트가 끝날 때마다 바로 기록하고
+    (카테고리는 main_category/sub_category 단위) 기록한 기사는 버린다.
+    먼저 끝난 사이트는 앞 사이트가 끝날 때까지 보관했다가 sites.yaml 순서로 기록한다.
+
+    use_site_health가 켜져 있으면 sites_health.json의 사이트별 기록으로
+    서킷이 열린 사이트를 건너뛰고(--site로 직접 지정한 경우 제외) 타임아웃/재시도를 조정한다.
 
     Returns:
-        (sites_data, sites_report) 튜플
+        ({"total_sections", "total_articles"}, sites_report) 튜플
     """
     sites = config.get("sites", {})
 
@@ -197,28 +209,37 @@ def crawl_all_sites(
         for cfg in target_sites.values():
             cfg["max_articles"] = max_articles_override
 
+    # 사이트 건강 기록: 서킷 open 사이트 건너뛰기, 적응형 타임아웃/재시도
+    health = SiteHealth(health_path) if use_site_health else None
+    skipped_sites = {}  # site_key → 다음 시험 요청 시각
+    run_sites = target_sites
+    if health:
+        run_sites = {}
+        for key, cfg in target_sites.items():
+            if health.state(key) == OPEN and not site_keys:
+                skipped_sites[key] = health.retry_after(key)
+                continue
+            run_sites[key] = health.apply(key, cfg)
+
     # 레이트 리미터 초기화
     domain_delays = {}
+    domain_bursts = {}
     for cfg in target_sites.values():
         from urllib.parse import urlparse
         domain = urlparse(cfg.get("url", "")).netloc
-        delay = cfg.get("rate_limit_seconds", 2.0)
-        domain_delays[domain] = delay
+        domain_delays[domain] = cfg.get("rate_limit_seconds", 2.0)
+        domain_bursts[domain] = cfg.get("rate_limit_burst", 1)
 
-    rate_limiter = DomainRateLimiter(
-        default_delay=config.get("defaults", {}).get("rate_limit_seconds", 2.0),
+    defaults = config.get("defaults", {})
+    rate_limiter = AsyncDomainRateLimiter(
+        default_delay=defaults.get("rate_limit_seconds", 2.0),
         domain_delays=domain_delays,
+        burst=defaults.get("rate_limit_burst", 1),
+        domain_bursts=domain_bursts,
     )
 
-    # 결과 데이터 구조
-    now = datetime.now()
-    sites_data = {
-        "crawled_at": now.isoformat(),
-        "source": "multi_site_crawler",
-        "total_sections": 0,
-        "total_articles": 0,
-        "categories": [],
-    }
+    # 상대 시간 "3시간 전" 등은 이 시각 기준으로 변환
+    now = set_reference_now()
 
     # 리포트 구조
     report = {
@@ -238,75 +259,128 @@ def crawl_all_sites(
         "category": category, "site": site_keys, "tier": tier, "retry_failed": retry_failed
     })
 
-    # 카테고리별 크롤링
+    # 전체 사이트 병렬 크롤링
+    started = time.time()
+    http_cache = None
+    if use_http_cache:
+        http_cache = HTTPCache()
+        pruned = http_cache.prune(config.get("defaults", {}).get("http_cache_max_age_days", 14))
+        if pruned:
+            logger.info(f"🧹 HTTP 캐시 만료 항목 {pruned}건 정리")
+    seen_index = None
+    if use_seen_index:
+        seen_index = SeenIndex(max_age_days=config.get("defaults", {}).get("seen_index_max_age_days", 7))
+        pruned = seen_index.prune()
+        if pruned:
+            logger.info(f"🧹 URL 인덱스 만료 항목 {pruned}건 정리")
+    engine = AsyncCrawlEngine(
+        rate_limiter,
+        max_connections=max_connections,
+        selenium_workers=selenium_workers,
+        http_cache=http_cache,
+        seen_index=seen_index,
+    )
+    section_counts = defaultdict(int)  # (main_category, sub_category) → 기사 수
+    site_article_counts = {}
+
+    def write_result(result):
+        if result.status != "success":
+            return
+        cat_name = run_sites[result.key].get("category", "기타")
+        for article in result.articles:
+            sub_name = article.get("press", cat_name)
+            section_counts[(cat_name, sub_name)] += 1
+            if writer is not None:
+                category_id = writer.add_category(
+                    {"main_category": cat_name, "sub_category": sub_name}, key=(cat_name, sub_name)
+                )
+                writer.add_item(category_id, article)
+        site_article_counts[result.key] = len(result.articles)
+        result.articles = []  # 기록한 기사는 들고 있지 않는다 (리포트에는 건수만 필요)
+
+    # 엔진은 완료 순서로 결과를 넘기므로 sites.yaml 순서로 다시 맞춰 기록
+    site_index = {key: i for i, key in enumerate(run_sites)}
+    ordered = OrderedFlush(write_result)
+
+    try:
+        site_results = engine.run(run_sites, on_result=lambda result: ordered.put(site_index[result.key], result))
+        if health:
+            for key, result in site_results.items():
+                health.record(key, result.status == "success", result.latencies, result.error)
+            health.save()
+            logger.info(f"🩺 {health.summary()}")
+    finally:
+        ordered.drain()  # 중단되었어도 끝난 사이트는 남긴다
+        if http_cache:
+            logger.info(f"🗄️  {http_cache.summary()}")
+            http_cache.close()
+        if seen_index:
+            logger.info(f"🗂️  {seen_index.summary()}")
+            seen_index.close()
+        if any(cfg.get("strategy") == "selenium" for cfg in target_sites.values()):
+            logger.info(f"🌐 {get_shared_pool().summary()}")
+            logger.info(WAIT_STATS.summary())
+            report["summary"]["page_waits"] = WAIT_STATS.snapshot()
+    wall_time = time.time() - started
+
+    # 카테고리별 집계 (sites.yaml 순서 유지)
     for cat_name, cat_sites in sites_by_category.items():
         print(f"\n[{cat_name}]")
-        category_articles = []
         report["by_category"][cat_name]["total"] = len(cat_sites)
 
         for key, cfg in cat_sites:
-            start_time = time.time()
+            if key in skipped_sites:
+                entry = health.sites.get(key, {})
+                reason = f"서킷 open, 연속 {entry.get('consecutive_failures', 0)}회 실패"
+                report["sites"][key] = {
+                    "status": "skipped",
+                    "name": cfg.get("name", key),
+                    "reason": reason,
+                    "last_error": entry.get("last_error", ""),
+                    "retry_after": skipped_sites[key],
+                    "strategy": cfg.get("strategy", "html"),
+                }
+                report["summary"]["skipped"] += 1
+                print_site_result(cfg.get("name", key), "skipped", error=f"{reason}, {skipped_sites[key]} 이후 재시도")
+                continue
 
-            try:
-                crawler = create_crawler(cfg, rate_limiter)
-                with crawler:
-                    articles = crawler.crawl()
+            result = site_results[key]
 
-                elapsed = time.time() - start_time
-                category_articles.extend(articles)
+            if result.status == "success":
+                articles_count = site_article_counts[key]
 
                 # 성공 리포트
                 report["sites"][key] = {
                     "status": "success",
                     "name": cfg.get("name", key),
-                    "articles_count": len(articles),
-                    "elapsed_seconds": round(elapsed, 1),
+                    "articles_count": articles_count,
+                    "elapsed_seconds": round(result.elapsed, 1),
                     "strategy": cfg.get("strategy", "html"),
                 }
                 report["summary"]["success"] += 1
-                report["summary"]["total_articles"] += len(articles)
+                report["summary"]["total_articles"] += articles_count
                 report["by_category"][cat_name]["success"] += 1
 
                 print_site_result(
                     cfg.get("name", key), "success",
-                    count=len(articles), elapsed=elapsed,
+                    count=articles_count, elapsed=result.elapsed,
                     strategy=cfg.get("strategy", "html"),
                 )
-
-            except Exception as e:
-                elapsed = time.time() - start_time
-                error_msg = str(e)[:100]
-
+            else:
                 # 실패 리포트
                 report["sites"][key] = {
                     "status": "failed",
                     "name": cfg.get("name", key),
-                    "error": error_msg,
-                    "elapsed_seconds": round(elapsed, 1),
+                    "error": result.error,
+                    "elapsed_seconds": round(result.elapsed, 1),
                     "strategy": cfg.get("strategy", "html"),
                 }
                 report["summary"]["failed"] += 1
                 report["by_category"][cat_name]["failed"] += 1
 
-                print_site_result(cfg.get("name", key), "failed", error=error_msg)
-                logger.debug(f"[{key}] 크롤링 실패 상세:", exc_info=True)
-
-        # 카테고리 데이터 추가
-        if category_articles:
-            # 카테고리 내 사이트별로 sub_category 분리
-            articles_by_site = defaultdict(list)
-            for article in category_articles:
-                articles_by_site[article.get("press", cat_name)].append(article)
-
-            for sub_name, sub_articles in articles_by_site.items():
-                sites_data["categories"].append({
-                    "main_category": cat_name,
-                    "sub_category": sub_name,
-                    "article_count": len(sub_articles),
-                    "articles": sub_articles,
-                })
-                sites_data["total_sections"] += 1
-                sites_data["total_articles"] += len(sub_articles)
+                print_site_result(cfg.get("name", key), "failed", error=result.error)
+
+    report["summary"]["wall_seconds"] = round(wall_time, 1)
 
     # by_category를 일반 dict로 변환 (JSON 직렬화용)
     report["by_category"] = dict(report["by_category"])
@@ -314,7 +388,50 @@ def crawl_all_sites(
     # 요약 출력
     print_summary(report)
 
-    return sites_data, report
+    counts = {"total_sections": len(section_counts), "total_articles": sum(section_counts.values())}
+    return counts, report
+
+
+def save_results(counts: dict, report: dict, writer: JsonlWriter, report_path: str):
+    """스트리밍 출력에 정상 종료 요약을 기록하고 리포트를 JSON 파일로 저장한다."""
+    writer.finish({
+        "total_sections": counts["total_sections"],
+        "total_articles": counts["total_articles"],
+    })
+    logger.info(f"📁 크롤링 데이터 저장: {writer.path} ({writer.item_count}건)")
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    logger.info(f"📋 리포트 저장: {report_path}")
+
+
+def open_output(output_path: str) -> JsonlWriter:
+    """sites_data 스트리밍 출력 (.zst로 끝나면 zstd 압축)"""
+    return JsonlWriter(output_path, meta={
+        "crawled_at": datetime.now().isoformat(),
+        "source": "multi_site_crawler",
+    })
+
+
+def run_sites_crawl(config_path: str = None, output_path: str = None, report_path: str = None) -> tuple[dict, dict]:
+    """
+    기본 경로로 전체 사이트를 크롤링하고 결과를 저장한다.
+    run_daily.py 스테이지 그래프에서 인프로세스로 호출하는 진입점.
+
+    Returns:
+        ({"total_sections", "total_articles"}, sites_report) 튜플 (기사는 output_path에만 기록)
+    """
+    base_dir = Path(__file__).parent
+    config = load_config(config_path or str(base_dir / "config" / "sites.yaml"))
+    report_path = report_path or str(base_dir / "sites_report.json")
+    with open_output(output_path or str(base_dir / "sites_data.jsonl")) as writer:
+        counts, report = crawl_all_sites(
+            config=config,
+            health_path=str(Path(report_path).with_name("sites_health.json")),
+            writer=writer,
+        )
+        save_results(counts, report, writer, report_path)
+    return counts, report
 
 
 def main():
@@ -333,7 +450,8 @@ def main():
     )
 
     parser.add_argument("--config", default=None, help="설정 파일 경로 (기본: config/sites.yaml)")
-    parser.add_argument("--output", default=None, help="출력 파일 경로 (기본: sites_data.json)")
+    parser.add_argument("--output", default=None,
+                        help="출력 파일 경로 (기본: sites_data.jsonl, .jsonl.zst면 zstd 압축)")
     parser.add_argument("--report", default=None, help="리포트 파일 경로 (기본: sites_report.json)")
     parser.add_argument("--category", default=None, help="특정 카테고리만 크롤링")
     parser.add_argument("--site", action="append", default=None, help="특정 사이트만 크롤링 (여러 번 지정 가능)")
@@ -341,13 +459,23 @@ def main():
                         help="특정 티어만 크롤링")
     parser.add_argument("--retry-failed", action="store_true", help="이전에 실패한 사이트만 재시도")
     parser.add_argument("--max-articles", type=int, default=None, help="사이트당 최대 기사 수 오버라이드")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS,
+                        help=f"전체 동시 요청 수 상한 (기본: {DEFAULT_MAX_CONNECTIONS})")
+    parser.add_argument("--selenium-workers", type=int, default=DEFAULT_SELENIUM_WORKERS,
+                        help=f"동시에 실행할 Selenium 사이트 수 (기본: {DEFAULT_SELENIUM_WORKERS})")
+    parser.add_argument("--no-http-cache", action="store_true",
+                        help="조건부 요청 캐시(cache/http_cache.sqlite)를 쓰지 않고 전체 다운로드")
+    parser.add_argument("--no-seen-index", action="store_true",
+                        help="수집 완료 URL 인덱스(cache/seen_urls.sqlite)를 쓰지 않고 모든 상세 페이지 수집")
+    parser.add_argument("--no-site-health", action="store_true",
+                        help="사이트 건강 기록(sites_health.json)의 서킷 브레이커/적응형 타임아웃 미사용")
 
     args = parser.parse_args()
 
     # 경로 설정
     base_dir = Path(__file__).parent
     config_path = args.config or str(base_dir / "config" / "sites.yaml")
-    output_path = args.output or str(base_dir / "sites_data.json")
+    output_path = args.output or str(base_dir / "sites_data.jsonl")
     report_path = args.report or str(base_dir / "sites_report.json")
 
     # 설정 로드
@@ -364,9 +492,10 @@ def main():
         if not previous_report:
             logger.warning("이전 리포트를 찾을 수 없습니다. 전체 사이트를 크롤링합니다.")
 
-    # 크롤링 실행
+    # 크롤링 실행 (중단되면 출력 파일에 끝난 사이트까지 남음)
+    writer = open_output(output_path)
     try:
-        sites_data, report = crawl_all_sites(
+        counts, report = crawl_all_sites(
             config=config,
             category=args.category,
             site_keys=args.site,
@@ -374,19 +503,21 @@ def main():
             retry_failed=args.retry_failed,
             previous_report=previous_report,
             max_articles_override=args.max_articles,
+            max_connections=args.max_connections,
+            selenium_workers=args.selenium_workers,
+            use_http_cache=not args.no_http_cache,
+            use_seen_index=not args.no_seen_index,
+            use_site_health=not args.no_site_health,
+            health_path=str(Path(report_path).with_name("sites_health.json")),
+            writer=writer,
         )
     except KeyboardInterrupt:
+        writer.close()
         logger.info("사용자에 의해 중단되었습니다.")
         sys.exit(130)
 
     # 결과 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(sites_data, f, ensure_ascii=False, indent=2)
-    logger.info(f"📁 크롤링 데이터 저장: {output_path}")
-
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
-    logger.info(f"📋 리포트 저장: {report_path}")
+    save_results(counts, report, writer, report_path)
 
     # 종료 코드
     failed_count = report.get("summary", {}).get("failed", 0)
@@ -7,11 +7,13 @@ import gc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional
+from typing import Generator, Optional
 from urllib.parse import urljoin, urlparse, urlencode, parse_qs, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from ..utils.date_parser import parse_date
+from ..utils.html_parser import SiteParser
 
 
 @dataclass
@@ -46,19 +48,24 @@ class BaseCrawler(ABC):
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
-    def __init__(self, site_config: dict, rate_limiter=None):
+    def __init__(self, site_config: dict, rate_limiter=None, http_cache=None, seen_index=None):
         self.config = site_config
         self.site_key = site_config.get("key", "unknown")
         self.name = site_config.get("name", "Unknown")
         self.url = site_config.get("url", "")
         self.max_articles = site_config.get("max_articles", 10)
         self.timeout = site_config.get("timeout_seconds", 15)
+        self.retry_count = max(1, site_config.get("retry_count", 3))
         self.max_pages = site_config.get("max_pages", 1)
         self.pagination_type = site_config.get("pagination_type", "none")
         self.pagination_param = site_config.get("pagination_param", "page")
         self.pagination_start = site_config.get("pagination_start", 1)
         self.rate_limiter = rate_limiter
+        self.http_cache = http_cache  # utils.http_cache.HTTPCache (없으면 매번 전체 다운로드)
+        self.seen_index = seen_index  # utils.seen_index.SeenIndex (이전 실행에서 수집한 본문 재사용)
         self.logger = logging.getLogger(f"crawler.{self.site_key}")
+        self.parser = SiteParser(site_config.get("selectors", {}))  # 셀렉터 사전 컴파일 (lxml 우선)
+        self.latencies = []  # 성공한 HTTP 요청별 소요 시간(초) — utils.site_health 적응형 타임아웃용
         self._session = None
 
     @property
@@ -82,6 +89,8 @@ class BaseCrawler(ABC):
         3. 각 기사 상세 페이지 본문 수집
         4. 정규화 및 검증
 
+        비동기 엔진(crawling_sites.engine)은 같은 단계 메서드를 직접 조합해 사이트 간 병렬로 실행한다.
+
         Returns:
             news_data.json 호환 딕셔너리 리스트
         """
@@ -89,33 +98,100 @@ class BaseCrawler(ABC):
 
         # 1단계: 기사 목록 수집
         self._wait_rate_limit(domain)
+        articles = self.collect_article_list()
+
+        # 2단계: 상세 페이지 본문 수집
+        pending = self.articles_needing_content(articles)
+        for i, article in enumerate(pending):
+            self._wait_rate_limit(domain)
+            self.fill_article_content(article, i, len(pending))
+
+        # 3단계: 정규화 및 검증
+        return self.finalize(articles)
+
+    def collect_article_list(self) -> list[Article]:
+        """기사 목록을 수집하고 결과를 로깅한다 (실패 시 예외 전파)."""
+        return self.drain_list_pages(self.list_pages())
+
+    def list_pages(self) -> Generator[None, None, list[Article]]:
+        """
+        collect_article_list를 목록 페이지 단위로 나눈 제너레이터.
+        다음 페이지를 요청하기 전 도메인 요청 간격을 기다려야 하는 지점마다 yield하고,
+        끝나면 기사 목록을 반환한다 (StopIteration.value).
+        비동기 엔진은 yield 사이의 대기를 이벤트 루프에서 하므로 대기 중에 스레드도 연결 슬롯도 잡지 않는다.
+        """
         try:
-            articles = self.fetch_article_list()
+            articles = yield from self.iter_list_pages()
         except Exception as e:
             self.logger.error(f"[{self.name}] 기사 목록 수집 실패: {e}")
             raise
 
         self.logger.info(f"[{self.name}] 목록에서 {len(articles)}건 발견")
+        return articles
 
-        # 2단계: 상세 페이지 본문 수집
-        if self.config.get("fetch_full_content", True):
-            for i, article in enumerate(articles):
-                if article.link and not article.content:
-                    self._wait_rate_limit(domain)
-                    try:
-                        full_content = self.fetch_article_content(article.link)
-                        if full_content:
-                            article.content = full_content
-                    except Exception as e:
-                        self.logger.warning(
-                            f"[{self.name}] 상세 페이지 수집 실패 ({i+1}/{len(articles)}): {e}"
-                        )
+    def iter_list_pages(self) -> Generator[None, None, list[Article]]:
+        """
+        페이지별 기사 목록 수집 (페이지네이션이 있는 전략이 재정의, 기본: fetch_article_list 한 번)
+        """
+        articles = self.fetch_article_list()
+        yield from ()
+        return articles
 
-        # 3단계: 정규화 및 검증
+    def drain_list_pages(self, pages: Generator[None, None, list[Article]]) -> list[Article]:
+        """페이지 제너레이터를 끝까지 실행한다 (동기 경로: 페이지 사이에 요청 간격 대기)"""
+        domain = self._get_domain()
+        while True:
+            try:
+                next(pages)
+            except StopIteration as stop:
+                return stop.value
+            self._wait_rate_limit(domain)
+
+    def articles_needing_content(self, articles: list[Article]) -> list[Article]:
+        """
+        상세 페이지 본문 수집이 필요한 기사만 반환한다.
+        URL 인덱스에 이미 본문이 있는 기사는 저장된 본문을 채우고 제외한다.
+        """
+        if not self.config.get("fetch_full_content", True):
+            return []
+
+        pending = []
+        reused = 0
+        for article in articles:
+            if not article.link or article.content:
+                continue
+            entry = self.seen_index.get(article.link) if self.seen_index else None
+            if entry and entry["content"]:
+                article.content = entry["content"]
+                reused += 1
+            else:
+                pending.append(article)
+
+        if reused:
+            self.logger.info(f"[{self.name}] URL 인덱스에서 본문 {reused}건 재사용")
+        return pending
+
+    def fill_article_content(self, article: Article, index: int = 0, total: int = 1):
+        """상세 페이지 본문으로 article.content를 채운다 (실패해도 목록 요약 유지)."""
+        try:
+            full_content = self.fetch_article_content(article.link)
+            if full_content:
+                article.content = full_content
+                if self.seen_index:
+                    self.seen_index.put(article.link, full_content)
+        except Exception as e:
+            self.logger.warning(
+                f"[{self.name}] 상세 페이지 수집 실패 ({index+1}/{total}): {e}"
+            )
+
+    def finalize(self, articles: list[Article]) -> list[dict]:
+        """출처 정보를 채우고 유효한 기사만 딕셔너리로 변환한다."""
         results = []
         for article in articles:
             article.press = article.press or self.name
             article.source_site = self.site_key
+            # 사이트마다 다른 날짜 표기를 표준 포맷으로 (파싱 실패 시 원본 유지)
+            article.published_time = parse_date(article.published_time, fallback_now=False)
             normalized = article.to_dict()
             if self._validate(normalized):
                 results.append(normalized)
@@ -136,44 +212,77 @@ class BaseCrawler(ABC):
     def fetch_article_content(self, url: str) -> Optional[str]:
         """
         기사 상세 페이지에서 본문을 수집한다.
-        기본 구현: requests + BeautifulSoup로 본문 추출.
+        기본 구현: requests + SiteParser로 본문 추출 (HTTP 캐시가 있으면 조건부 요청).
         서브클래스에서 오버라이드 가능.
         """
         content_selector = self.config.get("selectors", {}).get("detail_content", "article")
+        max_len = self.config.get("max_content_length", 2000)
 
         try:
-            resp = self.session.get(url, timeout=self.timeout)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # 셀렉터로 본문 영역 찾기
-            content_el = soup.select_one(content_selector)
-            if content_el:
-                # 불필요한 태그 제거
-                for tag in content_el.select("script, style, nav, footer, .ad, .advertisement"):
-                    tag.decompose()
-                text = content_el.get_text(separator="\n", strip=True)
-                # 최대 길이 제한 (2000자)
-                max_len = self.config.get("max_content_length", 2000)
-                if len(text) > max_len:
-                    # 문장 경계에서 자르기
-                    cut_text = text[:max_len]
-                    last_period = max(
-                        cut_text.rfind("."),
-                        cut_text.rfind("다."),
-                        cut_text.rfind("!"),
-                        cut_text.rfind("?")
-                    )
-                    if last_period > max_len * 0.5:
-                        text = cut_text[:last_period + 1]
-                    else:
-                        text = cut_text
-                return text
+            return self._get_parsed(url, self._extract_content, parse_key=["detail", content_selector, max_len, self.parser.backend])
         except Exception as e:
             self.logger.warning(f"[{self.name}] 본문 추출 실패 ({url}): {e}")
 
         return None
 
+    def _extract_content(self, html: str) -> Optional[str]:
+        """상세 페이지 HTML에서 본문 텍스트를 추출한다."""
+        content_selector = self.config.get("selectors", {}).get("detail_content", "article")
+        root = self.parser.parse(html, target=content_selector)
+
+        # 셀렉터로 본문 영역 찾기
+        content_el = root.select_one(content_selector)
+        if not content_el:
+            return None
+
+        # 불필요한 태그 제거
+        for tag in content_el.select("script, style, nav, footer, .ad, .advertisement"):
+            tag.decompose()
+        text = content_el.get_text(separator="\n", strip=True)
+        # 최대 길이 제한 (2000자)
+        max_len = self.config.get("max_content_length", 2000)
+        if len(text) > max_len:
+            # 문장 경계에서 자르기
+            cut_text = text[:max_len]
+            last_period = max(
+                cut_text.rfind("."),
+                cut_text.rfind("다."),
+                cut_text.rfind("!"),
+                cut_text.rfind("?")
+            )
+            if last_period > max_len * 0.5:
+                text = cut_text[:last_period + 1]
+            else:
+                text = cut_text
+        return text
+
+    def _get_parsed(self, url: str, parse, parse_key=None, raw: bool = False):
+        """
+        URL을 가져와 parse 결과를 반환한다.
+        HTTP 캐시가 있으면 조건부 요청으로 변경 없는 페이지의 파싱을 생략한다.
+
+        Args:
+            parse: 본문(raw면 bytes, 아니면 str) → JSON 직렬화 가능한 결과
+            parse_key: 파싱 결과에 영향을 주는 설정 (바뀌면 캐시된 파싱 결과 무효화)
+        """
+        started = time.time()
+        if self.http_cache is not None:
+            parsed = self.http_cache.fetch(
+                self.session, url, parse, parse_key=parse_key, timeout=self.timeout, raw=raw
+            )
+            self.latencies.append(time.time() - started)
+            return parsed
+
+        resp = self.session.get(url, timeout=self.timeout)
+        resp.raise_for_status()
+        self.latencies.append(time.time() - started)
+
+        # 인코딩 자동 감지
+        if resp.encoding and resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = resp.apparent_encoding
+
+        return parse(resp.content if raw else resp.text)
+
     def _validate(self, article_dict: dict) -> bool:
         """기사 데이터 유효성 검사"""
         title = article_dict.get("title", "").strip()
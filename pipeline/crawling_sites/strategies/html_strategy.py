@@ -1,6 +1,6 @@
 """
 HTML 스크래핑 기반 크롤링 전략.
-requests + BeautifulSoup로 서버 렌더링 페이지에서 기사를 수집한다.
+requests + lxml(utils.html_parser)로 서버 렌더링 페이지에서 기사를 수집한다.
 기업 뉴스룸, 보도자료 페이지 등에 적합.
 """
 import logging
@@ -8,7 +8,6 @@ import re
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
 
 from .base import BaseCrawler, Article
 from ..utils.retry import retry_with_backoff
@@ -34,6 +33,10 @@ class HTMLCrawler(BaseCrawler):
 
     def fetch_article_list(self) -> list[Article]:
         """HTML 페이지를 파싱하여 기사 목록을 반환한다 (멀티페이지 지원)."""
+        return self.drain_list_pages(self.iter_list_pages())
+
+    def iter_list_pages(self):
+        """목록 페이지를 하나씩 가져온다 (다음 페이지 전 대기 지점마다 yield)."""
         selectors = self.config.get("selectors", {})
         if not selectors.get("article_list"):
             raise ValueError(f"[{self.name}] selectors.article_list가 설정되지 않았습니다")
@@ -43,34 +46,22 @@ class HTMLCrawler(BaseCrawler):
         for page_num in range(self.pagination_start, self.pagination_start + self.max_pages):
             page_url = self._build_page_url(page_num)
 
-            # 페이지 가져오기
-            html = self._fetch_page(page_url)
-            soup = BeautifulSoup(html, "html.parser")
-
-            # 기사 목록 요소 선택
-            items = soup.select(selectors["article_list"])
-            if not items:
+            # 페이지 가져오기 + 목록 파싱 (변경 없는 페이지는 HTTP 캐시의 파싱 결과 사용)
+            page_articles = self._fetch_page_articles(page_url, selectors)
+            if not page_articles:
                 if page_num == self.pagination_start:
                     self.logger.warning(f"[{self.name}] 기사 목록을 찾을 수 없습니다: {selectors['article_list']}")
                 break  # 더 이상 기사 없으면 중단
 
-            for item in items:
-                try:
-                    article = self._parse_article_item(item, selectors)
-                    if article:
-                        all_articles.append(article)
-                except Exception as e:
-                    self.logger.warning(f"[{self.name}] 기사 항목 파싱 실패: {e}")
-                    continue
+            all_articles.extend(page_articles)
 
             # max_articles에 도달하면 중단
             if len(all_articles) >= self.max_articles:
                 break
 
-            # 다음 페이지 전 레이트 리밋 대기
+            # 다음 페이지 전 레이트 리밋 대기 (호출부가 기다린다)
             if page_num < self.pagination_start + self.max_pages - 1:
-                domain = self._get_domain()
-                self._wait_rate_limit(domain)
+                yield
 
         return all_articles[:self.max_articles]
 
@@ -181,18 +172,39 @@ class HTMLCrawler(BaseCrawler):
         self.logger.warning(f"[{self.name}] link_pattern 사용 시 ID 추출 실패")
         return ""
 
-    @retry_with_backoff(
-        max_attempts=3,
-        base_delay=1.0,
-        exceptions=(requests.RequestException,),
-    )
-    def _fetch_page(self, url: str) -> str:
-        """페이지 HTML을 가져온다 (재시도 포함)."""
-        resp = self.session.get(url, timeout=self.timeout)
-        resp.raise_for_status()
-
-        # 인코딩 자동 감지
-        if resp.encoding and resp.encoding.lower() == "iso-8859-1":
-            resp.encoding = resp.apparent_encoding
-
-        return resp.text
+    def _fetch_page_articles(self, url: str, selectors: dict) -> list[Article]:
+        """목록 페이지를 가져와 기사 항목을 파싱한다 (설정의 retry_count만큼 재시도)."""
+        fetch = retry_with_backoff(
+            max_attempts=self.retry_count,
+            base_delay=1.0,
+            exceptions=(requests.RequestException,),
+        )(self._fetch_page_articles_once)
+        return fetch(url, selectors)
+
+    def _fetch_page_articles_once(self, url: str, selectors: dict) -> list[Article]:
+        parse_key = [
+            "list", selectors,
+            self.config.get("link_pattern", ""),
+            self.config.get("link_attribute", "href"),
+            self.parser.backend,
+        ]
+        items = self._get_parsed(url, lambda html: self._parse_article_list(html, selectors), parse_key=parse_key)
+        return [Article(**item) for item in items]
+
+    def _parse_article_list(self, html: str, selectors: dict) -> list[dict]:
+        """목록 페이지 HTML → 기사 딕셔너리 리스트 (캐시 저장용)"""
+        root = self.parser.parse(html, target=selectors["article_list"])
+
+        # 기사 목록 요소 선택
+        items = root.select(selectors["article_list"])
+
+        articles = []
+        for item in items:
+            try:
+                article = self._parse_article_item(item, selectors)
+                if article:
+                    articles.append(article.to_dict())
+            except Exception as e:
+                self.logger.warning(f"[{self.name}] 기사 항목 파싱 실패: {e}")
+                continue
+        return articles
@@ -1,6 +1,6 @@
 """
 RSS/Atom 피드 기반 크롤링 전략.
-feedparser를 사용하여 RSS 피드에서 기사를 수집한다.
+requests 세션으로 피드를 받아 feedparser로 파싱한다.
 블로그, IT 미디어 등 RSS를 제공하는 사이트에 적합.
 """
 import logging
@@ -9,7 +9,6 @@ from datetime import datetime
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
 
 from .base import BaseCrawler, Article
 
@@ -26,19 +25,32 @@ class RSSCrawler(BaseCrawler):
     """
 
     def fetch_article_list(self) -> list[Article]:
-        """RSS 피드를 파싱하여 기사 목록을 반환한다."""
+        """
+        RSS 피드를 파싱하여 기사 목록을 반환한다.
+        피드는 세션(HTTP 캐시)으로 받아 feedparser에 bytes로 넘기므로,
+        변경 없는 피드는 feedparser 파싱을 생략한다.
+        """
         rss_url = self.config.get("rss_url", self.url)
 
         try:
-            # feedparser에 User-Agent와 타임아웃 설정
-            feed = feedparser.parse(
+            items = self._get_parsed(
                 rss_url,
-                agent=self.config.get("user_agent", self.DEFAULT_USER_AGENT),
+                lambda body: self._parse_feed(body, rss_url),
+                parse_key=["rss", self.max_articles],
+                raw=True,
             )
         except Exception as e:
             self.logger.error(f"[{self.name}] RSS 피드 파싱 실패: {e}")
             raise
 
+        # 날짜 없는 항목의 현재 시각 대체는 캐시 조회 뒤에 (캐시된 파싱 결과에 시각이 굳지 않도록)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+        return [Article(**{**item, "published_time": item.get("published_time") or now}) for item in items]
+
+    def _parse_feed(self, body: bytes, rss_url: str) -> list[dict]:
+        """피드 본문(bytes) → 기사 딕셔너리 리스트 (캐시 저장용)"""
+        feed = feedparser.parse(body)
+
         if feed.bozo and not feed.entries:
             self.logger.warning(f"[{self.name}] RSS 피드 오류: {feed.bozo_exception}")
             raise ValueError(f"RSS 피드를 읽을 수 없습니다: {rss_url}")
@@ -56,7 +68,7 @@ class RSSCrawler(BaseCrawler):
                     published_time=self._parse_feed_date(entry),
                     source_site=self.site_key,
                 )
-                articles.append(article)
+                articles.append(article.to_dict())
             except Exception as e:
                 self.logger.warning(f"[{self.name}] 피드 항목 파싱 실패: {e}")
                 continue
@@ -77,12 +89,11 @@ class RSSCrawler(BaseCrawler):
 
         # HTML 태그 제거
         if raw and ("<" in raw and ">" in raw):
-            soup = BeautifulSoup(raw, "html.parser")
-            return soup.get_text(separator=" ", strip=True)
+            return self.parser.text(raw, separator=" ")
         return raw.strip()
 
     def _parse_feed_date(self, entry) -> str:
-        """피드 항목의 날짜를 표준 포맷으로 변환"""
+        """피드 항목의 날짜를 표준 포맷으로 변환 (날짜가 없으면 빈 문자열)"""
         # feedparser가 파싱한 구조화된 시간 사용
         for date_field in ("published_parsed", "updated_parsed"):
             parsed_time = entry.get(date_field)
@@ -99,7 +110,7 @@ class RSSCrawler(BaseCrawler):
             if date_str:
                 return date_str
 
-        return datetime.now().strftime("%Y-%m-%d %H:%M")
+        return ""
 
     def _clean_title(self, title: str) -> str:
         """제목 정리 (HTML 엔티티, 불필요한 공백 제거)"""
@@ -107,6 +118,5 @@ class RSSCrawler(BaseCrawler):
             return ""
         # HTML 엔티티 디코딩
         if "&" in title:
-            soup = BeautifulSoup(title, "html.parser")
-            title = soup.get_text()
+            title = self.parser.text(title, strip=False)
         return " ".join(title.split()).strip()
@@ -3,24 +3,21 @@ Selenium 기반 크롤링 전략.
 JavaScript 렌더링이 필요한 동적 페이지에서 기사를 수집한다.
 정부 사이트, SPA 등에 적합.
 
-기존 news_crawler.py의 setup_driver 패턴을 재사용한다.
+브라우저는 utils.driver_pool의 공용 풀에서 임대한다.
+페이지 대기는 고정 sleep 대신 utils.page_wait의 준비 조건(셀렉터 등장)으로 판단한다.
 """
 import gc
-import time
 import logging
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
 from .base import BaseCrawler, Article
+from ..utils.driver_pool import get_shared_pool
+from ..utils.page_wait import scroll_and_wait, wait_for_page
 
 logger = logging.getLogger(__name__)
 
 # Selenium 관련 임포트 (설치되지 않았을 때 에러 방지)
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
@@ -30,12 +27,6 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     logger.warning("Selenium이 설치되지 않았습니다. SeleniumCrawler를 사용할 수 없습니다.")
 
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    WEBDRIVER_MANAGER_AVAILABLE = True
-except ImportError:
-    WEBDRIVER_MANAGER_AVAILABLE = False
-
 
 class SeleniumCrawler(BaseCrawler):
     """
@@ -49,18 +40,25 @@ class SeleniumCrawler(BaseCrawler):
             link: "td.title a"
             date: "td.date"
             detail_content: ".view-content"  # 상세 페이지 본문
-        page_load_wait: 3  # 페이지 로드 대기 시간(초)
+        wait_selector: ".board-list"  # 목록 준비 판단 셀렉터 (기본: selectors.article_list)
+        wait_timeout: 10  # 준비 대기 상한(초)
+        network_idle: false  # 셀렉터 등장 후 네트워크 유휴까지 추가 대기
+        page_load_wait: 3  # 기존 고정 대기 시간(초) — 대기 통계의 절약 시간 기준값
         scroll_count: 0  # 무한스크롤 횟수 (0이면 스크롤 안 함)
     """
 
-    def __init__(self, site_config: dict, rate_limiter=None):
+    def __init__(self, site_config: dict, rate_limiter=None, http_cache=None, seen_index=None):
         if not SELENIUM_AVAILABLE:
             raise RuntimeError("Selenium이 설치되지 않았습니다. pip install selenium")
-        super().__init__(site_config, rate_limiter)
+        super().__init__(site_config, rate_limiter, http_cache, seen_index)
         self._driver = None
 
     def fetch_article_list(self) -> list[Article]:
         """Selenium으로 페이지를 로드하고 기사 목록을 반환한다 (멀티페이지 지원)."""
+        return self.drain_list_pages(self.iter_list_pages())
+
+    def iter_list_pages(self):
+        """목록 페이지를 하나씩 로드한다 (다음 페이지 전 대기 지점마다 yield)."""
         selectors = self.config.get("selectors", {})
         if not selectors.get("article_list"):
             raise ValueError(f"[{self.name}] selectors.article_list가 설정되지 않았습니다")
@@ -74,19 +72,28 @@ class SeleniumCrawler(BaseCrawler):
 
                 # 페이지 로드
                 driver.get(page_url)
-                wait_time = self.config.get("page_load_wait", 3)
-                time.sleep(wait_time)
+                self._wait_ready(
+                    driver,
+                    self.config.get("wait_selector") or selectors["article_list"],
+                    baseline=self.config.get("page_load_wait", 3),
+                )
 
-                # 무한스크롤 처리 (첫 페이지만)
+                # 무한스크롤 처리 (첫 페이지만, 항목 수가 늘어날 때까지만 대기)
                 if page_num == self.pagination_start:
                     scroll_count = self.config.get("scroll_count", 0)
-                    for _ in range(scroll_count):
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1.5)
+                    if scroll_count:
+                        scroll_and_wait(
+                            driver,
+                            selectors["article_list"],
+                            scroll_count,
+                            timeout=self.config.get("scroll_wait_timeout", 5),
+                            stats_key=f"{self.site_key}:scroll",
+                            baseline=1.5,
+                        )
 
                 # 페이지 소스 파싱
-                soup = BeautifulSoup(driver.page_source, "html.parser")
-                items = soup.select(selectors["article_list"])
+                root = self.parser.parse(driver.page_source, target=selectors["article_list"])
+                items = root.select(selectors["article_list"])
 
                 if not items:
                     if page_num == self.pagination_start:
@@ -108,10 +115,9 @@ class SeleniumCrawler(BaseCrawler):
                 if len(all_articles) >= self.max_articles:
                     break
 
-                # 다음 페이지 전 대기
+                # 다음 페이지 전 대기 (호출부가 기다린다)
                 if page_num < self.pagination_start + self.max_pages - 1:
-                    domain = self._get_domain()
-                    self._wait_rate_limit(domain)
+                    yield
 
             return all_articles[:self.max_articles]
 
@@ -129,10 +135,10 @@ class SeleniumCrawler(BaseCrawler):
 
         try:
             driver.get(url)
-            time.sleep(self.config.get("page_load_wait", 2))
+            self._wait_ready(driver, content_selector, baseline=self.config.get("page_load_wait", 2))
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            content_el = soup.select_one(content_selector)
+            root = self.parser.parse(driver.page_source, target=content_selector)
+            content_el = root.select_one(content_selector)
 
             if content_el:
                 # 불필요한 태그 제거
@@ -199,58 +205,30 @@ class SeleniumCrawler(BaseCrawler):
             source_site=self.site_key,
         )
 
+    def _wait_ready(self, driver, selector: str, baseline: float):
+        """selector가 나타날 때까지(최대 wait_timeout초) 대기하고 대기 시간을 기록한다."""
+        wait_for_page(
+            driver,
+            selector=selector,
+            timeout=self.config.get("wait_timeout", 10),
+            network_idle=self.config.get("network_idle", False),
+            stats_key=self.site_key,
+            baseline=baseline,
+        )
+
     def _get_driver(self):
-        """Selenium WebDriver 인스턴스를 반환한다 (lazy 초기화)."""
+        """공용 WebDriver 풀에서 브라우저를 임대한다 (lazy, 크롤러 종료 시 반납)."""
         if self._driver is None:
-            self._driver = self._setup_driver()
+            self._driver = get_shared_pool().acquire(
+                user_agent=self.config.get("user_agent", self.DEFAULT_USER_AGENT)
+            )
+            self._driver.set_page_load_timeout(self.config.get("timeout_seconds", 30))
         return self._driver
 
-    def _setup_driver(self):
-        """
-        Chrome WebDriver를 설정한다.
-        기존 news_crawler.py의 setup_driver() 패턴을 재사용.
-        """
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--blink-settings=imagesEnabled=false")  # 이미지 로딩 비활성화
-        options.add_argument("--js-flags=--max-old-space-size=512")  # 메모리 제한
-        options.add_argument(
-            f"--user-agent={self.config.get('user_agent', self.DEFAULT_USER_AGENT)}"
-        )
-
-        # 불필요한 로그 억제
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-        # 시스템 chromedriver 우선, 없으면 webdriver_manager 폴백
-        import shutil
-        chromedriver_path = shutil.which('chromedriver')
-        try:
-            if chromedriver_path:
-                service = Service(chromedriver_path)
-                driver = webdriver.Chrome(service=service, options=options)
-            elif WEBDRIVER_MANAGER_AVAILABLE:
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=options)
-            else:
-                driver = webdriver.Chrome(options=options)
-        except Exception as e:
-            self.logger.error(f"ChromeDriver 초기화 실패: {e}")
-            raise RuntimeError(f"ChromeDriver를 찾을 수 없습니다: {e}")
-
-        driver.set_page_load_timeout(self.config.get("timeout_seconds", 30))
-        return driver
-
     def close(self):
-        """WebDriver 및 HTTP 세션 정리"""
+        """임대한 WebDriver 반납 및 HTTP 세션 정리"""
         if self._driver:
-            try:
-                self._driver.quit()
-            except Exception:
-                pass
+            get_shared_pool().release(self._driver)
             self._driver = None
             gc.collect()
         super().close()
@@ -1,6 +1,18 @@
 # 유틸리티 패키지
-from .rate_limiter import DomainRateLimiter
+from .rate_limiter import DomainRateLimiter, AsyncDomainRateLimiter
 from .retry import retry_with_backoff
 from .date_parser import parse_date
+from .http_cache import HTTPCache
+from .seen_index import SeenIndex
+from .driver_pool import DriverPool, get_shared_pool, build_chrome_options
+from .page_wait import WAIT_STATS, wait_for_page, scroll_and_wait
+from .html_parser import SiteParser, parse_html
+from .site_health import SiteHealth
+from .jsonl_store import JsonlWriter, OrderedFlush, iter_items, resolve_path
 
-__all__ = ['DomainRateLimiter', 'retry_with_backoff', 'parse_date']
+__all__ = [
+    'DomainRateLimiter', 'AsyncDomainRateLimiter', 'retry_with_backoff', 'parse_date',
+    'HTTPCache', 'SeenIndex', 'DriverPool', 'get_shared_pool', 'build_chrome_options',
+    'WAIT_STATS', 'wait_for_page', 'scroll_and_wait', 'SiteParser', 'parse_html',
+    'SiteHealth', 'JsonlWriter', 'OrderedFlush', 'iter_items', 'resolve_path',
+]
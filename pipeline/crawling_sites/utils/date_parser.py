@@ -1,10 +1,23 @@
 """
 다중 포맷 날짜 파서.
-한국어 날짜, ISO 8601, 상대 시간 등 다양한 형식을 표준 포맷으로 변환한다.
+한국어 날짜, ISO 8601, RFC 2822, 상대 시간 등 다양한 형식을 표준 포맷으로 변환한다.
+크롤러(BaseCrawler.finalize)와 랭커(run_batch.parse_korean_datetime)가 같은 엔진을 쓴다.
+
+- 정규식은 모듈 로드 시 한 번 컴파일
+- 문자열의 모양(첫 글자, 구분자)을 보고 해당 포맷만 시도 (여섯 가지 전략을 차례로 시도하지 않음)
+- 절대 날짜 결과는 LRU 캐시 (같은 날짜 문자열이 반복되는 목록 페이지/RSS에서 재사용)
+- 상대 시간("3시간 전")과 파싱 실패 폴백은 실행별 기준 시각(set_reference_now)을 사용
+
+사용 예:
+    set_reference_now()                      # 실행 시작 시 기준 시각 고정
+    parse_date("2026.03.02. 오후 3:30")       # "2026-03-02 15:30"
+    parse_datetime("3시간 전")                # datetime (기준 시각 - 3시간), 실패 시 None
 """
 import re
 import logging
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -12,224 +25,210 @@ logger = logging.getLogger(__name__)
 # 표준 출력 포맷
 STANDARD_FORMAT = "%Y-%m-%d %H:%M"
 
+# 상대 시간
+_JUST_NOW = frozenset(("방금", "방금 전", "just now"))
+_KO_RELATIVE_RE = re.compile(r"(\d+)\s*(초|분|시간|일|주|개월)\s*전")
+_EN_RELATIVE_RE = re.compile(r"(\d+)\s*(second|minute|hour|day|week|month)s?\s*ago")
+_KO_UNITS = {"초": "seconds", "분": "minutes", "시간": "hours", "일": "days", "주": "weeks", "개월": "months"}
+_EN_UNITS = {"second": "seconds", "minute": "minutes", "hour": "hours", "day": "days", "week": "weeks", "month": "months"}
+
+# 절대 날짜 (숫자로 시작)
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}T")
+_ISO_TZ_RE = re.compile(r"[+-]\d{2}:\d{2}$")
+_KO_YMD_RE = re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일")
+_KO_DOT_TIME_RE = re.compile(r"(\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s*(오전|오후)?\s*(\d{1,2}):(\d{2})?")
+_NUMERIC_RE = re.compile(r"(\d{4})[./\-](\d{1,2})[./\-](\d{1,2})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+_COMPACT_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+
+# 절대 날짜 (영문으로 시작)
+_RFC2822_RE = re.compile(r"[A-Za-z]{3},\s*\d{1,2}\s+[A-Za-z]{3}\s+\d{4}")
+_EN_DATE_FORMATS = (
+    "%b %d, %Y",       # Mar 2, 2026
+    "%B %d, %Y",       # March 2, 2026
+    "%b %d %Y",        # Mar 2 2026
+    "%B %d %Y",        # March 2 2026
+    "%b. %d, %Y",      # Mar. 2, 2026
+    "%b %d, %Y %H:%M",
+    "%B %d, %Y %H:%M",
+    "%b %d, %Y %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+)
+_EN_DAY_FIRST_FORMATS = (
+    "%d %b %Y",        # 2 Mar 2026
+    "%d %B %Y",        # 2 March 2026
+)
+
+_reference_now: Optional[datetime] = None
+
+
+def set_reference_now(now: datetime = None) -> datetime:
+    """
+    상대 시간 계산과 파싱 실패 폴백에 쓸 기준 시각을 고정한다 (기본: 현재 시각).
+    한 번의 크롤링/랭킹 실행 안에서 같은 문자열이 같은 시각으로 변환되도록 실행 시작 시 호출한다.
+    """
+    global _reference_now
+    _reference_now = now or datetime.now()
+    return _reference_now
+
 
-def parse_date(date_str: str, fallback_now: bool = True) -> str:
+def reference_now() -> datetime:
+    """고정된 기준 시각 (set_reference_now를 호출하지 않았으면 현재 시각)"""
+    return _reference_now or datetime.now()
+
+
+def parse_datetime(date_str: str, now: datetime = None) -> Optional[datetime]:
     """
-    다양한 날짜 문자열을 표준 포맷(YYYY-MM-DD HH:MM)으로 변환한다.
+    날짜 문자열을 naive datetime으로 변환한다 (타임존 표기는 제거, 시각은 그대로).
 
     지원 포맷:
         - ISO 8601: "2026-03-02T09:00:00Z", "2026-03-02T09:00:00+09:00"
+        - RFC 2822 (RSS): "Mon, 02 Mar 2026 09:00:00 +0000"
         - 한국어: "2026.03.02", "2026년 3월 2일", "2026.03.02. 오전 10:30"
-        - 상대 시간: "5분 전", "3시간 전", "1일 전", "방금"
-        - 영어: "Mar 2, 2026", "March 2, 2026", "2 hours ago"
-        - 슬래시/하이픈: "2026/03/02", "2026-03-02"
+        - 상대 시간: "5분 전", "3시간 전", "1일 전", "방금", "2 hours ago"
+        - 영어: "Mar 2, 2026", "March 2, 2026", "2 Mar 2026"
+        - 슬래시/하이픈: "2026/03/02", "2026-03-02 10:30", "20260302"
 
     Args:
-        date_str: 파싱할 날짜 문자열
-        fallback_now: 파싱 실패 시 현재 시각 반환 여부
+        now: 상대 시간 기준 시각 (기본: reference_now())
 
     Returns:
-        표준 포맷 문자열 "YYYY-MM-DD HH:MM" 또는 원본 문자열
+        datetime 또는 None (파싱 실패)
     """
     if not date_str or not isinstance(date_str, str):
-        return datetime.now().strftime(STANDARD_FORMAT) if fallback_now else ""
+        return None
+    text = date_str.strip()
+    if not text:
+        return None
 
-    date_str = date_str.strip()
+    relative = _parse_relative(text, now)
+    if relative is not None:
+        return relative
+    return _parse_absolute(text)
 
-    # 1. 상대 시간 (한국어)
-    result = _parse_korean_relative(date_str)
-    if result:
-        return result.strftime(STANDARD_FORMAT)
 
-    # 2. 상대 시간 (영어)
-    result = _parse_english_relative(date_str)
-    if result:
-        return result.strftime(STANDARD_FORMAT)
-
-    # 3. ISO 8601
-    result = _parse_iso(date_str)
-    if result:
-        return result.strftime(STANDARD_FORMAT)
-
-    # 4. 한국어 날짜 포맷
-    result = _parse_korean_date(date_str)
-    if result:
-        return result.strftime(STANDARD_FORMAT)
+def parse_date(date_str: str, fallback_now: bool = True, now: datetime = None) -> str:
+    """
+    다양한 날짜 문자열을 표준 포맷(YYYY-MM-DD HH:MM)으로 변환한다.
 
-    # 5. 영어 날짜 포맷
-    result = _parse_english_date(date_str)
-    if result:
-        return result.strftime(STANDARD_FORMAT)
+    Args:
+        date_str: 파싱할 날짜 문자열
+        fallback_now: 파싱 실패 시 기준 시각 반환 여부
+        now: 상대 시간/폴백 기준 시각 (기본: reference_now())
 
-    # 6. 숫자 기반 포맷 (2026.03.02, 2026/03/02, 2026-03-02)
-    result = _parse_numeric_date(date_str)
+    Returns:
+        표준 포맷 문자열 "YYYY-MM-DD HH:MM" 또는 원본 문자열
+    """
+    result = parse_datetime(date_str, now)
     if result:
         return result.strftime(STANDARD_FORMAT)
 
-    # 파싱 실패
-    logger.debug(f"날짜 파싱 실패: '{date_str}'")
+    if date_str and isinstance(date_str, str):
+        logger.debug(f"날짜 파싱 실패: '{date_str}'")
     if fallback_now:
-        return datetime.now().strftime(STANDARD_FORMAT)
-    return date_str
-
-
-def _parse_korean_relative(text: str) -> Optional[datetime]:
-    """한국어 상대 시간 파싱: '5분 전', '3시간 전', '1일 전', '방금'"""
-    now = datetime.now()
-
-    if text in ("방금", "방금 전", "just now"):
-        return now
-
-    patterns = [
-        (r"(\d+)\s*초\s*전", "seconds"),
-        (r"(\d+)\s*분\s*전", "minutes"),
-        (r"(\d+)\s*시간\s*전", "hours"),
-        (r"(\d+)\s*일\s*전", "days"),
-        (r"(\d+)\s*주\s*전", "weeks"),
-        (r"(\d+)\s*개월\s*전", "months"),
-    ]
+        return (now or reference_now()).strftime(STANDARD_FORMAT)
+    return date_str.strip() if isinstance(date_str, str) else ""
 
-    for pattern, unit in patterns:
-        match = re.match(pattern, text)
-        if match:
-            value = int(match.group(1))
-            if unit == "months":
-                return now - timedelta(days=value * 30)
-            return now - timedelta(**{unit: value})
-
-    return None
-
-
-def _parse_english_relative(text: str) -> Optional[datetime]:
-    """영어 상대 시간 파싱: '2 hours ago', '5 minutes ago'"""
-    now = datetime.now()
-    text_lower = text.lower().strip()
-
-    patterns = [
-        (r"(\d+)\s*seconds?\s*ago", "seconds"),
-        (r"(\d+)\s*minutes?\s*ago", "minutes"),
-        (r"(\d+)\s*hours?\s*ago", "hours"),
-        (r"(\d+)\s*days?\s*ago", "days"),
-        (r"(\d+)\s*weeks?\s*ago", "weeks"),
-        (r"(\d+)\s*months?\s*ago", "months"),
-    ]
-
-    for pattern, unit in patterns:
-        match = re.match(pattern, text_lower)
-        if match:
-            value = int(match.group(1))
-            if unit == "months":
-                return now - timedelta(days=value * 30)
-            return now - timedelta(**{unit: value})
 
+def _parse_relative(text: str, now: datetime = None) -> Optional[datetime]:
+    """
+    상대 시간: '5분 전', '3시간 전', '방금', '2 hours ago' (한 달은 30일로 계산)
+    '기사입력 3시간 전', '· 5분 전', 'Updated 2 hours ago'처럼 앞에 붙은 문구는 건너뛴다.
+    """
+    if text in _JUST_NOW:
+        return now or reference_now()
+
+    if "전" in text:
+        match = _KO_RELATIVE_RE.search(text)
+        if not match:
+            return None
+        unit = _KO_UNITS[match.group(2)]
+    elif "ago" in text or "AGO" in text or "Ago" in text:
+        match = _EN_RELATIVE_RE.search(text.lower())
+        if not match:
+            return None
+        unit = _EN_UNITS[match.group(2)]
+    else:
+        return None
+
+    value = int(match.group(1))
+    base = now or reference_now()
+    if unit == "months":
+        return base - timedelta(days=value * 30)
+    return base - timedelta(**{unit: value})
+
+
+@lru_cache(maxsize=8192)
+def _parse_absolute(text: str) -> Optional[datetime]:
+    """절대 날짜 — 첫 글자로 후보 포맷을 고른다"""
+    if text[0].isdigit():
+        if _ISO_RE.match(text):
+            return _parse_iso(text)
+        return _parse_numeric_shapes(text)
+    if text[0].isalpha():
+        if _RFC2822_RE.match(text):
+            try:
+                return parsedate_to_datetime(text).replace(tzinfo=None)
+            except (TypeError, ValueError):
+                return None
+        return _strptime_any(text, _EN_DATE_FORMATS)
     return None
 
 
 def _parse_iso(text: str) -> Optional[datetime]:
     """ISO 8601 파싱: '2026-03-02T09:00:00Z', '2026-03-02T09:00:00+09:00'"""
-    # 타임존 제거 (단순화)
-    cleaned = re.sub(r'[+-]\d{2}:\d{2}$', '', text)
-    cleaned = cleaned.rstrip('Z')
-
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M",
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(cleaned, fmt)
-        except ValueError:
-            continue
-
-    return None
-
+    cleaned = _ISO_TZ_RE.sub("", text).rstrip("Z")
+    try:
+        return datetime.fromisoformat(cleaned).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _parse_numeric_shapes(text: str) -> Optional[datetime]:
+    """숫자로 시작하는 날짜: 한국어 → 일-월-년 영문 → 구분자 숫자 → YYYYMMDD 순"""
+    try:
+        # "2026년 3월 2일 (10:30)"
+        match = _KO_YMD_RE.match(text)
+        if match:
+            y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            time_match = _TIME_RE.search(text)
+            if time_match:
+                return datetime(y, m, d, int(time_match.group(1)), int(time_match.group(2)))
+            return datetime(y, m, d)
 
-def _parse_korean_date(text: str) -> Optional[datetime]:
-    """한국어 날짜 파싱: '2026년 3월 2일', '2026.03.02. 오전 10:30'"""
-    # "2026년 3월 2일" 패턴
-    match = re.match(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text)
-    if match:
-        y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        # 시간 부분 찾기
-        time_match = re.search(r"(\d{1,2}):(\d{2})", text)
-        if time_match:
-            h, mi = int(time_match.group(1)), int(time_match.group(2))
+        # "2026.03.02. 오전 10:30"
+        match = _KO_DOT_TIME_RE.match(text)
+        if match:
+            y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            ampm = match.group(4)
+            h = int(match.group(5)) if match.group(5) else 0
+            mi = int(match.group(6)) if match.group(6) else 0
+            if ampm == "오후" and h < 12:
+                h += 12
+            elif ampm == "오전" and h == 12:
+                h = 0
             return datetime(y, m, d, h, mi)
-        return datetime(y, m, d)
-
-    # "2026.03.02. 오전 10:30" 패턴
-    match = re.match(r"(\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s*(오전|오후)?\s*(\d{1,2}):(\d{2})?", text)
-    if match:
-        y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        ampm = match.group(4)
-        h = int(match.group(5)) if match.group(5) else 0
-        mi = int(match.group(6)) if match.group(6) else 0
-        if ampm == "오후" and h < 12:
-            h += 12
-        elif ampm == "오전" and h == 12:
-            h = 0
-        return datetime(y, m, d, h, mi)
-
-    return None
-
+    except ValueError:
+        return None
 
-def _parse_english_date(text: str) -> Optional[datetime]:
-    """영어 날짜 파싱: 'Mar 2, 2026', 'March 2, 2026', 'Feb 28, 2026'"""
-    formats = [
-        "%b %d, %Y",       # Mar 2, 2026
-        "%B %d, %Y",       # March 2, 2026
-        "%b %d %Y",        # Mar 2 2026
-        "%B %d %Y",        # March 2 2026
-        "%d %b %Y",        # 2 Mar 2026
-        "%d %B %Y",        # 2 March 2026
-        "%b. %d, %Y",      # Mar. 2, 2026
-    ]
+    # "2 Mar 2026"
+    if not text[:4].isdigit():
+        return _strptime_any(text, _EN_DAY_FIRST_FORMATS)
 
-    for fmt in formats:
-        try:
-            return datetime.strptime(text.strip(), fmt)
-        except ValueError:
-            continue
-
-    # 시간 포함된 영어 날짜
-    time_formats = [
-        "%b %d, %Y %H:%M",
-        "%B %d, %Y %H:%M",
-        "%b %d, %Y %I:%M %p",
-        "%B %d, %Y %I:%M %p",
-    ]
-
-    for fmt in time_formats:
-        try:
-            return datetime.strptime(text.strip(), fmt)
-        except ValueError:
-            continue
-
-    return None
-
-
-def _parse_numeric_date(text: str) -> Optional[datetime]:
-    """숫자 기반 날짜 파싱: '2026.03.02', '2026/03/02', '2026-03-02', '20260302'"""
-    # 구분자 있는 경우
-    match = re.match(r"(\d{4})[./\-](\d{1,2})[./\-](\d{1,2})", text)
+    # "2026.03.02", "2026/03/02", "2026-03-02 10:30"
+    match = _NUMERIC_RE.match(text)
     if match:
         y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
         try:
-            dt = datetime(y, m, d)
-            # 시간 부분도 있는지 확인
-            time_match = re.search(r"(\d{1,2}):(\d{2})(?::(\d{2}))?", text[match.end():])
+            time_match = _TIME_RE.search(text, match.end())
             if time_match:
-                h = int(time_match.group(1))
-                mi = int(time_match.group(2))
-                return datetime(y, m, d, h, mi)
-            return dt
+                return datetime(y, m, d, int(time_match.group(1)), int(time_match.group(2)))
+            return datetime(y, m, d)
         except ValueError:
             pass
 
-    # YYYYMMDD 형식
-    match = re.match(r"^(\d{4})(\d{2})(\d{2})$", text)
+    # "20260302"
+    match = _COMPACT_RE.match(text)
     if match:
         try:
             return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
@@ -237,3 +236,12 @@ def _parse_numeric_date(text: str) -> Optional[datetime]:
             pass
 
     return None
+
+
+def _strptime_any(text: str, formats: tuple) -> Optional[datetime]:
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,327 @@
+"""
+Selenium WebDriver 풀 모듈.
+여러 크롤러(멀티사이트 Selenium 전략, 네이버 뉴스, 유튜브, 블랙키위)가
+고정 개수의 headless Chrome을 돌려 쓰도록 한다.
+
+- 풀 크기만큼만 브라우저를 띄우고, 임대(lease) 단위로 독점 사용 후 반납
+  (WebDriver 세션은 스레드 간 동시 사용이 불가능하므로 탭이 아닌 브라우저 단위로 임대)
+- 반납된 브라우저는 about:blank로 비운 뒤 다음 임대에 재사용 (콜드 스타트 생략)
+- 브라우저당 max_pages 페이지를 넘기면 종료 후 새로 띄워 메모리 증가를 제한
+- 임대 횟수, 대기 시간, 재생성 횟수를 metrics()로 제공
+
+사용 예:
+    pool = get_shared_pool()
+    with pool.lease(user_agent=UA) as driver:
+        driver.get(url)
+
+환경변수:
+    CHROME_POOL_SIZE       풀 크기 (기본: 2)
+    CHROME_POOL_MAX_PAGES  브라우저당 최대 페이지 수 (기본: 50)
+"""
+import atexit
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Selenium 관련 임포트 (설치되지 않았을 때 에러 방지)
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+    WEBDRIVER_MANAGER_AVAILABLE = True
+except ImportError:
+    WEBDRIVER_MANAGER_AVAILABLE = False
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def build_chrome_options(user_agent: str = None, extra_args: tuple = ()) -> "Options":
+    """크롤러 공통 headless Chrome 옵션 (메모리 최적화 포함)"""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-translate")
+    options.add_argument("--no-first-run")
+    options.add_argument("--blink-settings=imagesEnabled=false")  # 이미지 로딩 비활성화
+    options.add_argument("--js-flags=--max-old-space-size=512")  # JS 힙 제한
+    options.add_argument(f"--user-agent={user_agent or DEFAULT_USER_AGENT}")
+    for arg in extra_args:
+        options.add_argument(arg)
+
+    # 불필요한 로그 억제
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    return options
+
+
+def create_chrome_driver(options: "Options" = None, page_load_timeout: float = None):
+    """
+    Chrome WebDriver를 생성한다.
+    시스템 chromedriver 우선, 없으면 webdriver_manager 폴백.
+    """
+    if not SELENIUM_AVAILABLE:
+        raise RuntimeError("Selenium이 설치되지 않았습니다. pip install selenium")
+
+    options = options or build_chrome_options()
+    chromedriver_path = shutil.which("chromedriver")
+    try:
+        if chromedriver_path:
+            driver = webdriver.Chrome(service=Service(chromedriver_path), options=options)
+        elif WEBDRIVER_MANAGER_AVAILABLE:
+            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        logger.error(f"ChromeDriver 초기화 실패: {e}")
+        raise RuntimeError(f"ChromeDriver를 찾을 수 없습니다: {e}")
+
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+class PooledDriver:
+    """
+    풀에서 임대한 WebDriver 프록시.
+    get() 호출 수(로드한 페이지 수)를 세고, 나머지 속성은 원본 드라이버에 위임한다.
+    """
+
+    def __init__(self, driver, driver_id: int):
+        self._driver = driver
+        self.driver_id = driver_id
+        self.pages = 0
+        self.user_agent = None
+
+    def get(self, url: str):
+        self.pages += 1
+        return self._driver.get(url)
+
+    @property
+    def raw(self):
+        """원본 WebDriver"""
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class DriverPool:
+    """고정 크기 headless Chrome 풀 (스레드 안전)"""
+
+    def __init__(self, size: int = 2, max_pages: int = 50, page_load_timeout: float = 30):
+        """
+        Args:
+            size: 동시에 띄울 최대 브라우저 수
+            max_pages: 브라우저당 최대 페이지 수 (넘으면 재생성)
+            page_load_timeout: 새 브라우저의 기본 페이지 로드 타임아웃 (초)
+        """
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.page_load_timeout = page_load_timeout
+        self._slots = threading.Semaphore(self.size)
+        self._idle = queue.LifoQueue()  # 최근 반납된(가장 따뜻한) 브라우저부터 재사용
+        self._leased = set()  # 임대 중인 브라우저 (종료 시 반납되지 않은 것까지 정리)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._closed = False
+        self._metrics = {
+            "leases": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    def acquire(self, timeout: float = None, user_agent: str = None) -> PooledDriver:
+        """
+        브라우저를 임대한다. 풀이 가득 차 있으면 반납될 때까지 대기.
+
+        Raises:
+            TimeoutError: timeout 내에 임대하지 못한 경우
+        """
+        started = time.time()
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"WebDriver 풀 임대 대기 시간 초과 ({timeout}초)")
+        waited = time.time() - started
+
+        try:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._create()
+            self._apply_user_agent(driver, user_agent)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._leased.add(driver)
+            self._metrics["leases"] += 1
+            self._metrics["wait_seconds_total"] += waited
+            self._metrics["wait_seconds_max"] = max(self._metrics["wait_seconds_max"], waited)
+        return driver
+
+    def release(self, driver: PooledDriver, discard: bool = False):
+        """
+        브라우저를 반납한다.
+
+        Args:
+            discard: True면 재사용하지 않고 종료 (크래시 등 상태를 믿을 수 없을 때)
+        """
+        with self._lock:
+            if driver not in self._leased:  # close(leased=True)가 이미 종료한 브라우저
+                self._slots.release()
+                return
+            self._leased.discard(driver)
+        try:
+            if self._closed or discard or driver.pages >= self.max_pages:
+                self._quit(driver, recycled=not discard and driver.pages >= self.max_pages)
+                return
+            try:
+                driver.raw.get("about:blank")  # 페이지 메모리 해제 (페이지 수에는 포함하지 않음)
+                self._idle.put(driver)
+            except Exception:
+                self._quit(driver, recycled=False)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout: float = None, user_agent: str = None):
+        """with 문용 임대. 블록에서 예외가 나면 브라우저를 폐기한다."""
+        driver = self.acquire(timeout=timeout, user_agent=user_agent)
+        discard = False
+        try:
+            yield driver
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.release(driver, discard=discard)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["idle"] = self._idle.qsize()
+        metrics["avg_wait_seconds"] = (
+            round(metrics["wait_seconds_total"] / metrics["leases"], 2) if metrics["leases"] else 0.0
+        )
+        return metrics
+
+    def summary(self) -> str:
+        m = self.metrics()
+        return (
+            f"WebDriver 풀: 임대 {m['leases']}회 | 생성 {m['created']}개 | 재생성 {m['recycled']}회"
+            f" | 평균 대기 {m['avg_wait_seconds']}s (최대 {m['wait_seconds_max']:.1f}s)"
+        )
+
+    def close(self, leased: bool = False):
+        """
+        유휴 브라우저를 모두 종료한다 (임대 중인 브라우저는 반납 시 종료).
+
+        Args:
+            leased: True면 임대 중인 브라우저도 바로 종료 (프로세스 종료 직전처럼 반납을 기다릴 수 없을 때)
+        """
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver, recycled=False, count=False)
+        if leased:
+            with self._lock:
+                drivers, self._leased = list(self._leased), set()
+            for driver in drivers:
+                self._quit(driver, recycled=False, count=False)
+
+    def _create(self) -> PooledDriver:
+        driver = create_chrome_driver(page_load_timeout=self.page_load_timeout)
+        with self._lock:
+            self._next_id += 1
+            self._metrics["created"] += 1
+            driver_id = self._next_id
+        logger.debug(f"WebDriver #{driver_id} 생성")
+        return PooledDriver(driver, driver_id)
+
+    def _apply_user_agent(self, driver: PooledDriver, user_agent: Optional[str]):
+        """임대자별 User-Agent를 CDP로 적용 (브라우저 재시작 없이)"""
+        user_agent = user_agent or DEFAULT_USER_AGENT
+        if driver.user_agent == user_agent:
+            return
+        try:
+            driver.raw.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": user_agent})
+            driver.user_agent = user_agent
+        except Exception as e:
+            logger.debug(f"User-Agent 적용 실패 (무시): {e}")
+
+    def _quit(self, driver: PooledDriver, recycled: bool, count: bool = True):
+        try:
+            driver.raw.quit()
+        except Exception:
+            pass
+        if count:
+            with self._lock:
+                self._metrics["recycled" if recycled else "discarded"] += 1
+
+
+_shared_pool: Optional[DriverPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool() -> DriverPool:
+    """프로세스 공용 WebDriver 풀 (최초 호출 시 생성, 종료 시 자동 정리)"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool(
+                size=int(os.getenv("CHROME_POOL_SIZE", "2")),
+                max_pages=int(os.getenv("CHROME_POOL_MAX_PAGES", "50")),
+            )
+            atexit.register(shutdown_shared_pool)
+        return _shared_pool
+
+
+def shutdown_shared_pool():
+    """
+    공용 풀의 브라우저를 모두 종료한다.
+    fork한 자식(stage_graph의 isolate 단계)은 atexit이 돌지 않으므로 호출부가 직접 불러야 한다.
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is not None:
+            _shared_pool.close(leased=True)
+            _shared_pool = None
+
+
+def _forget_shared_pool():
+    # fork한 자식은 부모의 풀을 물려받지 않는다 (자식이 정리하면 부모의 브라우저까지 종료되므로)
+    global _shared_pool, _shared_lock
+    _shared_pool = None
+    _shared_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_shared_pool)
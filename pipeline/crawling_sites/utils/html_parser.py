@@ -0,0 +1,204 @@
+"""
+HTML 파서 계층 모듈.
+크롤러가 BeautifulSoup(html.parser)에 직접 의존하지 않고 같은 노드 API로 백엔드를 바꿔 쓰도록 한다.
+
+- lxml 백엔드 (기본, lxml + cssselect 설치 시): C 파서 + CSS 셀렉터를 XPath로 한 번 컴파일해 재사용
+- html.parser 백엔드 (폴백): BeautifulSoup. 단순 셀렉터(tag, #id, .class, tag.class)는
+  SoupStrainer로 대상 하위 트리만 파싱
+- 노드 API는 크롤러가 쓰던 BeautifulSoup 부분집합과 같다:
+  select / select_one / get / get_text(separator, strip) / decompose
+
+사용 예:
+    parser = SiteParser(site_config["selectors"])   # 사이트별 셀렉터 사전 컴파일
+    root = parser.parse(html, target=".view-content")
+    el = root.select_one(".view-content")
+    text = el.get_text(separator="\\n", strip=True) if el else ""
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# lxml 관련 임포트 (설치되지 않았을 때 html.parser로 폴백)
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator, SelectorError
+    LXML_AVAILABLE = True
+    _translator = HTMLTranslator()
+except ImportError:
+    LXML_AVAILABLE = False
+
+DEFAULT_BACKEND = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# lxml은 인코딩 선언이 있는 유니코드 문자열을 거부하므로 XML 선언은 제거 후 파싱
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>", re.IGNORECASE)
+# SoupStrainer로 표현 가능한 단순 셀렉터: tag, #id, .class, tag.class, tag#id
+_SIMPLE_SELECTOR_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9]*)?(?:([#.])([\w-]+))?$")
+_SKIP_TEXT_TAGS = ("script", "style")
+
+
+@lru_cache(maxsize=1024)
+def _compile_lxml(selector: str):
+    """CSS 셀렉터 → 하위 요소 검색 XPath (BeautifulSoup select처럼 자기 자신은 제외)"""
+    return etree.XPath(_translator.css_to_xpath(selector, prefix="descendant::"))
+
+
+@lru_cache(maxsize=256)
+def _strainer_for(selector: str) -> Optional[SoupStrainer]:
+    """단순 셀렉터면 SoupStrainer, 아니면 None (전체 파싱)"""
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    tag, kind, value = match.groups()
+    attrs = {}
+    if kind == "#":
+        attrs["id"] = value
+    elif kind == ".":
+        attrs["class"] = value
+    return SoupStrainer(tag or True, attrs=attrs)
+
+
+def _lxml_texts(el):
+    """BeautifulSoup.get_text와 같은 순서로 텍스트 노드 순회 (주석, script/style 제외)"""
+    if el.text and el.tag not in _SKIP_TEXT_TAGS:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT_TAGS:
+            yield from _lxml_texts(child)
+        if child.tail:
+            yield child.tail
+
+
+class Node:
+    """백엔드 공통 노드 래퍼"""
+
+    __slots__ = ("_el", "_lxml")
+
+    def __init__(self, el, is_lxml: bool):
+        self._el = el
+        self._lxml = is_lxml
+
+    def select(self, selector: str) -> list["Node"]:
+        if self._el is None:
+            return []
+        if self._lxml:
+            return [Node(el, True) for el in _compile_lxml(selector)(self._el)]
+        return [Node(el, False) for el in self._el.select(selector)]
+
+    def select_one(self, selector: str) -> Optional["Node"]:
+        if self._el is None:
+            return None
+        if self._lxml:
+            found = _compile_lxml(selector)(self._el)
+            return Node(found[0], True) if found else None
+        el = self._el.select_one(selector)
+        return Node(el, False) if el is not None else None
+
+    def get(self, attr: str, default=""):
+        if self._el is None:
+            return default
+        value = self._el.get(attr)
+        if value is None:
+            return default
+        if not self._lxml and isinstance(value, list):  # BeautifulSoup은 class 등을 리스트로 반환
+            return " ".join(value)
+        return value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if self._el is None:
+            return ""
+        if not self._lxml:
+            return self._el.get_text(separator=separator, strip=strip)
+        texts = _lxml_texts(self._el)
+        if strip:
+            texts = (t.strip() for t in texts)
+            texts = (t for t in texts if t)
+        return separator.join(texts)
+
+    def decompose(self):
+        if self._el is None:
+            return
+        if self._lxml:
+            # drop_tree는 뒤따르는 텍스트(tail)를 앞 텍스트에 이어 붙여 get_text(separator)에서
+            # 구분자가 사라지므로, 빈 주석으로 바꿔 tail을 별도 텍스트 노드로 남긴다 (BeautifulSoup과 같게)
+            parent = self._el.getparent()
+            if parent is None:
+                self._el.clear()
+                self._el = None
+                return
+            placeholder = etree.Comment("")
+            placeholder.tail = self._el.tail
+            self._el.tail = None
+            parent.replace(self._el, placeholder)
+        else:
+            self._el.decompose()
+
+    def __bool__(self):
+        return self._el is not None
+
+
+def parse_html(html: str, backend: str = None, target: str = None) -> Node:
+    """
+    HTML 문서를 파싱해 루트 노드를 반환한다.
+
+    Args:
+        backend: "lxml" 또는 "html.parser" (기본: 설치된 가장 빠른 백엔드)
+        target: 이 셀렉터의 하위 트리만 필요하면 지정 (html.parser 백엔드에서 부분 파싱)
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "lxml":
+        if not html or not html.strip():
+            return Node(None, True)
+        try:
+            return Node(lxml.html.document_fromstring(_XML_DECL_RE.sub("", html, count=1)), True)
+        except (etree.ParserError, ValueError):
+            return Node(None, True)
+
+    strainer = _strainer_for(target) if target else None
+    return Node(BeautifulSoup(html or "", "html.parser", parse_only=strainer), False)
+
+
+def html_to_text(markup: str, separator: str = "", strip: bool = True, backend: str = None) -> str:
+    """HTML 조각의 태그를 제거하고 엔티티를 디코딩한 텍스트"""
+    backend = backend or DEFAULT_BACKEND
+    if backend == "lxml":
+        if not markup or not markup.strip():
+            return ""
+        try:
+            root = Node(lxml.html.fragment_fromstring(markup, create_parent="div"), True)
+        except (etree.ParserError, ValueError):
+            return ""
+    else:
+        root = Node(BeautifulSoup(markup, "html.parser"), False)
+    return root.get_text(separator=separator, strip=strip)
+
+
+class SiteParser:
+    """
+    사이트별 파서. 생성 시 sites.yaml 셀렉터를 한 번 컴파일하고,
+    lxml(cssselect)이 지원하지 않는 셀렉터가 있으면 그 사이트만 html.parser로 폴백한다.
+    """
+
+    def __init__(self, selectors: dict = None, backend: str = None):
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend == "lxml":
+            for selector in (selectors or {}).values():
+                if not isinstance(selector, str) or not selector:
+                    continue
+                try:
+                    _compile_lxml(selector)
+                except SelectorError as e:
+                    logger.debug(f"lxml 미지원 셀렉터 '{selector}' → html.parser 사용: {e}")
+                    self.backend = "html.parser"
+                    break
+
+    def parse(self, html: str, target: str = None) -> Node:
+        return parse_html(html, backend=self.backend, target=target)
+
+    def text(self, markup: str, separator: str = "", strip: bool = True) -> str:
+        return html_to_text(markup, separator=separator, strip=strip, backend=self.backend)
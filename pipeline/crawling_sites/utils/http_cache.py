@@ -0,0 +1,201 @@
+"""
+조건부 요청(HTTP conditional request) 캐시 모듈.
+목록/상세 페이지의 ETag·Last-Modified와 본문 해시, 파싱 결과를 SQLite에 저장한다.
+
+- 재방문 시 If-None-Match / If-Modified-Since 헤더를 보낸다
+- 304 응답이거나 본문 해시가 이전과 같으면 저장된 파싱 결과를 그대로 반환 (BeautifulSoup 생략)
+- 파싱 결과는 parse_key(셀렉터 등 파싱 설정)의 해시와 함께 저장 → 설정이 바뀌면 다시 파싱
+- 파싱 결과는 본문에서만 결정되어야 한다 (현재 시각 등은 캐시 조회 뒤에 채울 것)
+- prune(max_age_days)로 오래 확인하지 않은 URL을 정리한다 (더 이상 목록에 없는 상세 페이지 등)
+
+사용 예:
+    cache = HTTPCache()
+    articles = cache.fetch(session, url, parse=parse_fn, parse_key=selectors, timeout=15)
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 위치: pipeline/cache/http_cache.sqlite
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "cache" / "http_cache.sqlite"
+
+
+def _parse_signature(parse_key: Any) -> str:
+    """파싱 설정을 안정적인 해시 문자열로 변환"""
+    raw = json.dumps(parse_key, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class HTTPCache:
+    """
+    URL별 검증자(ETag/Last-Modified) + 본문 해시 + 파싱 결과 캐시 (스레드 안전).
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: pipeline/cache/http_cache.sqlite)
+        """
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                body BLOB,
+                encoding TEXT,
+                parse_sig TEXT,
+                parsed TEXT,
+                fetched_at REAL
+            )
+            """
+        )
+        self._conn.commit()
+        self.stats = {"not_modified": 0, "unchanged": 0, "reparsed": 0, "miss": 0}
+
+    def fetch(
+        self,
+        session,
+        url: str,
+        parse: Callable[[Any], Any],
+        parse_key: Any = "",
+        timeout: float = 15,
+        raw: bool = False,
+    ) -> Any:
+        """
+        조건부 GET 후 파싱 결과를 반환한다.
+
+        Args:
+            session: requests.Session
+            url: 요청 URL
+            parse: 본문 → JSON 직렬화 가능한 결과 (예외 발생 시 캐시에 저장하지 않음, 본문에만 의존해야 함)
+            parse_key: 파싱 결과에 영향을 주는 설정 (셀렉터 등)
+            timeout: 요청 타임아웃 (초)
+            raw: True면 parse에 bytes를, False면 디코딩된 문자열을 넘긴다
+
+        Raises:
+            requests.RequestException: 요청 실패 또는 4xx/5xx 응답
+        """
+        row = self._get(url)
+        signature = _parse_signature(parse_key)
+
+        headers = {}
+        if row:
+            if row["etag"]:
+                headers["If-None-Match"] = row["etag"]
+            if row["last_modified"]:
+                headers["If-Modified-Since"] = row["last_modified"]
+
+        resp = session.get(url, headers=headers, timeout=timeout)
+
+        # 1. 304 Not Modified → 저장된 본문/파싱 결과 사용
+        if resp.status_code == 304 and row:
+            self._count("not_modified")
+            if row["parse_sig"] == signature:
+                self._touch(url)
+                return json.loads(row["parsed"])
+            body = zlib.decompress(row["body"])
+            parsed = parse(body if raw else body.decode(row["encoding"] or "utf-8", errors="replace"))
+            self._put(url, row["etag"], row["last_modified"], row["body_hash"], body,
+                      row["encoding"], signature, parsed)
+            return parsed
+
+        resp.raise_for_status()
+
+        # 인코딩 자동 감지
+        if resp.encoding and resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = resp.apparent_encoding
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        body = resp.content
+        body_hash = hashlib.sha1(body).hexdigest()
+
+        # 2. 서버가 검증자를 지원하지 않아도 본문이 같으면 파싱 생략
+        if row and row["body_hash"] == body_hash and row["parse_sig"] == signature:
+            self._count("unchanged")
+            self._put_validators(url, etag, last_modified)
+            return json.loads(row["parsed"])
+
+        # 3. 새로 파싱
+        self._count("reparsed" if row else "miss")
+        parsed = parse(body if raw else resp.text)
+        self._put(url, etag, last_modified, body_hash, body, resp.encoding, signature, parsed)
+        return parsed
+
+    def prune(self, max_age_days: float) -> int:
+        """fetched_at(마지막 요청·확인 시각)이 max_age_days보다 오래된 항목을 삭제하고 삭제 건수를 반환한다."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM http_cache WHERE fetched_at < ?",
+                (time.time() - max_age_days * 86400,),
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def summary(self) -> str:
+        hits = self.stats["not_modified"] + self.stats["unchanged"]
+        total = hits + self.stats["reparsed"] + self.stats["miss"]
+        return (
+            f"HTTP 캐시 재사용 {hits}/{total}건 "
+            f"(304: {self.stats['not_modified']}, 동일 본문: {self.stats['unchanged']})"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _get(self, url: str):
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, body, encoding, parse_sig, parsed "
+                "FROM http_cache WHERE url = ?",
+                (url,),
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        keys = ("etag", "last_modified", "body_hash", "body", "encoding", "parse_sig", "parsed")
+        return dict(zip(keys, row))
+
+    def _put(self, url, etag, last_modified, body_hash, body, encoding, signature, parsed):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, etag, last_modified, body_hash, body, encoding, parse_sig, parsed, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body_hash, zlib.compress(body), encoding,
+                 signature, json.dumps(parsed, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def _put_validators(self, url, etag, last_modified):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET etag = ?, last_modified = ?, fetched_at = ? WHERE url = ?",
+                (etag, last_modified, time.time(), url),
+            )
+            self._conn.commit()
+
+    def _touch(self, url: str):
+        with self._lock:
+            self._conn.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
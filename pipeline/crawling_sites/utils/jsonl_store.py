@@ -0,0 +1,244 @@
+"""
+크롤링 결과 스트리밍 저장 모듈 (JSONL, 선택적으로 zstd 압축).
+크롤러가 결과 전체를 메모리에 모았다가 마지막에 JSON 하나로 덤프하는 대신,
+기사/영상 하나마다 한 줄씩 기록하고 바로 flush한다. 프로세스가 도중에 죽어도 그때까지의 기록은 남는다.
+
+레코드 (한 줄에 JSON 하나):
+    {"type": "meta", "format": 1, "items_key": "articles", "crawled_at": ...}   첫 줄, 문서 공통 필드
+    {"type": "category", "id": 0, "main_category": ..., "sub_category": ...}  카테고리(섹션) 필드
+    {"type": "item", "category": 0, "data": {...}}                            기사/영상 하나
+    {"type": "end", "total_articles": ...}                                    정상 종료 시 요약 (없으면 부분 결과)
+
+파일 이름이 .zst로 끝나면 zstd 스트림으로 압축한다 (zstandard 패키지 필요).
+읽기 쪽은 잘린 마지막 줄을 무시하고, 기존 JSON 문서(categories → articles/videos)도 같은 API로 읽는다.
+
+사용 예:
+    with JsonlWriter("news_data.jsonl", meta={"crawled_at": now}) as writer:
+        cid = writer.add_category({"main_category": "IT", "sub_category": "모바일"})
+        writer.add_item(cid, article)
+        writer.finish({"total_articles": 1})
+
+    for category, item in iter_items(resolve_path(base_dir / "news_data")):
+        ...
+"""
+import io
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# zstd 압축은 선택 사항 (설치되지 않았으면 .zst 경로만 사용할 수 없음)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+    _STREAM_ERRORS = (ValueError, zstandard.ZstdError)
+except ImportError:
+    ZSTD_AVAILABLE = False
+    _STREAM_ERRORS = (ValueError,)
+
+FORMAT_VERSION = 1
+# resolve_path가 찾는 확장자 (같은 시각이면 앞쪽 우선)
+STREAM_SUFFIXES = (".jsonl.zst", ".jsonl", ".json")
+
+
+def _is_zstd(path: Path) -> bool:
+    return path.name.endswith(".zst")
+
+
+class JsonlWriter:
+    """레코드 단위로 flush하는 스레드 안전 JSONL 기록기"""
+
+    def __init__(self, path: str, meta: dict = None, items_key: str = "articles", compression_level: int = 3):
+        """
+        Args:
+            path: 출력 경로 (.zst로 끝나면 zstd 압축)
+            meta: 첫 줄에 기록할 문서 공통 필드 (crawled_at 등)
+            items_key: 기존 JSON 문서에서 카테고리 아래 목록 키 ("articles" 또는 "videos")
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._categories = {}  # 카테고리 키 → id
+        self.item_count = 0
+        self.closed = False
+
+        self._raw = open(self.path, "wb")
+        self._zstd = None
+        if _is_zstd(self.path):
+            if not ZSTD_AVAILABLE:
+                self._raw.close()
+                raise RuntimeError(f"zstd 압축 출력에는 zstandard 패키지가 필요합니다: {self.path}")
+            self._zstd = zstandard.ZstdCompressor(level=compression_level).stream_writer(self._raw)
+
+        self._write({"type": "meta", "format": FORMAT_VERSION, "items_key": items_key, **(meta or {})})
+
+    def _write(self, record: dict):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        if self._zstd:
+            self._zstd.write(line)
+            self._zstd.flush(zstandard.FLUSH_BLOCK)  # 블록 단위로 내보내야 중단 시에도 앞부분을 풀 수 있음
+        else:
+            self._raw.write(line)
+        self._raw.flush()
+
+    def add_category(self, fields: dict, key=None) -> int:
+        """
+        카테고리 레코드를 기록하고 id를 반환한다.
+        key를 주면 같은 key로 이미 기록된 카테고리의 id를 재사용한다.
+        """
+        with self._lock:
+            if key is not None and key in self._categories:
+                return self._categories[key]
+            category_id = len(self._categories)
+            self._categories[category_id if key is None else key] = category_id
+            self._write({"type": "category", "id": category_id, **fields})
+            return category_id
+
+    def add_item(self, category_id: int, item: dict):
+        with self._lock:
+            self._write({"type": "item", "category": category_id, "data": item})
+            self.item_count += 1
+
+    def finish(self, summary: dict = None):
+        """정상 종료 레코드(요약 필드)를 기록하고 닫는다."""
+        with self._lock:
+            if self.closed:
+                return
+            self._write({"type": "end", **(summary or {})})
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self._zstd:
+                self._zstd.close()  # 프레임 종료 + 원본 파일 닫기
+            else:
+                self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()  # 예외로 빠져나오면 end 레코드 없이 닫혀 부분 결과로 표시됨
+
+
+class OrderedFlush:
+    """
+    병렬로 끝난 결과를 끝난 순서가 아닌 번호(0, 1, 2, ...) 순서로 기록하는 스레드 안전 버퍼.
+    앞 번호가 끝날 때까지 뒤 번호의 결과를 잡아 두었다가 이어지는 만큼 flush(value)로 내보낸다.
+    (출력 순서가 섹션/사이트 설정 순서와 같아지는 대신, 느린 앞 번호 뒤의 결과만큼 메모리에 머문다)
+
+    사용 예:
+        ordered = OrderedFlush(lambda section: write_section(writer, section))
+        ordered.put(1, section_b)   # 0번이 아직이므로 보관
+        ordered.put(0, section_a)   # 0번, 1번 순서로 기록
+    """
+
+    def __init__(self, flush: Callable[[Any], None]):
+        self._flush = flush
+        self._pending = {}  # 번호 → 아직 내보내지 못한 결과
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def put(self, index: int, value):
+        """index번 결과를 넘긴다 (실패처럼 기록할 것이 없어도 순서를 잇기 위해 넘겨야 한다)."""
+        with self._lock:
+            self._pending[index] = value
+            while self._next in self._pending:
+                self._flush(self._pending.pop(self._next))
+                self._next += 1
+
+    def drain(self):
+        """중단 등으로 빠진 번호가 있어도 남은 결과를 번호 순서로 모두 내보낸다."""
+        with self._lock:
+            for index in sorted(self._pending):
+                self._flush(self._pending.pop(index))
+                self._next = index + 1
+
+
+def resolve_path(base: str) -> Optional[Path]:
+    """
+    확장자 없는 기본 경로(예: crawling_naver_news/news_data)에 대해
+    .jsonl.zst / .jsonl / .json 중 가장 최근에 기록된 파일을 반환한다 (없으면 None).
+    확장자가 붙은 경로를 주면 같은 이름의 다른 형식도 후보로 본다.
+    """
+    base = Path(base)
+    name = base.name
+    for suffix in STREAM_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    candidates = [base.with_name(name + suffix) for suffix in STREAM_SUFFIXES]
+    existing = [path for path in candidates if path.exists()]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: path.stat().st_mtime)
+
+
+def _open_lines(path: Path):
+    raw = open(path, "rb")
+    if not _is_zstd(path):
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    if not ZSTD_AVAILABLE:
+        raw.close()
+        raise RuntimeError(f"zstd 압축 파일을 읽으려면 zstandard 패키지가 필요합니다: {path}")
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return io.TextIOWrapper(reader, encoding="utf-8")
+
+
+def iter_records(path: str) -> Iterator[dict]:
+    """JSONL 레코드를 순서대로 읽는다. 중단된 크롤링의 잘린 마지막 줄/압축 블록은 건너뛴다."""
+    path = Path(path)
+    with _open_lines(path) as f:
+        try:
+            for line in f:
+                if not line.endswith("\n"):
+                    logger.warning(f"잘린 마지막 레코드 무시: {path}")
+                    return
+                yield json.loads(line)
+        except _STREAM_ERRORS as e:  # 깨진 줄, 끝나지 않은 압축 프레임
+            logger.warning(f"{path} 읽기 중단 (부분 결과): {e}")
+
+
+def _iter_legacy_items(path: Path) -> Iterator[tuple[dict, dict]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or "categories" not in data:
+        for item in data or []:
+            yield {}, item
+        return
+    for cat in data["categories"]:
+        items = cat.get("articles", []) or cat.get("videos", [])
+        fields = {k: v for k, v in cat.items() if k not in ("articles", "videos")}
+        for item in items:
+            yield fields, item
+
+
+def iter_items(path: str) -> Iterator[tuple[dict, dict]]:
+    """
+    (카테고리 필드, 기사/영상) 쌍을 기록 순서대로 읽는다.
+    .json 경로면 기존 JSON 문서(categories → articles/videos)를 읽는다.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        yield from _iter_legacy_items(path)
+        return
+
+    categories = {}
+    finished = False
+    for record in iter_records(path):
+        kind = record.get("type")
+        if kind == "item":
+            yield categories.get(record.get("category"), {}), record.get("data", {})
+        elif kind == "category":
+            categories[record.get("id")] = {k: v for k, v in record.items() if k not in ("type", "id")}
+        elif kind == "end":
+            finished = True
+    if not finished:
+        logger.warning(f"정상 종료 레코드가 없습니다 — 중단된 크롤링의 부분 결과: {path}")
+
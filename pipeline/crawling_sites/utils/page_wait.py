@@ -0,0 +1,181 @@
+"""
+Selenium 페이지 준비 대기 모듈.
+고정 time.sleep 대신 실제로 필요한 조건이 충족되는 즉시 진행한다.
+
+- wait_for_page: 셀렉터 등장(또는 document.readyState == complete) + 선택적 네트워크 유휴 대기
+- scroll_and_wait: 무한스크롤 후 항목 수가 늘어날 때까지만 대기
+- 모든 대기는 timeout으로 상한을 둔다 (조건 미충족 시 지금 상태로 진행)
+- 키(사이트)별 대기 시간 히스토그램과 기존 고정 대기 대비 절약 시간을 WAIT_STATS에 기록
+
+사용 예:
+    elapsed = wait_for_page(driver, selector=".board-list tr", timeout=10,
+                            stats_key="kt_news", baseline=3)
+    print(WAIT_STATS.summary())
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+# 네트워크 유휴 판단용: 로드된 리소스 수
+_RESOURCE_COUNT_JS = "return window.performance.getEntriesByType('resource').length;"
+
+POLL_INTERVAL = 0.1
+
+
+class WaitStats:
+    """키별 대기 시간 히스토그램 (스레드 안전)"""
+
+    BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0)  # 초 (마지막 구간은 10초 초과)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: [0] * (len(self.BUCKETS) + 1))
+        self._totals = defaultdict(float)
+        self._saved = defaultdict(float)
+        self._timeouts = defaultdict(int)
+
+    def record(self, key: str, elapsed: float, baseline: float = 0.0, timed_out: bool = False):
+        """
+        Args:
+            elapsed: 실제 대기 시간 (초)
+            baseline: 기존 고정 대기 시간 (절약 시간 계산용, 음수면 더 오래 기다린 것)
+        """
+        with self._lock:
+            self._counts[key][bisect_left(self.BUCKETS, elapsed)] += 1
+            self._totals[key] += elapsed
+            self._saved[key] += baseline - elapsed
+            if timed_out:
+                self._timeouts[key] += 1
+
+    def snapshot(self) -> dict:
+        """{키: {count, avg_seconds, saved_seconds, timeouts, histogram}}"""
+        labels = [f"<={b:g}s" for b in self.BUCKETS] + [f">{self.BUCKETS[-1]:g}s"]
+        with self._lock:
+            result = {}
+            for key, counts in self._counts.items():
+                count = sum(counts)
+                result[key] = {
+                    "count": count,
+                    "avg_seconds": round(self._totals[key] / count, 2) if count else 0.0,
+                    "saved_seconds": round(self._saved[key], 1),
+                    "timeouts": self._timeouts[key],
+                    "histogram": {label: n for label, n in zip(labels, counts) if n},
+                }
+            return result
+
+    def summary(self) -> str:
+        snapshot = self.snapshot()
+        if not snapshot:
+            return "페이지 대기 기록 없음"
+        lines = ["⏱️  페이지 대기 시간 (키별)"]
+        total_saved = 0.0
+        for key, info in sorted(snapshot.items()):
+            total_saved += info["saved_seconds"]
+            hist = " ".join(f"{label}:{n}" for label, n in info["histogram"].items())
+            timeout_note = f" | 타임아웃 {info['timeouts']}회" if info["timeouts"] else ""
+            lines.append(
+                f"   {key:<24} {info['count']:>3}회 평균 {info['avg_seconds']:.2f}s"
+                f" | 절약 {info['saved_seconds']:+.1f}s{timeout_note} | {hist}"
+            )
+        lines.append(f"   고정 대기 대비 총 절약: {total_saved:+.1f}s")
+        return "\n".join(lines)
+
+
+# 프로세스 공용 통계
+WAIT_STATS = WaitStats()
+
+
+def _poll(condition, timeout: float) -> bool:
+    """condition()이 참이 될 때까지 폴링 (예외는 미충족으로 간주)"""
+    deadline = time.time() + timeout
+    while True:
+        try:
+            if condition():
+                return True
+        except Exception:
+            pass
+        if time.time() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def _count(driver, selector: str) -> int:
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", selector)
+
+
+def wait_for_network_idle(driver, idle_time: float = 0.5, timeout: float = 5.0) -> bool:
+    """새 리소스 요청이 idle_time 동안 없을 때까지 대기"""
+    state = {"count": -1, "since": time.time()}
+
+    def idle():
+        count = driver.execute_script(_RESOURCE_COUNT_JS)
+        now = time.time()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return now - state["since"] >= idle_time
+
+    return _poll(idle, timeout)
+
+
+def wait_for_page(
+    driver,
+    selector: str = None,
+    timeout: float = 10.0,
+    network_idle: bool = False,
+    min_count: int = 1,
+    stats_key: str = None,
+    baseline: float = 0.0,
+) -> float:
+    """
+    페이지가 준비될 때까지 대기하고 실제 대기 시간을 반환한다.
+
+    Args:
+        selector: 등장을 기다릴 CSS 셀렉터 (없으면 document.readyState == complete)
+        timeout: 전체 대기 상한 (초)
+        network_idle: True면 조건 충족 후 네트워크 유휴까지 추가 대기 (남은 시간 내)
+        min_count: selector 요소가 최소 이만큼 있어야 준비 완료
+        stats_key: WAIT_STATS 기록 키 (없으면 기록 안 함)
+        baseline: 기존 고정 대기 시간 (절약 시간 계산용)
+    """
+    started = time.time()
+    if selector:
+        ready = _poll(lambda: _count(driver, selector) >= min_count, timeout)
+    else:
+        ready = _poll(lambda: driver.execute_script("return document.readyState;") == "complete", timeout)
+
+    remaining = timeout - (time.time() - started)
+    if network_idle and remaining > 0:
+        wait_for_network_idle(driver, timeout=remaining)
+
+    elapsed = time.time() - started
+    if stats_key:
+        WAIT_STATS.record(stats_key, elapsed, baseline, timed_out=not ready)
+    return elapsed
+
+
+def scroll_and_wait(
+    driver,
+    item_selector: str,
+    scroll_count: int,
+    timeout: float = 5.0,
+    stats_key: str = None,
+    baseline: float = 0.0,
+) -> int:
+    """
+    무한스크롤을 scroll_count회 수행한다. 매 스크롤 후 항목 수가 늘어날 때까지만 기다리고,
+    늘어나지 않으면(더 불러올 항목 없음) 중단한다. 최종 항목 수를 반환한다.
+    """
+    count = _count(driver, item_selector)
+    for _ in range(scroll_count):
+        before = count
+        started = time.time()
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        grew = _poll(lambda: _count(driver, item_selector) > before, timeout)
+        if stats_key:
+            WAIT_STATS.record(stats_key, time.time() - started, baseline, timed_out=not grew)
+        count = _count(driver, item_selector)
+        if not grew:
+            break
+    return count
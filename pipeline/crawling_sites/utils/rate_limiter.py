@@ -1,10 +1,16 @@
 """
 도메인별 요청 간격 제어 모듈.
 같은 도메인에 대한 과도한 요청을 방지한다.
+
+도메인마다 다음 요청 슬롯을 예약하는 토큰 버킷(GCRA) 방식:
+- 락은 슬롯 계산에만 잡고, 실제 대기는 락 밖에서 한다 → 한 도메인의 대기가 다른 도메인을 막지 않음
+- burst > 1이면 유휴 상태였던 도메인에 대해 burst개까지 간격 없이 연속 요청 허용
+- 스레드용 DomainRateLimiter.wait()와 asyncio용 AsyncDomainRateLimiter.wait_async()가
+  같은 예약 테이블을 공유한다
 """
+import asyncio
 import time
 import threading
-from collections import defaultdict
 
 
 class DomainRateLimiter:
@@ -17,33 +23,68 @@ class DomainRateLimiter:
         limiter.wait("news.samsung.com")  # 2초 대기 후 진행
     """
 
-    def __init__(self, default_delay: float = 2.0, domain_delays: dict = None):
+    def __init__(self, default_delay: float = 2.0, domain_delays: dict = None,
+                 burst: int = 1, domain_bursts: dict = None):
         """
         Args:
             default_delay: 기본 요청 간격 (초)
             domain_delays: 도메인별 커스텀 간격 (예: {"boho.or.kr": 3.0})
+            burst: 기본 버스트 허용량 (1이면 항상 간격 유지)
+            domain_bursts: 도메인별 커스텀 버스트 허용량
         """
         self.default_delay = default_delay
         self.domain_delays = domain_delays or {}
-        self._last_request_time = defaultdict(float)
+        self.default_burst = max(1, int(burst))
+        self.domain_bursts = domain_bursts or {}
+        # 도메인별 이론적 다음 도착 시각 (theoretical arrival time)
+        self._next_slot = {}
         self._lock = threading.Lock()
 
-    def wait(self, domain: str):
+    def reserve(self, domain: str) -> float:
         """
-        해당 도메인의 레이트 리밋에 따라 대기한다.
-        스레드 안전하게 구현.
+        해당 도메인의 다음 요청 슬롯을 예약하고, 슬롯까지 남은 대기 시간(초)을 반환한다.
+        예약 즉시 다음 호출자는 그 뒤 슬롯을 받으므로 호출자는 락 없이 대기하면 된다.
         """
+        delay = self.get_delay(domain)
+        burst = self.get_burst(domain)
         with self._lock:
-            delay = self.domain_delays.get(domain, self.default_delay)
-            now = time.time()
-            elapsed = now - self._last_request_time[domain]
+            now = time.monotonic()
+            tat = max(self._next_slot.get(domain, now), now) + delay
+            self._next_slot[domain] = tat
+        return max(0.0, tat - burst * delay - now)
 
-            if elapsed < delay:
-                wait_time = delay - elapsed
-                time.sleep(wait_time)
-
-            self._last_request_time[domain] = time.time()
+    def wait(self, domain: str):
+        """
+        해당 도메인의 레이트 리밋에 따라 대기한다.
+        스레드 안전하게 구현 (대기는 락 밖에서 수행).
+        """
+        wait_time = self.reserve(domain)
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def get_delay(self, domain: str) -> float:
         """해당 도메인의 설정된 딜레이 반환"""
         return self.domain_delays.get(domain, self.default_delay)
+
+    def get_burst(self, domain: str) -> int:
+        """해당 도메인의 버스트 허용량 반환"""
+        return max(1, int(self.domain_bursts.get(domain, self.default_burst)))
+
+
+class AsyncDomainRateLimiter(DomainRateLimiter):
+    """
+    asyncio용 레이트 리미터.
+
+    이벤트 루프에서는 wait_async()로 대기하고, 스레드 풀에서 실행되는 전략 코드
+    (페이지네이션 등)는 기존 wait()를 그대로 호출해도 같은 슬롯 예약을 공유한다.
+
+    사용 예:
+        limiter = AsyncDomainRateLimiter(default_delay=2.0, burst=2)
+        await limiter.wait_async("news.samsung.com")
+    """
+
+    async def wait_async(self, domain: str):
+        """해당 도메인의 다음 슬롯까지 이벤트 루프를 막지 않고 대기한다."""
+        wait_time = self.reserve(domain)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
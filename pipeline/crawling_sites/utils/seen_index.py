@@ -0,0 +1,142 @@
+"""
+이미 수집한 기사 URL 인덱스 모듈.
+URL → (본문 해시, 수집 시각, 추출 본문, 부가 정보)를 SQLite에 저장해
+다음 실행에서 같은 링크의 상세 페이지 요청을 생략한다.
+
+- 본문은 zlib 압축해 저장 (기사당 수 KB)
+- max_age_days보다 오래된 항목은 prune()으로 정리
+- 멀티사이트 크롤러와 네이버 뉴스 크롤러가 같은 파일을 공유 (WAL 모드)
+
+사용 예:
+    index = SeenIndex()
+    entry = index.get(url)
+    if entry:
+        article.content = entry["content"]
+    else:
+        ...
+        index.put(url, content)
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# 기본 인덱스 위치: pipeline/cache/seen_urls.sqlite
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[2] / "cache" / "seen_urls.sqlite"
+
+# 같은 기사를 가리키지만 값이 달라지는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+
+def normalize_url(url: str) -> str:
+    """프래그먼트와 추적용 쿼리 파라미터를 제거한 인덱스 키"""
+    parsed = urlparse(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.startswith(_TRACKING_PARAMS)
+    ]
+    return urlunparse(parsed._replace(query=urlencode(query), fragment=""))
+
+
+class SeenIndex:
+    """수집 완료 URL 인덱스 (스레드 안전)"""
+
+    def __init__(self, path: str = None, max_age_days: float = 7):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: pipeline/cache/seen_urls.sqlite)
+            max_age_days: 이보다 오래된 항목은 재사용하지 않고 prune() 시 삭제
+        """
+        self.path = Path(path or DEFAULT_INDEX_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT,
+                fetched_at REAL,
+                content BLOB,
+                extra TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_fetched_at ON seen_urls (fetched_at)")
+        self._conn.commit()
+        self.stats = {"hit": 0, "miss": 0, "stored": 0}
+
+    def get(self, url: str, max_age_seconds: float = None) -> Optional[dict]:
+        """
+        저장된 항목을 반환한다. 없거나 max_age_seconds(기본: max_age_days)보다 오래되면 None.
+
+        Returns:
+            {"content", "content_hash", "fetched_at", "extra"} 또는 None
+        """
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, fetched_at, content, extra FROM seen_urls WHERE url = ?",
+                (normalize_url(url),),
+            ).fetchone()
+            if not row or time.time() - row[1] > max_age:
+                self.stats["miss"] += 1
+                return None
+            self.stats["hit"] += 1
+
+        content_hash, fetched_at, content, extra = row
+        return {
+            "content": zlib.decompress(content).decode("utf-8") if content else "",
+            "content_hash": content_hash,
+            "fetched_at": fetched_at,
+            "extra": json.loads(extra) if extra else {},
+        }
+
+    def put(self, url: str, content: str, extra: dict = None):
+        """상세 페이지에서 추출한 본문을 기록한다."""
+        content = content or ""
+        encoded = content.encode("utf-8")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen_urls (url, content_hash, fetched_at, content, extra) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    hashlib.sha1(encoded).hexdigest(),
+                    time.time(),
+                    zlib.compress(encoded),
+                    json.dumps(extra, ensure_ascii=False) if extra else None,
+                ),
+            )
+            self._conn.commit()
+            self.stats["stored"] += 1
+
+    def prune(self) -> int:
+        """max_age_days보다 오래된 항목을 삭제하고 삭제 건수를 반환한다."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM seen_urls WHERE fetched_at < ?",
+                (time.time() - self.max_age_seconds,),
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def summary(self) -> str:
+        return (
+            f"URL 인덱스 재사용 {self.stats['hit']}건"
+            f" | 신규 {self.stats['miss']}건 | 저장 {self.stats['stored']}건"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,173 @@
+"""
+사이트별 건강 기록 + 서킷 브레이커 모듈.
+실행 간에 sites_health.json(sites_report.json 옆)에 사이트별 요청 지연 EWMA와 연속 실패 수를 남기고,
+다음 실행의 타임아웃·재시도·건너뛰기를 결정한다.
+
+상태:
+- closed    정상. 타임아웃을 지연 EWMA × timeout_multiplier로 조정 (min_timeout ~ 설정값 사이)
+            연속 실패가 있으면 재시도 1회로 축소
+- open      연속 failure_threshold회 실패 → cooldown 동안 크롤링하지 않고 "skipped"로 보고
+- half_open cooldown이 지나면 재시도 없이 1회 시험 요청 (성공 → closed, 실패 → cooldown 2배로 open)
+
+사용 예:
+    health = SiteHealth()
+    state = health.state(key)          # closed | open | half_open
+    cfg = health.apply(key, cfg)       # 타임아웃/재시도 조정된 설정 사본
+    health.record(key, success, latencies, error)
+    health.save()
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 위치: crawling_sites/sites_health.json (sites_report.json과 같은 디렉토리)
+DEFAULT_HEALTH_PATH = Path(__file__).resolve().parents[1] / "sites_health.json"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SiteHealth:
+    """실행 간 유지되는 사이트별 건강 기록"""
+
+    def __init__(
+        self,
+        path: str = None,
+        failure_threshold: int = 3,
+        cooldown_hours: float = 6,
+        max_cooldown_hours: float = 72,
+        ewma_alpha: float = 0.3,
+        timeout_multiplier: float = 4.0,
+        min_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            path: 기록 파일 경로 (기본: crawling_sites/sites_health.json)
+            failure_threshold: 이 횟수만큼 연속 실패하면 서킷 open
+            cooldown_hours: 첫 open 후 시험 요청까지 대기 시간 (재실패마다 2배, max_cooldown_hours 상한)
+            ewma_alpha: 요청 지연 EWMA 가중치
+            timeout_multiplier: 적응형 타임아웃 = 지연 EWMA × 배율
+            min_timeout: 적응형 타임아웃 하한 (초)
+        """
+        self.path = Path(path or DEFAULT_HEALTH_PATH)
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_hours * 3600
+        self.max_cooldown_seconds = max_cooldown_hours * 3600
+        self.ewma_alpha = ewma_alpha
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.sites = self._load()
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("sites", {})
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"사이트 건강 기록을 읽을 수 없어 새로 시작합니다 ({self.path}): {e}")
+            return {}
+
+    def save(self):
+        """원자적 저장 (임시 파일 → rename)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"updated_at": datetime.now().isoformat(), "sites": self.sites}
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix=".sites_health.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def state(self, key: str, now: float = None) -> str:
+        """현재 서킷 상태 (open이어도 cooldown이 지났으면 half_open)"""
+        entry = self.sites.get(key)
+        if not entry or entry.get("state") != OPEN:
+            return CLOSED
+        now = now or time.time()
+        return HALF_OPEN if now >= entry.get("retry_after", 0) else OPEN
+
+    def retry_after(self, key: str) -> Optional[str]:
+        """open 서킷의 다음 시험 요청 시각 (ISO)"""
+        entry = self.sites.get(key, {})
+        if entry.get("state") != OPEN:
+            return None
+        return datetime.fromtimestamp(entry.get("retry_after", 0)).isoformat(timespec="seconds")
+
+    def timeout_for(self, key: str, configured: float) -> float:
+        """지연 EWMA 기반 적응형 타임아웃 (기록이 없으면 설정값)"""
+        ewma = self.sites.get(key, {}).get("latency_ewma")
+        if not ewma:
+            return configured
+        return round(min(configured, max(self.min_timeout, ewma * self.timeout_multiplier)), 1)
+
+    def apply(self, key: str, site_config: dict) -> dict:
+        """건강 기록을 반영한 사이트 설정 사본 (timeout_seconds, retry_count)"""
+        cfg = dict(site_config)
+        entry = self.sites.get(key, {})
+        cfg["timeout_seconds"] = self.timeout_for(key, site_config.get("timeout_seconds", 15))
+        if self.state(key) == HALF_OPEN or entry.get("consecutive_failures", 0) > 0:
+            cfg["retry_count"] = 1  # 시험 요청/불안정 사이트는 재시도로 크롤링 시간을 늘리지 않음
+        return cfg
+
+    def record(self, key: str, success: bool, latencies: list = None, error: str = ""):
+        """실행 결과를 반영한다 (latencies: 성공한 요청별 소요 시간, 초)"""
+        now = time.time()
+        was_half_open = self.state(key, now) == HALF_OPEN
+        entry = self.sites.setdefault(key, {
+            "state": CLOSED,
+            "latency_ewma": None,
+            "consecutive_failures": 0,
+            "total_successes": 0,
+            "total_failures": 0,
+            "trips": 0,
+        })
+
+        for latency in latencies or []:
+            prev = entry.get("latency_ewma")
+            entry["latency_ewma"] = round(
+                latency if prev is None else self.ewma_alpha * latency + (1 - self.ewma_alpha) * prev, 3
+            )
+
+        if success:
+            entry["consecutive_failures"] = 0
+            entry["total_successes"] += 1
+            entry["last_success"] = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+            if entry["state"] == OPEN:
+                logger.info(f"[{key}] 시험 요청 성공 → 서킷 closed")
+            entry["state"] = CLOSED
+            entry["trips"] = 0
+            entry.pop("retry_after", None)
+            return
+
+        entry["consecutive_failures"] += 1
+        entry["total_failures"] += 1
+        entry["last_failure"] = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        entry["last_error"] = error[:200]
+        if was_half_open or entry["consecutive_failures"] >= self.failure_threshold:
+            entry["trips"] += 1
+            cooldown = min(self.cooldown_seconds * 2 ** (entry["trips"] - 1), self.max_cooldown_seconds)
+            entry["state"] = OPEN
+            entry["retry_after"] = now + cooldown
+            logger.warning(
+                f"[{key}] 연속 {entry['consecutive_failures']}회 실패 → 서킷 open "
+                f"({cooldown / 3600:.1f}시간 후 시험 요청)"
+            )
+
+    def summary(self) -> str:
+        states = [self.state(key) for key in self.sites]
+        return (
+            f"사이트 건강: 정상 {states.count(CLOSED)} | 차단 {states.count(OPEN)}"
+            f" | 시험 대기 {states.count(HALF_OPEN)}"
+        )
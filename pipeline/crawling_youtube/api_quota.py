@@ -0,0 +1,179 @@
+"""
+YouTube Data API 쿼터 계산 + 검색 결과 캐시 모듈.
+
+- search.list는 호출당 100 유닛, videos.list는 1 유닛 (ID 50개까지 한 번에 조회)
+- 같은 조건(키워드, 기간, 길이, 자막 등)의 검색 결과(영상 ID)는 TTL 동안 SQLite에 캐시해 재사용
+- 사용량은 실행 단위로 집계하고, 일일 합계는 쿼터 리셋 기준(미국 태평양 시간 자정)으로 누적해
+  일일 한도를 넘길 search.list 호출은 하지 않는다
+
+사용 예:
+    store = ApiCache()
+    quota = QuotaTracker(daily_limit=10000, store=store)
+    ids = store.get_search(params, ttl_hours=12)
+    if ids is None and quota.can_spend("search.list"):
+        ...  # API 호출
+        quota.charge("search.list")
+        store.put_search(params, ids)
+    print(quota.summary())
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+# 기본 캐시 위치: pipeline/cache/youtube_api.sqlite
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "cache" / "youtube_api.sqlite"
+
+# API 메서드별 쿼터 비용 (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+}
+DEFAULT_DAILY_QUOTA = 10000
+VIDEOS_BATCH_SIZE = 50  # videos.list id 파라미터 최대 개수
+
+# 쿼터는 태평양 시간 자정에 리셋된다
+_QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+
+
+def _quota_day() -> str:
+    return datetime.now(_QUOTA_TZ).strftime("%Y-%m-%d")
+
+
+def _search_key(params: dict) -> str:
+    raw = json.dumps(params, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ApiCache:
+    """검색 결과(영상 ID) 캐시 + 일일 쿼터 사용량 기록 (스레드 안전)"""
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                params TEXT,
+                video_ids TEXT,
+                fetched_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quota_usage (
+                day TEXT PRIMARY KEY,
+                units INTEGER
+            )
+            """
+        )
+        self._conn.commit()
+        self.stats = {"hit": 0, "miss": 0}
+
+    def get_search(self, params: dict, ttl_hours: float):
+        """TTL 안에 저장된 검색 결과 영상 ID 목록 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT video_ids, fetched_at FROM search_cache WHERE key = ?", (_search_key(params),)
+            ).fetchone()
+            if row and time.time() - row[1] < ttl_hours * 3600:
+                self.stats["hit"] += 1
+                return json.loads(row[0])
+            self.stats["miss"] += 1
+            return None
+
+    def put_search(self, params: dict, video_ids: list):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, params, video_ids, fetched_at) VALUES (?, ?, ?, ?)",
+                (_search_key(params), json.dumps(params, ensure_ascii=False), json.dumps(video_ids), time.time()),
+            )
+            self._conn.commit()
+
+    def prune(self, max_age_hours: float) -> int:
+        """오래된 검색 결과 삭제, 삭제 건수 반환"""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM search_cache WHERE fetched_at < ?", (time.time() - max_age_hours * 3600,)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def day_usage(self, day: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT units FROM quota_usage WHERE day = ?", (day,)).fetchone()
+            return row[0] if row else 0
+
+    def add_usage(self, day: str, units: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO quota_usage (day, units) VALUES (?, ?) "
+                "ON CONFLICT(day) DO UPDATE SET units = units + excluded.units",
+                (day, units),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class QuotaTracker:
+    """실행 단위 쿼터 사용량 집계 + 일일 한도 확인"""
+
+    def __init__(self, daily_limit: int = DEFAULT_DAILY_QUOTA, store: ApiCache = None):
+        """
+        Args:
+            daily_limit: 일일 쿼터 한도 (프로젝트 기본 10,000 유닛)
+            store: 일일 누적 사용량을 기록할 ApiCache (없으면 이번 실행 사용량만으로 판단)
+        """
+        self.daily_limit = daily_limit
+        self.store = store
+        self.used = 0
+        self.calls = {method: 0 for method in QUOTA_COSTS}
+        self.skipped = 0  # 한도 때문에 건너뛴 호출 수
+        self._lock = threading.Lock()
+
+    def today_used(self) -> int:
+        return self.store.day_usage(_quota_day()) if self.store else self.used
+
+    def can_spend(self, method: str) -> bool:
+        """이 호출로 일일 한도를 넘지 않는지 확인 (넘으면 skipped로 집계)"""
+        if self.today_used() + QUOTA_COSTS[method] <= self.daily_limit:
+            return True
+        with self._lock:
+            self.skipped += 1
+        return False
+
+    def charge(self, method: str, count: int = 1):
+        units = QUOTA_COSTS[method] * count
+        with self._lock:
+            self.used += units
+            self.calls[method] += count
+        if self.store:
+            self.store.add_usage(_quota_day(), units)
+
+    def snapshot(self) -> dict:
+        return {
+            "used": self.used,
+            "calls": dict(self.calls),
+            "skipped": self.skipped,
+            "today_used": self.today_used(),
+            "daily_limit": self.daily_limit,
+        }
+
+    def summary(self) -> str:
+        calls = ", ".join(f"{method} {n}회" for method, n in self.calls.items())
+        text = f"API 쿼터 사용 {self.used}유닛 ({calls}) | 오늘 누적 {self.today_used()}/{self.daily_limit}"
+        if self.skipped:
+            text += f" | 한도 초과로 건너뜀 {self.skipped}회"
+        return text
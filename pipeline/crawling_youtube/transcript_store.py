@@ -0,0 +1,130 @@
+"""
+YouTube 자막 캐시 모듈.
+이미 처리한 영상의 자막을 다시 받지 않도록 (video_id, 언어 조건)별 결과를 SQLite에 저장한다.
+
+- 자막 본문은 내용 해시(sha256)를 키로 한 번만 저장 (content-addressed, zlib 압축)
+- (video_id, 언어 조건) → 상태 + 본문 해시 인덱스
+- 성공한 자막은 만료 없이 재사용
+- 자막 비활성화/자막 없음/한국어 자막 없음/영상 접근 불가는 negative_ttl_hours 동안 "없음"으로 재사용
+  (나중에 자막이 추가될 수 있으므로 만료 후 다시 시도)
+- 네트워크 오류·IP 차단 등 일시적 실패는 저장하지 않는다
+
+사용 예:
+    store = TranscriptStore()
+    hit = store.get(video_id, "ko")       # None(미보유) 또는 (상태, 자막 또는 None)
+    store.put(video_id, "ko", "ok", transcript)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+# 기본 캐시 위치: pipeline/cache/youtube_transcripts.sqlite
+DEFAULT_STORE_PATH = Path(__file__).resolve().parent.parent / "cache" / "youtube_transcripts.sqlite"
+
+# 자막 조회 결과 상태
+OK = "ok"
+NO_KOREAN = "no_korean"        # 자막은 있으나 한국어 자막 없음
+DISABLED = "disabled"          # TranscriptsDisabled
+NOT_FOUND = "not_found"        # NoTranscriptFound
+UNAVAILABLE = "unavailable"    # VideoUnavailable
+ERROR = "error"                # 일시적 오류 (캐시하지 않음)
+
+NEGATIVE_STATUSES = (NO_KOREAN, DISABLED, NOT_FOUND, UNAVAILABLE)
+DEFAULT_NEGATIVE_TTL_HOURS = 72
+
+
+class TranscriptStore:
+    """영상별 자막 조회 결과 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str = None, negative_ttl_hours: float = DEFAULT_NEGATIVE_TTL_HOURS):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: pipeline/cache/youtube_transcripts.sqlite)
+            negative_ttl_hours: "자막 없음" 결과를 재사용할 시간
+        """
+        self.path = Path(path or DEFAULT_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.negative_ttl_seconds = negative_ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcript_blobs (
+                hash TEXT PRIMARY KEY,
+                data BLOB
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcript_index (
+                video_id TEXT,
+                lang_key TEXT,
+                status TEXT,
+                blob_hash TEXT,
+                fetched_at REAL,
+                PRIMARY KEY (video_id, lang_key)
+            )
+            """
+        )
+        self._conn.commit()
+        self.stats = {"hit": 0, "negative_hit": 0, "miss": 0}
+
+    def get(self, video_id: str, lang_key: str) -> Optional[tuple[str, Optional[dict]]]:
+        """저장된 (상태, 자막)을 반환한다. 없거나 "없음" 결과가 만료됐으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT i.status, i.fetched_at, b.data FROM transcript_index i "
+                "LEFT JOIN transcript_blobs b ON b.hash = i.blob_hash "
+                "WHERE i.video_id = ? AND i.lang_key = ?",
+                (video_id, lang_key),
+            ).fetchone()
+            if row is None:
+                self.stats["miss"] += 1
+                return None
+            status, fetched_at, data = row
+            if status == OK and data is not None:
+                self.stats["hit"] += 1
+                return status, json.loads(zlib.decompress(data))
+            if status in NEGATIVE_STATUSES and time.time() - fetched_at < self.negative_ttl_seconds:
+                self.stats["negative_hit"] += 1
+                return status, None
+            self.stats["miss"] += 1
+            return None
+
+    def put(self, video_id: str, lang_key: str, status: str, transcript: Optional[dict] = None):
+        """조회 결과 저장 (일시적 오류는 무시)"""
+        if status != OK and status not in NEGATIVE_STATUSES:
+            return
+        blob_hash = None
+        with self._lock:
+            if status == OK:
+                raw = json.dumps(transcript, ensure_ascii=False, sort_keys=True).encode("utf-8")
+                blob_hash = hashlib.sha256(raw).hexdigest()
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO transcript_blobs (hash, data) VALUES (?, ?)",
+                    (blob_hash, zlib.compress(raw)),
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcript_index (video_id, lang_key, status, blob_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (video_id, lang_key, status, blob_hash, time.time()),
+            )
+            self._conn.commit()
+
+    def summary(self) -> str:
+        total = sum(self.stats.values())
+        return (
+            f"자막 캐시 재사용 {self.stats['hit'] + self.stats['negative_hit']}/{total}건 "
+            f"(자막 {self.stats['hit']}, 자막 없음 {self.stats['negative_hit']})"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -7,11 +7,20 @@
 
 import json
 import re
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import yaml
 
+# 직접 실행 시 패키지 경로 설정 (crawling_sites.utils 공유)
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.utils.driver_pool import build_chrome_options, create_chrome_driver, get_shared_pool
+from crawling_sites.utils.page_wait import WAIT_STATS, wait_for_page
+
 # YouTube Transcript API (무료, API 키 불필요)
 try:
     from youtube_transcript_api import YouTubeTranscriptApi
@@ -29,12 +38,9 @@ except ImportError:
 # Selenium for scraping (YouTube Data API 없이 작동)
 try:
     from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -60,25 +66,12 @@ def load_config(config_path: str) -> dict:
         return yaml.safe_load(yaml_content)
 
 
+YOUTUBE_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
 def setup_driver() -> webdriver.Chrome:
-    """Selenium Chrome 드라이버 설정"""
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-    
-    # 시스템 chromedriver 우선, 없으면 webdriver_manager 폴백
-    import shutil
-    chromedriver_path = shutil.which('chromedriver')
-    if chromedriver_path:
-        service = Service(chromedriver_path)
-    else:
-        service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+    """Selenium Chrome 드라이버 설정 (풀을 쓰지 않는 단독 실행용)"""
+    return create_chrome_driver(build_chrome_options(user_agent=YOUTUBE_USER_AGENT))
 
 
 def get_channel_videos(driver: webdriver.Chrome, channel_id: str, max_videos: int = 10) -> list[dict]:
@@ -88,8 +81,9 @@ def get_channel_videos(driver: webdriver.Chrome, channel_id: str, max_videos: in
     
     try:
         driver.get(channel_url)
-        import time
-        time.sleep(3)  # 페이지 로딩 대기
+        # 영상 카드가 렌더링될 때까지만 대기 (기존 고정 3초)
+        wait_for_page(driver, selector='ytd-rich-item-renderer', timeout=10,
+                      stats_key='youtube:channel', baseline=3)
         
         # 영상 요소 찾기
         video_elements = driver.find_elements(By.CSS_SELECTOR, 'ytd-rich-item-renderer')[:max_videos]
@@ -133,7 +127,6 @@ def get_channel_videos(driver: webdriver.Chrome, channel_id: str, max_videos: in
 
 def search_youtube_by_keyword(driver: webdriver.Chrome, keyword: str, max_videos: int = 10) -> list[dict]:
     """키워드로 유튜브 검색하여 영상 목록 가져오기"""
-    import time
     from urllib.parse import quote
     
     videos = []
@@ -142,7 +135,9 @@ def search_youtube_by_keyword(driver: webdriver.Chrome, keyword: str, max_videos
     
     try:
         driver.get(search_url)
-        time.sleep(3)  # 페이지 로딩 대기
+        # 검색 결과가 렌더링될 때까지만 대기 (기존 고정 3초)
+        wait_for_page(driver, selector='ytd-video-renderer', timeout=10,
+                      stats_key='youtube:search', baseline=3)
         
         # 검색 결과 영상 요소 찾기
         video_elements = driver.find_elements(By.CSS_SELECTOR, 'ytd-video-renderer')[:max_videos]
@@ -352,7 +347,9 @@ def crawl_youtube(
         print("❌ Selenium이 필요합니다.")
         return {}
     
-    driver = setup_driver()
+    # 공용 WebDriver 풀에서 브라우저 임대
+    pool = get_shared_pool()
+    driver = pool.acquire(user_agent=YOUTUBE_USER_AGENT)
     
     result = {
         'crawled_at': datetime.now().isoformat(),
@@ -479,7 +476,9 @@ def crawl_youtube(
             result['categories'].append(category_data)
     
     finally:
-        driver.quit()
+        pool.release(driver)
+        print(f"\n{pool.summary()}")
+        print(WAIT_STATS.summary())
     
     # JSON 저장
     with open(output_path, 'w', encoding='utf-8') as f:
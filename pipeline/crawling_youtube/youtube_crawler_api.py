@@ -1,17 +1,30 @@
 """
 유튜브 크롤러 v2 (YouTube Data API 사용)
 - 공식 API로 정확한 영상 검색 및 필터링
-- 자막 추출은 youtube-transcript-api 사용
+- 검색 결과는 TTL 캐시로 재사용하고, 영상 상세는 전체 키워드를 모아 50개씩 videos.list로 조회
+- 실행별 쿼터 사용량 보고 (api_quota.QuotaTracker)
+- 자막 추출은 youtube-transcript-api 사용 (동시 수집, transcript_store로 영상별 결과 캐시)
 - 한국어 자막(CC) 유무 확인 가능
 """
 
-import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import yaml
 
+# 직접 실행 시 패키지 경로 설정 (crawling_sites.utils 공유)
+_pipeline_dir = Path(__file__).resolve().parent.parent
+if str(_pipeline_dir) not in sys.path:
+    sys.path.insert(0, str(_pipeline_dir))
+
+from crawling_sites.utils.jsonl_store import JsonlWriter
+from crawling_youtube.api_quota import DEFAULT_DAILY_QUOTA, VIDEOS_BATCH_SIZE, ApiCache, QuotaTracker
+from crawling_youtube import transcript_store
+from crawling_youtube.transcript_store import DEFAULT_NEGATIVE_TTL_HOURS, TranscriptStore
+
 # 환경변수 로드 (프로젝트 루트의 .env 사용)
 try:
     from dotenv import load_dotenv
@@ -42,39 +55,81 @@ except ImportError:
     print("⚠️ youtube-transcript-api 설치 필요")
 
 
+DEFAULT_SEARCH_CACHE_TTL_HOURS = 12
+DEFAULT_TRANSCRIPT_WORKERS = 4
+
+# 자막 조회 상태별 로그 메시지
+_TRANSCRIPT_MESSAGES = {
+    transcript_store.NO_KOREAN: "한국어 자막 없음",
+    transcript_store.DISABLED: "자막 비활성화",
+    transcript_store.NOT_FOUND: "자막 없음",
+    transcript_store.UNAVAILABLE: "영상 접근 불가",
+}
+
+
 class YouTubeCrawler:
     """YouTube Data API 기반 크롤러"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        cache: Optional[ApiCache] = None,
+        quota: Optional[QuotaTracker] = None,
+        search_cache_ttl_hours: float = DEFAULT_SEARCH_CACHE_TTL_HOURS,
+        transcripts: Optional[TranscriptStore] = None
+    ):
+        """
+        Args:
+            cache: 검색 결과 캐시 (없으면 매번 search.list 호출)
+            quota: 쿼터 집계기 (없으면 이번 실행 사용량만 집계)
+            search_cache_ttl_hours: 검색 결과 재사용 시간
+            transcripts: 자막 결과 캐시 (없으면 매번 조회)
+        """
         self.api_key = api_key or os.getenv('YOUTUBE_API_KEY')
         if not self.api_key or self.api_key == '여기에_API_키_입력':
             raise ValueError("YouTube API 키가 필요합니다. .env 파일에 YOUTUBE_API_KEY를 설정하세요.")
         
         self.youtube = build('youtube', 'v3', developerKey=self.api_key)
         self.transcript_api = YouTubeTranscriptApi() if TRANSCRIPT_AVAILABLE else None
+        self.cache = cache
+        self.quota = quota or QuotaTracker()
+        self.search_cache_ttl_hours = search_cache_ttl_hours
+        self.transcripts = transcripts
     
-    def search_videos(
+    def search_video_ids(
         self,
         keyword: str,
         max_results: int = 10,
         published_after_hours: int = 48,
-        video_duration: str = 'medium',  # short(<4min), medium(4-20min), long(>20min)
-        caption: str = 'closedCaption',  # any, closedCaption, none
+        video_duration: str = 'medium',
+        caption: str = 'closedCaption',
         region_code: str = 'KR',
         relevance_language: str = 'ko'
-    ) -> list[dict]:
+    ) -> list[str]:
         """
-        키워드로 영상 검색
-        
-        Args:
-            keyword: 검색 키워드
-            max_results: 최대 결과 수
-            published_after_hours: 최근 N시간 이내 영상만
-            video_duration: 영상 길이 (short/medium/long)
-            caption: 자막 유무 (closedCaption = 자막 있는 영상만)
-            region_code: 지역 코드 (KR = 한국)
-            relevance_language: 관련 언어
+        키워드 검색 결과 영상 ID 목록 (search.list, 100 유닛)
+        같은 조건의 검색은 search_cache_ttl_hours 동안 캐시에서 재사용한다.
+        일일 쿼터 한도를 넘게 되면 호출하지 않고 빈 목록을 반환한다.
         """
+        params = {
+            'q': keyword,
+            'max_results': max_results,
+            'published_after_hours': published_after_hours,
+            'video_duration': video_duration,
+            'caption': caption,
+            'region_code': region_code,
+            'relevance_language': relevance_language
+        }
+        if self.cache:
+            cached = self.cache.get_search(params, self.search_cache_ttl_hours)
+            if cached is not None:
+                print(f"   ♻️ 검색 캐시 사용 ({len(cached)}개)")
+                return cached
+        
+        if not self.quota.can_spend('search.list'):
+            print(f"   ⚠️ 일일 쿼터 한도 도달 — 검색 건너뜀 ({self.quota.today_used()}/{self.quota.daily_limit})")
+            return []
+        
         # 시간 필터
         published_after = (datetime.utcnow() - timedelta(hours=published_after_hours)).isoformat() + 'Z'
         
@@ -91,21 +146,42 @@ class YouTubeCrawler:
                 regionCode=region_code,
                 relevanceLanguage=relevance_language
             ).execute()
+        except Exception as e:
+            print(f"❌ API 검색 오류: {e}")
+            return []
+        finally:
+            self.quota.charge('search.list')  # 실패한 요청도 쿼터가 차감된다
+        
+        video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+        if self.cache:
+            self.cache.put_search(params, video_ids)
+        return video_ids
+    
+    def get_video_details(self, video_ids: list[str]) -> dict[str, dict]:
+        """
+        영상 상세 정보 조회 (videos.list, 요청당 1 유닛, ID 50개씩 묶음)
+        
+        Returns:
+            {video_id: 영상 정보} — 삭제/비공개 영상은 빠진다
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        details = {}
+        for start in range(0, len(unique_ids), VIDEOS_BATCH_SIZE):
+            batch = unique_ids[start:start + VIDEOS_BATCH_SIZE]
+            try:
+                videos_response = self.youtube.videos().list(
+                    part='snippet,contentDetails,statistics',
+                    id=','.join(batch),
+                    maxResults=VIDEOS_BATCH_SIZE
+                ).execute()
+            except Exception as e:
+                print(f"❌ API 영상 조회 오류: {e}")
+                continue
+            finally:
+                self.quota.charge('videos.list')
             
-            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-            
-            if not video_ids:
-                return []
-            
-            # 상세 정보 가져오기
-            videos_response = self.youtube.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=','.join(video_ids)
-            ).execute()
-            
-            videos = []
             for item in videos_response.get('items', []):
-                video = {
+                details[item['id']] = {
                     'video_id': item['id'],
                     'title': item['snippet']['title'],
                     'description': item['snippet']['description'],  # 전체 설명 수집
@@ -116,20 +192,45 @@ class YouTubeCrawler:
                     'view_count': int(item['statistics'].get('viewCount', 0)),
                     'like_count': int(item['statistics'].get('likeCount', 0)),
                     'comment_count': int(item['statistics'].get('commentCount', 0)),
-                    'link': f"https://www.youtube.com/watch?v={item['id']}",
-                    'search_keyword': keyword
+                    'link': f"https://www.youtube.com/watch?v={item['id']}"
                 }
-                videos.append(video)
-            
-            return videos
-            
-        except Exception as e:
-            print(f"❌ API 검색 오류: {e}")
-            return []
+        return details
+    
+    def search_videos(
+        self,
+        keyword: str,
+        max_results: int = 10,
+        published_after_hours: int = 48,
+        video_duration: str = 'medium',  # short(<4min), medium(4-20min), long(>20min)
+        caption: str = 'closedCaption',  # any, closedCaption, none
+        region_code: str = 'KR',
+        relevance_language: str = 'ko'
+    ) -> list[dict]:
+        """
+        키워드로 영상 검색
+        
+        Args:
+            keyword: 검색 키워드
+            max_results: 최대 결과 수
+            published_after_hours: 최근 N시간 이내 영상만
+            video_duration: 영상 길이 (short/medium/long)
+            caption: 자막 유무 (closedCaption = 자막 있는 영상만)
+            region_code: 지역 코드 (KR = 한국)
+            relevance_language: 관련 언어
+        """
+        video_ids = self.search_video_ids(
+            keyword, max_results, published_after_hours, video_duration,
+            caption, region_code, relevance_language
+        )
+        details = self.get_video_details(video_ids)
+        return [
+            {**details[video_id], 'search_keyword': keyword}
+            for video_id in video_ids if video_id in details
+        ]
     
     def get_transcript(self, video_id: str, korean_only: bool = True) -> Optional[dict]:
         """
-        영상 자막 추출
+        영상 자막 추출 (자막 캐시가 있으면 먼저 확인)
         
         Args:
             video_id: 유튜브 영상 ID
@@ -138,6 +239,34 @@ class YouTubeCrawler:
         if not self.transcript_api:
             return None
         
+        lang_key = 'ko' if korean_only else 'any'
+        cached = self.transcripts.get(video_id, lang_key) if self.transcripts else None
+        if cached is not None:
+            return cached[1]
+        
+        status, transcript = self.fetch_transcript(video_id, korean_only)
+        if status in _TRANSCRIPT_MESSAGES:
+            print(f"      ⚠️ {_TRANSCRIPT_MESSAGES[status]}")
+        if self.transcripts:
+            self.transcripts.put(video_id, lang_key, status, transcript)
+        return transcript
+    
+    def iter_transcripts(self, video_ids: list[str], korean_only: bool = True,
+                         max_workers: int = DEFAULT_TRANSCRIPT_WORKERS):
+        """여러 영상의 자막을 동시에 조회해 입력 순서대로 (video_id, 자막 또는 None)을 내보낸다."""
+        if not video_ids:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(video_ids)))) as executor:
+            transcripts = executor.map(lambda video_id: self.get_transcript(video_id, korean_only), video_ids)
+            yield from zip(video_ids, transcripts)
+    
+    def fetch_transcript(self, video_id: str, korean_only: bool = True) -> tuple[str, Optional[dict]]:
+        """
+        자막 API 조회 (캐시 미사용)
+        
+        Returns:
+            (상태, 자막 또는 None) — 상태는 transcript_store의 OK/NO_KOREAN/DISABLED/NOT_FOUND/UNAVAILABLE/ERROR
+        """
         try:
             # 자막 목록 조회
             transcript_list_obj = self.transcript_api.list(video_id)
@@ -154,8 +283,9 @@ class YouTubeCrawler:
                     break
             
             if korean_only and not korean_transcript:
-                print(f"      ⚠️ 한국어 자막 없음")
-                return None
+                return transcript_store.NO_KOREAN, None
+            if not available_transcripts:
+                return transcript_store.NOT_FOUND, None
             
             # 자막 선택 (한국어 우선, 없으면 첫 번째)
             selected = korean_transcript if korean_transcript else available_transcripts[0]
@@ -172,7 +302,7 @@ class YouTubeCrawler:
             
             full_text = ' '.join([t['text'] for t in transcript_items])
             
-            return {
+            return transcript_store.OK, {
                 'language': selected.language_code,
                 'transcript': transcript_items,
                 'full_text': full_text,
@@ -180,15 +310,14 @@ class YouTubeCrawler:
             }
             
         except TranscriptsDisabled:
-            print(f"      ⚠️ 자막 비활성화")
+            return transcript_store.DISABLED, None
         except NoTranscriptFound:
-            print(f"      ⚠️ 자막 없음")
+            return transcript_store.NOT_FOUND, None
         except VideoUnavailable:
-            print(f"      ⚠️ 영상 접근 불가")
+            return transcript_store.UNAVAILABLE, None
         except Exception as e:
             print(f"      ⚠️ 자막 오류: {e}")
-        
-        return None
+            return transcript_store.ERROR, None
     
     def calculate_quality_score(self, video: dict) -> float:
         """품질 점수 계산"""
@@ -251,125 +380,171 @@ def crawl_with_api(
     videos_per_keyword: int = 5,
     categories: list[str] = None
 ) -> dict:
-    """API 기반 크롤링 실행"""
+    """
+    API 기반 크롤링 실행
+
+    1) 전체 카테고리의 키워드 검색 (search.list, 캐시 우선)
+    2) 모은 영상 ID를 50개씩 묶어 상세 조회 (videos.list)
+    3) 카테고리/키워드 순서대로 중복·제외 키워드 필터
+    4) 자막 동시 추출 (자막 캐시 우선)
+
+    output_path: 결과 JSONL 경로 (.zst로 끝나면 zstd 압축). 영상마다 바로 기록되므로
+                 중단되어도 그때까지 수집한 영상은 남는다. 영상은 이 파일에만 남고
+                 반환값은 집계(crawled_at, total_videos, total_with_transcript, quota)뿐이다.
+    """
     
     print("=" * 60)
     print("🚀 YouTube API 크롤러 v2 시작")
     print("=" * 60)
     
-    # 크롤러 초기화
-    try:
-        crawler = YouTubeCrawler()
-    except ValueError as e:
-        print(f"❌ {e}")
-        return {}
-    
     # 설정 로드
     config = load_config(config_path)
     if not config:
         print("❌ 설정 파일 로드 실패")
         return {}
+    api_config = config.get('api') or {}
+    transcript_config = config.get('transcripts') or {}
+    
+    # 크롤러 초기화 (검색 캐시 + 쿼터 집계 + 자막 캐시)
+    cache = ApiCache()
+    quota = QuotaTracker(api_config.get('daily_quota', DEFAULT_DAILY_QUOTA), store=cache)
+    transcripts_cache = TranscriptStore(
+        negative_ttl_hours=transcript_config.get('negative_ttl_hours', DEFAULT_NEGATIVE_TTL_HOURS)
+    )
+    try:
+        crawler = YouTubeCrawler(
+            cache=cache,
+            quota=quota,
+            search_cache_ttl_hours=api_config.get('search_cache_ttl_hours', DEFAULT_SEARCH_CACHE_TTL_HOURS),
+            transcripts=transcripts_cache
+        )
+    except ValueError as e:
+        cache.close()
+        transcripts_cache.close()
+        print(f"❌ {e}")
+        return {}
+    cache.prune(max_age_hours=max(crawler.search_cache_ttl_hours, 24) * 7)
+    keywords_per_category = api_config.get('keywords_per_category', 3)
     
     result = {
         'crawled_at': datetime.now().isoformat(),
         'api_version': 'YouTube Data API v3',
         'total_videos': 0,
         'total_with_transcript': 0,
-        'categories': []
     }
     
     collected_ids = set()
     categories_config = config.get('categories', {})
-    target_categories = categories or list(categories_config.keys())
+    target_categories = [
+        cat_key for cat_key in (categories or list(categories_config.keys()))
+        if cat_key in categories_config
+    ]
     
-    for cat_key in target_categories:
-        if cat_key not in categories_config:
-            continue
-        
-        cat_config = categories_config[cat_key]
-        cat_name = cat_config.get('name', cat_key)
-        
-        print(f"\n📁 카테고리: {cat_name}")
-        print("-" * 40)
+    # 검색 전에 출력 파일을 연다 (중단 시 end 레코드 없이 부분 결과로 남음, 영상은 메모리에 모으지 않음)
+    writer = JsonlWriter(output_path, meta=dict(result), items_key='videos')
+    try:
+        category_ids = {}
+        for cat_key in target_categories:
+            cat_name = categories_config[cat_key].get('name', cat_key)
+            category_ids[cat_key] = writer.add_category({'category_key': cat_key, 'category_name': cat_name})
         
-        category_data = {
-            'category_key': cat_key,
-            'category_name': cat_name,
-            'videos': []
-        }
+        # 1) 키워드 검색 — 카테고리별 (키워드, 영상 ID 목록)
+        searches = {}
+        for cat_key in target_categories:
+            cat_config = categories_config[cat_key]
+            print(f"\n📁 카테고리: {cat_config.get('name', cat_key)}")
+            print("-" * 40)
+            
+            keywords_config = cat_config.get('keywords', {})
+            all_keywords = []
+            for priority in ['priority_1', 'priority_2']:
+                all_keywords.extend(keywords_config.get(priority, []))
+            
+            searches[cat_key] = []
+            for keyword in all_keywords[:keywords_per_category]:
+                print(f"\n🔍 키워드: '{keyword}'")
+                
+                # API 검색 (자막 유무 상관없이 수집, description으로 트렌드 매칭)
+                video_ids = crawler.search_video_ids(
+                    keyword=keyword,
+                    max_results=videos_per_keyword,
+                    published_after_hours=72,  # 최근 3일
+                    video_duration='medium',   # 4~20분
+                    caption='any'              # 자막 유무 상관없이 수집
+                )
+                print(f"   → {len(video_ids)}개 영상 발견")
+                searches[cat_key].append((keyword, video_ids))
         
-        # 키워드 수집
-        keywords_config = cat_config.get('keywords', {})
-        exclude_keywords = cat_config.get('exclude_keywords', [])
+        # 2) 상세 정보 일괄 조회 (50개씩)
+        all_ids = [video_id for cat_searches in searches.values() for _, ids in cat_searches for video_id in ids]
+        details = crawler.get_video_details(all_ids)
+        print(f"\n📦 영상 상세 조회: {len(details)}/{len(set(all_ids))}개")
         
-        all_keywords = []
-        for priority in ['priority_1', 'priority_2']:
-            all_keywords.extend(keywords_config.get(priority, []))
+        # 3) 중복·제외 키워드 필터 (카테고리/키워드 순서 유지)
+        selected = []  # (cat_key, video)
+        for cat_key in target_categories:
+            exclude_keywords = categories_config[cat_key].get('exclude_keywords', [])
+            for keyword, video_ids in searches[cat_key]:
+                for video_id in video_ids:
+                    # 중복 체크 (삭제/비공개 영상은 상세 조회에서 빠짐)
+                    if video_id in collected_ids or video_id not in details:
+                        continue
+                    video = {**details[video_id], 'search_keyword': keyword}
+                    
+                    # 제외 키워드 체크
+                    title = video.get('title', '')
+                    is_excluded = any(ex.lower() in title.lower() for ex in exclude_keywords)
+                    if is_excluded:
+                        print(f"      ⛔ 제외: {title[:40]}...")
+                        continue
+                    
+                    collected_ids.add(video_id)
+                    video['category'] = cat_key
+                    video['quality_score'] = crawler.calculate_quality_score(video)
+                    selected.append((cat_key, video))
         
-        for keyword in all_keywords[:3]:
-            print(f"\n🔍 키워드: '{keyword}' (자막 있는 영상만)")
-            
-            # API 검색 (자막 유무 상관없이 수집, description으로 트렌드 매칭)
-            videos = crawler.search_videos(
-                keyword=keyword,
-                max_results=videos_per_keyword,
-                published_after_hours=72,  # 최근 3일
-                video_duration='medium',   # 4~20분
-                caption='any'              # 자막 유무 상관없이 수집
-            )
-            
-            print(f"   → {len(videos)}개 영상 발견")
+        # 4) 자막 동시 추출 + 기록 (영상마다 바로 기록하고 버린다)
+        #    자막은 선택적 — AWS IP 차단 등으로 실패해도 영상 수집은 진행, description으로 트렌드 매칭
+        transcripts = crawler.iter_transcripts(
+            [video['video_id'] for _, video in selected],
+            max_workers=transcript_config.get('workers', DEFAULT_TRANSCRIPT_WORKERS)
+        )
+        for n, (_, transcript_data) in enumerate(transcripts):
+            cat_key, video = selected[n]
+            selected[n] = None  # 기록한 영상은 들고 있지 않는다
+            video['has_captions'] = bool(transcript_data)
+            video['transcript'] = transcript_data
+            if transcript_data:
+                result['total_with_transcript'] += 1
+                print(f"   📝 자막 ✅: {video['title'][:40]}... ({transcript_data['word_count']}단어)")
             
-            for video in videos:
-                # 중복 체크
-                if video['video_id'] in collected_ids:
-                    continue
-                
-                # 제외 키워드 체크
-                title = video.get('title', '')
-                is_excluded = any(ex.lower() in title.lower() for ex in exclude_keywords)
-                if is_excluded:
-                    print(f"      ⛔ 제외: {title[:40]}...")
-                    continue
-                
-                collected_ids.add(video['video_id'])
-                video['category'] = cat_key
-                video['quality_score'] = crawler.calculate_quality_score(video)
-                
-                # 자막 추출 (선택적 — AWS IP 차단 등으로 실패해도 영상 수집은 진행)
-                video['has_captions'] = False
-                video['transcript'] = None
-                if TRANSCRIPT_AVAILABLE:
-                    try:
-                        transcript_data = crawler.get_transcript(video['video_id'])
-                        if transcript_data:
-                            video['has_captions'] = True
-                            video['transcript'] = transcript_data
-                            result['total_with_transcript'] += 1
-                            print(f"   📝 자막 ✅: {title[:40]}... ({transcript_data['word_count']}단어)")
-                    except Exception:
-                        pass  # 자막 실패는 무시, description으로 트렌드 매칭
-                
-                video['fetched_at'] = datetime.now().isoformat()
-                category_data['videos'].append(video)
-                result['total_videos'] += 1
+            video['fetched_at'] = datetime.now().isoformat()
+            writer.add_item(category_ids[cat_key], video)
+            result['total_videos'] += 1
         
-        result['categories'].append(category_data)
-    
-    # JSON 저장
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+        result['quota'] = quota.snapshot()
+        writer.finish({
+            'total_videos': result['total_videos'],
+            'total_with_transcript': result['total_with_transcript'],
+            'quota': result['quota']
+        })
+    finally:
+        writer.close()
+        cache.close()
+        transcripts_cache.close()
     
     print("\n" + "=" * 60)
     print(f"✅ 크롤링 완료!")
     print(f"   - 총 영상: {result['total_videos']}개")
     print(f"   - 자막 추출 성공: {result['total_with_transcript']}개")
+    print(f"   - {quota.summary()}")
+    print(f"   - 검색 캐시: 재사용 {cache.stats['hit']}건 / 신규 {cache.stats['miss']}건")
+    print(f"   - {transcripts_cache.summary()}")
     print(f"   - 저장: {output_path}")
     print("=" * 60)
     
     return result
 
-
 if __name__ == '__main__':
     base_dir = Path(__file__).parent
     
@@ -381,7 +556,7 @@ if __name__ == '__main__':
     
     crawl_with_api(
         config_path=str(base_dir / 'config.yaml'),
-        output_path=str(base_dir / 'youtube_data.json'),
+        output_path=str(base_dir / 'youtube_data.jsonl'),
         videos_per_keyword=3,
         categories=None  # 전체 카테고리 수집
     )
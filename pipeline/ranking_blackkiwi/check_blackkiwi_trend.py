@@ -1,29 +1,22 @@
+import os
+import sys
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# 직접 실행 시 패키지 경로 설정 (crawling_sites.utils 공유)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawling_sites.utils.driver_pool import get_shared_pool
+
 def check_blackkiwi_trend_selenium():
     url = "https://blackkiwi.net/service/trend"
     print(f"Fetching BlackKiwi trend page (Selenium) from: {url}")
 
-    # 브라우저 설정 (Headless 모드 권장)
-    chrome_options = Options()
-    chrome_options.add_argument("--headless") # 창 안 띄우고 실행
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
+    # 공용 WebDriver 풀에서 브라우저 임대 (Headless)
     # 봇 탐지 회피용 User-Agent
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-    import shutil
-    chromedriver_path = shutil.which('chromedriver')
-    if chromedriver_path:
-        from selenium.webdriver.chrome.service import Service
-        driver = webdriver.Chrome(service=Service(chromedriver_path), options=chrome_options)
-    else:
-        driver = webdriver.Chrome(options=chrome_options)
+    pool = get_shared_pool()
+    driver = pool.acquire(user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     try:
         driver.get(url)
@@ -82,7 +75,7 @@ def check_blackkiwi_trend_selenium():
         print(f"An error occurred: {e}")
         
     finally:
-        driver.quit()
+        pool.release(driver)
 
 if __name__ == "__main__":
     check_blackkiwi_trend_selenium()
@@ -1,7 +1,8 @@
 import sys
 import os
-import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Set
@@ -29,16 +30,54 @@ except ImportError:
 # =========================================================================================
 import requests
 import xml.etree.ElementTree as ET
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from dotenv import load_dotenv
 
+from crawling_sites.utils.driver_pool import get_shared_pool
+from crawling_sites.utils.jsonl_store import iter_items, resolve_path
+from ranking_integrated.trend_cache import DEFAULT_STALE_MAX_HOURS, DEFAULT_TTL_HOURS, TrendCache
+
+BLACKKIWI_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 소스별 빈 결과 (수집 실패 + 대체할 지난 결과도 없을 때)
+EMPTY_TRENDS = {
+    "google": [],
+    "naver_datalab": [],
+    "blackkiwi": {"rising": [], "new": []},
+}
+# collect_all에서 기다리는 최대 시간 (넘으면 지난 결과로 대체, 수집은 백그라운드에서 계속)
+DEFAULT_DEADLINE_SECONDS = 45
+
+
 class TrendCollector:
-    def __init__(self):
+    """
+    트렌드 소스(구글 RSS, 네이버 데이터랩, 블랙키위) 수집기.
+    get_* 메서드는 소스별 TTL 캐시를 먼저 보고, 수집에 실패하면 지난 결과로 대체한다.
+    collect_all은 세 소스를 동시에 수집한다.
+    """
+
+    def __init__(self, cache: TrendCache = None, ttl_hours: Dict[str, float] = None,
+                 stale_max_hours: float = DEFAULT_STALE_MAX_HOURS, use_cache: bool = True):
+        """
+        Args:
+            cache: 트렌드 캐시 (기본: pipeline/cache/trends.sqlite)
+            ttl_hours: 소스별 재사용 시간 (기본: trend_cache.DEFAULT_TTL_HOURS)
+            stale_max_hours: 실패 시 대체로 쓸 지난 결과의 최대 나이
+            use_cache: False면 캐시 없이 매번 수집
+        """
         self.load_env()
+        self.ttl_hours = {**DEFAULT_TTL_HOURS, **(ttl_hours or {})}
+        self.stale_max_hours = stale_max_hours
+        self.latencies: Dict[str, tuple] = {}  # 소스 → (초, 상태)
+        self._local = threading.local()  # collect_all 작업 스레드의 소요 시간 기록 대상
+        self.cache = cache
+        if cache is None and use_cache:
+            try:
+                self.cache = TrendCache()
+            except Exception as e:
+                print(f"      ⚠️ 트렌드 캐시를 열 수 없어 캐시 없이 수집합니다: {e}")
         
     def load_env(self):
         # pipeline/ranking_integrated/generate_briefing.py -> pipeline -> project root -> .env
@@ -47,28 +86,122 @@ class TrendCollector:
         self.naver_client_id = os.getenv("NAVER_CLIENT_ID")
         self.naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
 
+    def collect_all(self, deadline_seconds: float = DEFAULT_DEADLINE_SECONDS) -> Dict[str, object]:
+        """
+        세 소스를 동시에 수집한다.
+        deadline_seconds 안에 끝나지 않은 소스는 지난 결과(없으면 빈 결과)로 대체하고,
+        늦은 수집은 백그라운드에서 마저 끝나 다음 실행을 위해 캐시에만 저장된다
+        (소스별 소요 시간은 작업마다 따로 모아 기한 안에 끝난 것만 latencies에 반영).
+
+        Returns:
+            {"google": [...], "naver_datalab": [...], "blackkiwi": {"rising": [...], "new": [...]}}
+        """
+        getters = {
+            "google": self.get_google_trends,
+            "naver_datalab": self.get_naver_datalab_trends,
+            "blackkiwi": self.get_blackkiwi_trends,
+        }
+        executor = ThreadPoolExecutor(max_workers=len(getters), thread_name_prefix="trend")
+        sinks = {source: {} for source in getters}
+        futures = {
+            source: executor.submit(self._run_with_sink, getter, sinks[source])
+            for source, getter in getters.items()
+        }
+        done, _ = wait_futures(futures.values(), timeout=deadline_seconds)
+        executor.shutdown(wait=False)
+
+        results = {}
+        for source, future in futures.items():
+            if future in done:
+                results[source] = future.result()
+                self.latencies.update(sinks[source])
+            else:
+                print(f"      ⏱️ {source} 수집이 {deadline_seconds:.0f}초 안에 끝나지 않아 지난 결과로 대체합니다")
+                self.latencies[source] = (deadline_seconds, "timeout")
+                results[source] = self._stale_or_empty(source)
+        return results
+
+    def latency_summary(self) -> str:
+        return " | ".join(
+            f"{source} {seconds:.1f}s({status})" for source, (seconds, status) in self.latencies.items()
+        )
+
+    def _collect(self, source: str, fetch):
+        """캐시 확인 → 수집 → 캐시 저장, 실패 시 지난 결과로 대체"""
+        if self.cache:
+            hit = self.cache.get(source, self.ttl_hours.get(source, 0))
+            if hit is not None:
+                payload, age = hit
+                print(f"      ♻️ {source}: 캐시 사용 ({age / 60:.0f}분 전 수집)")
+                self._set_latency(source, 0.0, "cache")
+                return payload
+
+        started = time.perf_counter()
+        try:
+            payload = fetch()
+            status = "ok"
+        except Exception as e:
+            print(f"      ❌ {source} 오류: {e}")
+            payload = None
+            status = "error"
+        elapsed = time.perf_counter() - started
+        self._set_latency(source, elapsed, status)
+        if self.cache:
+            self.cache.record_latency(source, elapsed, status)
+
+        if payload is None:
+            return self._stale_or_empty(source)
+        if self.cache:
+            self.cache.put(source, payload)
+        return payload
+
+    def _run_with_sink(self, getter, sink: dict):
+        """collect_all 작업: 소요 시간을 self.latencies 대신 sink에 기록한다"""
+        self._local.sink = sink
+        try:
+            return getter()
+        finally:
+            self._local.sink = None
+
+    def _set_latency(self, source: str, seconds: float, status: str):
+        sink = getattr(self._local, "sink", None)
+        (self.latencies if sink is None else sink)[source] = (seconds, status)
+
+    def _stale_or_empty(self, source: str):
+        if self.cache:
+            stale = self.cache.get(source, self.stale_max_hours)
+            if stale is not None:
+                payload, age = stale
+                print(f"      ⚠️ {source}: {age / 3600:.1f}시간 전 결과로 대체")
+                return payload
+        empty = EMPTY_TRENDS[source]
+        return {key: list(value) for key, value in empty.items()} if isinstance(empty, dict) else list(empty)
+
     def get_google_trends(self) -> List[str]:
         """구글 트렌드 RSS에서 실시간 검색어 추출"""
+        return self._collect("google", self._fetch_google_trends)
+
+    def _fetch_google_trends(self) -> List[str]:
         print("   [Google] 트렌드 수집 중...")
         url = "https://trends.google.co.kr/trending/rss?geo=KR"
         keywords = []
-        try:
-            resp = requests.get(url, timeout=5)
-            if resp.status_code == 200:
-                root = ET.fromstring(resp.content)
-                for item in root.findall('.//item'):
-                    title = item.find('title').text
-                    keywords.append(title)
-        except Exception as e:
-            print(f"      ❌ Google 오류: {e}")
+        resp = requests.get(url, timeout=5)
+        resp.raise_for_status()
+        root = ET.fromstring(resp.content)
+        for item in root.findall('.//item'):
+            title = item.find('title').text
+            keywords.append(title)
         return keywords
 
     def get_naver_datalab_trends(self) -> List[str]:
         """네이버 데이터랩 API에서 IT 트렌드 추출"""
-        print("   [Naver] 데이터랩 트렌드 수집 중...")
         if not self.naver_client_id or not self.naver_client_secret:
             print("      ⚠️ 네이버 API 키 없음")
             return []
+        return self._collect("naver_datalab", self._fetch_naver_datalab_trends)
+
+    def _fetch_naver_datalab_trends(self) -> List[str]:
+        print("   [Naver] 데이터랩 트렌드 수집 중...")
             
         url = "https://openapi.naver.com/v1/datalab/search"
         headers = {
@@ -99,45 +232,35 @@ class TrendCollector:
         }
         
         keywords = []
-        try:
-            resp = requests.post(url, headers=headers, json=body, timeout=5)
-            if resp.json().get('results'):
-                # ratio가 높은 순서대로 정렬하거나, 그냥 그룹명 자체를 키워드로 활용
-                # 여기서는 간단히 결과에 있는 그룹명만 가져옴
-                for result in resp.json()['results']:
-                     # ratio 확인
-                    data = result.get('data', [])
-                    if data:
-                        last_ratio = data[-1].get('ratio', 0)
-                        if last_ratio > 10: # 의미있는 검색량이 있을 때만
-                            keywords.append(result['title']) 
-                            # 상세 키워드도 추가하면 좋음
-        except Exception as e:
-            print(f"      ❌ Naver 오류: {e}")
+        resp = requests.post(url, headers=headers, json=body, timeout=5)
+        resp.raise_for_status()
+        if resp.json().get('results'):
+            # ratio가 높은 순서대로 정렬하거나, 그냥 그룹명 자체를 키워드로 활용
+            # 여기서는 간단히 결과에 있는 그룹명만 가져옴
+            for result in resp.json()['results']:
+                 # ratio 확인
+                data = result.get('data', [])
+                if data:
+                    last_ratio = data[-1].get('ratio', 0)
+                    if last_ratio > 10: # 의미있는 검색량이 있을 때만
+                        keywords.append(result['title']) 
+                        # 상세 키워드도 추가하면 좋음
             
         return keywords
 
     def get_blackkiwi_trends(self) -> Dict[str, List[str]]:
         """블랙키위에서 급상승/신규 키워드 크롤링 (Selenium)"""
+        return self._collect("blackkiwi", self._fetch_blackkiwi_trends)
+
+    def _fetch_blackkiwi_trends(self) -> Dict[str, List[str]]:
         print("   [BlackKiwi] 트렌드 수집 중 (브라우저 실행)...")
         url = "https://blackkiwi.net/service/trend"
         results = {"rising": [], "new": []}
         
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
+        pool = get_shared_pool()
         driver = None
         try:
-            import shutil
-            chromedriver_path = shutil.which('chromedriver')
-            if chromedriver_path:
-                from selenium.webdriver.chrome.service import Service
-                driver = webdriver.Chrome(service=Service(chromedriver_path), options=options)
-            else:
-                driver = webdriver.Chrome(options=options)
+            driver = pool.acquire(user_agent=BLACKKIWI_USER_AGENT)
             driver.get(url)
             wait = WebDriverWait(driver, 10)
             
@@ -154,12 +277,13 @@ class TrendCollector:
                 results["new"] = [e.text.strip() for e in elems if e.text.strip()][:10]
             except: pass
             
-        except Exception as e:
-            print(f"      ❌ BlackKiwi 오류: {e}")
         finally:
             if driver:
-                driver.quit()
-                
+                pool.release(driver)
+
+        if not results["rising"] and not results["new"]:
+            # 페이지 구조 변경/로딩 실패 — 빈 결과를 캐시하지 않고 지난 결과로 대체
+            raise RuntimeError("키워드 목록을 찾지 못했습니다")
         return results
 
 # =========================================================================================
@@ -170,17 +294,13 @@ class BriefingGenerator:
         self.news_data = self.load_news(news_json_path)
         
     def load_news(self, path: str):
-        if not os.path.exists(path):
+        # news_data.jsonl(.zst) 스트림 또는 기존 news_data.json 중 최신 파일
+        resolved = resolve_path(path)
+        if resolved is None:
             print(f"⚠️ 뉴스 데이터 파일이 없습니다: {path}")
             return []
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # data가 category별로 묶여있다면 flat하게 풀어서 검색하기 쉽게 만듦
-            all_articles = []
-            if 'categories' in data:
-                for cat in data['categories']:
-                    all_articles.extend(cat.get('articles', []))
-            return all_articles
+        # category별로 묶인 기사를 flat하게 풀어서 검색하기 쉽게 만듦
+        return [article for _, article in iter_items(resolved)]
 
     def match_trends(self, trend_keywords: Dict[str, float]) -> List[Dict]:
         """
@@ -226,18 +346,22 @@ def main():
     
     trends_map = {} # {키워드: 점수}
     
+    # 세 소스 동시 수집 (소스별 캐시, 실패 시 지난 결과)
+    trends = collector.collect_all()
+    print(f"   ⏱️ {collector.latency_summary()}")
+
     # Google (가중치 1.5 - 최신성 높음)
-    g_trends = collector.get_google_trends()
+    g_trends = trends['google']
     for kw in g_trends:
         trends_map[kw] = trends_map.get(kw, 0) + 1.5
         
     # Naver (가중치 1.2 - 일반적 관심)
-    n_trends = collector.get_naver_datalab_trends()
+    n_trends = trends['naver_datalab']
     for kw in n_trends:
         trends_map[kw] = trends_map.get(kw, 0) + 1.2
 
     # BlackKiwi (가중치 1.8 - 마케팅/실검 정확도 높음)
-    bk_trends = collector.get_blackkiwi_trends()
+    bk_trends = trends['blackkiwi']
     for kw in bk_trends['rising']:
         trends_map[kw] = trends_map.get(kw, 0) + 1.8
     for kw in bk_trends['new']:
@@ -249,8 +373,8 @@ def main():
     print(f"   (Top 5: {', '.join([k for k,v in top_5_kws])})")
 
     # 2. 로컬 뉴스 로드 및 매칭
-    # 경로: Crawling – Naver News/news_data.json
-    news_path = Path(__file__).resolve().parent.parent / "crawling_naver_news" / "news_data.json"
+    # 경로: crawling_naver_news/news_data.jsonl (또는 기존 news_data.json)
+    news_path = Path(__file__).resolve().parent.parent / "crawling_naver_news" / "news_data"
     
     generator = BriefingGenerator(str(news_path))
     if not generator.news_data:
@@ -0,0 +1,178 @@
+"""
+다중 키워드 집합 매처 (Aho-Corasick).
+트렌드 키워드, IT 부스트, 보안 임팩트, 블랙리스트, 카테고리 키워드를 하나의 오토마톤으로 만들어
+기사 텍스트를 한 번만 훑어 모든 매칭을 집합 태그와 함께 돌려준다.
+키워드 수가 늘어도 기사당 비용은 텍스트 길이(+매칭 수)에만 비례한다.
+
+- 매칭 의미는 기존 `kw in text`와 같다 (부분 문자열, 겹치는 매칭 포함)
+  word_boundary=True로 등록한 키워드만 앞뒤가 영문·숫자로 이어지는 매칭을 버린다 (metaverse의 meta 등)
+- 키워드는 소문자로 등록되며, 텍스트는 호출부에서 소문자로 넘긴다
+- pyahocorasick이 설치되어 있으면 C 구현을, 없으면 순수 파이썬 구현을 사용한다
+
+사용 예:
+    matcher = KeywordMatcher({"it": IT_BOOST_KEYWORDS, "security": SECURITY_IMPACT_KEYWORDS})
+    matcher.add_set("trend", trends_map.keys())
+    matcher.build()
+    hits = matcher.scan(text.lower())
+    hits.values("trend")            # 매칭된 트렌드 키워드 (텍스트에 처음 나온 순서)
+    hits.prefix(len(title)).has("security")   # 제목 부분에서만 확인
+"""
+from collections import deque
+from typing import Any, Iterable
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordHits:
+    """한 텍스트의 매칭 결과: (끝 위치, 태그, 값) 목록 — 텍스트 순서, 중복 출현 포함"""
+
+    __slots__ = ("matches", "_by_tag")
+
+    def __init__(self, matches: list[tuple[int, str, Any]]):
+        self.matches = matches
+        self._by_tag: dict[str, dict] = {}
+        for _, tag, value in matches:
+            self._by_tag.setdefault(tag, {}).setdefault(value, None)
+
+    def has(self, tag: str) -> bool:
+        return tag in self._by_tag
+
+    def values(self, tag: str) -> list:
+        """태그별로 매칭된 값 (중복 제거, 처음 나온 순서)"""
+        return list(self._by_tag.get(tag, ()))
+
+    def count(self, tag: str) -> int:
+        """태그별로 매칭된 서로 다른 값의 수"""
+        return len(self._by_tag.get(tag, ()))
+
+    def prefix(self, length: int) -> "KeywordHits":
+        """텍스트 앞 length 글자 안에서 끝나는 매칭만 남긴다 (같은 텍스트의 앞부분 재사용)"""
+        return KeywordHits([m for m in self.matches if m[0] < length])
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+
+class KeywordMatcher:
+    """태그가 붙은 여러 키워드 집합을 한 번에 찾는 Aho-Corasick 매처"""
+
+    def __init__(self, keyword_sets: dict[str, Iterable[str]] = None):
+        """
+        Args:
+            keyword_sets: {태그: 키워드 목록} (나중에 add_set/add로 추가 가능)
+        """
+        self._patterns: dict[str, list[tuple[str, Any]]] = {}
+        self._automaton = None
+        for tag, keywords in (keyword_sets or {}).items():
+            self.add_set(tag, keywords)
+
+    def add(self, keyword: str, tag: str, value: Any = None, word_boundary: bool = False):
+        """
+        키워드 하나를 등록한다. 매칭 시 (tag, value)를 돌려준다 (value 기본: 원래 키워드).
+        빈 문자열은 무시한다.
+        word_boundary: True면 앞뒤 글자가 영문 소문자·숫자인 매칭은 버린다 (한국어 조사는 허용)
+        """
+        pattern = keyword.lower()
+        if not pattern:
+            return
+        # 세 번째 값: 경계 확인이 필요하면 패턴 길이, 아니면 0
+        self._patterns.setdefault(pattern, []).append(
+            (tag, keyword if value is None else value, len(pattern) if word_boundary else 0)
+        )
+        self._automaton = None
+
+    def add_set(self, tag: str, keywords: Iterable[str], word_boundary: bool = False):
+        for keyword in keywords:
+            self.add(keyword, tag, word_boundary=word_boundary)
+
+    def build(self) -> "KeywordMatcher":
+        """오토마톤을 만든다 (scan이 처음 호출될 때 자동으로도 만든다)"""
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for pattern, payloads in self._patterns.items():
+                automaton.add_word(pattern, tuple(payloads))
+            if self._patterns:
+                automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._automaton = _PyAutomaton(self._patterns)
+        return self
+
+    def scan(self, text: str) -> KeywordHits:
+        """소문자 텍스트를 한 번 훑어 모든 매칭을 반환한다"""
+        if self._automaton is None:
+            self.build()
+        if not text or not self._patterns:
+            return KeywordHits([])
+        matches = []
+        for end, payloads in self._automaton.iter(text):
+            for tag, value, length in payloads:
+                if length and not _isolated(text, end - length + 1, end):
+                    continue
+                matches.append((end, tag, value))
+        return KeywordHits(matches)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _isolated(text: str, start: int, end: int) -> bool:
+    """text[start:end + 1] 앞뒤가 영문·숫자로 이어지지 않는지"""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    return end + 1 >= len(text) or not _is_word_char(text[end + 1])
+
+
+class _PyAutomaton:
+    """순수 파이썬 Aho-Corasick (pyahocorasick이 없을 때)"""
+
+    def __init__(self, patterns: dict[str, list]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple] = [()]
+
+        for pattern, payloads in patterns.items():
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = tuple(payloads)
+
+        # BFS로 실패 링크 계산, 출력은 실패 링크의 출력까지 합쳐 둔다
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter(self, text: str):
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0) if state else root.get(ch, 0)
+            if out[state]:
+                yield i, out[state]
@@ -3,14 +3,20 @@ import json
 import os
 import sys
 import subprocess
-import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 
-# 현재 디렉토리를 path에 추가하여 generate_briefing 모듈 import
+# 현재 디렉토리를 path에 추가하여 generate_briefing 모듈 import (상위 디렉토리는 crawling_sites 공유용)
 current_dir = Path(__file__).resolve().parent
 sys.path.append(str(current_dir))
+sys.path.append(str(current_dir.parent))
+
+from crawling_sites.utils.date_parser import parse_datetime, reference_now, set_reference_now
+from crawling_sites.utils.jsonl_store import iter_items, resolve_path
+from keyword_matcher import KeywordHits, KeywordMatcher
+from scoring import ScoreTable, load_scoring_config
+from reconstruction.text_normalizer import BRAND_NORMALIZE, default_normalizer
 
 try:
     from generate_briefing import TrendCollector, BriefingGenerator
@@ -45,28 +51,6 @@ SECURITY_IMPACT_KEYWORDS = [
     '악성코드', 'malware', 'phishing', '피싱', '스미싱',
 ]
 
-# 사이트 권위 가중치 (기본: 1.0, 높을수록 신뢰도/중요도 높음)
-SITE_AUTHORITY = {
-    # 정부·공공기관 (가장 신뢰도 높음) — sites.yaml site_key 기준
-    'kisa_security': 3.0, 'kisa_report': 2.5, 'kisa_notice': 2.5,
-    'kmcc_press': 2.5, 'msit_press': 2.5, 'pipc_press': 2.5,
-    # 주요 글로벌 IT 미디어
-    'techcrunch': 2.5, 'the_verge': 2.5, 'ars_technica': 2.5, 'wired': 2.0,
-    'cnet_global': 2.0, 'macrumors': 1.8, 'nine_to_five_mac': 1.8, 'gizmodo': 1.5,
-    # 국내 IT 미디어
-    'zdnet_korea': 2.0, 'itworld_korea': 1.8, 'cnet_korea': 1.8, 'bizwatch_news': 1.5,
-    # 공식 빅테크 뉴스룸
-    'apple_kr_newsroom': 2.5, 'apple_dev_newsroom': 2.0,
-    'samsung_newsroom': 2.0, 'google_korea_blog': 2.0, 'google_blog': 2.0,
-    'meta_newsroom': 1.8, 'lg_newsroom': 1.8,
-    # 개발자 블로그
-    'android_dev_blog': 1.8, 'ms_research_blog': 1.8, 'naver_search_tech': 1.5,
-    # 뉴스 IT 섹션
-    'weekly_donga': 1.3, 'enewstoday': 1.3, 'newsis_it': 1.3,
-    # 커뮤니티
-    'clien_news': 1.2,
-}
-
 # 비IT 키워드 필터링 (해당 키워드만 포함된 기사는 스코어 감점)
 NON_IT_FILTER = [
     '부동산', '아파트', '청약', '분양',
@@ -77,6 +61,115 @@ NON_IT_FILTER = [
 ]
 
 
+# 비IT 블랙리스트 (categorize_item: 매칭 시 제외)
+BLACKLIST_KEYWORDS = [
+    # 게임
+    '게임', '라그나로크', '붉은사막', '리니지', '배틀그라운드', 'e스포츠',
+    '엔씨소프트', '넥슨', '크래프톤', '스팀', 'steam', '플레이스테이션',
+    # 의학/건강
+    '의료', '의학', '병원', '진료', '수술', '질환', '질병', '약물',
+    # 엔터테인먼트
+    '웹툰', '만화', '애니메이션', '디즈니',
+    # 스포츠
+    'f1', '포뮬러', '올림픽',
+]
+
+# 키워드 기반 카테고리 분류 (순서대로 먼저 매칭된 카테고리)
+KEYWORD_MAP = {
+    'mobile': [
+        '아이폰', '갤럭시', '스마트폰', 'ios', 'android',
+        '태블릿', '웨어러블', '폴더블', '픽셀',
+    ],
+    'pc': [
+        '노트북', '데스크톱', '윈도우', '맥북', 'gpu', '그래픽카드',
+        '모니터', '키보드', '마우스', 'ssd', '메모리', '반도체',
+        'nvidia', 'amd', 'tsmc', '삼성전자',
+    ],
+    'ai': [
+        'ai', '인공지능', 'chatgpt', 'gemini', 'claude', 'llm', 'openai',
+        '클라우드', 'aws', 'azure', 'gcp', '머신러닝', '딥러닝',
+        '자율주행', '로봇', 'meta', '구글', '애플', '마이크로소프트',
+    ],
+    'network': [
+        '5g', '6g', 'wifi', '네트워크', '주파수', '대역폭',
+        '무선망', '유선망', '광통신',
+        'skt', 'kt', 'lgu+', '통신사', '요금제', '알뜰폰',
+        'mvno', '로밍',
+    ],
+    'security': [
+        '해킹', '보안', '취약점', '랜섬웨어', '개인정보', '사이버',
+        'kisa', '방통위', '과기정통부',
+    ],
+}
+
+
+def build_keyword_matcher(trends: Dict[str, float] = None) -> KeywordMatcher:
+    """
+    고정 키워드 집합(+트렌드 키워드)으로 실행당 한 번 만드는 매처.
+    태그: it, security, non_it, blacklist, cat:<카테고리>, trend
+    트렌드 키워드는 영문/한국어 브랜드 표기(iphone ↔ 아이폰)도 같은 트렌드로 매칭한다.
+    영문 브랜드 표기(별칭, 또는 트렌드 키워드 자체가 사전의 영문 브랜드명)는 단어 경계에서만 매칭해
+    metaverse·metal의 meta, laws의 aws, pineapple의 apple은 트렌드로 세지 않는다.
+    """
+    matcher = KeywordMatcher({
+        'it': IT_BOOST_KEYWORDS,
+        'security': SECURITY_IMPACT_KEYWORDS,
+        'non_it': NON_IT_FILTER,
+        'blacklist': BLACKLIST_KEYWORDS,
+    })
+    for cat, keywords in KEYWORD_MAP.items():
+        matcher.add_set(f'cat:{cat}', keywords)
+    if trends:
+        brands = default_normalizer(word_boundary=True)
+        for keyword in trends:
+            for alias in brands.variants(keyword):
+                # 별칭이 그 자체로 트렌드 키워드면 각자 매칭 (가중치 중복 합산 방지)
+                if alias == keyword or alias not in trends:
+                    matcher.add(alias, 'trend', keyword, word_boundary=_is_ascii_brand(alias, keyword))
+    return matcher.build()
+
+
+def _is_ascii_brand(alias: str, keyword: str) -> bool:
+    """부분 문자열로 매칭하면 다른 영단어에 걸리는 영문 브랜드 표기인지"""
+    if not alias.isascii():
+        return False
+    return alias != keyword or alias.lower() in BRAND_NORMALIZE
+
+
+def scan_item(matcher: KeywordMatcher, item: Dict) -> Dict[str, KeywordHits]:
+    """
+    아이템 텍스트를 한 번 훑어 용도별 매칭으로 나눈다.
+        score:     트렌드/IT 부스트 점수용 (뉴스: 제목+본문, 유튜브: 제목+설명+검색어+자막 앞부분)
+        body:      보안 임팩트·카테고리 키워드용 (제목+본문)
+        blacklist: 블랙리스트용 (제목+본문+설명)
+    각 텍스트가 스캔한 텍스트의 앞부분이 되도록 이어 붙여 prefix로 잘라 쓴다.
+    자막은 기존 점수 계산과 같게 소문자로 바꾸지 않고 붙인다 (대문자가 섞인 자막 표기는 매칭되지 않음).
+    """
+    title = item.get('title', '').lower()
+    content = item.get('content', '').lower()
+    description = item.get('description', '').lower()
+
+    if item.get('type') != 'youtube':
+        body_len = len(title) + 1 + len(content)
+        hits = matcher.scan(title + ' ' + content + ' ' + description)
+        body = hits.prefix(body_len)
+        return {'score': body, 'body': body, 'blacklist': hits}
+
+    text = title + ' ' + description + ' ' + item.get('search_keyword', '').lower()
+    if item.get('transcript'):
+        text += ' ' + item['transcript'].get('full_text', '')[:1000]
+    hits = matcher.scan(text)
+    if content:
+        # 본문이 있는 유튜브 아이템은 제목+본문 순서가 스캔 텍스트와 달라 따로 훑는다
+        body = matcher.scan(title + ' ' + content)
+        return {'score': hits, 'body': body, 'blacklist': matcher.scan(title + ' ' + content + ' ' + description)}
+    return {
+        'score': hits,
+        'body': hits.prefix(len(title) + 1),
+        'blacklist': hits.prefix(len(title) + 1 + len(description)),
+    }
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Daily Trend Briefing Batch Job')
     parser.add_argument('--start', type=str, required=True, help='Start DateTime (YYYY-MM-DD HH:MM)')
@@ -89,91 +182,11 @@ def parse_korean_datetime(date_str: str) -> datetime:
     네이버 뉴스, 외부 사이트(RSS/HTML) 등 다양한 날짜 형식을 파싱
     예: '2024.02.02. 오전 10:30', '1시간 전', '5분 전',
         '2026-03-03', '2026-03-03T10:30:00Z', '2026년 3월 3일'
+    크롤러와 같은 파서(crawling_sites.utils.date_parser)를 사용한다.
+    상대 시간은 build_daily_brief 시작 시 고정한 기준 시각으로 계산한다.
     """
-    now = datetime.now()
-    date_str = date_str.strip()
-
-    # 0. ISO 8601 datetime (RSS 표준: Z, +09:00 등 포함)
-    # "2026-03-03T10:30:00", "2026-03-03T10:30:00Z", "2026-03-03T10:30:00+09:00"
-    if 'T' in date_str:
-        try:
-            # Z → +00:00 변환 후 fromisoformat 사용, tzinfo 제거하여 naive datetime 반환
-            cleaned = date_str.replace('Z', '+00:00')
-            from datetime import timezone as _tz
-            dt = datetime.fromisoformat(cleaned)
-            if dt.tzinfo is not None:
-                # UTC → 로컬 naive (UTC 기준 유지)
-                dt = dt.replace(tzinfo=None)
-            return dt
-        except (ValueError, AttributeError):
-            pass
-
-    # 0b. "YYYY-MM-DD" (날짜만, 시간 없음) — 애플 뉴스룸, 대부분 외부 사이트
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
-        pass
-
-    # 0c. "YYYY.MM.DD" (점 포맷, 시간 없음)
-    try:
-        return datetime.strptime(date_str.rstrip('.'), "%Y.%m.%d")
-    except ValueError:
-        pass
-
-    # 0d. "YYYY년 MM월 DD일" (한국어 날짜)
-    try:
-        return datetime.strptime(date_str, "%Y년 %m월 %d일")
-    except ValueError:
-        pass
-
-    # 1. "N분 전", "N시간 전", "N일 전" 처리 (공백 유무 상관없이)
-    if '분' in date_str and '전' in date_str:
-        try:
-            minutes = int(re.search(r'(\d+)', date_str).group(1))
-            return now - timedelta(minutes=minutes)
-        except:
-            pass
-    elif '시간' in date_str and '전' in date_str:
-        try:
-            hours = int(re.search(r'(\d+)', date_str).group(1))
-            return now - timedelta(hours=hours)
-        except:
-            pass
-    elif '일' in date_str and '전' in date_str:
-        try:
-            days = int(re.search(r'(\d+)', date_str).group(1))
-            return now - timedelta(days=days)
-        except:
-            pass
-    
-    # 2. "2024.02.02. 오전 10:30" 형식 처리
-    try:
-        # '오전', '오후' 처리
-        is_pm = '오후' in date_str
-        cleaned = re.sub(r'(오전|오후)\s*', '', date_str).strip()
-        # 점(.)이 마지막에 있을 수 있음
-        cleaned = cleaned.rstrip('.')
-        
-        # 포맷 맞추기 (YYYY.MM.DD HH:MM)
-        dt = datetime.strptime(cleaned, "%Y.%m.%d. %H:%M")
-        
-        if is_pm and dt.hour < 12:
-            dt = dt + timedelta(hours=12)
-        elif not is_pm and dt.hour == 12: # 오전 12시는 0시
-            dt = dt - timedelta(hours=12)
-            
-        return dt
-    except:
-        pass
-
-    # 3. YYYY-MM-DD 형식 등 추가 대응 가능
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-    except:
-        pass
-        
-    # 파싱 실패 시 현재 시간 반환하거나 None (여기선 안전하게 아주 먼 과거)
-    return datetime.min
+    # 파싱 실패 시 아주 먼 과거 (기간 필터에서 제외)
+    return parse_datetime(date_str) or datetime.min
 
 def run_crawler(script_path: Path, cwd: Path):
     """크롤러 스크립트 실행"""
@@ -189,26 +202,42 @@ def run_crawler(script_path: Path, cwd: Path):
     except subprocess.CalledProcessError as e:
         print(f"❌ Crawler failed: {e}")
 
-def load_json_data(file_path: Path) -> List[Dict]:
-    if not file_path.exists():
+def flatten_crawl_data(data) -> List[Dict]:
+    """크롤러 출력(categories -> articles/videos 구조)을 단일 아이템 리스트로 펼친다"""
+    # 뉴스 데이터 구조 (categories -> articles)
+    if isinstance(data, dict) and 'categories' in data:
+        all_items = []
+        for cat in data['categories']:
+            articles = cat.get('articles', []) or cat.get('videos', [])
+            for item in articles:
+                item['source_category'] = cat.get('main_category', 'Unknown') or cat.get('category_name', 'Unknown')
+                all_items.append(item)
+        return all_items
+
+    return data or []
+
+def load_crawl_items(file_path: Path) -> Iterator[Dict]:
+    """
+    크롤러 출력 파일을 아이템 단위로 스트리밍한다.
+    확장자 없는 기본 경로면 .jsonl.zst / .jsonl / .json 중 가장 최근 파일을 읽는다.
+    중단된 크롤링의 JSONL도 기록된 데까지 읽는다.
+    """
+    resolved = resolve_path(file_path)
+    if resolved is None:
         print(f"⚠️ File not found: {file_path}")
-        return []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        
-        # 뉴스 데이터 구조 (categories -> articles)
-        if 'categories' in data:
-            all_items = []
-            for cat in data['categories']:
-                articles = cat.get('articles', []) or cat.get('videos', [])
-                for item in articles:
-                    item['source_category'] = cat.get('main_category', 'Unknown') or cat.get('category_name', 'Unknown')
-                    all_items.append(item)
-            return all_items
-            
-        return data
+        return
+    for cat, item in iter_items(resolved):
+        item['source_category'] = cat.get('main_category', 'Unknown') or cat.get('category_name', 'Unknown')
+        yield item
+
+def _count_into(items: Iterable[Dict], counts: Dict[str, int], source: str) -> Iterator[Dict]:
+    """스트림을 그대로 흘려보내면서 개수만 센다"""
+    counts[source] = 0
+    for item in items:
+        counts[source] += 1
+        yield item
 
-def filter_by_date(items: List[Dict], start_dt: datetime, end_dt: datetime, type: str) -> List[Dict]:
+def filter_by_date(items: Iterable[Dict], start_dt: datetime, end_dt: datetime, type: str) -> List[Dict]:
     filtered = []
     for item in items:
         item_dt = datetime.min
@@ -236,28 +265,21 @@ def filter_by_date(items: List[Dict], start_dt: datetime, end_dt: datetime, type
             
     return filtered
 
-def categorize_item(item: Dict, trends: Dict[str, float]) -> str | None:
+def categorize_item(item: Dict, trends: Dict[str, float], hits: Dict[str, KeywordHits] = None) -> str | None:
     """
     아이템을 6개 IT 카테고리로 분류
     1차: 블랙리스트 필터 (비IT 콘텐츠 차단)
     2차: source_category (sites.yaml에서 온 경우)
     3차: 키워드 매칭
     블랙리스트 매칭 시 None 반환 → 호출부에서 제외
+
+    hits: scan_item 결과 (스코어링 때 훑은 결과 재사용, 없으면 여기서 훑는다)
     """
+    if hits is None:
+        hits = scan_item(build_keyword_matcher(), item)
+
     # 0차: 비IT 블랙리스트 필터
-    BLACKLIST_KEYWORDS = [
-        # 게임
-        '게임', '라그나로크', '붉은사막', '리니지', '배틀그라운드', 'e스포츠',
-        '엔씨소프트', '넥슨', '크래프톤', '스팀', 'steam', '플레이스테이션',
-        # 의학/건강
-        '의료', '의학', '병원', '진료', '수술', '질환', '질병', '약물',
-        # 엔터테인먼트
-        '웹툰', '만화', '애니메이션', '디즈니',
-        # 스포츠
-        'f1', '포뮬러', '올림픽',
-    ]
-    text = (item.get('title', '') + ' ' + item.get('content', '') + ' ' + item.get('description', '')).lower()
-    if any(kw in text for kw in BLACKLIST_KEYWORDS):
+    if hits['blacklist'].has('blacklist'):
         return None
 
     # 1차: source_category 기반 (멀티사이트 크롤러 데이터)
@@ -276,87 +298,72 @@ def categorize_item(item: Dict, trends: Dict[str, float]) -> str | None:
     if source_cat in SOURCE_MAP:
         return SOURCE_MAP[source_cat]
 
-    # 2차: 키워드 매칭
-    text = (item.get('title', '') + ' ' + item.get('content', '')).lower()
-
-    KEYWORD_MAP = {
-        'mobile': [
-            '아이폰', '갤럭시', '스마트폰', 'ios', 'android',
-            '태블릿', '웨어러블', '폴더블', '픽셀',
-        ],
-        'pc': [
-            '노트북', '데스크톱', '윈도우', '맥북', 'gpu', '그래픽카드',
-            '모니터', '키보드', '마우스', 'ssd', '메모리', '반도체',
-            'nvidia', 'amd', 'tsmc', '삼성전자',
-        ],
-        'ai': [
-            'ai', '인공지능', 'chatgpt', 'gemini', 'claude', 'llm', 'openai',
-            '클라우드', 'aws', 'azure', 'gcp', '머신러닝', '딥러닝',
-            '자율주행', '로봇', 'meta', '구글', '애플', '마이크로소프트',
-        ],
-        'network': [
-            '5g', '6g', 'wifi', '네트워크', '주파수', '대역폭',
-            '무선망', '유선망', '광통신',
-            'skt', 'kt', 'lgu+', '통신사', '요금제', '알뜰폰',
-            'mvno', '로밍',
-        ],
-        'security': [
-            '해킹', '보안', '취약점', '랜섬웨어', '개인정보', '사이버',
-            'kisa', '방통위', '과기정통부',
-        ],
-    }
-    for cat, keywords in KEYWORD_MAP.items():
-        if any(k in text for k in keywords):
+    # 2차: 키워드 매칭 (제목+본문)
+    for cat in KEYWORD_MAP:
+        if hits['body'].has(f'cat:{cat}'):
             return cat
 
     # 기본값: 기타
     return 'etc'
 
-def main():
-    args = parse_args()
-    
-    try:
-        start_dt = datetime.strptime(args.start, "%Y-%m-%d %H:%M")
-        end_dt = datetime.strptime(args.end, "%Y-%m-%d %H:%M")
-    except ValueError:
-        print("❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD HH:MM 형식을 사용하세요.")
-        sys.exit(1)
-        
-    print(f"🗓️ Target Period: {start_dt} ~ {end_dt}")
-    
-    base_dir = Path(__file__).resolve().parent.parent
-    
-    # 1. Crawl (if not skipped)
-    if not args.skip_crawl:
-        # Naver News
-        news_script = base_dir / "crawling_naver_news" / "news_crawler.py"
-        run_crawler(news_script, news_script.parent)
-        
-        # Youtube (Data API v3 — AWS IP 차단 우회)
-        youtube_script = base_dir / "crawling_youtube" / "youtube_crawler_api.py"
-        run_crawler(youtube_script, youtube_script.parent)
+def run_crawlers(base_dir: Path):
+    """크롤러 스크립트를 순차 실행 (단독 실행용 — run_daily.py는 스테이지 그래프에서 직접 호출)"""
+    # Naver News
+    news_script = base_dir / "crawling_naver_news" / "news_crawler.py"
+    run_crawler(news_script, news_script.parent)
 
-        # 멀티사이트 크롤러
-        sites_script = base_dir / "crawling_sites" / "sites_crawler.py"
-        if sites_script.exists():
-            run_crawler(sites_script, sites_script.parent)
+    # Youtube (Data API v3 — AWS IP 차단 우회)
+    youtube_script = base_dir / "crawling_youtube" / "youtube_crawler_api.py"
+    run_crawler(youtube_script, youtube_script.parent)
 
-    # 2. Load Data
-    news_file = base_dir / "crawling_naver_news" / "news_data.json"
-    youtube_file = base_dir / "crawling_youtube" / "youtube_data.json"
-    sites_file = base_dir / "crawling_sites" / "sites_data.json"
+    # 멀티사이트 크롤러
+    sites_script = base_dir / "crawling_sites" / "sites_crawler.py"
+    if sites_script.exists():
+        run_crawler(sites_script, sites_script.parent)
 
-    news_items = load_json_data(news_file)
-    youtube_items = load_json_data(youtube_file)
-    sites_items = load_json_data(sites_file)
+def build_daily_brief(start_dt: datetime, end_dt: datetime, crawl_data: Dict[str, dict] = None) -> tuple[dict, Path]:
+    """
+    크롤링 결과를 필터링·스코어링·분류하여 daily_brief를 생성하고 파일로 저장한다.
 
-    print(f"\n📥 Loaded: {len(news_items)} news, {len(youtube_items)} videos, {len(sites_items)} external sites")
-    
-    # 3. Filter by Date
-    filtered_news = filter_by_date(news_items, start_dt, end_dt, 'news')
-    filtered_youtube = filter_by_date(youtube_items, start_dt, end_dt, 'youtube')
-    filtered_sites = filter_by_date(sites_items, start_dt, end_dt, 'news')  # 외부 사이트도 news 타입으로 날짜 필터링
+    Args:
+        start_dt, end_dt: 수집 기간 (UTC naive)
+        crawl_data: {"news": ..., "youtube": ..., "sites": ...} 크롤러 결과.
+                    dict면 메모리상의 결과, 경로면 그 출력 파일을 스트리밍으로 읽는다.
+                    False면 그 소스를 건너뛴다 (실패·타임아웃된 크롤러의 미완성 파일을 읽지 않도록).
+                    값이 없는 소스는 기본 출력 파일(.jsonl.zst/.jsonl/.json 중 최신)에서 읽는다.
+
+    Returns:
+        (daily_brief 딕셔너리, 저장 경로) 튜플
+    """
+    crawl_data = crawl_data or {}
+    base_dir = Path(__file__).resolve().parent.parent
+    set_reference_now()
 
+    # 2. Load Data + 3. Filter by Date (파일은 스트리밍으로 읽으면서 기간 내 아이템만 남김)
+    data_files = {
+        "news": base_dir / "crawling_naver_news" / "news_data",
+        "youtube": base_dir / "crawling_youtube" / "youtube_data",
+        "sites": base_dir / "crawling_sites" / "sites_data",
+    }
+    date_types = {"news": "news", "youtube": "youtube", "sites": "news"}  # 외부 사이트도 news 타입으로 날짜 필터링
+    loaded_counts = {}
+    filtered = {}
+    for source, file_path in data_files.items():
+        data = crawl_data.get(source)
+        if isinstance(data, dict):
+            items = flatten_crawl_data(data)
+        elif data is False:
+            print(f"⚠️ {source}: 크롤링 실패로 이번 브리핑에서 제외")
+            items = iter(())
+        else:
+            items = load_crawl_items(Path(data) if data else file_path)
+        filtered[source] = filter_by_date(_count_into(items, loaded_counts, source), start_dt, end_dt, date_types[source])
+
+    filtered_news = filtered["news"]
+    filtered_youtube = filtered["youtube"]
+    filtered_sites = filtered["sites"]
+
+    print(f"\n📥 Loaded: {loaded_counts['news']} news, {loaded_counts['youtube']} videos, {loaded_counts['sites']} external sites")
     print(f"📉 Filtered (Date): {len(filtered_news)} news, {len(filtered_youtube)} videos, {len(filtered_sites)} external")
 
     if not filtered_news and not filtered_youtube and not filtered_sites:
@@ -367,103 +374,76 @@ def main():
     print("\n📊 Collecting Trends...")
     collector = TrendCollector()
     
+    # 가중치는 scoring.yaml (트렌드 소스별 가중치, 기사 점수 배수, 사이트 권위)
+    scoring = load_scoring_config()
+    source_weights = scoring['trend_sources']
+
+    # 세 소스 동시 수집 (소스별 TTL 캐시, 실패·시간 초과 시 지난 결과로 대체)
+    trends = collector.collect_all()
+    print(f"   ⏱️ Trend sources: {collector.latency_summary()}")
+
     trends_map = {}
     # Google
-    for k in collector.get_google_trends(): trends_map[k] = trends_map.get(k, 0) + 1.5
+    for k in trends['google']: trends_map[k] = trends_map.get(k, 0) + source_weights['google']
     # Naver
-    for k in collector.get_naver_datalab_trends(): trends_map[k] = trends_map.get(k, 0) + 1.2
+    for k in trends['naver_datalab']: trends_map[k] = trends_map.get(k, 0) + source_weights['naver_datalab']
     # BlackKiwi
-    bk = collector.get_blackkiwi_trends()
-    for k in bk.get('rising', []): trends_map[k] = trends_map.get(k, 0) + 1.8
-    for k in bk.get('new', []): trends_map[k] = trends_map.get(k, 0) + 1.5
+    bk = trends['blackkiwi']
+    for k in bk.get('rising', []): trends_map[k] = trends_map.get(k, 0) + source_weights['blackkiwi_rising']
+    for k in bk.get('new', []): trends_map[k] = trends_map.get(k, 0) + source_weights['blackkiwi_new']
     
     # IT 키워드 부스팅: IT 관련 트렌드에 추가 가중치
-    boosted = 0
-    for kw in list(trends_map.keys()):
-        if any(it_kw in kw.lower() for it_kw in IT_BOOST_KEYWORDS):
-            trends_map[kw] = trends_map[kw] * 1.5
-            boosted += 1
-
     # 비IT 키워드 필터링: IT 무관 키워드 제거
+    static_matcher = build_keyword_matcher()
+    boosted = 0
     filtered_out = 0
     for kw in list(trends_map.keys()):
-        if any(non_it in kw.lower() for non_it in NON_IT_FILTER):
+        kw_hits = static_matcher.scan(kw.lower())
+        if kw_hits.has('it'):
+            trends_map[kw] = trends_map[kw] * scoring['trend_it_boost']
+            boosted += 1
+        if kw_hits.has('non_it'):
             del trends_map[kw]
             filtered_out += 1
 
     print(f"   Collected {len(trends_map)} trend keywords (IT boosted: {boosted}, non-IT filtered: {filtered_out})")
 
     # Scoring Combined List
+    # 모든 키워드 집합을 한 오토마톤으로 — 아이템 텍스트는 한 번만 훑고,
+    # 점수 재료는 컬럼으로 모아 한 번에 계산한다 (scoring.ScoreTable)
+    matcher = build_keyword_matcher(trends_map)
+    trend_rank = {kw: i for i, kw in enumerate(trends_map)}
+    item_hits = {}
     all_content = []
-    
-    def _calc_score(item: Dict, text: str, multiplier: float = 1.0) -> tuple:
-        """트렌드 키워드 매칭 + IT 부스트 기반 기사 점수 계산"""
-        score = 0
-        matched = []
-        for kw, weight in trends_map.items():
-            if kw.lower() in text:
-                score += weight * multiplier
-                matched.append(kw)
-        # IT 키워드 직접 부스트 (트렌드에 없어도 IT 핵심 단어면 가중치)
-        it_hits = sum(1 for kw in IT_BOOST_KEYWORDS if kw in text)
-        score += it_hits * 0.5
-        return score, matched
-
-    # News Scoring
-    for item in filtered_news:
-        text = (item.get('title', '') + " " + item.get('content', '')).lower()
-        score, matched = _calc_score(item, text)
-        item['trend_score'] = score
-        item['matched_keywords'] = matched
-        item['type'] = 'news'
-        all_content.append(item)
-
-    # External Sites Scoring (멀티사이트 크롤러 데이터)
-    for item in filtered_sites:
-        text = (item.get('title', '') + " " + item.get('content', '')).lower()
-        score, matched = _calc_score(item, text)
-        # 사이트 권위 가중치 적용
-        authority = SITE_AUTHORITY.get(item.get('source_site', ''), 1.0)
-        score *= authority
-        item['trend_score'] = score
-        item['matched_keywords'] = matched
-        item['type'] = 'news'
-        all_content.append(item)
-
-    # Youtube Scoring
-    for item in filtered_youtube:
-        text = (item.get('title', '') + " " + item.get('description', '') + " " + item.get('search_keyword', '')).lower()
-        if item.get('transcript'):
-            text += " " + item['transcript'].get('full_text', '')[:1000]
-        score, matched = _calc_score(item, text, multiplier=1.5)
+    table = ScoreTable(scoring)
+
+    for source, items in (("news", filtered_news), ("sites", filtered_sites), ("youtube", filtered_youtube)):
+        item_type = 'youtube' if source == 'youtube' else 'news'
+        for item in items:
+            item['type'] = item_type
+            hits = item_hits[id(item)] = scan_item(matcher, item)
+            matched = sorted(hits['score'].values('trend'), key=trend_rank.__getitem__)
+            item['matched_keywords'] = matched
+            table.add(
+                source,
+                trend_weight=sum(trends_map[kw] for kw in matched),
+                # IT 키워드 직접 부스트 (트렌드에 없어도 IT 핵심 단어면 가중치)
+                it_hits=hits['score'].count('it'),
+                # 보안·임팩트 추가 부스트 (CVE, 개인정보유출, 긴급패치 등)
+                has_security=hits['body'].has('security'),
+                timestamp=item.get('timestamp_obj'),
+                site=item.get('source_site', ''),
+            )
+            all_content.append(item)
+
+    # 트렌드 매칭 × 소스 배수 + IT 부스트, × 사이트 권위 × 보안 임팩트 × 신선도
+    for item, score in zip(all_content, table.scores(reference_now()).tolist()):
         item['trend_score'] = score
-        item['matched_keywords'] = matched
-        item['type'] = 'youtube'
-        all_content.append(item)
-
-    # 보안·임팩트 추가 부스트 (CVE, 개인정보유출, 긴급패치 등)
-    for item in all_content:
-        text = (item.get('title', '') + ' ' + item.get('content', '')).lower()
-        if any(kw in text for kw in SECURITY_IMPACT_KEYWORDS):
-            item['trend_score'] *= 1.3
-
-    # 신선도 보너스 (최근 6시간 ×1.3, 24시간 ×1.1)
-    for item in all_content:
-        ts = item.get('timestamp_obj')
-        if ts:
-            try:
-                age = datetime.now() - datetime.fromisoformat(ts)
-                if age.total_seconds() < 6 * 3600:
-                    item['trend_score'] *= 1.3
-                elif age.total_seconds() < 24 * 3600:
-                    item['trend_score'] *= 1.1
-            except (ValueError, TypeError):
-                pass
     
     # 5. Categorize & Sort
     final_report = {
         "generated_at": datetime.now().isoformat(),
-        "period": {"start": args.start, "end": args.end},
+        "period": {"start": start_dt.strftime("%Y-%m-%d %H:%M"), "end": end_dt.strftime("%Y-%m-%d %H:%M")},
         "trends_summary": sorted(trends_map.keys(), key=lambda k: trends_map[k], reverse=True)[:10],
         "categories": {
             "mobile": [],
@@ -480,7 +460,7 @@ def main():
     
     blacklisted_count = 0
     for item in all_content:
-        cat = categorize_item(item, trends_map)
+        cat = categorize_item(item, trends_map, item_hits[id(item)])
         if cat is None:
             blacklisted_count += 1
             continue
@@ -490,7 +470,7 @@ def main():
         print(f"   🚫 Blacklisted (non-IT): {blacklisted_count} items")
 
     # 카테고리별 최대 기사 수 제한 (네이버 독점 방지, 이미 trend_score 내림차순 정렬됨)
-    MAX_PER_CATEGORY = 20
+    MAX_PER_CATEGORY = scoring['max_per_category']
     for cat in final_report["categories"]:
         articles = final_report["categories"][cat]
         if len(articles) > MAX_PER_CATEGORY:
@@ -502,8 +482,11 @@ def main():
     output_dir.mkdir(exist_ok=True)
     output_path = output_dir / output_filename
     
-    with open(output_path, 'w', encoding='utf-8') as f:
+    # 임시 파일에 쓴 뒤 교체 — 타임아웃으로 중간에 종료돼도 반쯤 쓴 파일이 남지 않는다
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(final_report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
         
     print("\n" + "="*60)
     print(f"✅ Daily Brief Generated: {output_path}")
@@ -512,5 +495,25 @@ def main():
         print(f"   - {cat}: {len(items)}")
     print("="*60)
 
+    return final_report, output_path
+
+def main():
+    args = parse_args()
+    
+    try:
+        start_dt = datetime.strptime(args.start, "%Y-%m-%d %H:%M")
+        end_dt = datetime.strptime(args.end, "%Y-%m-%d %H:%M")
+    except ValueError:
+        print("❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD HH:MM 형식을 사용하세요.")
+        sys.exit(1)
+        
+    print(f"🗓️ Target Period: {start_dt} ~ {end_dt}")
+    
+    # 1. Crawl (if not skipped)
+    if not args.skip_crawl:
+        run_crawlers(Path(__file__).resolve().parent.parent)
+
+    build_daily_brief(start_dt, end_dt)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,138 @@
+"""
+랭킹 스코어 계산 모듈 (컬럼 단위).
+아이템마다 반복문을 돌며 점수를 곱해 가는 대신, 점수 재료(트렌드 가중치 합, IT 키워드 수,
+사이트 권위, 보안 임팩트 여부, 게시 시각)를 컬럼으로 모아 NumPy 식 한 번으로 점수를 계산한다.
+가중치는 scoring.yaml에서 읽는다 (코드 수정 없이 조정).
+
+    trend_score = (트렌드 가중치 합 × 소스 배수 + IT 키워드 수 × it_keyword)
+                  × 사이트 권위 × 보안 임팩트 배수 × 신선도 배수
+
+사용 예:
+    config = load_scoring_config()
+    table = ScoreTable(config)
+    for item in items:
+        table.add(source, trend_weight, it_hits, has_security, item.get('timestamp_obj'), item.get('source_site'))
+    scores = table.scores(now)
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import yaml
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "scoring.yaml"
+
+# scoring.yaml에 없는 항목의 기본값
+DEFAULT_SCORING = {
+    "trend_sources": {
+        "google": 1.5,
+        "naver_datalab": 1.2,
+        "blackkiwi_rising": 1.8,
+        "blackkiwi_new": 1.5,
+    },
+    "trend_it_boost": 1.5,
+    "weights": {
+        "it_keyword": 0.5,
+        "source_multiplier": {"news": 1.0, "youtube": 1.5},
+        "security_impact": 1.3,
+    },
+    "freshness": [
+        {"max_hours": 6, "multiplier": 1.3},
+        {"max_hours": 24, "multiplier": 1.1},
+    ],
+    "max_per_category": 20,
+    "site_authority": {},
+}
+
+
+def load_scoring_config(path: str = None) -> dict:
+    """scoring.yaml을 읽어 기본값 위에 덮어쓴다 (파일이 없으면 기본값)"""
+    config_path = Path(path) if path else DEFAULT_CONFIG_PATH
+    loaded = {}
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            loaded = yaml.safe_load(f) or {}
+
+    config = {}
+    for key, default in DEFAULT_SCORING.items():
+        value = loaded.get(key, default)
+        if isinstance(default, dict) and isinstance(value, dict):
+            value = {**default, **value}
+        config[key] = value
+    return config
+
+
+class ScoreTable:
+    """아이템별 점수 재료를 컬럼으로 모아 한 번에 점수를 계산한다"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        weights = config["weights"]
+        self._source_multiplier = weights["source_multiplier"]
+        self._authority = config["site_authority"]
+        self._trend_weight = []
+        self._it_hits = []
+        self._multiplier = []
+        self._authority_col = []
+        self._security = []
+        self._timestamps = []
+
+    def add(self, source: str, trend_weight: float, it_hits: int, has_security: bool,
+            timestamp: Optional[str] = None, site: str = None):
+        """
+        Args:
+            source: "news" | "sites" | "youtube" (사이트 권위는 sites에만 적용)
+            trend_weight: 매칭된 트렌드 키워드 가중치 합
+            it_hits: 매칭된 IT 부스트 키워드 수
+            has_security: 보안·임팩트 키워드 포함 여부
+            timestamp: 게시 시각 ISO 문자열 (filter_by_date의 timestamp_obj)
+            site: sites.yaml site_key
+        """
+        item_type = "youtube" if source == "youtube" else "news"
+        self._trend_weight.append(trend_weight)
+        self._it_hits.append(it_hits)
+        self._multiplier.append(self._source_multiplier.get(item_type, 1.0))
+        self._authority_col.append(self._authority.get(site or "", 1.0) if source == "sites" else 1.0)
+        self._security.append(has_security)
+        self._timestamps.append(timestamp or "NaT")
+
+    def __len__(self) -> int:
+        return len(self._trend_weight)
+
+    def ages_hours(self, now: datetime) -> np.ndarray:
+        """게시 후 경과 시간 (시간 단위, 시각이 없거나 잘못되면 NaN)"""
+        try:
+            stamps = np.array(self._timestamps, dtype="datetime64[us]")
+        except ValueError:
+            stamps = np.array([_to_datetime64(ts) for ts in self._timestamps], dtype="datetime64[us]")
+        return (np.datetime64(now, "us") - stamps) / np.timedelta64(1, "h")
+
+    def scores(self, now: datetime) -> np.ndarray:
+        """모든 아이템의 trend_score"""
+        if not self._trend_weight:
+            return np.zeros(0)
+        weights = self.config["weights"]
+
+        base = (
+            np.asarray(self._trend_weight, dtype=float) * np.asarray(self._multiplier, dtype=float)
+            + np.asarray(self._it_hits, dtype=float) * weights["it_keyword"]
+        )
+        security = np.where(np.asarray(self._security, dtype=bool), weights["security_impact"], 1.0)
+        return base * np.asarray(self._authority_col, dtype=float) * security * self._freshness(now)
+
+    def _freshness(self, now: datetime) -> np.ndarray:
+        ages = self.ages_hours(now)
+        multiplier = np.ones(len(ages))
+        # 뒤 구간부터 채워 앞(더 최근) 구간이 우선하도록
+        for tier in reversed(self.config["freshness"]):
+            with np.errstate(invalid="ignore"):
+                multiplier = np.where(ages < tier["max_hours"], tier["multiplier"], multiplier)
+        return multiplier
+
+
+def _to_datetime64(timestamp: str):
+    try:
+        return np.datetime64(datetime.fromisoformat(timestamp), "us")
+    except (ValueError, TypeError):
+        return np.datetime64("NaT")
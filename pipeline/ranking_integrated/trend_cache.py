@@ -0,0 +1,113 @@
+"""
+트렌드 수집 결과 캐시 모듈.
+소스(google, naver_datalab, blackkiwi)별 마지막 수집 결과와 수집 소요 시간을 SQLite에 저장한다.
+
+- 소스별 TTL 안이면 다시 수집하지 않고 저장된 결과를 사용 (몇 분 간격 수동 재실행 등)
+- 수집 실패/시간 초과 시 stale_max_hours 안의 지난 결과로 대체 (stale-on-error)
+- 매 수집의 소요 시간과 결과(ok/error/timeout/cache)를 기록
+
+사용 예:
+    cache = TrendCache()
+    hit = cache.get("google", max_age_hours=0.5)   # None 또는 (결과, 경과 시간)
+    cache.put("google", keywords)
+    cache.record_latency("google", 1.23, "ok")
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# 기본 캐시 위치: pipeline/cache/trends.sqlite
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "cache" / "trends.sqlite"
+
+# 소스별 재사용 시간 (구글 실시간 RSS는 자주, 데이터랩은 일 단위 데이터)
+DEFAULT_TTL_HOURS = {
+    "google": 0.5,
+    "naver_datalab": 6,
+    "blackkiwi": 1,
+}
+# 실패 시 대체로 쓸 수 있는 지난 결과의 최대 나이
+DEFAULT_STALE_MAX_HOURS = 48
+
+
+class TrendCache:
+    """소스별 트렌드 결과 + 수집 소요 시간 기록 (스레드 안전)"""
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trend_cache (
+                source TEXT PRIMARY KEY,
+                payload TEXT,
+                fetched_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trend_latency (
+                source TEXT,
+                started_at REAL,
+                seconds REAL,
+                status TEXT
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, source: str, max_age_hours: float) -> Optional[tuple[Any, float]]:
+        """max_age_hours 안에 저장된 (결과, 경과 초)를 반환한다 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM trend_cache WHERE source = ?", (source,)
+            ).fetchone()
+        if row is None:
+            return None
+        age = time.time() - row[1]
+        if age >= max_age_hours * 3600:
+            return None
+        return json.loads(row[0]), age
+
+    def put(self, source: str, payload: Any):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO trend_cache (source, payload, fetched_at) VALUES (?, ?, ?)",
+                (source, json.dumps(payload, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def record_latency(self, source: str, seconds: float, status: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO trend_latency (source, started_at, seconds, status) VALUES (?, ?, ?, ?)",
+                (source, time.time() - seconds, seconds, status),
+            )
+            self._conn.commit()
+
+    def recent_latency(self, source: str, limit: int = 20) -> list[tuple[float, str]]:
+        """최근 수집 소요 시간 [(초, 상태)] (최신순)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seconds, status FROM trend_latency WHERE source = ? ORDER BY started_at DESC LIMIT ?",
+                (source, limit),
+            ).fetchall()
+
+    def prune_latency(self, max_age_hours: float = 24 * 30) -> int:
+        """오래된 소요 시간 기록 삭제, 삭제 건수 반환"""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM trend_latency WHERE started_at < ?", (time.time() - max_age_hours * 3600,)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -3,11 +3,13 @@
 Phase 3: AI 재구성 모듈
 - LLM 클라이언트 (Gemini, OpenAI) 추상화
 - LLMRouter: 메인/폴백 자동 전환 + 재시도
-- AIRewriter: 클러스터 → 재구성 기사 변환
+- AIRewriter: 클러스터 → 재구성 기사 변환 (이미 다룬 스토리는 update 프롬프트로 갱신)
 """
 
+import hashlib
 import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -163,6 +165,52 @@ def build_articles_block(cluster: List[dict], max_chars_per_article: int = 1500)
     return "\n".join(blocks)
 
 
+class ClusterCheckpoint:
+    """
+    클러스터별 재구성 결과 체크포인트 (JSON 파일)
+
+    키는 카테고리 + 원문 링크 집합으로 만들어 클러스터링을 다시 돌려도 같은 클러스터를 찾는다.
+    폴백 결과는 저장하지 않으므로 재개 시 실패한 클러스터만 LLM을 다시 호출한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️ 클러스터 체크포인트 로드 실패 (새로 시작): {e}")
+
+    @staticmethod
+    def cluster_key(cluster: List[dict], category: str) -> str:
+        links = sorted(a.get("link", "") or a.get("title", "") for a in cluster)
+        raw = category + "\n" + "\n".join(links)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, cluster: List[dict], category: str) -> Optional[dict]:
+        entry = self.entries.get(self.cluster_key(cluster, category))
+        return dict(entry) if entry else None
+
+    def put(self, cluster: List[dict], category: str, result: dict):
+        """성공한 결과만 기록하고 즉시 디스크에 반영 (원문 기사는 제외)"""
+        if result.get("_fallback"):
+            return
+        entry = {k: v for k, v in result.items() if k != "_source_articles"}
+        with self._lock:
+            self.entries[self.cluster_key(cluster, category)] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self.entries)
+
+
 class AIRewriter:
     """AI 뉴스 재구성기"""
 
@@ -175,6 +223,7 @@ class AIRewriter:
         self.system_prompt = self._load_prompt("system_prompt.txt")
         self.merge_template = self._load_prompt("merge_prompt.txt")
         self.single_template = self._load_prompt("single_prompt.txt")
+        self.update_template = self._load_prompt("update_prompt.txt")
 
     def _load_prompt(self, filename: str) -> str:
         """프롬프트 파일 로드"""
@@ -223,6 +272,32 @@ class AIRewriter:
             print(f"  ❌ 클러스터 재구성 실패 (기사 {len(cluster)}건), 폴백 재구성 사용")
             return self._fallback_reconstruct(cluster, category)
 
+    def reconstruct_update(self, cluster: List[dict], category: str, story: dict) -> Optional[dict]:
+        """
+        이미 다룬 스토리(StoryIndex 매칭)의 후속 원문만 넣어 기존 기사를 갱신한다.
+        기존 기사는 제목+요약만 넘기고 새 원문은 짧게 잘라 입력 토큰을 줄인다.
+        LLM이 실패하면 기존 기사를 그대로 두도록 None을 반환한다 (폴백 재구성으로 덮어쓰지 않음).
+        """
+        new_articles = story.get("new_articles") or cluster
+        user_prompt = self.update_template.format(
+            category=category,
+            article_count=len(new_articles),
+            previous_title=story.get("title", ""),
+            previous_summary=story.get("summary", ""),
+            articles_block=build_articles_block(new_articles, max_chars_per_article=800),
+        )
+        try:
+            result = self.llm.generate(self.system_prompt, user_prompt)
+        except RuntimeError:
+            print(f"  ❌ 스토리 갱신 실패 [{story.get('title', '')[:20]}...], 기존 기사 유지")
+            return None
+
+        for field in ["title", "summary", "bullet_summary", "content", "hashtags"]:
+            if field not in result:
+                print(f"  ⚠️ LLM 응답에 '{field}' 필드 누락")
+                result[field] = self._get_default_value(field, cluster)
+        return result
+
     def _get_default_value(self, field: str, cluster: List[dict]):
         """누락된 필드의 기본값 생성"""
         representative = max(cluster, key=lambda a: a.get("trend_score", 0))
@@ -260,23 +335,51 @@ class AIRewriter:
             "_fallback": True,
         }
 
-    def reconstruct_all(self, clustered_data: Dict[str, List[List[dict]]]) -> List[dict]:
-        """전체 카테고리의 클러스터를 순차 재구성"""
+    def reconstruct_all(self, clustered_data: Dict[str, List[List[dict]]],
+                        checkpoint: ClusterCheckpoint = None,
+                        updates: Dict[int, dict] = None) -> List[dict]:
+        """
+        전체 카테고리의 클러스터를 순차 재구성
+
+        checkpoint가 주어지면 이미 성공한 클러스터는 LLM 호출 없이 저장된 결과를 사용하고,
+        새로 성공한 클러스터는 즉시 체크포인트에 기록한다.
+        updates({id(cluster): 스토리}, StoryIndex.plan)에 있는 클러스터는 update 프롬프트로
+        기존 기사를 갱신하고, 결과에 _story_id/_update_news_id를 붙여 DB 적재 시 UPDATE하게 한다.
+        """
         results = []
+        updates = updates or {}
         total_clusters = sum(len(clusters) for clusters in clustered_data.values())
         processed = 0
+        resumed = 0
 
         for category, clusters in clustered_data.items():
             for cluster in clusters:
                 processed += 1
-                print(f"  🔄 [{processed}/{total_clusters}] {category} - {len(cluster)}건 병합 중...")
+                story = updates.get(id(cluster))
 
-                result = self.reconstruct_cluster(cluster, category)
+                result = checkpoint.get(cluster, category) if checkpoint else None
+                if result:
+                    resumed += 1
+                    result["_source_articles"] = cluster
+                    self._mark_story_update(result, story)
+                    results.append(result)
+                    continue
+
+                if story:
+                    print(f"  🔁 [{processed}/{total_clusters}] {category} - 기존 스토리 갱신 중...")
+                    result = self.reconstruct_update(cluster, category, story)
+                else:
+                    print(f"  🔄 [{processed}/{total_clusters}] {category} - {len(cluster)}건 병합 중...")
+                    result = self.reconstruct_cluster(cluster, category)
                 if result:
                     result["category"] = category
-                    result["source_count"] = len(cluster)
-                    result["source_links"] = [a.get("link", "") for a in cluster]
+                    links = [a.get("link", "") for a in cluster]
+                    result["source_count"] = len(set(links) | story["links"]) if story else len(cluster)
+                    result["source_links"] = links
+                    if checkpoint:
+                        checkpoint.put(cluster, category, result)
                     result["_source_articles"] = cluster
+                    self._mark_story_update(result, story)
                     results.append(result)
 
                 # Rate limit 대응
@@ -285,10 +388,19 @@ class AIRewriter:
 
         fallback_count = sum(1 for r in results if r.get("_fallback"))
         print(f"  📊 재구성 결과: {len(results)}건 (폴백: {fallback_count}건)")
+        if resumed:
+            print(f"  ♻️ 체크포인트 재사용: {resumed}건 (LLM 호출 생략)")
 
         return results
 
 
+    @staticmethod
+    def _mark_story_update(result: dict, story: Optional[dict]):
+        if story:
+            result["_story_id"] = story["story_id"]
+            result["_update_news_id"] = story["news_id"]
+
+
 def create_llm_router(config: dict = None) -> LLMRouter:
     """설정 기반 LLMRouter 생성 팩토리"""
     config = config or {}
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """
 Phase 2: 주제 클러스터링 모듈
-- TF-IDF 벡터화 (char_wb n-gram으로 한국어 최적화)
-- 계층적 군집화 (Agglomerative Clustering)
+- TF-IDF 벡터화 (char_wb n-gram으로 한국어 최적화, 실행당 전체 카테고리 한 번만 학습 — text_features)
+- 계층적 군집화 (평균 연결)
+    · dense: AgglomerativeClustering (기사 수가 적을 때, 정확한 전체 쌍 비교)
+    · sparse: 희소 kNN 유사도 그래프 + 평균 연결 병합 (밀집 행렬 없이 수만 건까지)
 - 카테고리별 목표 클러스터 수 기반 제어
 """
 
@@ -11,9 +13,12 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import AgglomerativeClustering
 
+from sparse_linkage import knn_similarity_graph, sparse_average_linkage
+from text_features import TextFeatureService
+from text_normalizer import default_normalizer
+
 
 # IT 6개 카테고리별 목표 클러스터 수 (제한 완화)
 DEFAULT_TARGETS = {
@@ -29,11 +34,21 @@ DEFAULT_TARGETS = {
 class ArticleClusterer:
     """뉴스 기사 주제 클러스터링 (한국어 최적화)"""
 
-    def __init__(self, config: dict = None):
+    def __init__(self, config: dict = None, features: TextFeatureService = None):
         config = config or {}
         self.max_features = config.get("max_features", 5000)
         self.max_cluster_size = config.get("max_cluster_size", 10)
         self.targets = config.get("targets", DEFAULT_TARGETS)
+        # 군집화 백엔드: auto(기사 수가 dense_max_articles 이하면 dense) / dense / sparse
+        self.backend = config.get("backend", "auto")
+        self.dense_max_articles = config.get("dense_max_articles", 1000)
+        self.knn_neighbors = config.get("knn_neighbors", 15)
+        if self.backend not in ("auto", "dense", "sparse"):
+            raise ValueError(f"clustering.backend는 auto, dense, sparse 중 하나여야 합니다: {self.backend}")
+        # 실행 단위 공유 특성 (검증 단계 원문 유사도 체크도 같은 인스턴스를 사용)
+        self.features = features or TextFeatureService(
+            max_features=self.max_features, normalize=self._normalize_text
+        )
 
         # output_targets 형식도 호환
         if not self.targets or all(isinstance(v, float) for v in self.targets.values()):
@@ -52,6 +67,16 @@ class ArticleClusterer:
         """
         result = {}
 
+        # 전체 카테고리 기사로 TF-IDF 어휘를 한 번만 학습 (실패하면 카테고리별로 학습)
+        all_articles = [a for articles in articles_by_category.values() for a in articles]
+        shared = False
+        if len(all_articles) > 1:
+            try:
+                self.features.fit(all_articles)
+                shared = True
+            except ValueError as e:
+                print(f"  ⚠️ 공유 TF-IDF 학습 실패, 카테고리별로 학습: {e}")
+
         for category, articles in articles_by_category.items():
             if not articles:
                 result[category] = []
@@ -62,6 +87,11 @@ class ArticleClusterer:
                 print(f"     {category}: 1건 → 1개 클러스터")
                 continue
 
+            # 공유 어휘가 없으면 이 카테고리 기사로 다시 학습
+            # (앞 카테고리 어휘로 변환하면 겹치는 n-gram이 없어 영행렬이 된다)
+            if not shared:
+                self.features.reset()
+
             # 목표 클러스터 수 결정
             target = self.targets.get(category, {"min": 3, "max": 6})
             if isinstance(target, dict):
@@ -99,48 +129,16 @@ class ArticleClusterer:
 
         return result
 
-    # 영문↔한국어 브랜드명 정규화 (영문 기사와 한국어 기사가 같은 주제를 다루는 경우 클러스터링 정확도 향상)
-    _BRAND_NORMALIZE = {
-        'apple': '애플', 'iphone': '아이폰', 'ipad': '아이패드', 'macbook': '맥북',
-        'google': '구글', 'android': '안드로이드', 'pixel': '픽셀',
-        'microsoft': '마이크로소프트', 'windows': '윈도우',
-        'samsung': '삼성', 'galaxy': '갤럭시',
-        'meta': '메타', 'instagram': '인스타그램', 'whatsapp': '왓츠앱',
-        'openai': 'openai', 'chatgpt': 'chatgpt', 'gpt': 'gpt',
-        'nvidia': '엔비디아', 'amd': 'amd', 'qualcomm': '퀄컴',
-        'tesla': '테슬라', 'spacex': '스페이스엑스',
-        'amazon': '아마존', 'aws': 'aws', 'azure': 'azure',
-        'tiktok': '틱톡', 'youtube': '유튜브',
-    }
-
     def _normalize_text(self, text: str) -> str:
         """영문 브랜드명을 한국어로 정규화하여 영문·한국어 기사 간 클러스터링 정확도 향상"""
-        t = text.lower()
-        for en, ko in self._BRAND_NORMALIZE.items():
-            t = t.replace(en, ko)
-        return t
+        return default_normalizer().normalize(text.lower())
 
     def _cluster_articles(self, articles: List[dict], n_clusters: int) -> List[List[dict]]:
         """TF-IDF + 계층적 군집화로 기사 그룹핑"""
 
-        # 제목 + 본문 앞 300자 결합 + 브랜드명 정규화
-        texts = []
-        for a in articles:
-            title = a.get("title", "")
-            content = a.get("content", "")[:300]
-            texts.append(self._normalize_text(f"{title} {content}"))
-
-        # TF-IDF 벡터화 (한국어 최적화: char_wb + 2~4 n-gram)
-        vectorizer = TfidfVectorizer(
-            max_features=self.max_features,
-            analyzer="char_wb",
-            ngram_range=(2, 4),
-            min_df=1,
-            max_df=0.85,
-        )
-
+        # 제목 + 본문 앞 300자 + 브랜드명 정규화 TF-IDF 행 (공유 어휘에서 슬라이스)
         try:
-            tfidf_matrix = vectorizer.fit_transform(texts)
+            tfidf_matrix = self.features.rows(articles)
         except ValueError as e:
             print(f"  ⚠️ TF-IDF 벡터화 실패: {e}")
             return [[a] for a in articles]
@@ -154,12 +152,16 @@ class ArticleClusterer:
 
         # 계층적 군집화 (n_clusters 직접 지정)
         try:
-            clustering = AgglomerativeClustering(
-                n_clusters=n_clusters,
-                metric="cosine",
-                linkage="average",
-            )
-            labels = clustering.fit_predict(tfidf_matrix.toarray())
+            if self._use_sparse(len(articles)):
+                graph = knn_similarity_graph(tfidf_matrix, n_neighbors=self.knn_neighbors)
+                labels = sparse_average_linkage(graph, n_clusters)
+            else:
+                clustering = AgglomerativeClustering(
+                    n_clusters=n_clusters,
+                    metric="cosine",
+                    linkage="average",
+                )
+                labels = clustering.fit_predict(tfidf_matrix.toarray())
         except Exception as e:
             print(f"  ⚠️ 클러스터링 실패: {e}")
             return [[a] for a in articles]
@@ -174,6 +176,12 @@ class ArticleClusterer:
 
         return sorted_clusters
 
+    def _use_sparse(self, n_articles: int) -> bool:
+        """밀집 행렬(기사 수 × max_features)과 O(n²) 거리 행렬을 피할지 여부"""
+        if self.backend == "auto":
+            return n_articles > self.dense_max_articles
+        return self.backend == "sparse"
+
     def _get_representative(self, cluster: List[dict]) -> dict:
         """클러스터 내 trend_score + 콘텐츠 풍부도 복합 점수로 대표 기사 선정"""
         def _composite_score(a):
@@ -3,13 +3,14 @@
 Phase 5: DB 적재 모듈
 - PostgreSQL INSERT (JSONB 컬럼 포함)
 - 카테고리 매핑
-- ON CONFLICT DO NOTHING
+- ON CONFLICT DO NOTHING (같은 제목이 이미 있으면 건너뛰고 news_id는 None)
+- 이미 다룬 스토리의 갱신 기사는 기존 행(news_id)을 UPDATE
 """
 
 import json
 import os
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 CATEGORY_MAP = {
@@ -29,17 +30,32 @@ INSERT_SQL = """
     )
     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
     ON CONFLICT (title) DO NOTHING
+    RETURNING news_id
+"""
+
+# StoryIndex가 찾은 기존 스토리 기사 갱신 (카테고리·발행 시간·이미지는 유지)
+UPDATE_SQL = """
+    UPDATE news SET
+        title = %s, summary = %s, bullet_summary = %s, content = %s,
+        hashtags = %s, source_count = %s, source_name = %s
+    WHERE news_id = %s
+    RETURNING news_id
 """
 
 
-def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
+def load_to_db(reconstructed_articles: List[dict], db_config: dict = None) -> List[Optional[int]]:
     """
     재구성 기사를 PostgreSQL에 적재
 
     Args:
         reconstructed_articles: 재구성된 기사 리스트
         db_config: DB 연결 설정 (None이면 환경변수 사용)
+
+    Returns:
+        기사별 news_id 리스트 (입력과 같은 순서, 적재 실패·제목 중복으로 건너뜀 시 None)
+        이번에 INSERT/UPDATE한 행만 news_id가 있어 StoryIndex가 다른 기사의 행을 기록하지 않는다.
     """
+    news_ids: List[Optional[int]] = [None] * len(reconstructed_articles)
     import psycopg2
 
     if db_config is None:
@@ -57,9 +73,11 @@ def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
         cur = conn.cursor()
 
         inserted = 0
+        updated = 0
+        duplicated = 0
         failed = 0
 
-        for article in reconstructed_articles:
+        for idx, article in enumerate(reconstructed_articles):
             try:
                 # 출처 매체명 추출
                 source_articles = article.get("_source_articles", [])
@@ -87,6 +105,26 @@ def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
                 if published_at is None:
                     published_at = datetime.now(timezone.utc)
 
+                update_id = article.get("_update_news_id")
+                if update_id is not None:
+                    cur.execute(UPDATE_SQL, (
+                        article["title"],
+                        article["summary"],
+                        json.dumps(article["bullet_summary"], ensure_ascii=False),
+                        article["content"],
+                        json.dumps(article["hashtags"], ensure_ascii=False),
+                        article.get("source_count", 1),
+                        source_names,
+                        update_id,
+                    ))
+                    row = cur.fetchone()
+                    if row:
+                        conn.commit()
+                        news_ids[idx] = row[0]
+                        updated += 1
+                        continue
+                    # 기존 행이 삭제된 경우 새 기사로 INSERT
+
                 cur.execute(INSERT_SQL, (
                     article["title"],
                     article["summary"],
@@ -100,6 +138,13 @@ def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
                     article.get("source_count", 1),
                     published_at,
                 ))
+                row = cur.fetchone()
+                conn.commit()
+                if row is None:
+                    # 같은 제목의 기존 행 — 이 기사의 행이 아니므로 news_id를 돌려주지 않는다
+                    duplicated += 1
+                    continue
+                news_ids[idx] = row[0]
                 inserted += 1
             except Exception as e:
                 print(f"  ❌ DB INSERT 실패 [{article.get('title', '')[:20]}...]: {e}")
@@ -108,7 +153,8 @@ def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
                 continue
 
         conn.commit()
-        print(f"  📊 DB 적재 결과: {inserted}건 성공, {failed}건 실패 (총 {len(reconstructed_articles)}건)")
+        print(f"  📊 DB 적재 결과: {inserted}건 성공, {updated}건 갱신, {duplicated}건 중복, {failed}건 실패 "
+              f"(총 {len(reconstructed_articles)}건)")
 
     except Exception as e:
         print(f"  ❌ DB 연결 실패: {e}")
@@ -125,6 +171,8 @@ def load_to_db(reconstructed_articles: List[dict], db_config: dict = None):
         if conn:
             conn.close()
 
+    return news_ids
+
 
 def get_create_table_sql() -> str:
     """news 테이블 생성 SQL (참고용)"""
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+근접 중복 탐지 모듈 (MinHash + LSH)
+- 제목 + 본문 앞부분을 문자 n-gram 집합으로 바꿔 MinHash 서명 생성
+- 서명을 band로 나눠 같은 버킷에 들어간 기사만 후보 쌍으로 비교 (전체 쌍 비교 없음)
+- 후보 쌍은 서명 일치율(추정 Jaccard 유사도)이 threshold 이상이면 같은 그룹
+
+통신사 기사를 제목만 조금 바꿔 실은 매체 기사들처럼, 제목이 완전히 같지 않은 중복을 묶는다.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import List, Optional
+
+import numpy as np
+
+# 해시 함수 h(x) = (a·x + b) mod p 에 쓰는 메르센 소수
+_PRIME = (1 << 31) - 1
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+class NearDuplicateFinder:
+    """MinHash 서명 + LSH banding 기반 근접 중복 그룹 탐지기"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 3,
+                 lead_chars: int = 300, threshold: float = 0.7, seed: int = 1):
+        """
+        Args:
+            num_perm: MinHash 해시 함수 수 (서명 길이)
+            bands: LSH band 수 (num_perm의 약수, band당 행 수 = num_perm / bands)
+            shingle_size: 문자 n-gram 길이
+            lead_chars: 지문에 쓸 본문 앞부분 길이
+            threshold: 같은 기사로 볼 추정 Jaccard 유사도
+            seed: 해시 계수 시드 (실행 간 같은 결과)
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.lead_chars = lead_chars
+        self.threshold = threshold
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def fingerprint_text(self, article: dict) -> str:
+        """제목 + 본문 앞부분 (소문자, 공백·문장부호 제거)"""
+        text = article.get("title", "") + " " + article.get("content", "")[:self.lead_chars]
+        return _NON_WORD.sub("", text.lower())
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """문자 n-gram 집합의 MinHash 서명 (텍스트가 비어 있으면 None)"""
+        if not text:
+            return None
+        k = self.shingle_size
+        if len(text) <= k:
+            shingles = {text}
+        else:
+            shingles = {text[i:i + k] for i in range(len(text) - k + 1)}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        # (num_perm, n_shingles) 해시 행렬의 행별 최소값
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME).min(axis=1)
+
+    def groups(self, articles: List[dict]) -> List[List[int]]:
+        """
+        근접 중복 그룹 (기사 인덱스 리스트, 원래 순서)
+        중복이 없는 기사도 길이 1 그룹으로 포함한다.
+        """
+        signatures = [self.signature(self.fingerprint_text(a)) for a in articles]
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # LSH: band가 하나라도 같은 기사끼리만 비교
+        checked = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets = defaultdict(list)
+            for idx, sig in enumerate(signatures):
+                if sig is not None:
+                    buckets[sig[start:start + self.rows].tobytes()].append(idx)
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for pos, i in enumerate(members):
+                    for j in members[pos + 1:]:
+                        if (i, j) in checked:
+                            continue
+                        checked.add((i, j))
+                        if find(i) == find(j):
+                            continue
+                        similarity = float(np.mean(signatures[i] == signatures[j]))
+                        if similarity >= self.threshold:
+                            parent[find(j)] = find(i)
+
+        grouped = defaultdict(list)
+        for idx in range(len(articles)):
+            grouped[find(idx)].append(idx)
+        return sorted(grouped.values(), key=lambda members: members[0])
@@ -4,6 +4,7 @@ Phase 1: 전처리 모듈
 - 중복 제거 (제목 기준)
 - YouTube 기사 처리
 - 콘텐츠 정규화 (뉴스 아티팩트 제거)
+- 근접 중복 제거 (제목 + 본문 앞부분 MinHash/LSH)
 """
 
 import json
@@ -11,6 +12,7 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
+from near_duplicates import NearDuplicateFinder
 
 # 뉴스 원문 정리용 정규식 패턴
 CLEANUP_PATTERNS = [
@@ -35,8 +37,18 @@ COMPILED_PATTERNS = [re.compile(p, re.MULTILINE) for p in CLEANUP_PATTERNS]
 class Preprocessor:
     """뉴스 기사 전처리기"""
 
-    def __init__(self, max_content_length: int = 2000):
+    def __init__(self, max_content_length: int = 2000, near_duplicates: dict = None):
+        """
+        Args:
+            max_content_length: 기사 본문 최대 길이
+            near_duplicates: 근접 중복 설정 (config.yaml preprocessing.near_duplicates,
+                             enabled: false면 건너뜀, 나머지는 NearDuplicateFinder 인자)
+        """
         self.max_content_length = max_content_length
+        near_dup_config = dict(near_duplicates or {})
+        self.near_dup_finder = (
+            NearDuplicateFinder(**near_dup_config) if near_dup_config.pop("enabled", True) else None
+        )
 
     def process(self, brief_data: dict) -> Dict[str, List[dict]]:
         """
@@ -54,6 +66,7 @@ class Preprocessor:
 
         total_before = 0
         total_after = 0
+        total_near_dup = 0
 
         for category, articles in categories.items():
             total_before += len(articles)
@@ -73,10 +86,18 @@ class Preprocessor:
                 if a.get("type") == "youtube" or len(a.get("content", "").strip()) >= 50
             ]
 
+            # Step 5: 근접 중복 제거 (정리된 제목 + 본문 앞부분 기준, 뉴스만)
+            if self.near_dup_finder:
+                before = len(filtered)
+                filtered = self._merge_near_duplicates(filtered)
+                total_near_dup += before - len(filtered)
+
             result[category] = filtered
             total_after += len(filtered)
 
         print(f"  📊 전처리 결과: {total_before}건 → {total_after}건 (중복/빈콘텐츠 {total_before - total_after}건 제거)")
+        if total_near_dup:
+            print(f"     근접 중복(제목 변형 기사) {total_near_dup}건 포함")
         for cat, arts in result.items():
             news_count = sum(1 for a in arts if a.get("type") != "youtube")
             yt_count = sum(1 for a in arts if a.get("type") == "youtube")
@@ -93,17 +114,40 @@ class Preprocessor:
                 continue
 
             if key in seen:
-                existing = seen[key]
-                # 사이트 가중치(trend_score 반영) + 반응수 복합 판단
-                new_score = (article.get("trend_score", 0) or 0) + (article.get("reaction_count", 0) or 0) + (article.get("comment_count", 0) or 0)
-                old_score = (existing.get("trend_score", 0) or 0) + (existing.get("reaction_count", 0) or 0) + (existing.get("comment_count", 0) or 0)
-                if new_score > old_score:
+                if self._composite_score(article) > self._composite_score(seen[key]):
                     seen[key] = article
             else:
                 seen[key] = article
 
         return list(seen.values())
 
+    def _merge_near_duplicates(self, articles: List[dict]) -> List[dict]:
+        """
+        근접 중복 그룹마다 복합 점수가 가장 높은 기사 하나만 남긴다 (_deduplicate와 같은 기준).
+        YouTube는 제목이 본문을 대신하므로 제외한다. 남은 기사는 원래 순서를 유지한다.
+        """
+        news_idx = [i for i, a in enumerate(articles) if a.get("type") != "youtube"]
+        if len(news_idx) < 2:
+            return articles
+
+        keep = set(range(len(articles))) - set(news_idx)
+        for members in self.near_dup_finder.groups([articles[i] for i in news_idx]):
+            winner = news_idx[members[0]]
+            for m in members[1:]:
+                if self._composite_score(articles[news_idx[m]]) > self._composite_score(articles[winner]):
+                    winner = news_idx[m]
+            keep.add(winner)
+        return [a for i, a in enumerate(articles) if i in keep]
+
+    @staticmethod
+    def _composite_score(article: dict) -> float:
+        """사이트 가중치(trend_score 반영) + 반응수 복합 점수"""
+        return (
+            (article.get("trend_score", 0) or 0)
+            + (article.get("reaction_count", 0) or 0)
+            + (article.get("comment_count", 0) or 0)
+        )
+
     def _handle_youtube(self, articles: List[dict]) -> List[dict]:
         """
         YouTube 기사 처리
@@ -6,6 +6,7 @@ AI 뉴스 재구성 메인 실행 스크립트
   python reconstruct.py --input daily_brief_20260202.json
   python reconstruct.py --input daily_brief_20260202.json --dry-run
   python reconstruct.py --input daily_brief_20260202.json --output reconstructed.json --dry-run
+  python reconstruct.py --input daily_brief_20260202.json --checkpoint clusters.json  # 중단 후 재개
 """
 
 import argparse
@@ -24,9 +25,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from preprocessor import Preprocessor, load_daily_brief
 from clusterer import ArticleClusterer
-from ai_rewriter import AIRewriter, create_llm_router
+from ai_rewriter import AIRewriter, ClusterCheckpoint, create_llm_router
 from validator import ArticleValidator
 from db_loader import load_to_db
+from story_index import StoryIndex
 from image_generator import ThumbnailGenerator
 
 
@@ -65,6 +67,8 @@ def main():
     parser.add_argument("--output", default=None, help="재구성 결과 JSON 출력 경로")
     parser.add_argument("--dry-run", action="store_true", help="DB 적재 없이 결과만 출력")
     parser.add_argument("--config", default=None, help="설정 파일 경로")
+    parser.add_argument("--checkpoint", default=None,
+                        help="클러스터별 결과 체크포인트 JSON 경로 (재실행 시 성공한 클러스터는 LLM 호출 생략)")
     args = parser.parse_args()
 
     # 환경변수 로드 (프로젝트 루트 .env)
@@ -74,24 +78,47 @@ def main():
     else:
         print(f"  ⚠️ .env 파일을 찾을 수 없습니다: {env_path}")
 
+    brief_data = load_daily_brief(args.input)
+    run_reconstruction(
+        brief_data,
+        input_label=args.input,
+        output_path=args.output,
+        dry_run=args.dry_run,
+        config_path=args.config,
+        checkpoint_path=args.checkpoint,
+    )
+
+
+def run_reconstruction(brief_data: dict, input_label: str = "", output_path: str = None,
+                       dry_run: bool = False, config_path: str = None,
+                       checkpoint_path: str = None) -> list:
+    """
+    daily_brief 데이터를 재구성 기사로 변환한다 (Phase 1~5).
+    run_daily.py 스테이지 그래프에서 메모리상의 daily_brief를 그대로 넘겨 호출한다.
+
+    checkpoint_path가 주어지면 클러스터별 AI 재구성 결과를 기록/재사용한다.
+
+    Returns:
+        검증 완료된 재구성 기사 리스트
+    """
     # 설정 로드
-    config = load_config(args.config)
+    config = load_config(config_path)
 
     start_time = time.time()
     print("=" * 60)
     print(f"🚀 AI 뉴스 재구성 파이프라인 시작")
     print(f"   시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"   입력: {args.input}")
-    print(f"   모드: {'DRY-RUN (DB 적재 없음)' if args.dry_run else 'PRODUCTION'}")
+    print(f"   입력: {input_label or '(메모리)'}")
+    print(f"   모드: {'DRY-RUN (DB 적재 없음)' if dry_run else 'PRODUCTION'}")
     print("=" * 60)
 
     # ─────────────────────────────────────────────
     # Phase 1: 전처리
     # ─────────────────────────────────────────────
     print(f"\n📌 Phase 1: 전처리")
-    brief_data = load_daily_brief(args.input)
     preprocessor = Preprocessor(
-        max_content_length=config.get("preprocessing", {}).get("max_content_per_article", 2000)
+        max_content_length=config.get("preprocessing", {}).get("max_content_per_article", 2000),
+        near_duplicates=config.get("preprocessing", {}).get("near_duplicates"),
     )
     articles_by_category = preprocessor.process(brief_data)
     total_articles = sum(len(v) for v in articles_by_category.values())
@@ -106,6 +133,23 @@ def main():
     total_clusters = sum(len(v) for v in clustered.values())
     print(f"  ✅ 클러스터링 완료: {total_clusters}개 클러스터\n")
 
+    # ─────────────────────────────────────────────
+    # Phase 2.5: 이미 다룬 스토리 확인 (지난 실행과 같은 스토리는 건너뛰거나 갱신)
+    # ─────────────────────────────────────────────
+    story_config = dict(config.get("story_index") or {})
+    story_index = None
+    updates = {}
+    if story_config.pop("enabled", False):
+        print(f"📌 Phase 2.5: 이미 다룬 스토리 확인")
+        story_index = StoryIndex(**story_config)
+        if not dry_run:
+            pruned = story_index.prune()
+            if pruned:
+                print(f"  🧹 {story_index.retention_days}일 지난 스토리 {pruned}개 정리")
+        clustered, updates, skipped = story_index.plan(clustered)
+        total_clusters = sum(len(v) for v in clustered.values())
+        print(f"  ✅ 새 스토리 {total_clusters - len(updates)}개, 갱신 {len(updates)}개, 건너뜀 {skipped}개\n")
+
     # ─────────────────────────────────────────────
     # Phase 3: AI 재구성
     # ─────────────────────────────────────────────
@@ -113,7 +157,11 @@ def main():
     llm_config = config.get("llm", {})
     llm_router = create_llm_router(llm_config)
     rewriter = AIRewriter(llm_router, llm_config)
-    reconstructed = rewriter.reconstruct_all(clustered)
+    checkpoint = None
+    if checkpoint_path:
+        checkpoint = ClusterCheckpoint(checkpoint_path)
+        print(f"  💾 클러스터 체크포인트: {checkpoint_path} (저장된 결과 {len(checkpoint)}건)")
+    reconstructed = rewriter.reconstruct_all(clustered, checkpoint=checkpoint, updates=updates)
     print(f"  ✅ AI 재구성 완료: {len(reconstructed)}건\n")
 
     # LLM 통계 출력
@@ -158,17 +206,12 @@ def main():
     # Phase 4: 품질 검증
     # ─────────────────────────────────────────────
     print(f"📌 Phase 4: 품질 검증")
-    validator = ArticleValidator(config.get("validation", {}))
+    validator = ArticleValidator(config.get("validation", {}), features=clusterer.features)
     validated = validator.validate_all(reconstructed)
 
-    # 원문 유사도 체크
+    # 원문 유사도 체크 (전체 기사 한 번에)
     originality_warnings = 0
-    for article in validated:
-        source_articles = article.get("_source_articles", [])
-        original_contents = [a.get("content", "") for a in source_articles]
-        passed, similarity = validator.check_originality(
-            original_contents, article.get("content", "")
-        )
+    for article, (passed, similarity) in zip(validated, validator.check_originality_all(validated)):
         if not passed:
             originality_warnings += 1
             print(f"  ⚠️ 유사도 경고 [{article.get('title', '')[:20]}...]: {similarity:.2f}")
@@ -178,7 +221,7 @@ def main():
     # ─────────────────────────────────────────────
     # 결과 출력 (JSON)
     # ─────────────────────────────────────────────
-    if args.output:
+    if output_path:
         output_data = []
         for article in validated:
             output_data.append({
@@ -192,20 +235,25 @@ def main():
                 "source_count": article.get("source_count", 1),
                 "source_links": article.get("source_links", []),
             })
-        with open(args.output, "w", encoding="utf-8") as f:
+        with open(output_path, "w", encoding="utf-8") as f:
             json.dump(output_data, f, ensure_ascii=False, indent=2)
-        print(f"💾 결과 저장: {args.output}")
+        print(f"💾 결과 저장: {output_path}")
 
     # ─────────────────────────────────────────────
     # Phase 5: DB 적재
     # ─────────────────────────────────────────────
-    if not args.dry_run:
+    if not dry_run:
         print(f"\n📌 Phase 5: DB 적재")
         db_config_raw = config.get("database") or {}
-        load_to_db(validated, db_config_raw if db_config_raw.get("host") else None)
+        news_ids = load_to_db(validated, db_config_raw if db_config_raw.get("host") else None)
         print(f"  ✅ DB 적재 완료")
+        if story_index:
+            recorded = story_index.record_all(validated, news_ids)
+            print(f"  🗂️ 스토리 인덱스 기록: {recorded}건")
     else:
         print(f"\n⏭️  DRY-RUN 모드: DB 적재 건너뜀")
+    if story_index:
+        story_index.close()
 
     # ─────────────────────────────────────────────
     # 최종 요약
@@ -231,6 +279,8 @@ def main():
 
     print("=" * 60)
 
+    return validated
+
 
 if __name__ == "__main__":
     main()
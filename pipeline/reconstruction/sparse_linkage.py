@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+희소 평균 연결 군집화 모듈
+- L2 정규화된 희소 TF-IDF 행렬에서 기사별 코사인 유사도 상위 k개 이웃만 남긴 kNN 그래프 생성
+  (행 묶음 단위로 계산해 n × n 유사도 행렬이나 n × 특성 밀집 행렬을 만들지 않음)
+- 그래프 위에서 평균 연결(average linkage) 병합을 n_clusters개가 남을 때까지 반복
+
+두 클러스터 A, B의 평균 유사도 = (A–B 사이 그래프 간선 유사도 합) / (|A| × |B|)
+그래프에 없는 쌍은 유사도 0(코사인 거리 1)으로 본다. 모든 쌍이 그래프에 있으면
+AgglomerativeClustering(metric="cosine", linkage="average")와 같은 병합 순서가 된다.
+그래프가 끊겨 있으면 연결 요소끼리는 병합하지 않으므로 n_clusters보다 많이 남을 수 있다.
+"""
+
+import heapq
+from typing import Dict, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def knn_similarity_graph(matrix: sp.spmatrix, n_neighbors: int = 15, min_similarity: float = 0.0,
+                         chunk_size: int = 256) -> sp.csr_matrix:
+    """
+    코사인 유사도 kNN 그래프 (대칭, 대각 제외)
+
+    Args:
+        matrix: L2 정규화된 희소 행렬 (TfidfVectorizer 기본 출력)
+        n_neighbors: 기사별로 남길 이웃 수
+        min_similarity: 이 값 이하의 유사도 간선은 버림
+        chunk_size: 한 번에 유사도를 계산할 행 수 (메모리 ≈ chunk_size × n × 4바이트)
+    """
+    matrix = sp.csr_matrix(matrix, dtype=np.float32)
+    n = matrix.shape[0]
+    k = min(n_neighbors, n - 1)
+    if k <= 0:
+        return sp.csr_matrix((n, n), dtype=np.float32)
+
+    transposed = matrix.T.tocsr()
+    rows, cols, values = [], [], []
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        similarity = (matrix[start:stop] @ transposed).toarray()
+        similarity[np.arange(stop - start), np.arange(start, stop)] = -1.0  # 자기 자신 제외
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top_values = np.take_along_axis(similarity, top, axis=1)
+        keep = top_values > min_similarity
+        rows.append(np.nonzero(keep)[0] + start)
+        cols.append(top[keep])
+        values.append(top_values[keep])
+
+    graph = sp.csr_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+    )
+    return graph.maximum(graph.T).tocsr()
+
+
+def sparse_average_linkage(graph: sp.spmatrix, n_clusters: int) -> np.ndarray:
+    """
+    유사도 그래프 위의 평균 연결 병합
+
+    Returns:
+        기사별 클러스터 라벨 (0부터, 등장 순서)
+    """
+    n = graph.shape[0]
+    upper = sp.triu(graph, k=1).tocoo()
+
+    # 클러스터 → {이웃 클러스터: 간선 유사도 합}
+    links: List[Optional[Dict[int, float]]] = [{} for _ in range(n)]
+    for i, j, s in zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist()):
+        links[i][j] = s
+        links[j][i] = s
+    size = [1] * n
+    parent = list(range(n))
+
+    heap = [(-s, i, j) for i, j, s in zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist())]
+    heapq.heapify(heap)
+
+    remaining = n
+    while remaining > n_clusters and heap:
+        neg_avg, i, j = heapq.heappop(heap)
+        if links[i] is None or links[j] is None:
+            continue
+        total = links[i].get(j)
+        # 병합으로 크기/유사도 합이 바뀐 뒤의 오래된 항목은 건너뜀
+        if total is None or -neg_avg != total / (size[i] * size[j]):
+            continue
+
+        # 이웃이 많은 쪽(a)에 적은 쪽(b)을 합친다
+        a, b = (i, j) if len(links[i]) >= len(links[j]) else (j, i)
+        merged = links[a]
+        del merged[b]
+        for neighbor, s in links[b].items():
+            if neighbor == a:
+                continue
+            merged[neighbor] = merged.get(neighbor, 0.0) + s
+            neighbor_links = links[neighbor]
+            neighbor_links[a] = neighbor_links.get(a, 0.0) + neighbor_links.pop(b)
+        links[b] = None
+        parent[b] = a
+        size[a] += size[b]
+        remaining -= 1
+
+        for neighbor, s in merged.items():
+            heapq.heappush(heap, (-(s / (size[a] * size[neighbor])), min(a, neighbor), max(a, neighbor)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    labels = np.empty(n, dtype=np.int64)
+    numbering: Dict[int, int] = {}
+    for idx in range(n):
+        labels[idx] = numbering.setdefault(find(idx), len(numbering))
+    return labels
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+스토리 인덱스 모듈 (실행 간 스토리 기억)
+- 재구성해 DB에 적재한 클러스터의 지문(원문 링크 + 제목/본문 앞부분 MinHash)과 news_id를 SQLite에 저장
+- 다음 실행의 클러스터가 최근 lookback_days 안의 스토리와 같으면
+    · 새 원문이 없으면 건너뜀 (같은 기사를 다시 쓰지 않음)
+    · 새 원문이 있으면 update 프롬프트로 기존 기사(news_id)를 갱신
+- DB 적재에 성공한 기사만 기록한다 (DRY-RUN에서는 조회만 하고 저장하지 않음)
+- retention_days보다 오래 다시 나오지 않은 스토리는 실행마다 정리한다
+
+사용 예:
+    index = StoryIndex(**config["story_index"])
+    index.prune()                                         # 오래된 스토리 정리
+    clustered, updates, skipped = index.plan(clustered)   # Phase 3 전
+    ...
+    news_ids = load_to_db(validated)
+    index.record_all(validated, news_ids)                 # Phase 5 후
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from near_duplicates import NearDuplicateFinder
+
+# 기본 인덱스 위치: pipeline/cache/story_index.sqlite
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent / "cache" / "story_index.sqlite"
+
+
+def cluster_links(cluster: List[dict]) -> List[str]:
+    """클러스터 원문 링크 (링크가 없으면 제목으로 대신)"""
+    return [a.get("link", "") or a.get("title", "") for a in cluster]
+
+
+class StoryIndex:
+    """재구성 스토리 지문 → news_id 인덱스"""
+
+    def __init__(self, path: str = None, lookback_days: float = 3, similarity_threshold: float = 0.3,
+                 link_overlap: float = 0.5, on_match: str = "update", lead_chars: int = 150,
+                 num_perm: int = 64, retention_days: float = 30, enabled: bool = True):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: pipeline/cache/story_index.sqlite)
+            lookback_days: 비교할 스토리의 최근 기간
+            similarity_threshold: 제목/본문 앞부분 지문의 추정 Jaccard 유사도 기준
+            link_overlap: 새 클러스터 원문 중 이 비율 이상이 기존 스토리 원문이면 같은 스토리
+            on_match: "update"(새 원문이 있으면 갱신) 또는 "skip"(같은 스토리는 항상 건너뜀)
+            lead_chars: 지문에 쓸 원문별 본문 앞부분 길이
+            num_perm: MinHash 서명 길이
+            retention_days: prune 기본 보관 기간 (lookback_days보다 길게)
+            enabled: config.yaml 호환용 (False면 호출부에서 인덱스를 만들지 않음)
+        """
+        if on_match not in ("update", "skip"):
+            raise ValueError(f"on_match는 update 또는 skip이어야 합니다: {on_match}")
+        self.path = Path(path or DEFAULT_INDEX_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lookback_seconds = lookback_days * 86400
+        self.similarity_threshold = similarity_threshold
+        self.link_overlap = link_overlap
+        self.on_match = on_match
+        self.num_perm = num_perm
+        self.retention_days = retention_days
+        self._finder = NearDuplicateFinder(num_perm=num_perm, bands=1, lead_chars=lead_chars)
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS stories (
+                story_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT,
+                news_id INTEGER,
+                title TEXT,
+                summary TEXT,
+                links TEXT,
+                signature BLOB,
+                first_seen REAL,
+                last_seen REAL,
+                update_count INTEGER DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_recent ON stories(category, last_seen)")
+        self._conn.commit()
+
+    def fingerprint(self, cluster: List[dict]) -> np.ndarray:
+        """클러스터 원문들의 제목 + 본문 앞부분을 이은 텍스트의 MinHash 서명"""
+        text = "".join(self._finder.fingerprint_text(a) for a in cluster)
+        signature = self._finder.signature(text)
+        return signature if signature is not None else np.zeros(self.num_perm, dtype=np.uint64)
+
+    def _recent(self, category: str) -> List[dict]:
+        rows = self._conn.execute(
+            "SELECT story_id, news_id, title, summary, links, signature FROM stories "
+            "WHERE category = ? AND last_seen >= ?",
+            (category, time.time() - self.lookback_seconds),
+        ).fetchall()
+        return [
+            {
+                "story_id": story_id,
+                "news_id": news_id,
+                "title": title,
+                "summary": summary,
+                "links": set(json.loads(links)),
+                "signature": np.frombuffer(signature, dtype=np.uint64),
+            }
+            for story_id, news_id, title, summary, links, signature in rows
+        ]
+
+    def match(self, cluster: List[dict], category: str, candidates: List[dict] = None) -> Optional[dict]:
+        """
+        클러스터와 같은 최근 스토리를 찾는다.
+
+        Returns:
+            스토리 dict (+ similarity, new_articles) 또는 None
+        """
+        candidates = self._recent(category) if candidates is None else candidates
+        if not candidates:
+            return None
+
+        links = cluster_links(cluster)
+        signature = self.fingerprint(cluster)
+        similarities = np.mean(np.stack([c["signature"] for c in candidates]) == signature, axis=1)
+
+        best, best_score = None, 0.0
+        for story, similarity in zip(candidates, similarities.tolist()):
+            overlap = sum(1 for link in links if link in story["links"]) / max(1, len(links))
+            if overlap < self.link_overlap and similarity < self.similarity_threshold:
+                continue
+            score = max(overlap, similarity)
+            if score > best_score:
+                best, best_score = story, score
+        if best is None:
+            return None
+
+        return {
+            **best,
+            "similarity": best_score,
+            "new_articles": [a for a, link in zip(cluster, links) if link not in best["links"]],
+        }
+
+    def plan(self, clustered: Dict[str, List[List[dict]]]) -> Tuple[Dict[str, List[List[dict]]], Dict[int, dict], int]:
+        """
+        클러스터를 새 스토리 / 갱신 / 건너뜀으로 나눈다.
+
+        Returns:
+            (재구성할 클러스터, {id(cluster): 매칭 스토리} 갱신 대상, 건너뛴 클러스터 수)
+        """
+        planned = {}
+        updates = {}
+        skipped = 0
+        for category, clusters in clustered.items():
+            candidates = self._recent(category)
+            claimed = set()
+            kept = []
+            for cluster in clusters:
+                story = self.match(cluster, category, candidates)
+                if story is None:
+                    kept.append(cluster)
+                    continue
+                title = (story["title"] or "")[:20]
+                if story["new_articles"] and self.on_match == "update" and story["story_id"] not in claimed:
+                    claimed.add(story["story_id"])
+                    updates[id(cluster)] = story
+                    kept.append(cluster)
+                    print(f"  🔁 {category}: 기존 스토리 갱신 [{title}...] (새 원문 {len(story['new_articles'])}건)")
+                else:
+                    skipped += 1
+                    print(f"  ⏭️  {category}: 이미 다룬 스토리 [{title}...] (유사도 {story['similarity']:.2f})")
+            planned[category] = kept
+        return planned, updates, skipped
+
+    def record(self, article: dict, news_id: int):
+        """DB에 적재된 재구성 기사를 스토리로 기록 (갱신이면 기존 스토리에 원문/지문을 합친다)"""
+        cluster = article.get("_source_articles", [])
+        links = cluster_links(cluster)
+        signature = self.fingerprint(cluster).tobytes()
+        now = time.time()
+        story_id = article.get("_story_id")
+
+        if story_id is not None:
+            row = self._conn.execute("SELECT links FROM stories WHERE story_id = ?", (story_id,)).fetchone()
+            if row:
+                merged = sorted(set(json.loads(row[0])) | set(links))
+                self._conn.execute(
+                    "UPDATE stories SET news_id = ?, title = ?, summary = ?, links = ?, signature = ?, "
+                    "last_seen = ?, update_count = update_count + 1 WHERE story_id = ?",
+                    (news_id, article.get("title", ""), article.get("summary", ""),
+                     json.dumps(merged, ensure_ascii=False), signature, now, story_id),
+                )
+                return
+
+        self._conn.execute(
+            "INSERT INTO stories (category, news_id, title, summary, links, signature, first_seen, last_seen) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (article.get("category", ""), news_id, article.get("title", ""), article.get("summary", ""),
+             json.dumps(sorted(set(links)), ensure_ascii=False), signature, now, now),
+        )
+
+    def record_all(self, articles: List[dict], news_ids: List[Optional[int]]) -> int:
+        """적재에 성공한(news_id가 있는) 기사만 기록하고 기록 건수를 반환한다"""
+        recorded = 0
+        for article, news_id in zip(articles, news_ids):
+            if news_id is None:
+                continue
+            self.record(article, news_id)
+            recorded += 1
+        self._conn.commit()
+        return recorded
+
+    def prune(self, max_age_days: float = None) -> int:
+        """오래된 스토리 삭제 (기본: retention_days), 삭제 건수 반환"""
+        if max_age_days is None:
+            max_age_days = self.retention_days
+        cur = self._conn.execute("DELETE FROM stories WHERE last_seen < ?", (time.time() - max_age_days * 86400,))
+        self._conn.commit()
+        return cur.rowcount
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+텍스트 특성 공유 모듈 (실행 단위)
+- 클러스터링: 전체 카테고리 기사를 한 번만 정규화해 char_wb 2~4-gram TF-IDF 어휘를 한 번 학습하고,
+  카테고리별 군집화와 대형 클러스터 분리에는 행 슬라이스만 넘긴다 (n-gram 추출 반복 없음)
+- 원문 유사도: 상태 없는 HashingVectorizer로 모든 기사의 원문/재구성 본문을 한 번에 해싱하고,
+  IDF는 기존처럼 기사(원문 + 재구성 본문) 묶음마다 희소 행렬 연산으로 계산해 최대 코사인 유사도를 구한다
+
+사용 예:
+    features = TextFeatureService(normalize=clusterer._normalize_text)
+    features.fit(all_articles)
+    matrix = features.rows(cluster)                       # 희소 TF-IDF 행 슬라이스
+    scores = features.originality([(originals, content), ...])
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize as l2_normalize
+
+
+class TextFeatureService:
+    """실행 동안 공유하는 TF-IDF 특성 (기사 dict 기준 행 조회)"""
+
+    def __init__(self, max_features: int = 5000, lead_chars: int = 300,
+                 normalize: Callable[[str], str] = None, hash_features: int = 2 ** 18):
+        """
+        Args:
+            max_features: 클러스터링 어휘 크기
+            lead_chars: 클러스터링에 쓸 본문 앞부분 길이 (제목 + 본문 앞부분)
+            normalize: 텍스트 정규화 함수 (브랜드명 정규화 등)
+            hash_features: 원문 유사도 해싱 차원 수
+        """
+        self.max_features = max_features
+        self.lead_chars = lead_chars
+        self.normalize = normalize or (lambda text: text)
+        self._vectorizer: Optional[TfidfVectorizer] = None
+        self._matrix: Optional[sp.csr_matrix] = None
+        # 학습한 기사 dict를 붙잡아 두어 id()가 다른 객체에 재사용되지 않게 한다
+        self._articles: List[dict] = []
+        self._index: Dict[int, int] = {}
+        # 단어 단위 (기존 원문 유사도 체크와 같은 토큰), 부호 반전 없이 빈도만 해싱
+        self._hasher = HashingVectorizer(n_features=hash_features, alternate_sign=False, norm=None)
+
+    def _clustering_text(self, article: dict) -> str:
+        """제목 + 본문 앞부분 결합 + 정규화"""
+        return self.normalize(f"{article.get('title', '')} {article.get('content', '')[:self.lead_chars]}")
+
+    def _new_vectorizer(self) -> TfidfVectorizer:
+        # 한국어 최적화: char_wb + 2~4 n-gram
+        return TfidfVectorizer(
+            max_features=self.max_features,
+            analyzer="char_wb",
+            ngram_range=(2, 4),
+            min_df=1,
+            max_df=0.85,
+        )
+
+    def fit(self, articles: List[dict]) -> "TextFeatureService":
+        """
+        기사 전체로 어휘/IDF를 학습하고 행렬을 저장한다.
+        실패하면(ValueError: 빈 어휘 등) 이전 상태를 유지한 채 예외를 그대로 올린다.
+        """
+        vectorizer = self._new_vectorizer()
+        matrix = vectorizer.fit_transform([self._clustering_text(a) for a in articles]).tocsr()
+        self._vectorizer = vectorizer
+        self._matrix = matrix
+        self._articles = list(articles)
+        self._index = {id(a): idx for idx, a in enumerate(self._articles)}
+        return self
+
+    def reset(self):
+        """학습 상태를 비운다 (다음 rows()가 넘긴 기사들로 다시 학습)."""
+        self._vectorizer = None
+        self._matrix = None
+        self._articles = []
+        self._index = {}
+
+    @property
+    def fitted(self) -> bool:
+        return self._vectorizer is not None
+
+    def rows(self, articles: List[dict]) -> sp.csr_matrix:
+        """
+        기사들의 TF-IDF 행 (입력 순서)
+        학습 전이면 이 기사들로 학습하고, 학습에 없던 기사가 섞여 있으면 학습된 어휘로 변환한다.
+        """
+        if not self.fitted:
+            self.fit(articles)
+        positions = [self._position(a) for a in articles]
+        if all(pos is not None for pos in positions):
+            return self._matrix[positions]
+        return self._vectorizer.transform([self._clustering_text(a) for a in articles]).tocsr()
+
+    def _position(self, article: dict) -> Optional[int]:
+        """학습한 기사의 행 번호 (같은 객체일 때만, 내용이 같은 다른 dict는 None)"""
+        pos = self._index.get(id(article))
+        if pos is None or self._articles[pos] is not article:
+            return None
+        return pos
+
+    def originality(self, pairs: List[Tuple[List[str], str]]) -> List[float]:
+        """
+        (원문 본문 리스트, 재구성 본문) 쌍마다 원문과의 최대 코사인 유사도
+        모든 쌍의 텍스트를 한 번에 해싱하고, IDF는 쌍(원문 + 재구성 본문)마다 따로 계산한다
+        (쌍마다 TfidfVectorizer를 새로 학습하던 방식과 같은 smooth IDF 가중치.
+         단, 기존의 쌍별 max_features=1000 어휘 제한은 두지 않아 긴 본문에서는 점수가 조금 다를 수 있다).
+        """
+        texts, groups, is_reconstructed = [], [], []
+        for pair_idx, (originals, reconstructed) in enumerate(pairs):
+            valid = [c for c in originals if c.strip()]
+            if not valid or not reconstructed:
+                continue
+            texts.extend(valid + [reconstructed])
+            groups.extend([pair_idx] * (len(valid) + 1))
+            is_reconstructed.extend([False] * len(valid) + [True])
+
+        scores = [0.0] * len(pairs)
+        if not texts:
+            return scores
+
+        counts = self._hasher.transform(texts).tocsr()
+        counts.sort_indices()
+        groups = np.asarray(groups)
+        n_rows = len(texts)
+
+        # 행 → 쌍 소속 행렬로 쌍별 문서 빈도(df)를 구해 각 행의 항에 맞춰 펼친다
+        membership = sp.csr_matrix((np.ones(n_rows), (groups, np.arange(n_rows))), shape=(len(pairs), n_rows))
+        present = counts.copy()
+        present.data[:] = 1.0
+        row_df = (membership.T @ (membership @ present)).multiply(present).tocsr()
+        row_df.sort_indices()
+        group_size = np.bincount(groups, minlength=len(pairs))[groups]
+
+        # smooth idf = ln((1 + n) / (1 + df)) + 1
+        n_per_entry = np.repeat(group_size, np.diff(counts.indptr))
+        tfidf = counts.astype(np.float64)
+        tfidf.data *= np.log((1.0 + n_per_entry) / (1.0 + row_df.data)) + 1.0
+        tfidf = l2_normalize(tfidf)
+
+        # 원문 행마다 같은 쌍의 재구성 본문 행과 내적 (L2 정규화되어 있어 코사인 유사도)
+        reconstructed_row = {groups[row]: row for row in np.nonzero(is_reconstructed)[0].tolist()}
+        original_rows = np.nonzero(~np.asarray(is_reconstructed))[0]
+        partner = tfidf[[reconstructed_row[g] for g in groups[original_rows].tolist()]]
+        similarity = np.asarray(tfidf[original_rows].multiply(partner).sum(axis=1)).ravel()
+        for owner, sim in zip(groups[original_rows].tolist(), similarity.tolist()):
+            scores[owner] = max(scores[owner], sim)
+        return scores
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+브랜드명 정규화 모듈
+- 영문 브랜드명 → 한국어 표기 사전을 트라이 형태 정규식 하나로 컴파일해 텍스트를 한 번만 훑어 치환
+  (항목마다 str.replace로 새 문자열을 만들던 방식 대체, 사전이 수백 개로 늘어도 비용이 거의 같음)
+- 같은 위치에서는 가장 긴 항목 우선 (chatgpt > gpt)
+- 대소문자 무시는 소문자로 바꾼 사본에서 찾고 원문에 잘라 붙여 처리한다
+  (re.IGNORECASE는 항목 수에 비례해 느려져 쓰지 않음)
+- word_boundary=True면 영문·숫자와 붙어 있는 부분은 치환하지 않음 (metaverse의 meta 등)
+  한국어 조사가 바로 붙는 경우(meta가)는 치환한다
+
+클러스터링(영문·한국어 기사 주제 묶기), 해시태그 보정, 랭킹 트렌드 키워드 별칭에서 공유한다.
+
+사용 예:
+    normalizer = default_normalizer()
+    normalizer.normalize("new iphone")                    # "new 아이폰"
+    default_normalizer(word_boundary=True).variants("아이폰")  # {"아이폰", "iphone"}
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Set
+
+# 영문↔한국어 브랜드명 (영문 기사와 한국어 기사가 같은 주제를 다루는 경우 클러스터링 정확도 향상)
+BRAND_NORMALIZE = {
+    'apple': '애플', 'iphone': '아이폰', 'ipad': '아이패드', 'macbook': '맥북',
+    'google': '구글', 'android': '안드로이드', 'pixel': '픽셀',
+    'microsoft': '마이크로소프트', 'windows': '윈도우',
+    'samsung': '삼성', 'galaxy': '갤럭시',
+    'meta': '메타', 'instagram': '인스타그램', 'whatsapp': '왓츠앱',
+    'openai': 'openai', 'chatgpt': 'chatgpt', 'gpt': 'gpt',
+    'nvidia': '엔비디아', 'amd': 'amd', 'qualcomm': '퀄컴',
+    'tesla': '테슬라', 'spacex': '스페이스엑스',
+    'amazon': '아마존', 'aws': 'aws', 'azure': 'azure',
+    'tiktok': '틱톡', 'youtube': '유튜브',
+}
+
+
+def _trie_pattern(words) -> str:
+    """
+    단어 목록을 트라이 형태 정규식으로 변환 (공통 접두사를 한 번만 비교)
+    끝날 수 있는 노드의 나머지는 탐욕적 (?:...)? 로 감싸 가장 긴 단어가 먼저 맞는다.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class BrandNormalizer:
+    """브랜드 사전 → 단일 컴파일 정규식 치환기"""
+
+    def __init__(self, mapping: Dict[str, str] = None, word_boundary: bool = False):
+        """
+        Args:
+            mapping: {원래 표기: 정규화 표기} (대소문자 무시, 기본: BRAND_NORMALIZE)
+            word_boundary: True면 앞뒤가 영문·숫자로 이어지는 부분은 치환하지 않음
+        """
+        mapping = BRAND_NORMALIZE if mapping is None else mapping
+        self.word_boundary = word_boundary
+        self._lookup = {key.lower(): value for key, value in mapping.items() if key}
+        self._body = None
+        self._pattern = None
+        self._pattern_ignorecase = None
+        if self._lookup:
+            body = _trie_pattern(self._lookup)
+            if word_boundary:
+                body = f"(?<![a-z0-9])(?:{body})(?![a-z0-9])"
+            self._body = body
+            self._pattern = re.compile(body)
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+    def _replace(self, match: re.Match) -> str:
+        # IGNORECASE 경로에서 İ처럼 소문자가 사전 표기와 달라지는 매칭은 그대로 둔다
+        return self._lookup.get(match.group(0).lower(), match.group(0))
+
+    def normalize(self, text: str) -> str:
+        """사전 항목을 정규화 표기로 치환 (사전에 없는 부분의 대소문자는 그대로)"""
+        if not text or self._pattern is None:
+            return text
+        lowered = text.lower()
+        if lowered == text:
+            return self._pattern.sub(self._replace, text)
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자(İ 등)가 있으면 위치를 맞출 수 없어 느린 경로
+            if self._pattern_ignorecase is None:
+                self._pattern_ignorecase = re.compile(self._body, re.IGNORECASE)
+            return self._pattern_ignorecase.sub(self._replace, text)
+
+        parts = []
+        pos = 0
+        for match in self._pattern.finditer(lowered):
+            parts.append(text[pos:match.start()])
+            parts.append(self._lookup[match.group(0)])
+            pos = match.end()
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    def reversed(self) -> "BrandNormalizer":
+        """정규화 표기 → 원래 표기 치환기 (정규화 표기가 같은 항목이 여럿이면 첫 항목)"""
+        reverse = {}
+        for key, value in self._lookup.items():
+            if value.lower() != key:
+                reverse.setdefault(value, key)
+        return BrandNormalizer(reverse, word_boundary=self.word_boundary)
+
+    def variants(self, text: str) -> Set[str]:
+        """text와 같은 대상을 가리키는 표기들 (원래 표기, 정규화 표기, 역정규화 표기)"""
+        return {text, self.normalize(text), _reversed(self).normalize(text)}
+
+
+@lru_cache(maxsize=None)
+def _reversed(normalizer: BrandNormalizer) -> BrandNormalizer:
+    return normalizer.reversed()
+
+
+@lru_cache(maxsize=None)
+def default_normalizer(word_boundary: bool = False) -> BrandNormalizer:
+    """BRAND_NORMALIZE 기본 치환기 (프로세스당 한 번 컴파일)"""
+    return BrandNormalizer(word_boundary=word_boundary)
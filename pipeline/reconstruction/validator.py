@@ -3,20 +3,20 @@
 Phase 4: 품질 검증 모듈
 - 5개 필드 길이/형식 검증
 - bullet_summary, hashtags 자동 보정
-- 원문 유사도 체크
+- 원문 유사도 체크 (실행 단위 TextFeatureService로 전체 기사를 한 번에 해싱)
 """
 
 import re
 from typing import Dict, List, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from text_features import TextFeatureService
+from text_normalizer import default_normalizer
 
 
 class ArticleValidator:
     """재구성 기사 품질 검증기"""
 
-    def __init__(self, config: dict = None):
+    def __init__(self, config: dict = None, features: TextFeatureService = None):
         config = config or {}
         self.title_length = config.get("title_length", {"min": 5, "max": 30})
         self.summary_length = config.get("summary_length", {"min": 50, "max": 200})
@@ -27,6 +27,7 @@ class ArticleValidator:
         self.hashtag_count = config.get("hashtag_count", {"min": 3, "max": 5})
         self.hashtag_item_length = config.get("hashtag_item_length", {"min": 2, "max": 8})
         self.originality_threshold = config.get("originality_threshold", 0.8)
+        self.features = features or TextFeatureService()
 
     def validate_all(self, articles: List[dict]) -> List[dict]:
         """전체 기사 검증 + 자동 보정"""
@@ -179,9 +180,10 @@ class ArticleValidator:
                 if tag not in cleaned:  # 중복 제거
                     cleaned.append(tag)
 
-        # 3개 미만이면 제목/본문에서 키워드 추출
+        # 3개 미만이면 제목/본문에서 키워드 추출 (영문 브랜드명은 한국어 표기로 바꿔 후보에 포함)
         if len(cleaned) < self.hashtag_count["min"]:
-            words = re.findall(r'[가-힣]{2,6}', title + " " + content[:200])
+            text = default_normalizer(word_boundary=True).normalize(title + " " + content[:200])
+            words = re.findall(r'[가-힣]{2,6}', text)
             # 빈도순 정렬
             word_freq = {}
             for w in words:
@@ -208,29 +210,33 @@ class ArticleValidator:
         if not original_contents or not reconstructed_content:
             return True, 0.0
 
-        # 빈 문자열 필터링
-        valid_originals = [c for c in original_contents if c.strip()]
-        if not valid_originals:
-            return True, 0.0
-
-        all_texts = valid_originals + [reconstructed_content]
-
         try:
-            vectorizer = TfidfVectorizer(max_features=1000)
-            tfidf = vectorizer.fit_transform(all_texts)
-
-            reconstructed_vec = tfidf[-1]
-            max_similarity = 0.0
-            for i in range(len(valid_originals)):
-                sim = cosine_similarity(tfidf[i], reconstructed_vec)[0][0]
-                max_similarity = max(max_similarity, sim)
-
+            max_similarity = self.features.originality([(original_contents, reconstructed_content)])[0]
             passed = max_similarity < threshold
             return passed, max_similarity
         except Exception as e:
             print(f"  ⚠️ 유사도 체크 실패: {e}")
             return True, 0.0
 
+    def check_originality_all(self, articles: List[dict], threshold: float = None) -> List[Tuple[bool, float]]:
+        """
+        재구성 기사 전체의 원문 유사도 체크 (_source_articles 본문 기준, 해싱/IDF 계산 한 번)
+
+        Returns:
+            기사별 (통과 여부, 최대 유사도 값)
+        """
+        threshold = threshold or self.originality_threshold
+        pairs = [
+            ([a.get("content", "") for a in article.get("_source_articles", [])], article.get("content", ""))
+            for article in articles
+        ]
+        try:
+            similarities = self.features.originality(pairs)
+        except Exception as e:
+            print(f"  ⚠️ 유사도 체크 실패: {e}")
+            return [(True, 0.0)] * len(articles)
+        return [(similarity < threshold, similarity) for similarity in similarities]
+
 
 if __name__ == "__main__":
     # 간단한 테스트
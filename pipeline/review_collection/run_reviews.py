@@ -67,28 +67,15 @@ def get_llm_router():
     return create_llm_router(llm_config)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Play Store 리뷰 수집 파이프라인")
-    parser.add_argument("--date", type=str, default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘 KST)")
-    parser.add_argument("--dry-run", action="store_true", help="DB 저장 없이 수집만 (미구현, 향후)")
-    parser.add_argument("--skip-collect", action="store_true", help="수집 스킵, 분석+요약만")
-    parser.add_argument("--max-reviews", type=int, default=50, help="앱당 최대 수집 리뷰 수 (기본: 50)")
-    args = parser.parse_args()
-
-    # 날짜 결정
-    if args.date:
-        target_date = datetime.strptime(args.date, "%Y-%m-%d")
-    else:
-        target_date = datetime.now(KST).replace(tzinfo=None)
-    date_label = target_date.strftime("%Y-%m-%d")
-
-    print("=" * 60)
-    print(f"📱 Play Store 리뷰 수집 파이프라인")
-    print(f"   날짜: {date_label}")
-    print(f"   수집: {'SKIP' if args.skip_collect else 'ON'}")
-    print(f"   앱당 최대: {args.max_reviews}개")
-    print("=" * 60)
-
+def run_review_pipeline(date_label: str, max_reviews: int = 50, skip_collect: bool = False) -> dict:
+    """
+    리뷰 파이프라인 본체 (시딩 → 수집 → 분석 → 요약).
+    오류는 호출부로 전파한다 (CLI는 exit 1, run_daily.py 스테이지 그래프는 실패 처리).
+
+    Returns:
+        단계별 결과 요약 딕셔너리
+    """
+    result = {}
     conn = None
     try:
         conn = get_db_connection()
@@ -101,20 +88,22 @@ def main():
         log("✅", f"앱 시딩 완료 (신규 {added}개)")
 
         # Step 2a: Play Store 리뷰 수집
-        if not args.skip_collect:
+        if not skip_collect:
             log("📌", "Step 2a: Play Store 리뷰 수집")
             from review_collection.playstore_collector import collect_all_active_apps
-            collect_result = collect_all_active_apps(conn, max_reviews_per_app=args.max_reviews)
+            collect_result = collect_all_active_apps(conn, max_reviews_per_app=max_reviews)
             log("✅", f"Play Store 수집 완료: {collect_result.get('total_apps', 0)}개 앱, "
                       f"{collect_result.get('total_collected', 0)}개 리뷰")
+            result["playstore"] = collect_result
 
             # Step 2b: App Store 리뷰 수집
             print()
             log("📌", "Step 2b: App Store 리뷰 수집")
             from review_collection.appstore_collector import collect_all_appstore_apps
-            appstore_result = collect_all_appstore_apps(conn, max_reviews_per_app=args.max_reviews)
+            appstore_result = collect_all_appstore_apps(conn, max_reviews_per_app=max_reviews)
             log("✅", f"App Store 수집 완료: {appstore_result.get('total_apps', 0)}개 앱, "
                       f"{appstore_result.get('total_collected', 0)}개 리뷰")
+            result["appstore"] = appstore_result
         else:
             log("⏭️", "Step 2: 수집 스킵")
 
@@ -127,6 +116,7 @@ def main():
         log("✅", f"로컬 감정: {analysis_result.get('local_sentiment', 0)}건, "
                   f"종합 분석: {analysis_result.get('apps_analyzed', 0)}개 앱 "
                   f"(Gemini {analysis_result.get('gemini_calls', 0)}회)")
+        result["analysis"] = analysis_result
 
         # Step 4: 통계 집계 + notability 점수 계산
         print()
@@ -134,15 +124,43 @@ def main():
         from review_collection.review_summarizer import generate_daily_summaries
         summary_result = generate_daily_summaries(conn, date_label)
         log("✅", f"통계 집계: {summary_result.get('apps_processed', 0)}개 앱")
+        result["summary"] = summary_result
+    finally:
+        if conn:
+            conn.close()
+
+    return result
+
 
+def main():
+    parser = argparse.ArgumentParser(description="Play Store 리뷰 수집 파이프라인")
+    parser.add_argument("--date", type=str, default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘 KST)")
+    parser.add_argument("--dry-run", action="store_true", help="DB 저장 없이 수집만 (미구현, 향후)")
+    parser.add_argument("--skip-collect", action="store_true", help="수집 스킵, 분석+요약만")
+    parser.add_argument("--max-reviews", type=int, default=50, help="앱당 최대 수집 리뷰 수 (기본: 50)")
+    args = parser.parse_args()
+
+    # 날짜 결정
+    if args.date:
+        target_date = datetime.strptime(args.date, "%Y-%m-%d")
+    else:
+        target_date = datetime.now(KST).replace(tzinfo=None)
+    date_label = target_date.strftime("%Y-%m-%d")
+
+    print("=" * 60)
+    print(f"📱 Play Store 리뷰 수집 파이프라인")
+    print(f"   날짜: {date_label}")
+    print(f"   수집: {'SKIP' if args.skip_collect else 'ON'}")
+    print(f"   앱당 최대: {args.max_reviews}개")
+    print("=" * 60)
+
+    try:
+        run_review_pipeline(date_label, max_reviews=args.max_reviews, skip_collect=args.skip_collect)
     except Exception as e:
         log("❌", f"파이프라인 오류: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
-    finally:
-        if conn:
-            conn.close()
 
     print()
     print("=" * 60)
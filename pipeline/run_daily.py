@@ -15,15 +15,25 @@ Usage:
   python run_daily.py --skip-crawl             # 크롤링 건너뛰기
   python run_daily.py --dry-run                # DB 적재 없이 실행
   python run_daily.py --date 2026-02-09        # 특정 날짜 기준
+  python run_daily.py --workers 2              # 동시 실행 단계 수 제한
+  python run_daily.py --resume                 # 같은 날짜의 중단된 실행 이어서 하기
+
+일간 모드는 stage_graph.StageGraph로 단계를 인프로세스 실행한다.
+의존성이 없는 단계(소스별 크롤링, 리뷰 수집)는 동시에 돌고, 결과는 메모리로 전달된다.
+단계 결과는 runs/<날짜>/manifest.json에 기록되며, --resume 시 완료된 단계는 산출물만
+다시 읽고 AI 재구성은 성공한 클러스터의 LLM 호출을 생략한다.
 """
 
 import argparse
-import subprocess
+import json
 import sys
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from run_manifest import RunManifest
+from stage_graph import StageGraph, StageResult
+
 KST = timezone(timedelta(hours=9))
 PIPELINE_DIR = Path(__file__).resolve().parent
 
@@ -32,31 +42,6 @@ def log(icon: str, msg: str):
     print(f"{icon} [{datetime.now(KST).strftime('%H:%M:%S')}] {msg}")
 
 
-def run_step(cmd: list, cwd: Path, timeout: int, label: str) -> bool:
-    """Run a subprocess step. Returns True on success."""
-    log("▶️", f"{label} 시작...")
-    log("  ", f"cmd: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(cwd),
-            timeout=timeout,
-            capture_output=False,
-        )
-        if result.returncode == 0:
-            log("✅", f"{label} 완료")
-            return True
-        else:
-            log("❌", f"{label} 실패 (exit code: {result.returncode})")
-            return False
-    except subprocess.TimeoutExpired:
-        log("⏰", f"{label} 타임아웃 ({timeout}초)")
-        return False
-    except FileNotFoundError as e:
-        log("❌", f"{label} 실행 불가: {e}")
-        return False
-
-
 def _generate_cover_image(report: dict, briefing_type: str, date_str: str):
     """브리핑 커버 이미지 생성 (실패해도 파이프라인 중단하지 않음)"""
     try:
@@ -242,40 +227,234 @@ def run_monthly(args, target_date):
     print("=" * 60)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="IT 도깨비 - Pipeline Runner")
-    parser.add_argument("--mode", type=str, default="daily",
-                        choices=["daily", "weekly", "monthly"],
-                        help="실행 모드: daily(기본), weekly, monthly")
-    parser.add_argument("--skip-crawl", action="store_true", help="크롤링 건너뛰기 (daily 모드)")
-    parser.add_argument("--dry-run", action="store_true", help="DB 적재 없이 실행")
-    parser.add_argument("--date", type=str, default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘 KST)")
-    parser.add_argument("--output", type=str, default=None, help="출력 파일 경로 (weekly/monthly 모드)")
-    args = parser.parse_args()
+def _load_env():
+    """프로젝트 루트 .env 로드 (인프로세스 단계들이 공유)"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    env_path = PIPELINE_DIR.parent / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
 
-    # 기준 날짜 결정 (KST)
-    if args.date:
+
+def _find_existing_brief(start_dt: datetime, date_compact: str):
+    """랭킹 단계 실패 시 재구성 입력으로 쓸 기존 daily_brief 파일을 찾는다."""
+    # run_batch.py uses start_dt (UTC) for filename, so check both UTC start and KST dates
+    start_compact = start_dt.strftime("%Y%m%d")
+    for directory in (PIPELINE_DIR, PIPELINE_DIR / "ranking_integrated"):
+        for compact in (start_compact, date_compact):
+            path = directory / f"daily_brief_{compact}.json"
+            if path.exists():
+                return path
+
+    # Try to find any existing daily_brief file
+    existing = sorted(PIPELINE_DIR.glob("daily_brief_*.json"), reverse=True)
+    if not existing:
+        existing = sorted((PIPELINE_DIR / "ranking_integrated").glob("daily_brief_*.json"), reverse=True)
+    return existing[0] if existing else None
+
+
+def _run_newsletter(args, target_date, date_compact: str) -> bool:
+    """일간 뉴스레터 생성 + 커버 이미지 + DB 적재. 생성 성공 여부 반환."""
+    sys.path.insert(0, str(PIPELINE_DIR / "content_generator"))
+    from daily_generator import DailyBriefingGenerator
+
+    generator = DailyBriefingGenerator(pipeline_dir=PIPELINE_DIR)
+    nl_date = target_date.replace(tzinfo=None)
+    data = generator.collect_daily_data(nl_date)
+
+    if not data["reconstructed_articles"]:
+        log("⚠️", "재구성 기사 0건 → 뉴스레터 생성 스킵")
+        return False
+
+    analysis = generator.analyze_daily(data)
+    log("✅", f"일간 분석: {analysis['total_articles']}건")
+
+    report = generator.generate_report(data, analysis)
+    if not report:
+        log("⚠️", "일간 뉴스레터 생성 실패 (폴백도 실패)")
+        return False
+
+    nl_output = PIPELINE_DIR / f"daily_newsletter_{date_compact}.json"
+    with open(nl_output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    log("✅", f"일간 뉴스레터 저장: {nl_output.name}")
+
+    # 커버 이미지 생성
+    _generate_cover_image(report, "daily", date_compact)
+    # 커버 이미지 포함하여 JSON 재저장
+    if report.get("cover_image_url"):
+        with open(nl_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    # DB 적재
+    if not args.dry_run:
         try:
-            target_date = datetime.strptime(args.date, "%Y-%m-%d").replace(tzinfo=KST)
-        except ValueError:
-            print("❌ --date 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요.")
-            sys.exit(1)
-    else:
-        target_date = datetime.now(KST)
+            from briefing_db_loader import load_daily_to_db
+            load_daily_to_db(report, data["date_label"])
+        except Exception as e:
+            log("⚠️", f"뉴스레터 DB 적재 실패 (JSON은 저장됨): {e}")
 
-    # 주간/월간 모드 분기
-    if args.mode == "weekly":
-        run_weekly(args, target_date)
-        return
-    elif args.mode == "monthly":
-        run_monthly(args, target_date)
-        return
+    return True
 
-    # ─────────────────────────────────────────────
-    # 일간 모드 (daily)
-    # ─────────────────────────────────────────────
+
+def build_daily_graph(args, target_date, start_dt: datetime, end_dt: datetime,
+                      manifest: RunManifest, artifacts: dict) -> StageGraph:
+    """
+    일간 파이프라인 스테이지 그래프 구성
+
+        crawl_naver ─┐
+        crawl_youtube ├─→ rank ─→ reconstruct ─→ newsletter
+        crawl_sites ──┘
+        reviews (독립 실행)
+
+    각 단계의 산출물 경로는 artifacts[단계 이름]에 미리 채워 두고, 실행 매니페스트가 이를 기록한다.
+    모든 단계는 자식 프로세스에서 실행되어(isolate) 타임아웃 시 강제 종료된다
+    (단계 함수 안에서 바꾼 artifacts는 부모에 반영되지 않으므로 경로는 여기서 정한다).
+    """
     date_str = target_date.strftime("%Y-%m-%d")
     date_compact = target_date.strftime("%Y%m%d")
+    graph = StageGraph(max_workers=args.workers, log=log)
+
+    # ─── Step 1: 크롤링 (소스별 병렬) ───
+    crawl_stages = []
+    if not args.skip_crawl:
+        artifacts["crawl_naver"] = str(PIPELINE_DIR / "crawling_naver_news" / "news_data.jsonl")
+        artifacts["crawl_youtube"] = str(PIPELINE_DIR / "crawling_youtube" / "youtube_data.jsonl")
+        artifacts["crawl_sites"] = str(PIPELINE_DIR / "crawling_sites" / "sites_data.jsonl")
+
+        def crawl_naver(_):
+            from crawling_naver_news.news_crawler import crawl_news
+            crawler_dir = PIPELINE_DIR / "crawling_naver_news"
+            crawl_news(
+                crawling_md_path=str(crawler_dir / "크롤링.md"),
+                output_path=artifacts["crawl_naver"],
+                articles_per_section=10,
+                fetch_full_content=True,
+                workers=args.naver_workers,
+            )
+            return artifacts["crawl_naver"]
+
+        def crawl_youtube(_):
+            from crawling_youtube.youtube_crawler_api import crawl_with_api
+            crawler_dir = PIPELINE_DIR / "crawling_youtube"
+            crawl_with_api(
+                config_path=str(crawler_dir / "config.yaml"),
+                output_path=artifacts["crawl_youtube"],
+                videos_per_keyword=3,
+            )
+            return artifacts["crawl_youtube"]
+
+        def crawl_sites(_):
+            from crawling_sites.sites_crawler import run_sites_crawl
+            run_sites_crawl(output_path=artifacts["crawl_sites"])
+            return artifacts["crawl_sites"]
+
+        graph.add_stage("crawl_naver", crawl_naver, timeout=480, isolate=True)
+        graph.add_stage("crawl_youtube", crawl_youtube, timeout=300, isolate=True)
+        graph.add_stage("crawl_sites", crawl_sites, timeout=480, isolate=True)
+        crawl_stages = ["crawl_naver", "crawl_youtube", "crawl_sites"]
+
+    # ─── Step 1: 랭킹 + 트렌드 매칭 (크롤러 출력 파일을 스트리밍으로 읽음) ───
+    # 실패·타임아웃된 크롤러의 출력 파일은 중간에 끊긴 것이므로 읽지 않고 그 소스를 제외한다.
+    # --skip-crawl이면 크롤링 단계가 없으므로 기존 출력 파일을 읽는다.
+    sources = {"crawl_naver": "news", "crawl_youtube": "youtube", "crawl_sites": "sites"}
+    artifacts["rank"] = str(PIPELINE_DIR / f"daily_brief_{start_dt.strftime('%Y%m%d')}.json")
+
+    def rank(inputs):
+        sys.path.insert(0, str(PIPELINE_DIR / "ranking_integrated"))
+        from run_batch import build_daily_brief
+        crawl_data = {
+            source: inputs[stage] or False
+            for stage, source in sources.items() if stage in inputs
+        }
+        final_report, _ = build_daily_brief(start_dt, end_dt, crawl_data=crawl_data)
+        return final_report
+
+    graph.add_stage("rank", rank, deps=crawl_stages, timeout=180, soft_deps=True, isolate=True)
+
+    # ─── Step 1.5: Play Store 리뷰 수집 + 분석 (뉴스 흐름과 독립) ───
+    def reviews(_):
+        from review_collection.run_reviews import run_review_pipeline
+        return run_review_pipeline(date_str, max_reviews=50)
+
+    graph.add_stage("reviews", reviews, timeout=300, isolate=True)
+
+    # ─── Step 2: AI 재구성 + 썸네일 + DB 적재 ───
+    # Also save output JSON for artifact upload
+    artifacts["reconstruct"] = str(PIPELINE_DIR / f"reconstructed_{date_compact}.json")
+
+    def reconstruct(inputs):
+        brief_data = inputs.get("rank")
+        input_label = "(메모리: rank 단계)"
+        if brief_data is None:
+            log("⚠️", "랭킹 실패. 기존 daily_brief 파일을 찾습니다...")
+            brief_path = _find_existing_brief(start_dt, date_compact)
+            if not brief_path:
+                raise RuntimeError("사용 가능한 daily_brief 파일이 없습니다.")
+            log("📂", f"기존 파일 사용: {brief_path.name}")
+            with open(brief_path, "r", encoding="utf-8") as f:
+                brief_data = json.load(f)
+            input_label = str(brief_path)
+
+        sys.path.insert(0, str(PIPELINE_DIR / "reconstruction"))
+        from reconstruct import run_reconstruction
+        return run_reconstruction(
+            brief_data,
+            input_label=input_label,
+            output_path=artifacts["reconstruct"],
+            dry_run=args.dry_run,
+            checkpoint_path=str(manifest.cluster_checkpoint_path),
+        )
+
+    graph.add_stage("reconstruct", reconstruct, deps=["rank"], timeout=900, soft_deps=True, isolate=True)
+
+    # ─── Step 3: Daily Newsletter (일간 뉴스레터) ───
+    # 미생성(False)이면 record()가 실패로 기록하므로 경로는 생성된 경우에만 재사용된다
+    artifacts["newsletter"] = str(PIPELINE_DIR / f"daily_newsletter_{date_compact}.json")
+
+    def newsletter(_):
+        return _run_newsletter(args, target_date, date_compact)
+
+    graph.add_stage("newsletter", newsletter, deps=["reconstruct"], timeout=300, isolate=True)
+
+    return graph
+
+
+def _restore_completed(graph: StageGraph, manifest: RunManifest) -> dict:
+    """
+    매니페스트에서 완료된 단계를 찾아 산출물을 다시 읽는다.
+
+    선행 단계가 다시 실행되는 경우 결과가 달라질 수 있으므로, 모든 선행 단계가
+    복원된 단계만 재사용한다 (등록 순서 = 위상 순서).
+    """
+    restored = {}
+    for name, stage in graph.stages.items():
+        if not manifest.is_completed(name) or any(dep not in restored for dep in stage.deps):
+            continue
+        artifact = manifest.artifact(name)
+        if artifact is None:
+            restored[name] = None
+            continue
+        if Path(artifact).suffix != ".json":
+            # 크롤링 스트림(.jsonl/.jsonl.zst)은 경로를 그대로 넘기고 rank 단계가 스트리밍으로 읽는다
+            if Path(artifact).exists():
+                restored[name] = artifact
+            else:
+                log("⚠️", f"[{name}] 산출물이 없어 다시 실행합니다: {artifact}")
+            continue
+        try:
+            with open(artifact, "r", encoding="utf-8") as f:
+                restored[name] = json.load(f)
+        except (OSError, ValueError) as e:
+            log("⚠️", f"[{name}] 산출물 로드 실패, 다시 실행합니다: {e}")
+    return restored
+
+
+def run_daily(args, target_date):
+    """일간 파이프라인 모드"""
+    date_str = target_date.strftime("%Y-%m-%d")
 
     # Time window for crawling: yesterday 18:00 KST ~ today 18:00 KST
     # run_batch.py uses UTC naive datetimes internally (datetime.now() on UTC server),
@@ -293,169 +472,47 @@ def main():
     print(f"   (UTC 변환: {start_dt.strftime('%Y-%m-%d %H:%M')} ~ {end_dt.strftime('%Y-%m-%d %H:%M')} UTC)")
     print(f"   모드: {'DRY-RUN' if args.dry_run else 'PRODUCTION'}")
     print(f"   크롤링: {'SKIP' if args.skip_crawl else 'ON'}")
+    print(f"   동시 실행 단계: 최대 {args.workers}개")
+    print(f"   재개: {'ON' if args.resume else 'OFF'}")
     print("=" * 60)
 
-    crawl_ok = True
-    ranking_ok = False
-    reconstruct_ok = False
-
-    # ─────────────────────────────────────────────
-    # Step 1: Crawling + Ranking + Trend Matching
-    # ─────────────────────────────────────────────
-    log("📌", "Step 1: 크롤링 + 랭킹 + 트렌드 매칭")
-
-    batch_cmd = [
-        sys.executable,
-        str(PIPELINE_DIR / "ranking_integrated" / "run_batch.py"),
-        "--start", start_dt.strftime("%Y-%m-%d %H:%M"),
-        "--end", end_dt.strftime("%Y-%m-%d %H:%M"),
-    ]
-    if args.skip_crawl:
-        batch_cmd.append("--skip-crawl")
-
-    crawl_ok = run_step(
-        cmd=batch_cmd,
-        cwd=PIPELINE_DIR / "ranking_integrated",
-        timeout=600,
-        label="크롤링 + 랭킹",
-    )
-
-    # Check if daily_brief file was generated
-    # run_batch.py uses start_dt (UTC) for filename, so check both UTC start and KST dates
-    start_compact = start_dt.strftime("%Y%m%d")
-    start_kst_compact = start_kst.strftime("%Y%m%d")
-    brief_path = PIPELINE_DIR / f"daily_brief_{start_compact}.json"
-    if not brief_path.exists():
-        brief_path = PIPELINE_DIR / f"daily_brief_{date_compact}.json"
-    # Also check in ranking_integrated directory
-    alt_brief_path = PIPELINE_DIR / "ranking_integrated" / f"daily_brief_{start_compact}.json"
-    if not alt_brief_path.exists():
-        alt_brief_path = PIPELINE_DIR / "ranking_integrated" / f"daily_brief_{date_compact}.json"
-
-    if not brief_path.exists() and alt_brief_path.exists():
-        brief_path = alt_brief_path
-
-    if not brief_path.exists():
-        if crawl_ok:
-            log("⚠️", f"daily_brief_{date_compact}.json 파일이 생성되지 않았습니다.")
-        else:
-            log("⚠️", "크롤링 실패. 기존 daily_brief 파일을 찾습니다...")
-
-        # Try to find any existing daily_brief file
-        existing = sorted(PIPELINE_DIR.glob("daily_brief_*.json"), reverse=True)
-        if not existing:
-            existing = sorted((PIPELINE_DIR / "ranking_integrated").glob("daily_brief_*.json"), reverse=True)
-
-        if existing:
-            brief_path = existing[0]
-            log("📂", f"기존 파일 사용: {brief_path.name}")
-        else:
-            log("❌", "사용 가능한 daily_brief 파일이 없습니다. 파이프라인 중단.")
-            sys.exit(1)
-    else:
-        log("📂", f"입력 파일: {brief_path.name}")
+    _load_env()
+    if str(PIPELINE_DIR) not in sys.path:
+        sys.path.insert(0, str(PIPELINE_DIR))
 
-    # ─────────────────────────────────────────────
-    # Step 1.5: Play Store 리뷰 수집 + 분석
-    # ─────────────────────────────────────────────
-    print()
-    log("📌", "Step 1.5: Play Store 리뷰 수집 + 분석")
-    review_ok = run_step(
-        cmd=[
-            sys.executable,
-            str(PIPELINE_DIR / "review_collection" / "run_reviews.py"),
-            "--date", date_str,
-            "--max-reviews", "50",
-        ],
-        cwd=PIPELINE_DIR,
-        timeout=300,
-        label="리뷰 수집+분석",
-    )
-    if not review_ok:
-        log("⚠️", "리뷰 수집 실패 (뉴스 브리핑은 정상 진행)")
+    manifest = RunManifest(date_str, reset=not args.resume)
+    artifacts = {}
+    graph = build_daily_graph(args, target_date, start_dt, end_dt, manifest, artifacts)
 
-    # ─────────────────────────────────────────────
-    # Step 2: AI Reconstruction + Thumbnail + DB
-    # ─────────────────────────────────────────────
-    print()
-    log("📌", "Step 2: AI 재구성 + 썸네일 + DB 적재")
+    restored = {}
+    if args.resume:
+        log("📋", f"실행 매니페스트: {manifest.path} — {manifest.summary()}")
+        restored = _restore_completed(graph, manifest)
 
-    reconstruct_cmd = [
-        sys.executable,
-        str(PIPELINE_DIR / "reconstruction" / "reconstruct.py"),
-        "--input", str(brief_path),
-    ]
-    if args.dry_run:
-        reconstruct_cmd.append("--dry-run")
+    def record(result: StageResult):
+        # 뉴스레터 미생성(False)은 다음 재개 시 다시 시도하도록 실패로 기록
+        status = "failed" if result.ok and result.value is False else result.status
+        manifest.record(result.name, status, artifact=artifacts.get(result.name),
+                        error=result.error, elapsed=result.elapsed)
 
-    # Also save output JSON for artifact upload
-    output_json = PIPELINE_DIR / f"reconstructed_{date_compact}.json"
-    reconstruct_cmd.extend(["--output", str(output_json)])
+    results = graph.run(restored=restored, on_result=record)
 
-    reconstruct_ok = run_step(
-        cmd=reconstruct_cmd,
-        cwd=PIPELINE_DIR / "reconstruction",
-        timeout=900,
-        label="AI 재구성",
-    )
+    crawl_ok = results["rank"].ok
+    reconstruct_ok = results["reconstruct"].ok
+    newsletter_ok = results["newsletter"].ok and bool(results["newsletter"].value)
 
-    # ─────────────────────────────────────────────
-    # Step 3: Daily Newsletter (일간 뉴스레터)
-    # ─────────────────────────────────────────────
-    newsletter_ok = False
-    if reconstruct_ok:
-        print()
-        log("📌", "Step 3: 일간 뉴스레터 생성")
-        try:
-            sys.path.insert(0, str(PIPELINE_DIR / "content_generator"))
-            from daily_generator import DailyBriefingGenerator
-
-            generator = DailyBriefingGenerator(pipeline_dir=PIPELINE_DIR)
-            nl_date = target_date.replace(tzinfo=None)
-            data = generator.collect_daily_data(nl_date)
-
-            if data["reconstructed_articles"]:
-                analysis = generator.analyze_daily(data)
-                log("✅", f"일간 분석: {analysis['total_articles']}건")
-
-                report = generator.generate_report(data, analysis)
-                if report:
-                    import json as _json
-                    nl_output = PIPELINE_DIR / f"daily_newsletter_{date_compact}.json"
-                    with open(nl_output, "w", encoding="utf-8") as f:
-                        _json.dump(report, f, ensure_ascii=False, indent=2)
-                    log("✅", f"일간 뉴스레터 저장: {nl_output.name}")
-
-                    # 커버 이미지 생성
-                    _generate_cover_image(report, "daily", date_compact)
-                    # 커버 이미지 포함하여 JSON 재저장
-                    if report.get("cover_image_url"):
-                        with open(nl_output, "w", encoding="utf-8") as f:
-                            _json.dump(report, f, ensure_ascii=False, indent=2)
-
-                    # DB 적재
-                    if not args.dry_run:
-                        try:
-                            from briefing_db_loader import load_daily_to_db
-                            load_daily_to_db(report, data["date_label"])
-                        except Exception as e:
-                            log("⚠️", f"뉴스레터 DB 적재 실패 (JSON은 저장됨): {e}")
-
-                    newsletter_ok = True
-                else:
-                    log("⚠️", "일간 뉴스레터 생성 실패 (폴백도 실패)")
-            else:
-                log("⚠️", "재구성 기사 0건 → 뉴스레터 생성 스킵")
-        except Exception as e:
-            log("⚠️", f"일간 뉴스레터 생성 오류: {e}")
-    else:
-        log("⚠️", "재구성 실패 → 뉴스레터 생성 스킵")
+    if not results["reviews"].ok:
+        log("⚠️", "리뷰 수집 실패 (뉴스 브리핑은 정상 진행)")
 
     # ─────────────────────────────────────────────
     # Summary
     # ─────────────────────────────────────────────
     print()
     print("=" * 60)
+    for name, result in results.items():
+        detail = f" — {result.error}" if result.error else ""
+        log("  ", f"{name:<14} {result.status:<8} {result.elapsed:6.1f}초{detail}")
+    log("📋", f"실행 매니페스트: {manifest.path}")
     if reconstruct_ok and crawl_ok:
         if newsletter_ok:
             log("🎉", "파이프라인 완료 (모든 단계 성공)")
@@ -470,5 +527,42 @@ def main():
         sys.exit(1)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="IT 도깨비 - Pipeline Runner")
+    parser.add_argument("--mode", type=str, default="daily",
+                        choices=["daily", "weekly", "monthly"],
+                        help="실행 모드: daily(기본), weekly, monthly")
+    parser.add_argument("--skip-crawl", action="store_true", help="크롤링 건너뛰기 (daily 모드)")
+    parser.add_argument("--dry-run", action="store_true", help="DB 적재 없이 실행")
+    parser.add_argument("--date", type=str, default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘 KST)")
+    parser.add_argument("--output", type=str, default=None, help="출력 파일 경로 (weekly/monthly 모드)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 최대 단계 수 (daily 모드, 기본: 4)")
+    parser.add_argument("--naver-workers", type=int, default=2,
+                        help="네이버 뉴스 섹션 동시 수집 수 (daily 모드, 기본: 2, CHROME_POOL_SIZE 이하)")
+    parser.add_argument("--resume", action="store_true",
+                        help="같은 날짜의 실행 매니페스트를 이어서 완료된 단계 건너뛰기 (daily 모드)")
+    args = parser.parse_args()
+
+    # 기준 날짜 결정 (KST)
+    if args.date:
+        try:
+            target_date = datetime.strptime(args.date, "%Y-%m-%d").replace(tzinfo=KST)
+        except ValueError:
+            print("❌ --date 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요.")
+            sys.exit(1)
+    else:
+        target_date = datetime.now(KST)
+
+    # 주간/월간 모드 분기
+    if args.mode == "weekly":
+        run_weekly(args, target_date)
+        return
+    elif args.mode == "monthly":
+        run_monthly(args, target_date)
+        return
+
+    run_daily(args, target_date)
+
+
 if __name__ == "__main__":
     main()
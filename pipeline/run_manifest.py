@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+IT 도깨비 - 일간 실행 매니페스트 (체크포인트/재개)
+
+기준 날짜별로 runs/<YYYY-MM-DD>/manifest.json에 완료된 단계와 산출물 경로를 기록한다.
+run_daily.py --resume 시 완료 단계는 산출물만 다시 읽어 건너뛰고,
+AI 재구성 단계는 같은 디렉토리의 clusters.json(클러스터별 결과)을 이어서 사용한다.
+
+manifest.json 구조:
+    {
+      "run_date": "2026-03-10",
+      "created_at": "...",
+      "updated_at": "...",
+      "stages": {
+        "rank": {"status": "success", "artifact": ".../daily_brief_20260309.json",
+                 "elapsed_seconds": 12.3, "finished_at": "..."},
+        "reconstruct": {"status": "timeout", "error": "900초 초과", ...}
+      }
+    }
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+RUNS_DIR = Path(__file__).resolve().parent / "runs"
+
+
+def write_json_atomic(path: Path, data):
+    """임시 파일에 쓴 뒤 교체 — 프로세스가 중간에 죽어도 이전 내용이 보존된다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class RunManifest:
+    """기준 날짜별 단계 완료 기록 (스레드 안전)"""
+
+    def __init__(self, run_date: str, runs_dir: Path = None, reset: bool = False):
+        """
+        Args:
+            run_date: 기준 날짜 (YYYY-MM-DD)
+            runs_dir: 매니페스트 루트 디렉토리 (기본: pipeline/runs)
+            reset: True면 기존 기록과 클러스터 체크포인트를 버리고 새로 시작
+        """
+        self.run_date = run_date
+        self.run_dir = Path(runs_dir or RUNS_DIR) / run_date
+        self.path = self.run_dir / "manifest.json"
+        self._lock = threading.Lock()
+
+        if reset:
+            for stale in (self.path, self.cluster_checkpoint_path):
+                if stale.exists():
+                    stale.unlink()
+
+        self.data = self._load()
+
+    @property
+    def cluster_checkpoint_path(self) -> Path:
+        """AIRewriter 클러스터별 결과 체크포인트 경로"""
+        return self.run_dir / "clusters.json"
+
+    def _load(self) -> dict:
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        now = datetime.now().isoformat()
+        return {"run_date": self.run_date, "created_at": now, "updated_at": now, "stages": {}}
+
+    def _save(self):
+        self.data["updated_at"] = datetime.now().isoformat()
+        write_json_atomic(self.path, self.data)
+
+    def is_completed(self, stage: str) -> bool:
+        """단계가 성공으로 기록되어 있고 산출물이 남아 있는지 확인"""
+        entry = self.data["stages"].get(stage)
+        if not entry or entry.get("status") != "success":
+            return False
+        artifact = entry.get("artifact")
+        return artifact is None or Path(artifact).exists()
+
+    def artifact(self, stage: str) -> Optional[str]:
+        return self.data["stages"].get(stage, {}).get("artifact")
+
+    def record(self, stage: str, status: str, artifact: str = None, error: str = "", elapsed: float = 0.0):
+        """단계 결과를 기록하고 즉시 디스크에 반영"""
+        with self._lock:
+            self.data["stages"][stage] = {
+                "status": status,
+                "artifact": artifact,
+                "error": error,
+                "elapsed_seconds": round(elapsed, 1),
+                "finished_at": datetime.now().isoformat(),
+            }
+            self._save()
+
+    def summary(self) -> str:
+        stages = self.data["stages"]
+        done = [name for name in stages if self.is_completed(name)]
+        return f"{len(done)}/{len(stages)}개 단계 완료 ({', '.join(done) or '없음'})"
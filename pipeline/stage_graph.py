@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+IT 도깨비 - 스테이지 그래프 실행기
+
+run_daily.py의 단계(크롤링, 랭킹, 리뷰, 재구성, 뉴스레터)를 의존성 그래프로 선언하고 실행한다.
+- 의존성이 없는 단계는 동시에 실행 (예: 리뷰 수집 ∥ 크롤링/랭킹)
+- 단계 결과는 메모리로 후속 단계에 전달 (JSON 재적재 없음)
+- 단계별 타임아웃 (초과 시 실패 처리 후 나머지 그래프 진행)
+- isolate=True 단계는 fork한 자식 프로세스에서 실행해 타임아웃 시 강제 종료한다
+  (스레드 단계는 멈출 수 없어 초과 후에도 LLM 호출/파일 쓰기를 계속할 수 있음)
+
+사용 예:
+    graph = StageGraph(max_workers=4, log=log)
+    graph.add_stage("crawl", crawl_fn, timeout=600, isolate=True)
+    graph.add_stage("rank", rank_fn, deps=["crawl"], timeout=120)
+    results = graph.run()
+    results["rank"].ok, results["rank"].value
+"""
+
+import multiprocessing
+import queue
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _default_log(icon: str, msg: str):
+    print(f"{icon} {msg}")
+
+
+def _exit_on_sigterm(signum, frame):
+    # 타임아웃 종료(terminate)도 예외로 바꿔 자식의 정리 코드(finally)가 돌게 한다
+    raise SystemExit(128 + signum)
+
+
+def _release_child_resources():
+    """
+    자식 프로세스가 띄운 공용 자원을 정리한다.
+    multiprocessing 자식은 os._exit로 끝나 atexit 정리가 돌지 않으므로 직접 호출해야
+    단계가 띄운 Chrome/chromedriver가 남지 않는다. (단계가 풀을 쓰지 않았으면 아무것도 안 함)
+    """
+    driver_pool = sys.modules.get("crawling_sites.utils.driver_pool")
+    if driver_pool is not None:
+        try:
+            driver_pool.shutdown_shared_pool()
+        except Exception as e:
+            print(f"⚠️ WebDriver 풀 정리 실패: {e}")
+
+
+@dataclass
+class Stage:
+    """그래프의 단일 단계 정의"""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]  # 선행 단계 결과 {이름: 값}을 받아 결과를 반환
+    deps: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None  # 초 (None이면 무제한)
+    soft_deps: bool = False  # True면 선행 단계가 실패해도 실행 (실패한 입력은 None)
+    isolate: bool = False  # True면 자식 프로세스에서 실행 (타임아웃 시 종료, 결과는 pickle 가능해야 함)
+
+
+@dataclass
+class StageResult:
+    """단계 실행 결과"""
+    name: str
+    status: str  # success | resumed | failed | timeout | skipped
+    value: Any = None
+    error: str = ""
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("success", "resumed")
+
+
+class StageGraph:
+    """의존성 기반 단계 실행기 (스레드 또는 자식 프로세스)"""
+
+    def __init__(self, max_workers: int = 4, log: Callable[[str, str], None] = None):
+        self.max_workers = max(1, max_workers)
+        self.log = log or _default_log
+        self.stages: Dict[str, Stage] = {}
+
+    def add_stage(self, name: str, func: Callable[[Dict[str, Any]], Any], deps: List[str] = None,
+                  timeout: float = None, soft_deps: bool = False, isolate: bool = False) -> Stage:
+        """단계를 등록한다. 등록 순서가 동시 시작 시의 우선순위가 된다."""
+        if name in self.stages:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        stage = Stage(name=name, func=func, deps=list(deps or []), timeout=timeout,
+                      soft_deps=soft_deps, isolate=isolate)
+        self.stages[name] = stage
+        return stage
+
+    def _validate(self):
+        """미등록 의존성과 순환 의존성을 검사한다."""
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise ValueError(f"[{stage.name}] 등록되지 않은 의존 단계: {dep}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성 발견: {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def run(self, restored: Dict[str, Any] = None,
+            on_result: Callable[[StageResult], None] = None) -> Dict[str, StageResult]:
+        """
+        그래프 전체를 실행하고 단계별 결과를 반환한다.
+
+        타임아웃된 isolate 단계는 자식 프로세스를 종료(SIGTERM → SIGKILL)한다.
+        스레드 단계는 강제 종료할 수 없으므로 데몬 스레드로 버려두고, 이후 도착하는 결과는 무시한다.
+
+        Args:
+            restored: 이전 실행에서 완료된 단계 {이름: 복원된 값} — 실행하지 않고 결과로 사용
+            on_result: 실행된 단계가 끝날 때마다 호출 (체크포인트 기록용)
+        """
+        self._validate()
+
+        results: Dict[str, StageResult] = {}
+        for name, value in (restored or {}).items():
+            if name in self.stages:
+                results[name] = StageResult(name, "resumed", value)
+                self.log("♻️", f"[{name}] 이전 실행 결과 재사용")
+        pending = [name for name in self.stages if name not in results]  # 등록 순서 유지
+        running: Dict[str, float] = {}  # 이름 → 시작 시각
+        processes: Dict[str, multiprocessing.Process] = {}  # isolate 단계 이름 → 자식 프로세스
+        done_queue: "queue.Queue[tuple]" = queue.Queue()
+
+        def worker(stage: Stage, inputs: Dict[str, Any]):
+            started = time.time()
+            try:
+                value = stage.func(inputs)
+                done_queue.put((stage.name, "success", value, "", time.time() - started))
+            except BaseException as e:  # SystemExit 포함 — 스레드에서 조용히 사라지지 않도록
+                done_queue.put((stage.name, "failed", None, f"{type(e).__name__}: {e}", time.time() - started))
+
+        def child(stage: Stage, inputs: Dict[str, Any], conn):
+            started = time.time()
+            signal.signal(signal.SIGTERM, _exit_on_sigterm)
+            try:
+                value = stage.func(inputs)
+                message = (stage.name, "success", value, "", time.time() - started)
+            except BaseException as e:
+                message = (stage.name, "failed", None, f"{type(e).__name__}: {e}", time.time() - started)
+            finally:
+                _release_child_resources()
+            try:
+                conn.send(message)
+            except Exception as e:  # 결과를 pickle할 수 없는 경우
+                conn.send((stage.name, "failed", None, f"결과 전달 실패: {type(e).__name__}: {e}",
+                           time.time() - started))
+            finally:
+                conn.close()
+
+        def relay(name: str, process: multiprocessing.Process, conn):
+            # 자식 결과를 완료 큐로 옮긴다 (결과 없이 끝나면 종료 코드로 실패 처리)
+            started = time.time()
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                process.join()
+                message = (name, "failed", None, f"자식 프로세스 비정상 종료 (exit {process.exitcode})",
+                           time.time() - started)
+            finally:
+                conn.close()
+            done_queue.put(message)
+
+        def start_process(stage: Stage, inputs: Dict[str, Any]):
+            ctx = multiprocessing.get_context("fork")
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            # fork 전에 버퍼를 비워야 부모의 미출력 로그가 자식에서 한 번 더 찍히지 않는다
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # 데몬 프로세스: 부모가 중단되면 함께 종료 (단계 안에서 multiprocessing 자식은 만들 수 없음)
+            process = ctx.Process(target=child, args=(stage, inputs, send_conn),
+                                  name=f"stage-{stage.name}", daemon=True)
+            process.start()
+            send_conn.close()  # 부모 쪽 송신 끝을 닫아야 자식이 죽으면 recv가 EOFError로 끝난다
+            processes[stage.name] = process
+            threading.Thread(target=relay, args=(stage.name, process, recv_conn),
+                             name=f"relay-{stage.name}", daemon=True).start()
+
+        def kill(name: str):
+            process = processes.pop(name, None)
+            if process is None or not process.is_alive():
+                return
+            process.terminate()
+            process.join(5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+        while pending or running:
+            # 1. 실행 가능한 단계 시작
+            for name in list(pending):
+                stage = self.stages[name]
+                if any(dep not in results for dep in stage.deps):
+                    continue
+
+                failed_deps = [dep for dep in stage.deps if not results[dep].ok]
+                if failed_deps and not stage.soft_deps:
+                    pending.remove(name)
+                    results[name] = StageResult(name, "skipped", error=f"선행 단계 실패: {', '.join(failed_deps)}")
+                    self.log("⏭️", f"[{name}] 건너뜀 (선행 단계 실패: {', '.join(failed_deps)})")
+                    continue
+
+                if len(running) >= self.max_workers:
+                    continue
+
+                pending.remove(name)
+                inputs = {dep: results[dep].value for dep in stage.deps}
+                running[name] = time.time()
+                self.log("▶️", f"[{name}] 시작" + (f" (타임아웃 {int(stage.timeout)}초)" if stage.timeout else ""))
+                if stage.isolate:
+                    start_process(stage, inputs)
+                else:
+                    threading.Thread(target=worker, args=(stage, inputs), name=f"stage-{name}", daemon=True).start()
+
+            if not running:
+                continue
+
+            # 2. 가장 먼저 만료되는 타임아웃까지 완료 이벤트 대기
+            now = time.time()
+            deadlines = [
+                running[n] + self.stages[n].timeout
+                for n in running if self.stages[n].timeout is not None
+            ]
+            wait = max(0.0, min(deadlines) - now) if deadlines else None
+
+            try:
+                name, status, value, error, elapsed = done_queue.get(timeout=wait)
+                if name in running:
+                    del running[name]
+                    if name in processes:
+                        processes.pop(name).join()
+                    results[name] = StageResult(name, status, value, error, elapsed)
+                    if status == "success":
+                        self.log("✅", f"[{name}] 완료 ({elapsed:.1f}초)")
+                    else:
+                        self.log("❌", f"[{name}] 실패 ({elapsed:.1f}초): {error}")
+                    if on_result:
+                        on_result(results[name])
+            except queue.Empty:
+                pass
+
+            # 3. 타임아웃 처리
+            now = time.time()
+            for name in list(running):
+                timeout = self.stages[name].timeout
+                if timeout is not None and now - running[name] >= timeout:
+                    del running[name]
+                    killed = name in processes
+                    kill(name)
+                    results[name] = StageResult(name, "timeout", error=f"{int(timeout)}초 초과", elapsed=timeout)
+                    self.log("⏰", f"[{name}] 타임아웃 ({int(timeout)}초)" + (" — 프로세스 종료" if killed else ""))
+                    if on_result:
+                        on_result(results[name])
+
+        return results
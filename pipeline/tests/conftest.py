@@ -0,0 +1,12 @@
+"""
+pipeline 테스트 공용 설정
+모듈들이 스크립트처럼 실행되므로(reconstruction/ranking_integrated는 평면 import)
+실행 시와 같은 경로를 sys.path에 넣는다.
+"""
+import sys
+from pathlib import Path
+
+PIPELINE_DIR = Path(__file__).resolve().parent.parent
+for _path in (PIPELINE_DIR, PIPELINE_DIR / "reconstruction", PIPELINE_DIR / "ranking_integrated"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
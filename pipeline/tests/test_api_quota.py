@@ -0,0 +1,152 @@
+"""crawling_youtube.api_quota 검색 캐시/쿼터 집계 + YouTubeCrawler 묶음 조회"""
+import pytest
+
+from crawling_youtube import api_quota
+from crawling_youtube.api_quota import ApiCache, QuotaTracker
+from crawling_youtube.youtube_crawler_api import YouTubeCrawler
+
+PARAMS = {"q": "갤럭시", "max_results": 10, "published_after_hours": 48}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = ApiCache(str(tmp_path / "youtube_api.sqlite"))
+    yield store
+    store.close()
+
+
+def test_search_cache_hit_respects_ttl(cache, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(api_quota.time, "time", lambda: now[0])
+    cache.put_search(PARAMS, ["a", "b"])
+
+    assert cache.get_search(dict(reversed(PARAMS.items())), ttl_hours=12) == ["a", "b"]
+    assert cache.get_search({**PARAMS, "q": "아이폰"}, ttl_hours=12) is None
+    now[0] += 13 * 3600
+    assert cache.get_search(PARAMS, ttl_hours=12) is None
+    assert cache.stats == {"hit": 1, "miss": 2}
+
+    assert cache.prune(max_age_hours=12) == 1
+    assert cache.get_search(PARAMS, ttl_hours=100) is None
+
+
+def test_quota_tracker_stops_search_at_daily_limit(cache, monkeypatch):
+    monkeypatch.setattr(api_quota, "_quota_day", lambda: "2026-03-10")
+    cache.add_usage("2026-03-10", 9850)
+    quota = QuotaTracker(daily_limit=10000, store=cache)
+
+    assert quota.can_spend("search.list")
+    quota.charge("search.list")
+    quota.charge("videos.list", 3)
+    assert not quota.can_spend("search.list")
+    assert quota.can_spend("videos.list")
+
+    snapshot = quota.snapshot()
+    assert snapshot["used"] == 103 and snapshot["today_used"] == 9953
+    assert snapshot["calls"] == {"search.list": 1, "videos.list": 3} and snapshot["skipped"] == 1
+    # 다른 날 사용량은 섞이지 않는다
+    assert cache.day_usage("2026-03-09") == 0
+
+
+def test_quota_tracker_without_store_counts_this_run_only():
+    quota = QuotaTracker(daily_limit=150)
+    assert quota.can_spend("search.list")
+    quota.charge("search.list")
+    assert not quota.can_spend("search.list")
+    assert "한도 초과로 건너뜀 1회" in quota.summary()
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeYouTube:
+    """search().list / videos().list 호출을 기록하는 가짜 Data API 클라이언트"""
+
+    def __init__(self, search_ids=(), fail_videos=False):
+        self.search_ids = list(search_ids)
+        self.fail_videos = fail_videos
+        self.search_calls = []
+        self.video_calls = []
+
+    def search(self):
+        return self
+
+    def videos(self):
+        return self
+
+    def list(self, **kwargs):
+        if "q" in kwargs:
+            self.search_calls.append(kwargs["q"])
+            return FakeRequest({"items": [{"id": {"videoId": vid}} for vid in self.search_ids]})
+        ids = kwargs["id"].split(",")
+        self.video_calls.append(ids)
+        if self.fail_videos:
+            return FakeRequest(RuntimeError("quotaExceeded"))
+        return FakeRequest({"items": [_video_item(vid) for vid in ids if vid != "deleted"]})
+
+
+def _video_item(video_id):
+    return {
+        "id": video_id,
+        "snippet": {"title": f"영상 {video_id}", "description": "", "channelTitle": "채널",
+                    "channelId": "c1", "publishedAt": "2026-03-10T00:00:00Z"},
+        "contentDetails": {"duration": "PT10M"},
+        "statistics": {"viewCount": "10"},
+    }
+
+
+def make_crawler(youtube, cache=None, quota=None):
+    # 실제 생성자는 googleapiclient로 클라이언트를 만들므로 필요한 속성만 채운다
+    crawler = YouTubeCrawler.__new__(YouTubeCrawler)
+    crawler.youtube = youtube
+    crawler.transcript_api = None
+    crawler.cache = cache
+    crawler.quota = quota or QuotaTracker()
+    crawler.search_cache_ttl_hours = 12
+    crawler.transcripts = None
+    return crawler
+
+
+def test_video_details_are_fetched_in_batches_of_50():
+    youtube = FakeYouTube()
+    crawler = make_crawler(youtube)
+    ids = [f"v{n}" for n in range(120)] + ["v0", "deleted"]
+
+    details = crawler.get_video_details(ids)
+
+    assert [len(batch) for batch in youtube.video_calls] == [50, 50, 21]
+    assert len(details) == 120 and "deleted" not in details
+    assert crawler.quota.calls["videos.list"] == 3 and crawler.quota.used == 3
+
+
+def test_failed_video_batch_is_still_charged():
+    crawler = make_crawler(FakeYouTube(fail_videos=True))
+    assert crawler.get_video_details(["a", "b"]) == {}
+    assert crawler.quota.used == 1
+
+
+def test_repeated_search_uses_cache_instead_of_search_list(cache):
+    youtube = FakeYouTube(search_ids=["a", "b", "gone"])
+    crawler = make_crawler(youtube, cache=cache)
+
+    first = crawler.search_videos("갤럭시")
+    second = crawler.search_videos("갤럭시")
+
+    assert youtube.search_calls == ["갤럭시"]
+    assert [v["video_id"] for v in first] == [v["video_id"] for v in second] == ["a", "b", "gone"]
+    assert crawler.quota.calls == {"search.list": 1, "videos.list": 2}
+
+
+def test_search_is_skipped_when_quota_is_exhausted():
+    youtube = FakeYouTube(search_ids=["a"])
+    crawler = make_crawler(youtube, quota=QuotaTracker(daily_limit=99))
+
+    assert crawler.search_video_ids("갤럭시") == []
+    assert youtube.search_calls == [] and crawler.quota.skipped == 1
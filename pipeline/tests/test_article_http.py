@@ -0,0 +1,75 @@
+"""crawling_naver_news.article_http 본문/카운터 HTTP 수집 (가짜 세션)"""
+import json
+
+import requests
+
+from crawling_naver_news.article_http import (
+    COMMENT_API_URL, LIKE_API_URL, extract_article_body, fetch_article_http, fetch_articles_http,
+    parse_article_ids,
+)
+
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/001/0012345678?sid=105"
+ARTICLE_HTML = """<html><body><div id="dic_area">첫 줄<br>둘째 줄
+<script>var x = 1;</script><style>.a{}</style>  셋째 줄  </div></body></html>"""
+
+
+class FakeResponse:
+    def __init__(self, text="", status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, routes):
+        self.routes = routes
+        self.requested = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requested.append((url, headers))
+        response = self.routes.get(url)
+        return response if response is not None else FakeResponse(status_code=404)
+
+
+def _routes(comment_success=True):
+    like = {"contents": [{"reactions": [{"count": 3}, {"count": "4"}]}]}
+    comment = {"success": comment_success, "result": {"count": {"comment": 12}}}
+    return {
+        ARTICLE_URL: FakeResponse(ARTICLE_HTML),
+        LIKE_API_URL: FakeResponse(f"callback({json.dumps(like)});"),
+        COMMENT_API_URL: FakeResponse(f"_callback({json.dumps(comment)})"),
+    }
+
+
+def test_parse_article_ids():
+    assert parse_article_ids(ARTICLE_URL) == ("001", "0012345678")
+    assert parse_article_ids("https://n.news.naver.com/article/comment/015/0000001") == ("015", "0000001")
+    assert parse_article_ids("https://example.com/") is None
+
+
+def test_extract_article_body_keeps_line_breaks_and_drops_scripts():
+    assert extract_article_body(ARTICLE_HTML) == "첫 줄\n둘째 줄\n셋째 줄"
+    assert extract_article_body("<html><body><p>no body</p></body></html>") == ""
+
+
+def test_fetch_article_http_collects_body_and_counters_with_referer():
+    session = FakeSession(_routes())
+    result = fetch_article_http(session, ARTICLE_URL)
+
+    assert result == {"content": "첫 줄\n둘째 줄\n셋째 줄", "comment_count": 12, "reaction_count": 7}
+    assert all(headers == {"Referer": ARTICLE_URL} for url, headers in session.requested if url != ARTICLE_URL)
+
+
+def test_missing_counter_falls_back_to_selenium():
+    assert fetch_article_http(FakeSession(_routes(comment_success=False)), ARTICLE_URL) is None
+    assert fetch_article_http(FakeSession({}), ARTICLE_URL) is None
+
+
+def test_fetch_articles_http_maps_each_url():
+    session = FakeSession(_routes())
+    results = fetch_articles_http(session, [ARTICLE_URL, "https://example.com/not-naver"], max_workers=2)
+    assert results["https://example.com/not-naver"] is None
+    assert results[ARTICLE_URL]["reaction_count"] == 7
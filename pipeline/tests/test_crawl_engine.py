@@ -0,0 +1,114 @@
+"""crawling_sites.engine.AsyncCrawlEngine 연결 슬롯 / 도메인 요청 간격"""
+import threading
+import time
+
+import pytest
+
+from crawling_sites import engine as engine_module
+from crawling_sites.engine import AsyncCrawlEngine, SiteResult
+from crawling_sites.utils.rate_limiter import AsyncDomainRateLimiter
+
+
+class FakeCrawler:
+    """요청 시작 시각을 기록하는 가짜 전략 (list_pages개 목록 페이지 + details개 상세 페이지)"""
+
+    def __init__(self, cfg, rate_limiter, log):
+        self.cfg = cfg
+        self.rate_limiter = rate_limiter
+        self.log = log
+        self.latencies = []
+
+    def _get_domain(self):
+        return self.cfg["domain"]
+
+    def _request(self, what):
+        self.log.append((self.cfg["key"], what, time.monotonic()))
+        time.sleep(self.cfg.get("request_seconds", 0.01))
+
+    def list_pages(self):
+        for page in range(self.cfg.get("list_pages", 1)):
+            if page:
+                yield  # 다음 페이지 전 요청 간격 대기 지점
+            self._request(f"list{page}")
+        return [{"n": i} for i in range(self.cfg.get("details", 0))]
+
+    def articles_needing_content(self, articles):
+        return articles
+
+    def fill_article_content(self, article, i, total):
+        self._request(f"detail{i}")
+
+    def finalize(self, articles):
+        return articles
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def request_log(monkeypatch):
+    log = []
+    monkeypatch.setattr(
+        engine_module, "create_crawler",
+        lambda cfg, rate_limiter, http_cache=None, seen_index=None: FakeCrawler(cfg, rate_limiter, log),
+    )
+    return log
+
+
+def _starts(log, key):
+    return [started for site, _, started in log if site == key]
+
+
+def test_same_domain_spacing_survives_queueing_on_connection_slots(request_log):
+    limiter = AsyncDomainRateLimiter(default_delay=0.2)
+    engine = AsyncCrawlEngine(limiter, max_connections=1)
+    sites = {
+        # 다른 도메인의 느린 요청이 유일한 연결 슬롯을 오래 잡고 있는 동안 예약 시간이 지나가도
+        "fast": {"key": "fast", "domain": "a.example", "details": 3, "detail_concurrency": 3},
+        "slow": {"key": "slow", "domain": "b.example", "request_seconds": 0.6},
+    }
+
+    results = engine.run(sites)
+
+    assert all(isinstance(r, SiteResult) and r.status == "success" for r in results.values())
+    starts = _starts(request_log, "fast")
+    assert len(starts) == 4
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.18, gaps
+
+
+def test_pagination_wait_releases_connection_slot(request_log):
+    limiter = AsyncDomainRateLimiter(default_delay=0.3)
+    engine = AsyncCrawlEngine(limiter, max_connections=1)
+    sites = {
+        "paged": {"key": "paged", "domain": "a.example", "list_pages": 2},
+        "other": {"key": "other", "domain": "b.example"},
+    }
+
+    engine.run(sites)
+
+    paged = _starts(request_log, "paged")
+    other = _starts(request_log, "other")
+    # 페이지 사이 0.3초 대기 동안 다른 사이트가 슬롯을 쓸 수 있어야 한다
+    assert paged[0] < other[0] < paged[1]
+    assert paged[1] - paged[0] >= 0.28
+
+
+@pytest.mark.parametrize("max_connections", [1, 2, 8])
+def test_more_paginating_sites_than_connections_do_not_deadlock(request_log, max_connections):
+    limiter = AsyncDomainRateLimiter(default_delay=0.05)
+    engine = AsyncCrawlEngine(limiter, max_connections=max_connections, selenium_workers=1)
+    sites = {
+        f"site{n}": {"key": f"site{n}", "domain": f"{n}.example", "list_pages": 3, "details": 1,
+                     "request_seconds": 0.005}
+        for n in range(3 * max_connections + 3)
+    }
+    results = {}
+    runner = threading.Thread(target=lambda: results.update(engine.run(sites)), daemon=True)
+
+    runner.start()
+    runner.join(20)
+
+    assert not runner.is_alive(), "페이지네이션 대기 중 크롤링이 멈췄다"
+    assert len(results) == len(sites) and all(r.status == "success" for r in results.values())
+    assert len(request_log) == len(sites) * 4
@@ -0,0 +1,79 @@
+"""benchmarks/crawl_fixtures 아카이브 저장/로드와 재생 서버 (로컬 포트만 사용)"""
+import requests
+
+from benchmarks.crawl_fixtures import FixtureArchive, ReplayServer, _percentile
+from crawling_sites.engine import create_crawler
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>First post</title><link>https://blog.example.com/posts/1</link>
+<pubDate>Tue, 10 Mar 2026 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _archive():
+    archive = FixtureArchive()
+    archive.add("https://blog.example.com/feed", 200, {"Content-Type": "application/rss+xml", "ETag": '"f1"'}, FEED)
+    archive.add("https://blog.example.com/posts/1", 200, {"Content-Type": "text/html", "X-Trace": "dropped"},
+                b"<html><body><article>Full body</article></body></html>")
+    archive.add("https://cdn.example.com/logo.png", 200, {"Content-Type": "image/png"}, b"\x89PNG")
+    return archive
+
+
+def test_archive_roundtrip_dedupes_bodies(tmp_path):
+    archive = _archive()
+    archive.add("https://blog.example.com/feed?copy", 200, {}, FEED)
+    path = tmp_path / "fixtures.zip"
+    archive.save(path, meta={"sites": ["blog"]})
+
+    loaded = FixtureArchive.load(path)
+    entry, body = loaded.get("https://blog.example.com/posts/1")
+    assert entry["headers"] == {"Content-Type": "text/html"}  # 재생에 필요한 헤더만 저장
+    assert body.startswith(b"<html>")
+    assert len(loaded.bodies) == 3
+    assert loaded.origins() == ["https://blog.example.com", "https://cdn.example.com"]
+
+
+def test_replay_server_rewrites_urls_and_honours_etag():
+    with ReplayServer(_archive()) as server:
+        feed_url = server.rewrite_url("https://blog.example.com/feed")
+        assert feed_url.startswith("http://127.0.0.1:")
+
+        resp = requests.get(feed_url, timeout=5)
+        assert resp.status_code == 200
+        assert server.rewrite_url("https://blog.example.com/posts/1").encode() in resp.content
+
+        cached = requests.get(feed_url, headers={"If-None-Match": '"f1"'}, timeout=5)
+        assert cached.status_code == 304
+        assert requests.get(server.rewrite_url("https://blog.example.com/missing"), timeout=5).status_code == 404
+    assert server.stats["not_modified"] == 1 and server.stats["misses"] == 1
+
+
+def test_replay_server_injects_errors():
+    with ReplayServer(_archive(), error_rate=1.0, error_status=503, seed=1) as server:
+        resp = requests.get(server.rewrite_url("https://blog.example.com/feed"), timeout=5)
+    assert resp.status_code == 503
+    assert server.stats["errors"] == 1
+
+
+def test_crawler_runs_offline_against_replay_server():
+    sites = {"blog": {"key": "blog", "name": "Blog", "strategy": "rss",
+                      "url": "https://blog.example.com/", "rss_url": "https://blog.example.com/feed",
+                      "selectors": {"detail_content": "article"}}}
+    with ReplayServer(_archive()) as server:
+        cfg = server.rewrite_sites(sites)["blog"]
+        crawler = create_crawler(cfg, rate_limiter=None)
+        try:
+            articles = crawler.crawl()
+        finally:
+            crawler.close()
+
+    assert sites["blog"]["rss_url"] == "https://blog.example.com/feed"  # 원본 설정은 그대로
+    assert [a["title"] for a in articles] == ["First post"]
+    assert articles[0]["content"] == "Full body"
+
+
+def test_percentile_nearest_rank():
+    assert _percentile([], 50) == 0.0
+    assert _percentile([4, 1, 3, 2], 50) == 2
+    assert _percentile([4, 1, 3, 2], 95) == 4
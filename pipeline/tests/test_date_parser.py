@@ -0,0 +1,71 @@
+"""crawling_sites.utils.date_parser 다중 포맷/상대 시간 파싱"""
+from datetime import datetime
+
+import pytest
+
+from crawling_sites.utils import date_parser
+from crawling_sites.utils.date_parser import parse_date, parse_datetime
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2026-03-02T09:00:00Z", datetime(2026, 3, 2, 9, 0)),
+    ("2026-03-02T09:00:00+09:00", datetime(2026, 3, 2, 9, 0)),
+    ("Mon, 02 Mar 2026 09:00:00 +0000", datetime(2026, 3, 2, 9, 0)),
+    ("2026.03.02", datetime(2026, 3, 2)),
+    ("2026년 3월 2일", datetime(2026, 3, 2)),
+    ("2026.03.02. 오후 3:30", datetime(2026, 3, 2, 15, 30)),
+    ("2026.03.02. 오전 12:05", datetime(2026, 3, 2, 0, 5)),
+    ("Mar 2, 2026", datetime(2026, 3, 2)),
+    ("2 March 2026", datetime(2026, 3, 2)),
+    ("2026/03/02", datetime(2026, 3, 2)),
+    ("2026-03-02 10:30", datetime(2026, 3, 2, 10, 30)),
+    ("20260302", datetime(2026, 3, 2)),
+])
+def test_absolute_formats(text, expected):
+    assert parse_datetime(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("5분 전", datetime(2026, 3, 10, 11, 55)),
+    ("3시간 전", datetime(2026, 3, 10, 9, 0)),
+    ("1일 전", datetime(2026, 3, 9, 12, 0)),
+    ("2개월 전", datetime(2026, 1, 9, 12, 0)),
+    ("방금", NOW),
+    ("2 hours ago", datetime(2026, 3, 10, 10, 0)),
+    ("1 Day Ago", datetime(2026, 3, 9, 12, 0)),
+])
+def test_relative_formats(text, expected):
+    assert parse_datetime(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("기사입력 3시간 전", datetime(2026, 3, 10, 9, 0)),
+    ("· 5분 전", datetime(2026, 3, 10, 11, 55)),
+    ("입력 2일 전 · 수정", datetime(2026, 3, 8, 12, 0)),
+    ("Updated 2 hours ago", datetime(2026, 3, 10, 10, 0)),
+    ("· 30 minutes ago", datetime(2026, 3, 10, 11, 30)),
+])
+def test_prefixed_relative_formats(text, expected):
+    assert parse_datetime(text, NOW) == expected
+
+
+def test_am_pm_marker_is_not_mistaken_for_relative():
+    # "오전"에도 "전"이 들어 있어 상대 시간 경로를 거친 뒤 절대 날짜로 파싱되어야 한다
+    assert parse_datetime("2026년 3월 2일 오전 10:30", NOW) == datetime(2026, 3, 2, 10, 30)
+
+
+def test_parse_date_fallback_uses_reference_now():
+    date_parser.set_reference_now(NOW)
+    try:
+        assert parse_date("알 수 없음") == "2026-03-10 12:00"
+        assert parse_date("알 수 없음", fallback_now=False) == "알 수 없음"
+        assert parse_date("3시간 전") == "2026-03-10 09:00"
+    finally:
+        date_parser._reference_now = None
+
+
+@pytest.mark.parametrize("text", [None, "", "   ", "전", "몇 시간 전", "2026.13.40"])
+def test_unparseable_returns_none(text):
+    assert parse_datetime(text, NOW) is None
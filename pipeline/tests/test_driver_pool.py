@@ -0,0 +1,103 @@
+"""crawling_sites.utils.driver_pool.DriverPool 임대 / 재사용 / 재생성 (가짜 드라이버)"""
+import threading
+
+import pytest
+
+from crawling_sites.utils import driver_pool as driver_pool_module
+from crawling_sites.utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+        self.quit_called = False
+        self.cdp = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def created(monkeypatch):
+    drivers = []
+
+    def fake_create(options=None, page_load_timeout=None):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(driver_pool_module, "create_chrome_driver", fake_create)
+    return drivers
+
+
+def test_released_driver_is_reused_warm(created):
+    pool = DriverPool(size=2)
+    with pool.lease(user_agent="UA") as driver:
+        driver.get("https://a.com")
+    with pool.lease(user_agent="UA") as again:
+        pass
+
+    assert again.raw is driver.raw
+    assert len(created) == 1
+    assert created[0].visited[-1] == "about:blank"
+    # 같은 User-Agent면 CDP 호출을 반복하지 않음
+    assert len(created[0].cdp) == 1
+    assert pool.metrics()["leases"] == 2
+
+
+def test_driver_is_recycled_after_max_pages_and_discarded_on_error(created):
+    pool = DriverPool(size=1, max_pages=2)
+    with pool.lease() as driver:
+        driver.get("https://a.com/1")
+        driver.get("https://a.com/2")
+    assert created[0].quit_called
+
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            raise RuntimeError("crash")
+    assert created[1].quit_called
+
+    metrics = pool.metrics()
+    assert (metrics["recycled"], metrics["discarded"], metrics["idle"]) == (1, 1, 0)
+
+
+def test_pool_bounds_concurrent_browsers(created):
+    pool = DriverPool(size=1)
+    first = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire(timeout=5)))
+    waiter.start()
+    pool.release(first)
+    waiter.join()
+
+    assert got[0].raw is first.raw
+    assert len(created) == 1
+
+
+def test_close_quits_idle_drivers(created):
+    pool = DriverPool(size=2)
+    a, b = pool.acquire(), pool.acquire()
+    pool.release(a)
+    pool.close()
+    assert created[0].quit_called
+    pool.release(b)  # 닫힌 뒤 반납된 브라우저도 종료
+    assert created[1].quit_called
+
+
+def test_close_with_leased_quits_drivers_still_on_lease(created):
+    pool = DriverPool(size=2)
+    a, b = pool.acquire(), pool.acquire()
+    pool.release(a)
+    pool.close(leased=True)
+    assert created[0].quit_called and created[1].quit_called
+
+    pool.release(b)  # 이미 종료된 브라우저를 늦게 반납해도 슬롯만 돌려받는다
+    assert pool.acquire(timeout=0.05) is not None
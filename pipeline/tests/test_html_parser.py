@@ -0,0 +1,62 @@
+"""crawling_sites.utils.html_parser 백엔드 간 같은 노드 API 결과"""
+import pytest
+
+from crawling_sites.utils.html_parser import LXML_AVAILABLE, SiteParser, html_to_text, parse_html
+
+BACKENDS = ["html.parser"] + (["lxml"] if LXML_AVAILABLE else [])
+
+LIST_PAGE = """<?xml version="1.0" encoding="utf-8"?>
+<html><body>
+<ul class="board-list">
+  <li class="item"><a href="/news/1" class="title">첫 &amp; 기사</a><span class="date">2026.03.10</span></li>
+  <li class="item"><a href="/news/2" class="title"> 둘째 <b>기사</b> </a><script>var x;</script></li>
+</ul>
+<div class="view-content">본문<style>.x{}</style> 텍스트<br/>다음 줄</div>
+</body></html>"""
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_select_get_and_text(backend):
+    root = parse_html(LIST_PAGE, backend=backend)
+    items = root.select("ul.board-list li.item")
+
+    assert len(items) == 2
+    assert [i.select_one("a.title").get("href") for i in items] == ["/news/1", "/news/2"]
+    assert items[0].select_one("a").get("class") == "title"
+    assert items[0].select_one("a.title").get_text(strip=True) == "첫 & 기사"
+    assert items[1].get_text(separator=" ", strip=True) == "둘째 기사"
+    assert items[1].select_one(".date") is None
+    assert items[1].select_one("a").get("missing", "기본") == "기본"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_decompose_keeps_following_text(backend):
+    root = parse_html(LIST_PAGE, backend=backend, target=".view-content")
+    content = root.select_one(".view-content")
+    for br in content.select("br"):
+        br.decompose()
+    assert content.get_text(separator="|", strip=True) == "본문|텍스트|다음 줄"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_content_extraction_matches_across_backends(backend):
+    html = "<article><p>첫 문단</p>둘째 문장<div class='ad'>광고</div>셋째 문장<nav>메뉴</nav></article>"
+    content = parse_html(html, backend=backend).select_one("article")
+    for tag in content.select("script, style, nav, footer, .ad"):
+        tag.decompose()
+    assert content.get_text(separator="\n", strip=True) == "첫 문단\n둘째 문장\n셋째 문장"
+    assert content.select(".ad") == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_empty_documents_and_fragments(backend):
+    assert not parse_html("", backend=backend).select_one("a")
+    assert parse_html("   ", backend=backend).select("a") == []
+    assert html_to_text("<p>A &lt;B&gt;</p> <i>C</i>", separator=" ", backend=backend) == "A <B> C"
+
+
+def test_unsupported_selector_falls_back_to_html_parser():
+    if not LXML_AVAILABLE:
+        pytest.skip("lxml 미설치")
+    assert SiteParser({"article_list": "li.item"}).backend == "lxml"
+    assert SiteParser({"article_list": "li:-soup-contains('속보')"}).backend == "html.parser"
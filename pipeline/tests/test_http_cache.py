@@ -0,0 +1,118 @@
+"""crawling_sites.utils.http_cache.HTTPCache 조건부 요청 / 정리 + RSS 날짜 대체 시점"""
+import time
+from datetime import datetime
+
+import pytest
+
+from crawling_sites.strategies import rss_strategy
+from crawling_sites.strategies.rss_strategy import RSSCrawler
+from crawling_sites.utils.http_cache import HTTPCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self.apparent_encoding = "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """응답을 차례로 돌려주고 요청 헤더를 기록"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HTTPCache(str(tmp_path / "http_cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_not_modified_reuses_parsed_result_without_parsing(cache):
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return {"len": len(text)}
+
+    session = FakeSession(
+        FakeResponse(200, b"hello", {"ETag": '"v1"'}),
+        FakeResponse(304),
+    )
+    assert cache.fetch(session, "https://a/list", parse) == {"len": 5}
+    assert cache.fetch(session, "https://a/list", parse) == {"len": 5}
+
+    assert calls == ["hello"]
+    assert session.sent_headers[1] == {"If-None-Match": '"v1"'}
+    assert cache.stats["not_modified"] == 1
+
+
+def test_same_body_skips_parse_but_new_parse_key_reparses(cache):
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return text.upper()
+
+    session = FakeSession(*(FakeResponse(200, b"same") for _ in range(3)))
+    cache.fetch(session, "https://a/", parse, parse_key={"sel": "a"})
+    cache.fetch(session, "https://a/", parse, parse_key={"sel": "a"})
+    assert cache.fetch(session, "https://a/", parse, parse_key={"sel": "b"}) == "SAME"
+
+    assert len(calls) == 2
+    assert cache.stats["unchanged"] == 1
+
+
+def test_prune_drops_entries_not_fetched_recently(cache, monkeypatch):
+    cache.fetch(FakeSession(FakeResponse(200, b"old")), "https://a/old", lambda t: t)
+    later = time.time() + 10 * 86400
+    monkeypatch.setattr("crawling_sites.utils.http_cache.time.time", lambda: later)
+    cache.fetch(FakeSession(FakeResponse(200, b"new")), "https://a/new", lambda t: t)
+
+    assert cache.prune(7) == 1
+    assert cache._get("https://a/old") is None
+    assert cache._get("https://a/new") is not None
+
+
+UNDATED_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Undated post</title><link>https://blog.example/1</link><description>body</description></item>
+</channel></rss>"""
+
+
+def test_rss_now_fallback_is_not_frozen_in_cache(cache, monkeypatch):
+    now = [datetime(2026, 3, 10, 9, 0)]
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now[0]
+
+    monkeypatch.setattr(rss_strategy, "datetime", FakeDatetime)
+    crawler = RSSCrawler({"key": "blog", "name": "Blog", "url": "https://blog.example/feed"}, http_cache=cache)
+    crawler._session = FakeSession(FakeResponse(200, UNDATED_FEED, {"ETag": '"f"'}), FakeResponse(304))
+
+    first = crawler.fetch_article_list()
+    now[0] = datetime(2026, 3, 11, 9, 0)
+    second = crawler.fetch_article_list()
+
+    assert first[0].published_time == "2026-03-10 09:00"
+    assert second[0].published_time == "2026-03-11 09:00"
+    assert cache.stats["not_modified"] == 1
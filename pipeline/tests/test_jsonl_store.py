@@ -0,0 +1,139 @@
+"""crawling_sites.utils.jsonl_store 스트리밍 기록/읽기 + crawl_all_sites 스트리밍 출력"""
+import json
+import os
+import time
+
+import pytest
+
+from crawling_sites import engine as engine_module
+from crawling_sites.sites_crawler import crawl_all_sites
+from crawling_sites.utils.jsonl_store import (
+    ZSTD_AVAILABLE, JsonlWriter, OrderedFlush, iter_items, iter_records, resolve_path,
+)
+
+
+def _write(path, finish=True):
+    writer = JsonlWriter(str(path), meta={"crawled_at": "2026-03-10T09:00:00"})
+    mobile = writer.add_category({"main_category": "IT", "sub_category": "모바일"}, key="mobile")
+    writer.add_item(mobile, {"title": "a"})
+    assert writer.add_category({"main_category": "IT", "sub_category": "모바일"}, key="mobile") == mobile
+    ai = writer.add_category({"main_category": "IT", "sub_category": "AI"})
+    writer.add_item(ai, {"title": "b"})
+    writer.add_item(mobile, {"title": "c"})
+    if finish:
+        writer.finish({"total_articles": writer.item_count})
+    else:
+        writer.close()
+
+
+@pytest.mark.parametrize("suffix", [".jsonl"] + ([".jsonl.zst"] if ZSTD_AVAILABLE else []))
+def test_roundtrip_keeps_order_and_categories(tmp_path, suffix):
+    path = tmp_path / f"news_data{suffix}"
+    _write(path)
+
+    items = [(category["sub_category"], item["title"]) for category, item in iter_items(path)]
+    assert items == [("모바일", "a"), ("AI", "b"), ("모바일", "c")]
+    records = list(iter_records(path))
+    assert records[0]["type"] == "meta" and records[0]["crawled_at"] == "2026-03-10T09:00:00"
+    assert records[-1] == {"type": "end", "total_articles": 3}
+
+
+def test_truncated_last_line_is_ignored(tmp_path, caplog):
+    path = tmp_path / "news_data.jsonl"
+    _write(path, finish=False)
+    with open(path, "ab") as f:
+        f.write(b'{"type": "item", "category": 0, "da')
+
+    assert [item["title"] for _, item in iter_items(path)] == ["a", "b", "c"]
+    assert "정상 종료 레코드가 없습니다" in caplog.text
+
+
+def test_legacy_json_document_is_read_with_same_api(tmp_path):
+    path = tmp_path / "youtube_data.json"
+    path.write_text(json.dumps({"categories": [
+        {"main_category": "IT", "sub_category": "리뷰", "videos": [{"title": "v1"}, {"title": "v2"}]},
+    ]}), encoding="utf-8")
+
+    items = list(iter_items(path))
+    assert [item["title"] for _, item in items] == ["v1", "v2"]
+    assert items[0][0] == {"main_category": "IT", "sub_category": "리뷰"}
+
+
+def test_resolve_path_picks_newest_format(tmp_path):
+    base = tmp_path / "news_data"
+    assert resolve_path(base) is None
+    legacy = tmp_path / "news_data.json"
+    legacy.write_text("{}")
+    stream = tmp_path / "news_data.jsonl"
+    stream.write_text("")
+    os.utime(legacy, (1, 1))
+
+    assert resolve_path(base) == stream
+    assert resolve_path(tmp_path / "news_data.json") == stream
+
+
+def test_ordered_flush_writes_in_index_order_and_drains_past_gaps():
+    flushed = []
+    ordered = OrderedFlush(flushed.append)
+    ordered.put(1, "b")
+    ordered.put(2, "c")
+    assert flushed == []  # 0번이 끝나기 전까지 보관
+    ordered.put(0, "a")
+    assert flushed == ["a", "b", "c"]
+
+    ordered.put(5, "f")  # 3, 4번은 실패로 오지 않음
+    ordered.put(4, "e")
+    ordered.drain()
+    assert flushed == ["a", "b", "c", "e", "f"]
+
+
+class FakeCrawler:
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.latencies = []
+
+    def _get_domain(self):
+        return self.cfg["key"] + ".example"
+
+    def list_pages(self):
+        if self.cfg.get("fail"):
+            raise RuntimeError("목록 실패")
+        time.sleep(self.cfg.get("delay", 0))
+        yield from ()
+        return [{"title": f"{self.cfg['key']} {n}", "press": self.cfg["name"]} for n in range(self.cfg["count"])]
+
+    def articles_needing_content(self, articles):
+        return []
+
+    def finalize(self, articles):
+        return articles
+
+    def close(self):
+        pass
+
+
+def test_crawl_all_sites_streams_articles_and_returns_counts(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        engine_module, "create_crawler",
+        lambda cfg, rate_limiter, http_cache=None, seen_index=None: FakeCrawler(cfg),
+    )
+    config = {"defaults": {"rate_limit_seconds": 0}, "sites": {
+        "samsung": {"key": "samsung", "name": "삼성 뉴스룸", "category": "빅테크", "count": 2, "rate_limit_seconds": 0,
+                    "delay": 0.2},
+        "lg": {"key": "lg", "name": "LG 뉴스룸", "category": "빅테크", "count": 1, "rate_limit_seconds": 0},
+        "broken": {"key": "broken", "name": "Broken", "category": "보안", "count": 0, "fail": True,
+                   "rate_limit_seconds": 0},
+    }}
+    path = tmp_path / "sites_data.jsonl"
+
+    with JsonlWriter(str(path)) as writer:
+        counts, report = crawl_all_sites(
+            config, use_http_cache=False, use_seen_index=False, use_site_health=False, writer=writer,
+        )
+
+    assert counts == {"total_sections": 2, "total_articles": 3}
+    assert report["summary"]["success"] == 2 and report["summary"]["failed"] == 1
+    assert report["sites"]["samsung"]["articles_count"] == 2
+    # lg가 먼저 끝나도 sites.yaml 순서로 기록
+    written = [(category["sub_category"], item["title"]) for category, item in iter_items(path)]
+    assert written == [("삼성 뉴스룸", "samsung 0"), ("삼성 뉴스룸", "samsung 1"), ("LG 뉴스룸", "lg 0")]
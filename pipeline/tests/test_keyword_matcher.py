@@ -0,0 +1,102 @@
+"""ranking_integrated.keyword_matcher + run_batch.scan_item/categorize_item (기존 `kw in text` 의미 유지)"""
+import random
+
+from keyword_matcher import KeywordMatcher, _PyAutomaton
+from run_batch import (
+    BLACKLIST_KEYWORDS, IT_BOOST_KEYWORDS, KEYWORD_MAP, SECURITY_IMPACT_KEYWORDS,
+    build_keyword_matcher, categorize_item, scan_item,
+)
+
+# 브랜드 별칭이 없는 트렌드 키워드 (별칭 매칭은 test_text_normalizer에서 다룬다)
+TRENDS = {"반도체": 3.0, "llm": 2.0, "zero trust": 1.5, "해킹": 1.0, "5g 요금제": 1.0}
+
+
+def test_scan_finds_overlapping_matches_in_text_order():
+    matcher = KeywordMatcher({"a": ["he", "she", "hers"], "b": ["his", "he"]}).build()
+    hits = matcher.scan("ushers his")
+
+    assert hits.values("a") == ["she", "he", "hers"]
+    assert hits.values("b") == ["he", "his"]
+    assert hits.count("a") == 3
+    assert hits.prefix(4).values("a") == ["she", "he"]
+    assert KeywordMatcher().scan("anything").matches == []
+
+
+def test_pure_python_automaton_matches_substring_semantics():
+    rng = random.Random(7)
+    alphabet = "abc가나 "
+    keywords = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)}
+    keywords = [kw for kw in keywords if kw.strip()]
+    automaton = _PyAutomaton({kw: [("k", kw)] for kw in keywords})
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        found = {value for _, payloads in automaton.iter(text) for _, value in payloads}
+        assert found == {kw for kw in keywords if kw in text}
+
+
+def _baseline(item):
+    """user-018 이전 run_batch의 텍스트 구성과 `in` 매칭"""
+    if item["type"] == "youtube":
+        score_text = (item.get("title", "") + " " + item.get("description", "") + " "
+                      + item.get("search_keyword", "")).lower()
+        if item.get("transcript"):
+            score_text += " " + item["transcript"].get("full_text", "")[:1000]
+    else:
+        score_text = (item.get("title", "") + " " + item.get("content", "")).lower()
+    body = (item.get("title", "") + " " + item.get("content", "")).lower()
+    everything = (item.get("title", "") + " " + item.get("content", "") + " " + item.get("description", "")).lower()
+    return {
+        "trend": [kw for kw in TRENDS if kw.lower() in score_text],
+        "it": sum(1 for kw in IT_BOOST_KEYWORDS if kw in score_text),
+        "security": any(kw in body for kw in SECURITY_IMPACT_KEYWORDS),
+        "blacklist": any(kw in everything for kw in BLACKLIST_KEYWORDS),
+        "category": next((cat for cat, kws in KEYWORD_MAP.items() if any(k in body for k in kws)), None),
+    }
+
+
+def _random_items(n):
+    rng = random.Random(11)
+    vocab = (list(TRENDS) + IT_BOOST_KEYWORDS[:15] + SECURITY_IMPACT_KEYWORDS[:5] + BLACKLIST_KEYWORDS[:5]
+             + ["노트북", "해킹", "네트워크", "LLM", "Zero Trust", "오늘", "발표", "시장", "the", "news"])
+
+    def text(k):
+        return " ".join(rng.choice(vocab) for _ in range(rng.randint(0, k)))
+
+    items = []
+    for i in range(n):
+        item = {"type": "youtube" if i % 2 else "news", "title": text(6), "content": text(20) if i % 3 else "",
+                "description": text(10)}
+        if item["type"] == "youtube":
+            item["search_keyword"] = text(2)
+            if i % 4 == 1:
+                item["transcript"] = {"full_text": text(40)}
+        items.append(item)
+    return items
+
+
+def test_scan_item_reproduces_baseline_substring_results():
+    matcher = build_keyword_matcher(TRENDS)
+    for item in _random_items(400):
+        hits = scan_item(matcher, item)
+        expected = _baseline(item)
+        assert sorted(hits["score"].values("trend")) == sorted(expected["trend"])
+        assert hits["score"].count("it") == expected["it"]
+        assert hits["body"].has("security") == expected["security"]
+        assert hits["blacklist"].has("blacklist") == expected["blacklist"]
+        if not expected["blacklist"]:
+            assert categorize_item(dict(item), TRENDS, hits) == (expected["category"] or "etc")
+
+
+def test_transcript_is_matched_without_lowercasing():
+    matcher = build_keyword_matcher({"llm": 1.0})
+    upper = {"type": "youtube", "title": "리뷰", "transcript": {"full_text": "LLM 성능 비교"}}
+    lower = {"type": "youtube", "title": "리뷰", "transcript": {"full_text": "llm 성능 비교"}}
+
+    assert scan_item(matcher, upper)["score"].values("trend") == []
+    assert scan_item(matcher, lower)["score"].values("trend") == ["llm"]
+
+
+def test_categorize_item_without_precomputed_hits():
+    assert categorize_item({"title": "새 노트북 출시", "content": ""}, {}) == "pc"
+    assert categorize_item({"title": "신작 게임 공개", "content": "노트북"}, {}) is None
@@ -0,0 +1,98 @@
+"""crawling_naver_news.news_crawler.crawl_news 섹션 병렬 수집 (가짜 풀/섹션 수집)"""
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from crawling_naver_news import news_crawler
+from crawling_sites.utils.jsonl_store import iter_items, iter_records
+
+SECTIONS = [
+    {"main_category": "IT/과학", "sub_category": sub, "section_url": f"https://news.naver.com/section/{n}"}
+    for n, sub in enumerate(["모바일", "인터넷/SNS", "통신/뉴미디어", "IT 일반"])
+]
+
+
+class FakePool:
+    size = 2
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, user_agent=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            yield object()
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def summary(self):
+        return "fake pool"
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(news_crawler, "get_shared_pool", lambda: pool)
+    monkeypatch.setattr(news_crawler, "parse_crawling_md", lambda path: SECTIONS)
+    monkeypatch.setattr(news_crawler.gc, "collect", lambda: None)
+    monkeypatch.setattr(news_crawler.time, "sleep", lambda seconds: None)
+    return pool
+
+
+def _fake_crawl_section(fail_on=None):
+    def crawl_section(driver, section, articles_per_section, fetch_full_content, seen_index, session, http_workers):
+        index = SECTIONS.index(section)
+        # 앞 섹션일수록 늦게 끝나도록 해 완료 순서와 크롤링.md 순서를 다르게 만든다
+        real_sleep(0.05 * (len(SECTIONS) - index))
+        if index == fail_on:
+            raise RuntimeError("섹션 실패")
+        return [{"title": f"{section['sub_category']} {n}", "link": f"{section['section_url']}/{n}"} for n in range(2)]
+    return crawl_section
+
+
+real_sleep = time.sleep
+
+
+def _crawl(tmp_path, workers):
+    return news_crawler.crawl_news(
+        "unused.md", str(tmp_path / "news_data.jsonl"), fetch_full_content=False,
+        use_seen_index=False, use_http_fast_path=False, workers=workers,
+    )
+
+
+def test_parallel_sections_are_bounded_by_pool_and_all_written(tmp_path, pool, monkeypatch):
+    monkeypatch.setattr(news_crawler, "crawl_section", _fake_crawl_section())
+    result = _crawl(tmp_path, workers=8)
+
+    assert pool.peak == 2  # 워커 수는 풀 크기로 제한
+    items = list(iter_items(tmp_path / "news_data.jsonl"))
+    assert len(items) == 8
+    # 뒤 섹션이 먼저 끝나도 크롤링.md 순서로 기록
+    categories = [record for record in iter_records(tmp_path / "news_data.jsonl") if record["type"] == "category"]
+    assert [category["sub_category"] for category in categories] == [s["sub_category"] for s in SECTIONS]
+    assert [category["id"] for category in categories] == [0, 1, 2, 3]
+    assert list(iter_records(tmp_path / "news_data.jsonl"))[-1] == {"type": "end", "total_articles": 8}
+    # 기사는 파일에만 남고 반환값은 집계뿐
+    assert set(result) == {"crawled_at", "total_sections", "total_articles"}
+    assert (result["total_sections"], result["total_articles"]) == (4, 8)
+
+
+def test_failing_section_is_reraised_and_output_stays_partial(tmp_path, pool, monkeypatch):
+    monkeypatch.setattr(news_crawler, "crawl_section", _fake_crawl_section(fail_on=3))
+    with pytest.raises(RuntimeError, match="섹션 실패"):
+        _crawl(tmp_path, workers=2)
+
+    records = list(iter_records(tmp_path / "news_data.jsonl"))
+    assert all(record["type"] != "end" for record in records)
+    # 실패 전에 끝난 섹션은 순서대로 남는다
+    assert [record["sub_category"] for record in records if record["type"] == "category"] == [
+        s["sub_category"] for s in SECTIONS[:3]
+    ]
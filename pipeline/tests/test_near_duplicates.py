@@ -0,0 +1,76 @@
+"""reconstruction.near_duplicates MinHash/LSH 근접 중복 + Preprocessor 5단계"""
+import random
+
+import pytest
+
+from near_duplicates import NearDuplicateFinder
+from preprocessor import Preprocessor
+
+_SYLLABLES = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+
+
+def _sentence(rng, words=60):
+    return " ".join("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(words))
+
+
+def _story(rng):
+    return {"title": _sentence(rng, 8), "content": _sentence(rng, 80)}
+
+
+def _variant(article, rng):
+    """제목 끝만 바꾸고 본문 끝을 잘라낸 전재 기사"""
+    return {
+        "title": article["title"] + " " + _sentence(rng, 1),
+        "content": article["content"][:-40],
+    }
+
+
+def test_invalid_band_configuration():
+    with pytest.raises(ValueError):
+        NearDuplicateFinder(num_perm=64, bands=10)
+
+
+def test_signature_is_deterministic_and_ignores_punctuation():
+    finder = NearDuplicateFinder()
+    a = finder.signature(finder.fingerprint_text({"title": "삼성, 새 폰 공개!", "content": "본문"}))
+    b = finder.signature(finder.fingerprint_text({"title": "삼성 새 폰 공개", "content": "본문"}))
+    assert (a == b).all()
+    assert finder.signature("") is None
+    assert NearDuplicateFinder(seed=1).signature("짧다").tolist() == finder.signature("짧다").tolist()
+
+
+def test_groups_variants_and_keeps_distinct_stories_apart():
+    rng = random.Random(3)
+    stories = [_story(rng) for _ in range(40)]
+    articles, truth = [], []
+    for story_id, story in enumerate(stories):
+        articles.append(story)
+        truth.append(story_id)
+        for _ in range(story_id % 3):
+            articles.append(_variant(story, rng))
+            truth.append(story_id)
+    articles.append({"title": "", "content": ""})
+    truth.append(-1)
+
+    groups = NearDuplicateFinder().groups(articles)
+
+    assert sorted(i for g in groups for i in g) == list(range(len(articles)))
+    assert sorted(sorted(truth[i] for i in g) for g in groups) == sorted(
+        sorted(truth[i] for i in range(len(articles)) if truth[i] == t) for t in set(truth)
+    )
+
+
+def test_preprocessor_keeps_highest_scoring_variant_and_youtube():
+    rng = random.Random(5)
+    story = _story(rng)
+    low = {**story, "link": "low", "trend_score": 1}
+    high = {**_variant(story, rng), "link": "high", "trend_score": 5}
+    other = {**_story(rng), "link": "other"}
+    youtube = {"title": story["title"] + " 리뷰", "content": "", "type": "youtube", "link": "yt"}
+
+    result = Preprocessor().process({"categories": {"ai": [low, other, high, youtube]}})
+    assert [a["link"] for a in result["ai"]] == ["other", "high", "yt"]
+
+    disabled = Preprocessor(near_duplicates={"enabled": False})
+    result = disabled.process({"categories": {"ai": [dict(low), dict(other), dict(high)]}})
+    assert len(result["ai"]) == 3
@@ -0,0 +1,64 @@
+"""crawling_sites.utils.page_wait 준비 조건 대기 (가짜 드라이버)"""
+import time
+
+import pytest
+
+from crawling_sites.utils import page_wait
+from crawling_sites.utils.page_wait import WaitStats, scroll_and_wait, wait_for_page
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(page_wait, "POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(page_wait, "WAIT_STATS", WaitStats())
+
+
+class FakeDriver:
+    """items_over_time(경과 초) → 셀렉터 항목 수, 스크롤마다 grow_per_scroll개 추가"""
+
+    def __init__(self, items_over_time=lambda t: 0, grow_per_scroll=0, max_items=None):
+        self.started = time.time()
+        self.items_over_time = items_over_time
+        self.grow_per_scroll = grow_per_scroll
+        self.max_items = max_items
+        self.scrolled = 0
+
+    def execute_script(self, script, *args):
+        if "scrollTo" in script:
+            self.scrolled += 1
+            return None
+        if "readyState" in script:
+            return "complete"
+        count = self.items_over_time(time.time() - self.started) + self.scrolled * self.grow_per_scroll
+        return count if self.max_items is None else min(count, self.max_items)
+
+
+def test_wait_returns_as_soon_as_selector_appears():
+    driver = FakeDriver(lambda t: 5 if t > 0.1 else 0)
+    elapsed = wait_for_page(driver, selector=".item", timeout=3, stats_key="site", baseline=3)
+
+    assert 0.1 <= elapsed < 1.0
+    stats = page_wait.WAIT_STATS.snapshot()["site"]
+    assert stats["count"] == 1 and stats["timeouts"] == 0
+    assert stats["saved_seconds"] > 2
+
+
+def test_wait_is_bounded_by_timeout_and_counts_timeouts():
+    elapsed = wait_for_page(FakeDriver(), selector=".missing", timeout=0.2, stats_key="site")
+    assert 0.2 <= elapsed < 0.6
+    assert page_wait.WAIT_STATS.snapshot()["site"]["timeouts"] == 1
+
+
+def test_scroll_stops_when_no_new_items_load():
+    driver = FakeDriver(lambda t: 10, grow_per_scroll=10, max_items=30)
+    count = scroll_and_wait(driver, ".item", scroll_count=5, timeout=0.1)
+
+    assert count == 30
+    assert driver.scrolled == 3  # 20, 30, 그리고 더 늘지 않은 세 번째 스크롤에서 중단
+
+
+def test_histogram_buckets():
+    stats = WaitStats()
+    for elapsed in (0.1, 0.4, 4.0, 20.0):
+        stats.record("k", elapsed)
+    assert stats.snapshot()["k"]["histogram"] == {"<=0.25s": 1, "<=0.5s": 1, "<=5s": 1, ">10s": 1}
@@ -0,0 +1,78 @@
+"""crawling_sites.utils.rate_limiter 슬롯 예약 (GCRA)"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crawling_sites.utils import rate_limiter as rate_limiter_module
+from crawling_sites.utils.rate_limiter import AsyncDomainRateLimiter, DomainRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic 고정 시계 (now[0]을 바꿔 시간 이동)"""
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_reserve_spaces_requests_per_domain(clock):
+    limiter = DomainRateLimiter(default_delay=2.0)
+    assert limiter.reserve("a.com") == 0.0
+    assert limiter.reserve("a.com") == 2.0
+    assert limiter.reserve("a.com") == 4.0
+    # 다른 도메인은 독립
+    assert limiter.reserve("b.com") == 0.0
+
+
+def test_idle_domain_does_not_accumulate_credit_beyond_burst(clock):
+    limiter = DomainRateLimiter(default_delay=1.0, burst=2)
+    assert [limiter.reserve("a.com") for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    clock[0] += 60  # 오래 쉬어도 burst개까지만 연속 허용
+    assert [limiter.reserve("a.com") for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_domain_overrides(clock):
+    limiter = DomainRateLimiter(default_delay=1.0, domain_delays={"slow.kr": 3.0}, domain_bursts={"fast.com": 3})
+    limiter.reserve("slow.kr")
+    assert limiter.reserve("slow.kr") == 3.0
+    assert [limiter.reserve("fast.com") for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_concurrent_threads_get_distinct_slots():
+    limiter = DomainRateLimiter(default_delay=10.0)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = limiter.reserve("a.com")
+        with lock:
+            waits.append(round(wait))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(waits) == [0, 10, 20, 30, 40, 50, 60, 70]
+
+
+def test_async_wait_does_not_block_other_domains():
+    limiter = AsyncDomainRateLimiter(default_delay=0.3)
+
+    async def scenario():
+        await limiter.wait_async("a.com")
+        started = time.monotonic()
+        # a.com은 0.3초 기다려야 하지만 b.com은 바로 진행
+        a = asyncio.create_task(limiter.wait_async("a.com"))
+        await limiter.wait_async("b.com")
+        b_elapsed = time.monotonic() - started
+        await a
+        return b_elapsed, time.monotonic() - started
+
+    b_elapsed, a_elapsed = asyncio.run(scenario())
+    assert b_elapsed < 0.1
+    assert a_elapsed >= 0.28
@@ -0,0 +1,78 @@
+"""run_manifest.RunManifest / run_daily._restore_completed / ai_rewriter.ClusterCheckpoint 재개"""
+import json
+
+from ai_rewriter import ClusterCheckpoint
+from run_daily import _restore_completed
+from run_manifest import RunManifest
+from stage_graph import StageGraph
+
+
+def _graph():
+    graph = StageGraph(log=lambda icon, msg: None)
+    graph.add_stage("crawl", lambda _: None)
+    graph.add_stage("rank", lambda _: None, deps=["crawl"])
+    graph.add_stage("reconstruct", lambda _: None, deps=["rank"])
+    return graph
+
+
+def test_record_persists_and_reloads(tmp_path):
+    artifact = tmp_path / "brief.json"
+    artifact.write_text("{}")
+    manifest = RunManifest("2026-03-10", runs_dir=tmp_path)
+    manifest.record("rank", "success", artifact=str(artifact), elapsed=1.234)
+    manifest.record("reconstruct", "timeout", error="900초 초과")
+
+    reloaded = RunManifest("2026-03-10", runs_dir=tmp_path)
+    assert reloaded.is_completed("rank")
+    assert not reloaded.is_completed("reconstruct")
+    assert reloaded.data["stages"]["rank"]["elapsed_seconds"] == 1.2
+
+
+def test_missing_artifact_is_not_completed(tmp_path):
+    manifest = RunManifest("2026-03-10", runs_dir=tmp_path)
+    manifest.record("rank", "success", artifact=str(tmp_path / "gone.json"))
+    assert not manifest.is_completed("rank")
+
+
+def test_reset_discards_manifest_and_cluster_checkpoint(tmp_path):
+    manifest = RunManifest("2026-03-10", runs_dir=tmp_path)
+    manifest.record("crawl", "success")
+    manifest.cluster_checkpoint_path.write_text("{}")
+
+    fresh = RunManifest("2026-03-10", runs_dir=tmp_path, reset=True)
+    assert fresh.data["stages"] == {}
+    assert not fresh.cluster_checkpoint_path.exists()
+
+
+def test_restore_only_reuses_stages_whose_upstream_is_restored(tmp_path):
+    crawl_out = tmp_path / "news_data.jsonl"
+    crawl_out.write_text("")
+    brief = tmp_path / "brief.json"
+    brief.write_text(json.dumps({"categories": {}}))
+    reconstructed = tmp_path / "reconstructed.json"
+    reconstructed.write_text("[]")
+
+    manifest = RunManifest("2026-03-10", runs_dir=tmp_path)
+    manifest.record("crawl", "failed", artifact=str(crawl_out))
+    manifest.record("rank", "success", artifact=str(brief))
+    manifest.record("reconstruct", "success", artifact=str(reconstructed))
+    assert _restore_completed(_graph(), manifest) == {}
+
+    manifest.record("crawl", "success", artifact=str(crawl_out))
+    restored = _restore_completed(_graph(), manifest)
+    # .jsonl 산출물은 경로 그대로, .json은 내용을 읽어 복원
+    assert restored == {"crawl": str(crawl_out), "rank": {"categories": {}}, "reconstruct": []}
+
+
+def test_cluster_checkpoint_skips_fallback_and_survives_reload(tmp_path):
+    path = tmp_path / "clusters.json"
+    cluster = [{"link": "https://a"}, {"link": "https://b"}]
+    checkpoint = ClusterCheckpoint(str(path))
+    checkpoint.put(cluster, "ai", {"title": "재구성", "_source_articles": cluster})
+    checkpoint.put([{"link": "https://c"}], "ai", {"title": "폴백", "_fallback": True})
+
+    reloaded = ClusterCheckpoint(str(path))
+    assert len(reloaded) == 1
+    # 클러스터 순서가 바뀌어도 같은 키, 원문 기사는 저장하지 않음
+    assert reloaded.get(list(reversed(cluster)), "ai") == {"title": "재구성"}
+    assert reloaded.get(cluster, "mobile") is None
@@ -0,0 +1,91 @@
+"""ranking_integrated.scoring 설정 병합 + 컬럼 단위 점수 계산"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from scoring import DEFAULT_SCORING, ScoreTable, load_scoring_config
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def _stamp(hours_ago):
+    return (NOW - timedelta(hours=hours_ago)).isoformat()
+
+
+def _loop_score(config, source, trend_weight, it_hits, has_security, timestamp, site):
+    """아이템마다 곱해 가던 기존 방식의 점수"""
+    weights = config["weights"]
+    item_type = "youtube" if source == "youtube" else "news"
+    score = trend_weight * weights["source_multiplier"][item_type] + it_hits * weights["it_keyword"]
+    if source == "sites":
+        score *= config["site_authority"].get(site, 1.0)
+    if has_security:
+        score *= weights["security_impact"]
+    if timestamp:
+        age = (NOW - datetime.fromisoformat(timestamp)).total_seconds() / 3600
+        for tier in config["freshness"]:
+            if age < tier["max_hours"]:
+                score *= tier["multiplier"]
+                break
+    return score
+
+
+def test_shipped_config_loads_with_site_authority():
+    config = load_scoring_config()
+    assert config["weights"]["source_multiplier"] == {"news": 1.0, "youtube": 1.5}
+    assert config["site_authority"]["kisa_security"] == 3.0
+    assert [tier["max_hours"] for tier in config["freshness"]] == [6, 24]
+
+
+def test_partial_config_is_merged_over_defaults(tmp_path):
+    path = tmp_path / "scoring.yaml"
+    path.write_text("weights:\n  it_keyword: 2.0\nmax_per_category: 5\n", encoding="utf-8")
+    config = load_scoring_config(str(path))
+
+    assert config["weights"]["it_keyword"] == 2.0
+    assert config["weights"]["security_impact"] == DEFAULT_SCORING["weights"]["security_impact"]
+    assert config["max_per_category"] == 5
+    assert config["trend_sources"] == DEFAULT_SCORING["trend_sources"]
+    assert load_scoring_config(str(tmp_path / "missing.yaml")) == DEFAULT_SCORING
+
+
+def test_scores_match_per_item_loop():
+    config = load_scoring_config()
+    rows = [
+        ("news", 3.0, 2, False, _stamp(1), None),
+        ("sites", 1.5, 0, True, _stamp(10), "kisa_security"),
+        ("sites", 2.0, 1, False, _stamp(30), "unknown_site"),
+        ("youtube", 4.0, 3, True, _stamp(5.99), None),
+        ("news", 0.0, 1, False, None, None),
+        # 사이트 권위는 외부 사이트 기사에만
+        ("news", 1.0, 0, False, _stamp(48), "kisa_security"),
+    ]
+    table = ScoreTable(config)
+    for row in rows:
+        table.add(*row)
+
+    assert len(table) == len(rows)
+    np.testing.assert_allclose(table.scores(NOW), [_loop_score(config, *row) for row in rows])
+
+
+def test_freshness_tier_boundaries():
+    table = ScoreTable(load_scoring_config())
+    for hours in (0, 5.99, 6, 23.99, 24, 100):
+        table.add("news", 1.0, 0, False, _stamp(hours))
+    np.testing.assert_allclose(table.scores(NOW), [1.3, 1.3, 1.1, 1.1, 1.0, 1.0])
+
+
+def test_missing_or_invalid_timestamp_gets_no_bonus():
+    table = ScoreTable(load_scoring_config())
+    table.add("news", 1.0, 0, False, _stamp(1))
+    table.add("news", 1.0, 0, False, "날짜 아님")
+    table.add("news", 1.0, 0, False, None)
+
+    ages = table.ages_hours(NOW)
+    assert ages[0] == pytest.approx(1.0) and np.isnan(ages[1:]).all()
+    np.testing.assert_allclose(table.scores(NOW), [1.3, 1.0, 1.0])
+
+
+def test_empty_table():
+    assert ScoreTable(load_scoring_config()).scores(NOW).shape == (0,)
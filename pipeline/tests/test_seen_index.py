@@ -0,0 +1,53 @@
+"""crawling_sites.utils.seen_index.SeenIndex 본문 재사용 / 만료"""
+import time
+
+from crawling_sites.strategies.base import Article
+from crawling_sites.strategies.html_strategy import HTMLCrawler
+from crawling_sites.utils import seen_index as seen_index_module
+from crawling_sites.utils.seen_index import SeenIndex, normalize_url
+
+
+def test_normalize_url_drops_tracking_params_and_fragment():
+    url = "https://a.com/news?id=3&utm_source=x&fbclid=y#top"
+    assert normalize_url(url) == "https://a.com/news?id=3"
+
+
+def test_put_get_roundtrip_with_extra(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"))
+    index.put("https://a.com/1?utm_medium=rss", "본문", extra={"press": "A"})
+
+    entry = index.get("https://a.com/1")
+    assert entry["content"] == "본문"
+    assert entry["extra"] == {"press": "A"}
+    assert index.get("https://a.com/2") is None
+    assert index.stats == {"hit": 1, "miss": 1, "stored": 1}
+
+
+def test_expired_entries_are_not_reused_and_pruned(tmp_path, monkeypatch):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"), max_age_days=1)
+    index.put("https://a.com/old", "old")
+    later = time.time() + 2 * 86400
+    monkeypatch.setattr(seen_index_module.time, "time", lambda: later)
+    index.put("https://a.com/new", "new")
+
+    assert index.get("https://a.com/old") is None
+    assert index.prune() == 1
+    assert index.get("https://a.com/new")["content"] == "new"
+
+
+def test_crawler_skips_detail_fetch_for_indexed_links(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"))
+    index.put("https://a.com/1", "저장된 본문")
+    crawler = HTMLCrawler({"key": "a", "name": "A", "url": "https://a.com"}, seen_index=index)
+    fetched = []
+    crawler.fetch_article_content = lambda link: fetched.append(link) or f"{link} 본문"
+
+    articles = [Article(title="첫 기사", link="https://a.com/1"), Article(title="둘째 기사", link="https://a.com/2")]
+    pending = crawler.articles_needing_content(articles)
+    for i, article in enumerate(pending):
+        crawler.fill_article_content(article, i, len(pending))
+
+    assert [a.link for a in pending] == ["https://a.com/2"]
+    assert fetched == ["https://a.com/2"]
+    assert articles[0].content == "저장된 본문"
+    assert index.get("https://a.com/2")["content"] == "https://a.com/2 본문"
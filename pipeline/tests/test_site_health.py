@@ -0,0 +1,75 @@
+"""crawling_sites.utils.site_health.SiteHealth 서킷 브레이커 / 적응형 타임아웃"""
+import pytest
+
+from crawling_sites.utils import site_health as site_health_module
+from crawling_sites.utils.site_health import CLOSED, HALF_OPEN, OPEN, SiteHealth
+
+HOUR = 3600
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(site_health_module.time, "time", lambda: now[0])
+    return now
+
+
+def test_opens_after_threshold_then_half_opens_after_cooldown(tmp_path, clock):
+    health = SiteHealth(str(tmp_path / "health.json"), failure_threshold=2, cooldown_hours=1)
+    health.record("kt", False, error="timeout")
+    assert health.state("kt") == CLOSED
+    assert health.apply("kt", {"retry_count": 3})["retry_count"] == 1  # 불안정 사이트는 재시도 축소
+
+    health.record("kt", False, error="timeout")
+    assert health.state("kt") == OPEN
+    clock[0] += HOUR
+    assert health.state("kt") == HALF_OPEN
+
+
+def test_failed_trial_doubles_cooldown_and_success_closes(tmp_path, clock):
+    health = SiteHealth(str(tmp_path / "health.json"), failure_threshold=1, cooldown_hours=1, max_cooldown_hours=3)
+    health.record("kt", False)
+    clock[0] += HOUR
+    health.record("kt", False)  # 시험 요청 실패 → 2시간
+    assert health.sites["kt"]["retry_after"] == clock[0] + 2 * HOUR
+
+    clock[0] += 2 * HOUR
+    health.record("kt", False)  # 4시간이지만 상한 3시간
+    assert health.sites["kt"]["retry_after"] == clock[0] + 3 * HOUR
+
+    clock[0] += 3 * HOUR
+    health.record("kt", True)
+    assert health.state("kt") == CLOSED
+    assert health.sites["kt"]["trips"] == 0
+
+
+def test_adaptive_timeout_is_bounded(tmp_path):
+    health = SiteHealth(str(tmp_path / "health.json"), ewma_alpha=0.5, timeout_multiplier=4, min_timeout=5)
+    assert health.timeout_for("new", 15) == 15
+
+    health.record("fast", True, latencies=[0.2, 0.4])
+    assert health.sites["fast"]["latency_ewma"] == 0.3
+    assert health.timeout_for("fast", 15) == 5  # 하한
+
+    health.record("slow", True, latencies=[10.0])
+    assert health.timeout_for("slow", 15) == 15  # 설정값 상한
+    health.record("mid", True, latencies=[2.0])
+    assert health.apply("mid", {"timeout_seconds": 15, "retry_count": 3}) == {"timeout_seconds": 8.0, "retry_count": 3}
+
+
+def test_save_and_reload(tmp_path, clock):
+    path = tmp_path / "health.json"
+    health = SiteHealth(str(path), failure_threshold=1)
+    health.record("kt", False, error="x" * 500)
+    health.save()
+
+    reloaded = SiteHealth(str(path), failure_threshold=1)
+    assert reloaded.state("kt") == OPEN
+    assert len(reloaded.sites["kt"]["last_error"]) == 200
+    assert list(tmp_path.iterdir()) == [path]  # 임시 파일 남지 않음
+
+
+def test_corrupt_file_starts_fresh(tmp_path):
+    path = tmp_path / "health.json"
+    path.write_text("{not json")
+    assert SiteHealth(str(path)).sites == {}
@@ -0,0 +1,113 @@
+"""reconstruction.sparse_linkage kNN 유사도 그래프 + 희소 평균 연결 병합"""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.cluster import AgglomerativeClustering
+from sklearn.metrics import adjusted_rand_score
+from sklearn.preprocessing import normalize
+
+from benchmarks.bench_clustering import make_corpus
+from clusterer import ArticleClusterer
+from sparse_linkage import knn_similarity_graph, sparse_average_linkage
+
+
+def _random_matrix(n, features=40, density=0.3, seed=0):
+    rng = np.random.default_rng(seed)
+    dense = rng.random((n, features)) * (rng.random((n, features)) < density)
+    dense[:, 0] += 0.01  # 빈 행 방지
+    return sp.csr_matrix(normalize(dense))
+
+
+def test_knn_graph_keeps_top_k_symmetric_without_diagonal():
+    matrix = _random_matrix(30)
+    graph = knn_similarity_graph(matrix, n_neighbors=4, chunk_size=7)
+    similarity = (matrix @ matrix.T).toarray()
+    np.fill_diagonal(similarity, -1)
+
+    assert (graph != graph.T).nnz == 0
+    assert graph.diagonal().sum() == 0
+    for row in range(30):
+        top = set(np.argsort(-similarity[row])[:4].tolist())
+        neighbors = set(graph[row].indices.tolist())
+        assert top <= neighbors
+        np.testing.assert_allclose(graph[row].toarray().ravel()[list(top)], similarity[row, list(top)], rtol=1e-5)
+
+
+def test_knn_graph_edge_cases():
+    assert knn_similarity_graph(_random_matrix(1), n_neighbors=5).nnz == 0
+    matrix = sp.csr_matrix(np.eye(3))
+    assert knn_similarity_graph(matrix, n_neighbors=2, min_similarity=0.0).nnz == 0
+
+
+@pytest.mark.parametrize("n_clusters", [2, 5, 12])
+def test_full_graph_matches_dense_average_linkage(n_clusters):
+    matrix = _random_matrix(40, seed=n_clusters)
+    graph = knn_similarity_graph(matrix, n_neighbors=39)
+
+    labels = sparse_average_linkage(graph, n_clusters)
+    expected = AgglomerativeClustering(n_clusters=n_clusters, metric="cosine", linkage="average").fit_predict(
+        matrix.toarray()
+    )
+
+    assert len(set(labels.tolist())) == n_clusters
+    assert adjusted_rand_score(expected, labels) == pytest.approx(1.0)
+
+
+def test_disconnected_components_are_not_merged():
+    graph = sp.csr_matrix(np.array([
+        [0, 0.9, 0, 0],
+        [0.9, 0, 0, 0],
+        [0, 0, 0, 0.8],
+        [0, 0, 0.8, 0],
+    ]))
+    assert sparse_average_linkage(graph, 1).tolist() == [0, 0, 1, 1]
+    assert sparse_average_linkage(graph, 3).tolist() == [0, 0, 1, 2]
+
+
+def test_clusterer_sparse_backend_recovers_stories():
+    articles, truth = make_corpus(120, story_size=6, seed=1)
+    n_clusters = len(set(truth))
+    results = {}
+    for backend in ("dense", "sparse"):
+        clusters = ArticleClusterer({"backend": backend})._cluster_articles(articles, n_clusters)
+        label_of = {id(a): label for label, cluster in enumerate(clusters) for a in cluster}
+        results[backend] = adjusted_rand_score(truth, [label_of[id(a)] for a in articles])
+
+    assert results["sparse"] >= 0.9
+    assert results["sparse"] >= results["dense"] - 0.05
+
+
+def test_clusterer_backend_selection():
+    with pytest.raises(ValueError):
+        ArticleClusterer({"backend": "gpu"})
+    auto = ArticleClusterer({"dense_max_articles": 10})
+    assert not auto._use_sparse(10) and auto._use_sparse(11)
+    assert ArticleClusterer({"backend": "sparse"})._use_sparse(2)
+
+
+
+def test_failed_shared_fit_falls_back_to_per_category_vocabulary(monkeypatch):
+    def stories(words):
+        return [{"title": f"{word} 소식 {n}", "content": f"{word} {word} 관련 기사 {n}"} for word in words for n in range(3)]
+
+    by_category = {
+        "mobile_device": stories(["갤럭시폴드", "아이폰프로"]),
+        "security_policy": stories(["ransomware", "phishing"]),  # 앞 카테고리와 겹치는 n-gram이 거의 없다
+    }
+    total = sum(len(articles) for articles in by_category.values())
+    clusterer = ArticleClusterer({"backend": "dense", "targets": {"mobile_device": 2, "security_policy": 2}})
+    real_fit = clusterer.features.fit
+
+    def fit(articles):
+        if len(articles) == total:  # 전체 카테고리 공유 학습만 실패
+            raise ValueError("After pruning, no terms remain")
+        return real_fit(articles)
+
+    monkeypatch.setattr(clusterer.features, "fit", fit)
+    result = clusterer.cluster_by_category(by_category)
+
+    # 두 번째 카테고리도 첫 카테고리 어휘(영행렬)가 아닌 자기 어휘로 묶인다
+    for category, articles in by_category.items():
+        groups = sorted(sorted(a["title"].split()[0] for a in cluster) for cluster in result[category])
+        words = sorted({a["title"].split()[0] for a in articles})
+        assert groups == [[word] * 3 for word in words]
@@ -0,0 +1,154 @@
+"""stage_graph.StageGraph 실행 순서 / 실패 전파 / 타임아웃 종료"""
+import os
+import time
+
+import pytest
+
+from stage_graph import StageGraph
+
+
+def _quiet(icon, msg):
+    pass
+
+
+def test_runs_in_dependency_order_and_passes_values():
+    graph = StageGraph(max_workers=2, log=_quiet)
+    graph.add_stage("a", lambda _: 1)
+    graph.add_stage("b", lambda _: 2)
+    graph.add_stage("sum", lambda inputs: inputs["a"] + inputs["b"], deps=["a", "b"])
+
+    results = graph.run()
+
+    assert results["sum"].status == "success"
+    assert results["sum"].value == 3
+
+
+def test_failed_dependency_skips_hard_dep_and_feeds_none_to_soft_dep():
+    def boom(_):
+        raise RuntimeError("크롤링 실패")
+
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("crawl", boom)
+    graph.add_stage("hard", lambda inputs: "ran", deps=["crawl"])
+    graph.add_stage("soft", lambda inputs: inputs, deps=["crawl"], soft_deps=True)
+
+    results = graph.run()
+
+    assert results["crawl"].status == "failed"
+    assert "RuntimeError" in results["crawl"].error
+    assert results["hard"].status == "skipped"
+    assert results["soft"].value == {"crawl": None}
+
+
+def test_restored_stage_is_not_rerun():
+    calls = []
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("crawl", lambda _: calls.append("crawl"))
+    graph.add_stage("rank", lambda inputs: inputs["crawl"] + "!", deps=["crawl"])
+
+    results = graph.run(restored={"crawl": "path.jsonl"})
+
+    assert calls == []
+    assert results["crawl"].status == "resumed"
+    assert results["rank"].value == "path.jsonl!"
+
+
+def test_cycle_is_rejected():
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("a", lambda _: None, deps=["b"])
+    graph.add_stage("b", lambda _: None, deps=["a"])
+    with pytest.raises(ValueError):
+        graph.run()
+
+
+def test_isolated_stage_returns_value_from_child_process():
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("pid", lambda _: os.getpid(), isolate=True)
+    graph.add_stage("echo", lambda inputs: inputs["pid"], deps=["pid"], isolate=True)
+
+    results = graph.run()
+
+    assert results["pid"].ok
+    assert results["pid"].value != os.getpid()
+    assert results["echo"].value == results["pid"].value
+
+
+def test_isolated_stage_failure_is_reported():
+    def boom(_):
+        raise ValueError("bad")
+
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("boom", boom, isolate=True)
+    graph.add_stage("crash", lambda _: os._exit(3), isolate=True)
+
+    results = graph.run()
+
+    assert results["boom"].status == "failed"
+    assert "ValueError: bad" in results["boom"].error
+    assert results["crash"].status == "failed"
+    assert "exit 3" in results["crash"].error
+
+
+def test_timed_out_isolated_stage_is_killed(tmp_path):
+    marker = tmp_path / "late.txt"
+
+    def slow(_):
+        time.sleep(2)
+        marker.write_text("still running")  # 타임아웃 뒤에도 살아 있으면 파일이 생긴다
+        return "late"
+
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("slow", slow, timeout=0.5, isolate=True)
+    graph.add_stage("after", lambda inputs: inputs, deps=["slow"], soft_deps=True)
+
+    started = time.time()
+    results = graph.run()
+    time.sleep(2.5)
+
+    assert time.time() - started < 5
+    assert results["slow"].status == "timeout"
+    assert results["after"].value == {"slow": None}
+    assert not marker.exists()
+
+
+class _MarkerDriver:
+    """quit 호출을 파일로 남기는 가짜 WebDriver (자식 프로세스의 호출을 부모에서 확인)"""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        with open(self.marker, "a") as f:
+            f.write("quit\n")
+
+
+@pytest.mark.parametrize("sleep, timeout", [(0, None), (10, 0.5)], ids=["finished", "timed_out"])
+def test_isolated_stage_quits_shared_driver_pool(tmp_path, monkeypatch, sleep, timeout):
+    from crawling_sites.utils import driver_pool
+
+    marker = tmp_path / "quit.txt"
+    monkeypatch.setattr(driver_pool, "create_chrome_driver", lambda **kwargs: _MarkerDriver(marker))
+    monkeypatch.setenv("CHROME_POOL_SIZE", "2")
+
+    def crawl(_):
+        pool = driver_pool.get_shared_pool()
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        time.sleep(sleep)  # second는 임대 중인 채로 종료 — 풀 정리가 모두 종료해야 한다
+        return "done"
+
+    graph = StageGraph(log=_quiet)
+    graph.add_stage("crawl", crawl, timeout=timeout, isolate=True)
+    results = graph.run()
+    deadline = time.time() + 5
+    while marker.exists() is False or marker.read_text().count("quit") < 2:
+        if time.time() > deadline:
+            break
+        time.sleep(0.05)
+
+    assert results["crawl"].status == ("success" if timeout is None else "timeout")
+    assert marker.read_text().count("quit") == 2
+    assert driver_pool._shared_pool is None  # 부모의 풀은 만들어지지 않음
@@ -0,0 +1,149 @@
+"""reconstruction.story_index 실행 간 스토리 기억 + db_loader 적재 결과 기록"""
+import sys
+import types
+
+import pytest
+
+import story_index as story_index_module
+from db_loader import load_to_db
+from story_index import StoryIndex
+
+
+def _article(link, title, content="본문 " * 40):
+    return {"link": link, "title": title, "content": content}
+
+
+STORY = [_article("https://a/1", "갤럭시 S26 공개 행사 일정 확정"), _article("https://b/1", "삼성 갤럭시 S26 공개일 확정")]
+OTHER = [_article("https://c/9", "랜섬웨어 공격으로 병원 시스템 마비", "보안 " * 40)]
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = StoryIndex(str(tmp_path / "story_index.sqlite"), lookback_days=3, retention_days=30)
+    yield idx
+    idx.close()
+
+
+def _reconstructed(cluster, title, category="mobile", story_id=None):
+    article = {"title": title, "summary": "요약", "category": category, "_source_articles": cluster}
+    if story_id is not None:
+        article["_story_id"] = story_id
+    return article
+
+
+def test_plan_updates_story_with_new_sources_and_skips_repeats(index):
+    assert index.record_all([_reconstructed(STORY, "갤럭시 S26 공개")], [101]) == 1
+
+    followup = STORY + [_article("https://d/2", "갤럭시 S26 사전 예약 시작")]
+    planned, updates, skipped = index.plan({"mobile": [list(STORY), followup, OTHER]})
+
+    assert skipped == 1
+    assert planned["mobile"] == [followup, OTHER]
+    story = updates[id(followup)]
+    assert story["news_id"] == 101
+    assert [a["link"] for a in story["new_articles"]] == ["https://d/2"]
+
+    index.record_all([_reconstructed(followup, "갤럭시 S26 예약", story_id=story["story_id"])], [101])
+    rows = index._conn.execute("SELECT news_id, links, update_count FROM stories").fetchall()
+    assert len(rows) == 1 and rows[0][2] == 1 and "https://d/2" in rows[0][1]
+
+
+def test_other_category_and_skip_mode(tmp_path, index):
+    index.record_all([_reconstructed(STORY, "갤럭시 S26 공개")], [101])
+    planned, updates, skipped = index.plan({"ai": [list(STORY)]})
+    assert planned["ai"] == [STORY] and not updates and skipped == 0
+
+    skip_index = StoryIndex(str(index.path), on_match="skip")
+    planned, updates, skipped = skip_index.plan({"mobile": [STORY + [_article("https://d/2", "새 원문")]]})
+    assert planned["mobile"] == [] and skipped == 1
+    skip_index.close()
+
+    with pytest.raises(ValueError):
+        StoryIndex(str(tmp_path / "x.sqlite"), on_match="merge")
+
+
+def test_record_all_ignores_articles_without_news_id(index):
+    recorded = index.record_all([_reconstructed(STORY, "적재됨"), _reconstructed(OTHER, "건너뜀")], [7, None])
+    assert recorded == 1
+    assert index._conn.execute("SELECT news_id FROM stories").fetchall() == [(7,)]
+
+
+def test_prune_drops_stories_past_retention(index, monkeypatch):
+    now = [1_000_000_000.0]
+    monkeypatch.setattr(story_index_module.time, "time", lambda: now[0])
+    index.record_all([_reconstructed(STORY, "오래된 스토리")], [1])
+    now[0] += 10 * 86400
+    index.record_all([_reconstructed(OTHER, "최근 스토리", category="security")], [2])
+
+    # lookback(3일)이 지나면 비교 대상은 아니지만 보관 기간 안이면 남는다
+    assert index.plan({"mobile": [list(STORY)]})[2] == 0
+    assert index.prune() == 0
+    now[0] += 25 * 86400
+    assert index.prune() == 1
+    assert index._conn.execute("SELECT news_id FROM stories").fetchall() == [(2,)]
+
+
+class FakeCursor:
+    """INSERT ... ON CONFLICT (title) DO NOTHING RETURNING news_id 흉내"""
+
+    def __init__(self, titles):
+        self.titles = titles
+        self.row = None
+        self.statements = []
+
+    def execute(self, sql, params):
+        self.statements.append(sql.split()[0])
+        if sql.lstrip().startswith("INSERT"):
+            title = params[0]
+            if title in self.titles:
+                self.row = None
+            else:
+                self.titles[title] = len(self.titles) + 100
+                self.row = (self.titles[title],)
+        elif sql.lstrip().startswith("UPDATE"):
+            self.row = (params[-1],) if params[-1] in self.titles.values() else None
+        else:
+            self.row = None
+
+    def fetchone(self):
+        return self.row
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _db_article(title, **extra):
+    return {"title": title, "summary": "요약", "bullet_summary": [], "content": "본문", "hashtags": [],
+            "category": "mobile", "_source_articles": STORY, **extra}
+
+
+def test_conflicting_insert_is_not_recorded_in_story_index(index, monkeypatch):
+    cursor = FakeCursor({"이미 있는 제목": 5})
+    fake_psycopg2 = types.SimpleNamespace(connect=lambda **kwargs: FakeConnection(cursor))
+    monkeypatch.setitem(sys.modules, "psycopg2", fake_psycopg2)
+
+    articles = [
+        _db_article("새 기사"),
+        _db_article("이미 있는 제목"),
+        _db_article("갱신 기사", _update_news_id=5),
+    ]
+    news_ids = load_to_db(articles, {"host": "fake"})
+
+    assert news_ids == [101, None, 5]
+    assert "SELECT" not in cursor.statements
+    assert index.record_all(articles, news_ids) == 2
+    assert sorted(r[0] for r in index._conn.execute("SELECT news_id FROM stories")) == [5, 101]
@@ -0,0 +1,76 @@
+"""reconstruction.text_features 실행 단위 TF-IDF 행 조회 + 원문 유사도"""
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from text_features import TextFeatureService
+
+ARTICLES = [
+    {"title": "갤럭시 S26 공개", "content": "삼성전자가 새 스마트폰을 공개했다"},
+    {"title": "아이폰 18 루머", "content": "애플의 차기 아이폰 디자인이 유출됐다"},
+    {"title": "랜섬웨어 경보", "content": "보안 당국이 랜섬웨어 공격 주의를 당부했다"},
+    {"title": "AI 반도체 수요", "content": "엔비디아 GPU 수요가 계속 늘고 있다"},
+]
+
+
+def test_rows_are_slices_of_the_fitted_matrix():
+    service = TextFeatureService().fit(ARTICLES)
+    expected = service._vectorizer.transform([service._clustering_text(a) for a in ARTICLES])
+
+    subset = [ARTICLES[2], ARTICLES[0]]
+    np.testing.assert_allclose(service.rows(subset).toarray(), expected[[2, 0]].toarray())
+
+
+def test_fit_keeps_its_own_references_to_the_articles():
+    articles = [dict(a) for a in ARTICLES]
+    service = TextFeatureService().fit(articles)
+    first = articles[0]
+    articles.clear()
+
+    assert service._position(first) == 0
+    # 내용이 같아도 다른 dict는 학습된 행이 아니다 (변환 경로)
+    assert service._position(dict(first)) is None
+
+
+def test_reused_id_is_not_mistaken_for_a_fitted_article():
+    service = TextFeatureService().fit(ARTICLES)
+    stranger = {"title": "전혀 다른 기사", "content": "날씨가 맑다"}
+    # id()가 재사용된 상황을 흉내: 인덱스에는 있지만 저장된 객체와 다르다
+    service._index[id(stranger)] = 0
+
+    row = service.rows([stranger]).toarray()
+    fresh = service._vectorizer.transform([service._clustering_text(stranger)]).toarray()
+    np.testing.assert_allclose(row, fresh)
+    assert not np.allclose(row, service._matrix[0].toarray())
+
+
+def test_rows_fit_on_first_use_and_failed_fit_keeps_state():
+    service = TextFeatureService()
+    assert service.rows(ARTICLES).shape[0] == len(ARTICLES)
+    matrix = service._matrix
+    with pytest.raises(ValueError):
+        service.fit([{"title": "", "content": ""}])
+    assert service._matrix is matrix and service._position(ARTICLES[1]) == 1
+
+
+def _reference_originality(originals, reconstructed):
+    """쌍마다 TfidfVectorizer를 새로 학습하던 기존 방식"""
+    valid = [c for c in originals if c.strip()]
+    if not valid or not reconstructed:
+        return 0.0
+    matrix = TfidfVectorizer().fit_transform(valid + [reconstructed])
+    return float(cosine_similarity(matrix[-1], matrix[:-1]).max())
+
+
+def test_originality_matches_per_pair_tfidf():
+    pairs = [
+        (["삼성전자가 새 스마트폰을 공개했다 가격은 미정", "새 스마트폰 공개 행사"], "삼성전자가 새 스마트폰을 공개했다"),
+        (["the quick brown fox jumps", "lazy dogs sleep"], "a quick brown fox jumped over lazy dogs"),
+        (["   ", ""], "내용"),
+        (["원문만 있다"], ""),
+        (["완전히 같은 문장이다"], "완전히 같은 문장이다"),
+    ]
+    scores = TextFeatureService().originality(pairs)
+    np.testing.assert_allclose(scores, [_reference_originality(*pair) for pair in pairs], atol=1e-9)
+    assert scores[4] == pytest.approx(1.0)
@@ -0,0 +1,74 @@
+"""reconstruction.text_normalizer 브랜드명 정규화 + 랭킹 트렌드 브랜드 별칭 매칭"""
+import random
+
+import pytest
+
+from benchmarks.bench_text_normalizer import _replace_loop, make_articles, make_dictionary
+from keyword_matcher import KeywordMatcher
+from reconstruction.text_normalizer import BRAND_NORMALIZE, BrandNormalizer, default_normalizer
+from run_batch import build_keyword_matcher, scan_item
+
+
+def test_normalize_prefers_longest_entry_and_keeps_other_case():
+    normalizer = default_normalizer()
+    assert normalizer.normalize("new iphone") == "new 아이폰"
+    assert normalizer.normalize("ChatGPT vs GPT") == "chatgpt vs gpt"
+    assert normalizer.normalize("Apple Watch 출시") == "애플 Watch 출시"
+    assert normalizer.normalize("") == "" and normalizer.normalize("한국어만") == "한국어만"
+
+
+def test_word_boundary_skips_embedded_brands_but_allows_particles():
+    normalizer = default_normalizer(word_boundary=True)
+    assert normalizer.normalize("metaverse와 meta가 laws") == "metaverse와 메타가 laws"
+    assert normalizer.normalize("pineapple apple") == "pineapple 애플"
+    assert default_normalizer().normalize("metaverse") == "메타verse"
+
+
+def test_length_changing_lowercase_falls_back_to_ignorecase():
+    normalizer = BrandNormalizer({"apple": "애플"})
+    assert normalizer.normalize("İ APPLE") == "İ 애플"
+
+
+def test_reversed_and_variants():
+    normalizer = default_normalizer(word_boundary=True)
+    assert normalizer.variants("아이폰") == {"아이폰", "iphone"}
+    assert normalizer.variants("iPhone") == {"iPhone", "아이폰"}
+    # 정규화 표기가 원래 표기와 같은 항목(aws)은 역방향에 넣지 않는다
+    assert "aws" not in normalizer.reversed()._lookup
+    assert len(BrandNormalizer({})) == 0 and BrandNormalizer({}).normalize("apple") == "apple"
+
+
+def test_trie_matches_replace_loop_on_non_overlapping_dictionary():
+    rng = random.Random(3)
+    mapping = make_dictionary(200, rng)
+    # 기본 사전에는 서로 포함되는 항목(chatgpt/gpt)이 있어 합성 항목만 비교한다
+    synthetic = {k: v for k, v in mapping.items() if k not in BRAND_NORMALIZE}
+    texts = make_articles(synthetic, 50, 5, rng)
+    normalizer = BrandNormalizer(synthetic)
+    loop = _replace_loop(synthetic)
+    assert [normalizer.normalize(t) for t in texts] == [loop(t) for t in texts]
+
+
+def test_keyword_matcher_word_boundary_flag():
+    matcher = KeywordMatcher()
+    matcher.add("meta", "brand", word_boundary=True)
+    matcher.add("meta", "plain")
+    hits = matcher.scan("metaverse, meta가 meta2 meta")
+
+    assert [end for end, tag, _ in hits.matches if tag == "brand"] == [14, 26]
+    assert len([m for m in hits.matches if m[1] == "plain"]) == 4
+
+
+@pytest.mark.parametrize("text", ["laws and regulations", "pineapple juice", "metaverse platform", "heavy metal"])
+def test_brand_trends_do_not_match_inside_other_words(text):
+    matcher = build_keyword_matcher({"애플": 2.0, "메타": 1.5, "aws": 1.0, "amd": 1.0})
+    item = {"type": "news", "title": text, "content": "amdahl 법칙"}
+    assert scan_item(matcher, item)["score"].values("trend") == []
+
+
+def test_brand_trends_match_english_and_korean_forms():
+    matcher = build_keyword_matcher({"애플": 2.0, "메타": 1.5, "AWS": 1.0, "반도체": 1.0})
+    item = {"type": "news", "title": "Apple 신제품과 meta가 발표", "content": "aws 장애, 반도체주 강세"}
+    assert sorted(scan_item(matcher, item)["score"].values("trend")) == sorted(["애플", "메타", "AWS", "반도체"])
+    # 브랜드가 아닌 트렌드 키워드는 기존처럼 부분 문자열로 매칭한다
+    assert scan_item(matcher, {"type": "news", "title": "반도체주", "content": ""})["score"].values("trend") == ["반도체"]
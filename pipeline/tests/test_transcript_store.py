@@ -0,0 +1,104 @@
+"""crawling_youtube.transcript_store 자막 캐시 + YouTubeCrawler 동시 자막 조회"""
+import threading
+import time as real_time
+
+import pytest
+
+from crawling_youtube import transcript_store
+from crawling_youtube.transcript_store import TranscriptStore
+from crawling_youtube.youtube_crawler_api import YouTubeCrawler
+
+TRANSCRIPT = {"language": "ko", "text": "안녕하세요", "segments": 1}
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = TranscriptStore(str(tmp_path / "transcripts.sqlite"), negative_ttl_hours=1)
+    yield s
+    s.close()
+
+
+def test_ok_transcript_roundtrip_and_shared_blob(store):
+    assert store.get("v1", "ko") is None
+    store.put("v1", "ko", transcript_store.OK, TRANSCRIPT)
+    store.put("v2", "ko", transcript_store.OK, dict(TRANSCRIPT))
+
+    assert store.get("v1", "ko") == (transcript_store.OK, TRANSCRIPT)
+    assert store.get("v1", "any") is None
+    blobs = store._conn.execute("SELECT COUNT(*) FROM transcript_blobs").fetchone()[0]
+    assert blobs == 1
+
+
+def test_negative_result_expires_and_errors_are_not_cached(store, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(transcript_store.time, "time", lambda: now[0])
+    store.put("off", "ko", transcript_store.DISABLED)
+    store.put("flaky", "ko", transcript_store.ERROR)
+
+    assert store.get("off", "ko") == (transcript_store.DISABLED, None)
+    assert store.get("flaky", "ko") is None
+    now[0] += 2 * 3600
+    assert store.get("off", "ko") is None
+    assert store.stats == {"hit": 0, "negative_hit": 1, "miss": 2}
+
+
+def test_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "transcripts.sqlite")
+    first = TranscriptStore(path)
+    first.put("v1", "ko", transcript_store.OK, TRANSCRIPT)
+    first.close()
+
+    second = TranscriptStore(path)
+    assert second.get("v1", "ko") == (transcript_store.OK, TRANSCRIPT)
+    second.close()
+
+
+def make_crawler(results, transcripts=None, delay=0.0):
+    """fetch_transcript를 results로 대신하는 크롤러 (실제 생성자는 Data API 클라이언트가 필요)"""
+    crawler = YouTubeCrawler.__new__(YouTubeCrawler)
+    crawler.transcript_api = object()
+    crawler.transcripts = transcripts
+    crawler.fetched = []
+    crawler.active = 0
+    crawler.max_active = 0
+    lock = threading.Lock()
+
+    def fetch_transcript(video_id, korean_only=True):
+        with lock:
+            crawler.fetched.append(video_id)
+            crawler.active += 1
+            crawler.max_active = max(crawler.max_active, crawler.active)
+        real_time.sleep(delay)
+        with lock:
+            crawler.active -= 1
+        return results[video_id]
+
+    crawler.fetch_transcript = fetch_transcript
+    return crawler
+
+
+def test_get_transcript_reuses_cached_and_negative_results(store):
+    results = {
+        "ok": (transcript_store.OK, TRANSCRIPT),
+        "off": (transcript_store.DISABLED, None),
+        "flaky": (transcript_store.ERROR, None),
+    }
+    crawler = make_crawler(results, transcripts=store)
+
+    for _ in range(2):
+        assert crawler.get_transcript("ok") == TRANSCRIPT
+        assert crawler.get_transcript("off") is None
+        assert crawler.get_transcript("flaky") is None
+
+    assert crawler.fetched == ["ok", "off", "flaky", "flaky"]
+
+
+def test_iter_transcripts_is_concurrent_bounded_and_ordered():
+    ids = [f"v{n}" for n in range(8)]
+    results = {vid: (transcript_store.OK, {"text": vid}) for vid in ids}
+    crawler = make_crawler(results, delay=0.05)
+
+    pairs = list(crawler.iter_transcripts(ids, max_workers=3))
+
+    assert pairs == [(vid, {"text": vid}) for vid in ids]
+    assert 1 < crawler.max_active <= 3
@@ -0,0 +1,98 @@
+"""ranking_integrated.trend_cache + TrendCollector 병렬 수집/기한 초과 처리"""
+import threading
+
+import pytest
+
+from ranking_integrated import trend_cache
+from ranking_integrated.generate_briefing import TrendCollector
+from ranking_integrated.trend_cache import TrendCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = TrendCache(str(tmp_path / "trends.sqlite"))
+    yield store
+    store.close()
+
+
+def make_collector(cache, monkeypatch, google=None, naver=None, blackkiwi=None):
+    collector = TrendCollector(cache=cache)
+    collector.naver_client_id = collector.naver_client_secret = "test"
+    monkeypatch.setattr(collector, "_fetch_google_trends", google or (lambda: ["g1", "g2"]))
+    monkeypatch.setattr(collector, "_fetch_naver_datalab_trends", naver or (lambda: ["n1"]))
+    monkeypatch.setattr(collector, "_fetch_blackkiwi_trends", blackkiwi or (lambda: {"rising": ["r"], "new": []}))
+    return collector
+
+
+def test_cache_ttl_and_stale_fallback(cache, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(trend_cache.time, "time", lambda: now[0])
+    cache.put("google", ["g1"])
+    now[0] += 3600
+
+    assert cache.get("google", max_age_hours=0.5) is None
+    payload, age = cache.get("google", max_age_hours=2)
+    assert payload == ["g1"] and age == pytest.approx(3600)
+
+
+def test_collect_all_uses_cache_within_ttl(cache, monkeypatch):
+    calls = []
+    collector = make_collector(cache, monkeypatch, google=lambda: calls.append(1) or ["g1"])
+
+    first = collector.collect_all(deadline_seconds=5)
+    second = collector.collect_all(deadline_seconds=5)
+
+    assert first == second == {"google": ["g1"], "naver_datalab": ["n1"], "blackkiwi": {"rising": ["r"], "new": []}}
+    assert calls == [1]
+    assert {status for _, status in collector.latencies.values()} == {"cache"}
+
+
+def test_failed_source_falls_back_to_stale_result(cache, monkeypatch):
+    cache.put("naver_datalab", ["어제 키워드"])
+    collector = make_collector(cache, monkeypatch, naver=lambda: 1 / 0)
+    collector.ttl_hours["naver_datalab"] = 0
+
+    results = collector.collect_all(deadline_seconds=5)
+
+    assert results["naver_datalab"] == ["어제 키워드"]
+    assert collector.latencies["naver_datalab"][1] == "error"
+    assert cache.recent_latency("naver_datalab")[0][1] == "error"
+
+
+def test_late_source_keeps_timeout_and_only_updates_cache(cache, monkeypatch):
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_google():
+        release.wait(5)
+        return ["늦은 결과"]
+
+    collector = make_collector(cache, monkeypatch, google=slow_google)
+    original_collect = collector._collect
+
+    def collect_and_signal(source, fetch):
+        try:
+            return original_collect(source, fetch)
+        finally:
+            if source == "google":
+                finished.set()
+
+    monkeypatch.setattr(collector, "_collect", collect_and_signal)
+
+    results = collector.collect_all(deadline_seconds=0.2)
+    assert results["google"] == []
+    assert collector.latencies["google"] == (0.2, "timeout")
+    assert collector.latencies["naver_datalab"][1] == "ok"
+
+    release.set()
+    assert finished.wait(5)
+    # 늦게 끝난 수집은 이번 실행 기록을 덮어쓰지 않고 다음 실행을 위해 캐시에만 남는다
+    assert collector.latencies["google"] == (0.2, "timeout")
+    assert cache.get("google", max_age_hours=1)[0] == ["늦은 결과"]
+    assert cache.recent_latency("google")[0][1] == "ok"
+
+
+def test_sequential_getter_records_latency_directly(cache, monkeypatch):
+    collector = make_collector(cache, monkeypatch)
+    assert collector.get_google_trends() == ["g1", "g2"]
+    assert collector.latencies["google"][1] == "ok"